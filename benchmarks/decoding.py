@@ -0,0 +1,56 @@
+#
+# Compares the compiled model decoders against dacite.from_dict
+#
+# Usage: python benchmarks/decoding.py [rows]
+#
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import dacite
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.models.taskdetailsdto import TaskDetailsDto
+from ProjectManagerSdk.models.taskdto import TaskDto
+
+
+def sample_task(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{index:012d}",
+        "name": f"Task {index}",
+        "shortId": f"T-{index}",
+        "projectId": "d71246fa-22e5-47e5-bbd8-42e10ff69fc9",
+        "project": {"id": "d71246fa-22e5-47e5-bbd8-42e10ff69fc9", "name": "Project", "shortId": "P-1"},
+        "status": {"id": "5fa1c0b8-dd9a-4f38-ab5a-6d8c1f31e9b1", "name": "In Progress", "order": 1, "isDone": False},
+        "assignees": [{"id": f"a-{n}", "name": f"Assignee {n}", "initials": "AA", "allocatedEffort": 480} for n in range(3)],
+        "todos": [{"id": f"t-{n}", "text": f"Todo {n}", "complete": n % 2 == 0} for n in range(2)],
+        "tags": [{"id": "tag", "name": "Tag", "color": "#ff0000"}],
+        "plannedStartDate": "2026-01-01",
+        "plannedFinishDate": "2026-02-01",
+        "percentComplete": index % 100,
+        "plannedCost": 1234.5,
+        "isSummary": False,
+        "some_random_new_Field": "ignored",
+    }
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    payload = json.loads(json.dumps({"data": [sample_task(i) for i in range(rows)]}))["data"]
+
+    # Both paths must produce identical objects
+    assert [dacite.from_dict(data_class=TaskDto, data=row) for row in payload[:100]] == [from_dict(TaskDto, row) for row in payload[:100]]
+
+    for data_class in (TaskDto, TaskDetailsDto):
+        baseline = min(timeit.repeat(lambda: [dacite.from_dict(data_class=data_class, data=row) for row in payload], number=1, repeat=3))
+        compiled = min(timeit.repeat(lambda: [from_dict(data_class, row) for row in payload], number=1, repeat=3))
+        lazy = min(timeit.repeat(lambda: [(task.id, task.name) for task in (lazy_from_dict(data_class, row) for row in payload)], number=1, repeat=3))
+        print(f"{data_class.__name__:16} {rows} rows: dacite {baseline * 1000:8.1f} ms, compiled {compiled * 1000:8.1f} ms ({baseline / compiled:.1f}x), "
+              f"lazy reading id and name {lazy * 1000:8.1f} ms ({baseline / lazy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
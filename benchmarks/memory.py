@@ -0,0 +1,60 @@
+#
+# Measures the memory used per model instance by the slotted models
+# compared to equivalent models with a per-instance __dict__
+#
+# Usage: python benchmarks/memory.py [rows]
+#
+
+import dataclasses
+import os
+import sys
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ProjectManagerSdk.decoders import from_dict
+from ProjectManagerSdk.models.projectdto import ProjectDto
+from ProjectManagerSdk.models.resourcedto import ResourceDto
+from ProjectManagerSdk.models.taskdto import TaskDto
+from ProjectManagerSdk.models.taskfieldvaluedto import TaskFieldValueDto
+from ProjectManagerSdk.models.timesheetdto import TimesheetDto
+
+
+def unslotted(data_class: type) -> type:
+    """Recreates a model as a regular dataclass with the same fields and defaults"""
+    fields = [(field.name, field.type, dataclasses.field(default=field.default)) for field in dataclasses.fields(data_class)]
+    return dataclasses.make_dataclass(data_class.__name__, fields)
+
+
+def sample(data_class: type, index: int) -> dict:
+    values = {str: f"value {index}", int: index, float: index * 1.5, bool: index % 2 == 0}
+    row = {}
+    for field in dataclasses.fields(data_class):
+        for field_type, value in values.items():
+            if field.type in (field_type, field_type | None):
+                row[field.name] = value
+    return row
+
+
+def measure(data_class: type, rows: list) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [from_dict(data_class, row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / len(rows)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for data_class in (TaskDto, TimesheetDto, ResourceDto, ProjectDto, TaskFieldValueDto):
+        rows = [sample(data_class, i) for i in range(count)]
+        slotted = measure(data_class, rows)
+        regular = measure(unslotted(data_class), rows)
+        print(f"{data_class.__name__:18} {len(dataclasses.fields(data_class)):3} fields: "
+              f"__dict__ {regular:7.0f} bytes, __slots__ {slotted:7.0f} bytes per instance ({1 - slotted / regular:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
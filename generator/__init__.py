@@ -0,0 +1,26 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+"""
+Generates the API client, its categories and the data models of the SDK
+from the newest OpenAPI file.
+
+SdkGenerator downloads the OpenAPI file into the `swagger` folder and
+writes its own version of the generated files; running `python -m
+generator` afterwards rewrites those files from the templates in this
+package, so that the generated code keeps the features of this SDK.
+Run `python -m generator --check` to verify that the generated files
+are up to date.
+"""
+
+from generator.generate import generate, main
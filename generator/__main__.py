@@ -0,0 +1,17 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from generator.generate import main
+import sys
+
+sys.exit(main())
@@ -0,0 +1,282 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from generator import templates
+from typing import Dict, List
+import argparse
+import dataclasses
+import glob
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Folders whose every file is written by the generator; files that are no longer generated are removed
+GENERATED_FOLDERS = ["src/ProjectManagerSdk/clients", "src/ProjectManagerSdk/asyncclients", "src/ProjectManagerSdk/models"]
+
+@dataclasses.dataclass
+class Parameter:
+    """A path or query parameter, or the body of an API call"""
+
+    name: str
+    """The name of the Python argument"""
+
+    wireName: str
+    """The name of the parameter in the API call"""
+
+    location: str
+    """One of "path", "query", "body" or "upload" """
+
+    type: str
+    """The Python type of the argument"""
+
+    description: str
+
+@dataclasses.dataclass
+class Operation:
+    """One API call, rendered as a method of its category"""
+
+    name: str
+    method: str
+    path: str
+    description: str
+    parameters: List[Parameter]
+    result: str
+    """The Python type of the data returned, such as `List[TaskDto]`, `object` or `bytes`"""
+
+    @property
+    def body(self) -> Parameter | None:
+        return next((parameter for parameter in self.parameters if parameter.location in ("body", "upload")), None)
+
+    @property
+    def paged(self) -> bool:
+        """true for OData queries, which take $top and $skip"""
+        names = [parameter.wireName for parameter in self.parameters]
+        return "$top" in names and "$skip" in names
+
+@dataclasses.dataclass
+class Category:
+    """A group of API calls sharing an OpenAPI tag"""
+
+    name: str
+    operations: List[Operation]
+
+    @property
+    def className(self) -> str:
+        return self.name + "Client"
+
+    @property
+    def moduleName(self) -> str:
+        return self.className.lower()
+
+    @property
+    def attributeName(self) -> str:
+        return self.name[0].lower() + self.name[1:]
+
+@dataclasses.dataclass
+class Api:
+    """Everything read from the OpenAPI file and sdk-config.json"""
+
+    config: dict
+    spec: dict
+    categories: List[Category]
+
+    @property
+    def version(self) -> str:
+        return self.spec["info"]["version"]
+
+    @property
+    def handwritten(self) -> List[str]:
+        """the models kept as they are, such as `AstroResult`"""
+        return [f"src/ProjectManagerSdk/models/{name.lower()}.py" for name in self.config["Python"]["HandwrittenClasses"]]
+
+def latest_swagger(root: str, config: dict) -> str:
+    """the path of the OpenAPI file with the highest version number"""
+    files = glob.glob(os.path.join(root, config["SwaggerSchemaFolder"], "swagger-*.json"))
+    if not files:
+        raise FileNotFoundError(f"No OpenAPI files found in {config['SwaggerSchemaFolder']}")
+    return max(files, key=lambda name: [int(part) for part in re.findall(r"\d+", os.path.basename(name))])
+
+def load(root: str = ROOT) -> Api:
+    """Read sdk-config.json and the newest OpenAPI file
+
+    Parameters
+    ----------
+    root : str
+        The root folder of the repository
+    """
+    with open(os.path.join(root, "sdk-config.json"), encoding="utf-8") as file:
+        config = json.load(file)
+    with open(latest_swagger(root, config), encoding="utf-8-sig") as file:
+        spec = json.load(file)
+    return Api(config, spec, categories(spec, config))
+
+def method_name(summary: str) -> str:
+    """the snake_case name of an API method, such as `query_tasks` for "Query Tasks" """
+    return re.sub(r"[^a-z0-9]+", "_", summary.lower()).strip("_")
+
+def schema_name(schema: dict) -> str | None:
+    """the name of a referenced schema, directly or through `allOf`"""
+    if "$ref" in schema:
+        return schema["$ref"].rsplit("/", 1)[1]
+    if len(schema.get("allOf", [])) == 1:
+        return schema_name(schema["allOf"][0])
+    return None
+
+def python_type(schema: dict, spec: dict) -> str:
+    """the Python type of values of a schema"""
+    name = schema_name(schema)
+    if name is not None:
+        return "str" if "enum" in spec["components"]["schemas"][name] else name
+    kind = schema.get("type")
+    if kind == "array":
+        return f"List[{python_type(schema['items'], spec)}]"
+    if kind == "integer":
+        return "int"
+    if kind == "number":
+        return "float"
+    if kind == "boolean":
+        return "bool"
+    if kind == "string":
+        return "str"
+    return "object"
+
+def result_type(operation: dict, spec: dict) -> str:
+    """the Python type of the data returned by an API call"""
+    schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+    name = schema_name(schema)
+    if name is None:
+        return "bytes" if schema.get("format") == "byte" else python_type(schema, spec)
+    data = spec["components"]["schemas"][name].get("properties", {}).get("data")
+    if data is None or data.get("type") == "object":
+        return "object"
+    return python_type(data, spec)
+
+def ignored(operation: dict, config: dict) -> bool:
+    """true for endpoints left out of the SDK"""
+    ignoredEndpoints = [endpoint.lower() for endpoint in config.get("IgnoredEndpoints", [])]
+    # SdkGenerator only names methods after summaries made of letters, digits and spaces
+    return (operation["summary"].lower() in ignoredEndpoints
+            or not re.fullmatch(r"[A-Za-z0-9 ]+", operation["summary"]))
+
+def parameters(operation: dict, spec: dict, config: dict) -> List[Parameter]:
+    """the arguments of an API method, in OpenAPI order followed by the body"""
+    ignoredParameters = {(parameter["Name"].lower(), parameter["Location"].lower()) for parameter in config.get("IgnoredParameters", [])}
+    result = []
+    for parameter in operation.get("parameters", []):
+        if (parameter["name"].lower(), parameter["in"].lower()) in ignoredParameters:
+            continue
+        result.append(Parameter(parameter["name"].lstrip("$"), parameter["name"], parameter["in"],
+                                python_type(parameter["schema"], spec), parameter.get("description", "")))
+    body = operation.get("requestBody")
+    if body is not None:
+        if "multipart/form-data" in body["content"]:
+            result.append(Parameter("fileName", "fileName", "upload", "str | Upload",
+                                    "The full path of a file to upload to the API, or an `Upload` that streams bytes, a file object or chunks"))
+        else:
+            result.append(Parameter("body", "body", "body", python_type(body["content"]["application/json"]["schema"], spec),
+                                    body.get("description", "")))
+    return result
+
+def categories(spec: dict, config: dict) -> List[Category]:
+    """the API categories, sorted by module name, with their methods in OpenAPI order"""
+    found: Dict[str, Category] = {}
+    for path, methods in spec["paths"].items():
+        for method, operation in methods.items():
+            if ignored(operation, config):
+                continue
+            tag = operation["tags"][0]
+            category = found.setdefault(tag, Category(tag, []))
+            category.operations.append(Operation(method_name(operation["summary"]), method.upper(), path,
+                                                 operation.get("description", ""), parameters(operation, spec, config),
+                                                 result_type(operation, spec)))
+    return sorted(found.values(), key=lambda category: category.moduleName)
+
+def generate(api: Api) -> Dict[str, str]:
+    """Render every generated file
+
+    Returns the contents of each file, keyed by its path relative to the
+    root of the repository.
+
+    Parameters
+    ----------
+    api : Api
+        The API to generate the SDK for
+    """
+    files = {}
+    models = list(api.config["Python"]["HandwrittenClasses"])
+    for name, schema in api.spec["components"]["schemas"].items():
+        if name in models or "enum" in schema or any(name.endswith(suffix) for suffix in api.config["GenericSuffixes"]):
+            continue
+        fields = [(field, python_type(value, api.spec)) for field, value in schema.get("properties", {}).items()]
+        files[f"src/ProjectManagerSdk/models/{name.lower()}.py"] = templates.model(name, schema, fields)
+        models.append(name)
+    files["src/ProjectManagerSdk/models/__init__.py"] = ""
+    for category in api.categories:
+        files[f"src/ProjectManagerSdk/clients/{category.moduleName}.py"] = templates.client(category)
+    files["src/ProjectManagerSdk/clients/__init__.py"] = ""
+    for category in api.categories:
+        files[f"src/ProjectManagerSdk/asyncclients/{category.moduleName}.py"] = templates.client(category, asynchronous=True)
+    files["src/ProjectManagerSdk/asyncclients/__init__.py"] = ""
+    files["src/ProjectManagerSdk/projectmanagerclient.py"] = templates.api_client(api)
+    files["src/ProjectManagerSdk/asyncprojectmanagerclient.py"] = templates.api_client(api, asynchronous=True)
+    files["src/ProjectManagerSdk/endpointtemplates.py"] = templates.endpoint_templates(api)
+    files["src/ProjectManagerSdk/__init__.py"] = templates.package(api, models)
+    files["pyproject.toml"] = templates.pyproject(api.version)
+    return files
+
+def stale(root: str, api: Api, files: Dict[str, str]) -> List[str]:
+    """the files in generated folders that are neither generated nor handwritten"""
+    result = []
+    for folder in GENERATED_FOLDERS:
+        for name in sorted(glob.glob(os.path.join(root, folder, "*.py"))):
+            relative = os.path.relpath(name, root).replace(os.sep, "/")
+            if relative not in files and relative not in api.handwritten:
+                result.append(relative)
+    return result
+
+def changed(root: str, files: Dict[str, str]) -> List[str]:
+    """the generated files that differ from the files on disk"""
+    result = []
+    for relative, content in sorted(files.items()):
+        try:
+            with open(os.path.join(root, relative), encoding="utf-8", newline="") as file:
+                if file.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+        result.append(relative)
+    return result
+
+def main(argv: List[str] | None = None) -> int:
+    """Write the generated files, or with `--check` report the files that are out of date"""
+    parser = argparse.ArgumentParser(prog="python -m generator", description="Generate the API client, its categories and the data models of the SDK from the newest OpenAPI file")
+    parser.add_argument("--root", default=ROOT, help="the root folder of the repository")
+    parser.add_argument("--check", action="store_true", help="report out of date files instead of writing them")
+    args = parser.parse_args(argv)
+    api = load(args.root)
+    files = generate(api)
+    if args.check:
+        outdated = changed(args.root, files) + stale(args.root, api, files)
+        for relative in outdated:
+            print(f"{relative} is out of date; run `python -m generator`", file=sys.stderr)
+        return 1 if outdated else 0
+    for relative in changed(args.root, files):
+        os.makedirs(os.path.dirname(os.path.join(args.root, relative)), exist_ok=True)
+        with open(os.path.join(args.root, relative), "w", encoding="utf-8", newline="") as file:
+            file.write(files[relative])
+    for relative in stale(args.root, api, files):
+        os.remove(os.path.join(args.root, relative))
+    return 0
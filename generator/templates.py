@@ -0,0 +1,412 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import List
+import re
+
+HEADER = """#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+"""
+
+# Arguments added to each download method to write the file to a target instead of returning it
+DOWNLOAD_PARAMETERS = "target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None"
+
+DOWNLOAD_DOCS = """        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+"""
+
+# Arguments added to each iter_* method, after the OData query options
+PAGING_PARAMETERS = "page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0"
+
+PAGING_DOCS = """        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+"""
+
+# Names in Python types that are not data models
+BUILTIN_TYPES = ("List", "str", "int", "float", "bool", "object", "bytes", "Upload")
+
+def wrap(text: str, indent: int) -> str:
+    """joins the words of each paragraph of a description into lines of at most 72 characters"""
+    lines: List[str] = []
+    for paragraph in re.split(r"\r?\n\r?\n", text):
+        if lines:
+            lines.append("")
+        line = ""
+        for word in paragraph.split():
+            if line and indent + len(line) + 1 + len(word) > 72:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.append(line)
+    return "".join(" " * indent + line + "\n" if line else "\n" for line in lines)
+
+def docstring(description: str, parameters: List[tuple]) -> str:
+    """a numpy style method docstring from a description and (name, type, description) tuples"""
+    text = '        """\n' + wrap(description, 8) + "\n        Parameters\n        ----------\n"
+    for name, kind, about in parameters:
+        text += f"        {name} : {kind}\n" + wrap(about, 12)
+    return text
+
+# The handwritten modules exported by the package, after the API client
+EXPORTS = """from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.tools import remove_empty_elements
+from ProjectManagerSdk.pagination import paginate, paginate_async
+from ProjectManagerSdk.jsoncodec import JsonCodec, OrjsonCodec, get_json_codec
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.columnar import ColumnarResult, DictionaryColumn, to_columns
+from ProjectManagerSdk.odata import ODataFilter, ODataOrderBy, compile_filter, compile_orderby, query_local
+from ProjectManagerSdk.ratelimiter import RateLimiter
+from ProjectManagerSdk.retry import RetryBudget, RetryPolicy
+from ProjectManagerSdk.circuitbreaker import CircuitBreaker
+from ProjectManagerSdk.endpoints import path_resource, path_template
+from ProjectManagerSdk.singleflight import SingleFlight
+from ProjectManagerSdk.responsecache import REFERENCE_DATA_TTLS, ResponseCache
+from ProjectManagerSdk.diskcache import DiskCache, StoredResponse
+from ProjectManagerSdk.validatorcache import REVALIDATED_ENDPOINTS, ValidatorCache
+from ProjectManagerSdk.compression import ContentDecoder, TransferMeter, TransferStats, available_encodings
+from ProjectManagerSdk.downloads import Download, DownloadInfo
+from ProjectManagerSdk.uploads import Upload
+from ProjectManagerSdk.transfers import FileDownload, FileUpload, TransferManager, TransferReport, TransferResult
+from ProjectManagerSdk.sync import SYNC_SOURCES, SyncEngine, SyncResult, SyncSource
+from ProjectManagerSdk.taskwriter import TaskWriter
+from ProjectManagerSdk.changesettracker import AsyncChangesetTracker, ChangesetTracker
+"""
+
+def package(api, models: List[str]) -> str:
+    """Render the package's __init__.py, which exports the client, the API categories and the data models"""
+    text = "# API client\nfrom ProjectManagerSdk.projectmanagerclient import ProjectManagerClient\n" + EXPORTS
+    text += "# API categories\n"
+    text += "".join(f"from ProjectManagerSdk.clients.{category.moduleName} import {category.className}\n" for category in api.categories)
+    text += "# Data models\n"
+    text += "".join(f"from ProjectManagerSdk.models.{model.lower()} import {model}\n" for model in sorted(models, key=str.lower))
+    return text
+
+def api_client(api, asynchronous: bool = False) -> str:
+    """Render the API client, which connects each API category to the shared transport"""
+    project = api.config["ProjectName"]
+    if asynchronous:
+        text = HEADER + f'''
+import platform
+
+from ProjectManagerSdk.asyncclientbase import AsyncProjectManagerClientBase
+
+class AsyncProjectManagerClient(AsyncProjectManagerClientBase):
+    """
+    {project} API Client object for asyncio applications
+
+    This client exposes the same API categories as `ProjectManagerClient`,
+    but every API method is a coroutine that must be awaited.  Requests are
+    sent through a shared `httpx.AsyncClient`, so many calls can be in
+    flight at once from a single thread.
+
+    Close the client with `await client.aclose()` or use it as an async
+    context manager; the synchronous `close` and `with` are not supported.
+    """
+
+    def __init__(self, env: str, appname: str):
+        """Construct a new AsyncProjectManagerClient client object
+'''
+        folder, prefix = "asyncclients", "Async"
+    else:
+        text = HEADER + f'''
+import platform
+
+from ProjectManagerSdk.clientbase import ProjectManagerClientBase
+
+class ProjectManagerClient(ProjectManagerClientBase):
+    """
+    {project} API Client object
+    
+    Use this object to connect to the API.
+    """
+
+    def __init__(self, env: str, appname: str):
+        """Construct a new ProjectManagerClient client object
+'''
+        folder, prefix = "clients", ""
+    text += '''        
+        Parameters
+        ----------
+        env : str
+            Select the environment to use for this client. You may either 
+            provide an environment name or a full URL of a custom environment.
+        appname : str
+            Provide a name for your application for logging and debugging. This
+            name will be recorded alongside API calls so that you can identify
+            the source of errors. 
+        """
+'''
+    text += "".join(f"        from ProjectManagerSdk.{folder}.{category.moduleName} import {prefix}{category.className}\n" for category in api.categories)
+    text += "".join(f"        self.{category.attributeName} = {prefix}{category.className}(self)\n" for category in api.categories)
+    text += "        self.serverUrl = env\n"
+    for environment in api.config["Environments"]:
+        text += f'''        if env == "{environment["Name"]}":
+            self.serverUrl = "{environment["Url"]}"
+'''
+    text += f'''        self.sdkName = "Python"
+        self.sdkVersion = "{api.version}"
+        self.machineName = platform.uname().node
+        self.applicationName = appname
+        self.bearerToken = None
+        super().__init__()
+'''
+    return text
+
+def endpoint_templates(api) -> str:
+    """Render the table of API endpoints that request paths are matched against"""
+    templates = sorted({operation.path for category in api.categories for operation in category.operations})
+    queries = sorted({operation.path for category in api.categories for operation in category.operations if operation.paged})
+    return HEADER + '''
+# The path of every API method, as written in the API documentation
+
+PATH_TEMPLATES = (
+''' + "".join(f'    "{template}",\n' for template in templates) + ''')
+
+# The endpoints of OData queries, which take $filter, $top and $skip
+
+QUERY_TEMPLATES = (
+''' + "".join(f'    "{template}",\n' for template in queries) + ")\n"
+
+def pyproject(version: str) -> str:
+    """Render the package metadata; slotted models need Python 3.10"""
+    return f'''[project]
+name = "ProjectManagerSdk"
+version = "{version}"
+authors = [
+    {{ name = "ProjectManager.com", email = "support@projectmanager.com" }}
+]
+description = "Software development kit for the ProjectManager.com API for Python"
+readme = "README.md"
+requires-python = ">=3.10"
+classifiers = [
+    "Programming Language :: Python :: 3",
+    "License :: OSI Approved :: MIT License",
+    "Operating System :: OS Independent",
+]
+dependencies = [
+    "dacite ~= 1.8.1"
+]
+
+[project.optional-dependencies]
+async = [
+    "httpx >= 0.24"
+]
+speedups = [
+    "orjson >= 3.8"
+]
+columnar = [
+    "numpy >= 1.22"
+]
+compression = [
+    "brotli >= 1.0",
+    "zstandard >= 0.18"
+]
+
+[project.urls]
+"Homepage" = "https://github.com/projectmgr/projectmanager-sdk-python"
+"Bug Tracker" = "https://github.com/projectmgr/projectmanager-sdk-python/issues"
+'''
+
+def model(name: str, schema: dict, fields: List[tuple]) -> str:
+    """Render a data model from its schema and (name, type) tuples for its fields"""
+    models = sorted({word for _, kind in fields for word in re.findall(r"\w+", kind) if word not in BUILTIN_TYPES}, key=str.lower)
+    text = HEADER + "\n\n"
+    if name in models:
+        # Models that contain themselves, such as the children of a NotificationDto
+        models.remove(name)
+        text += "from __future__ import annotations\n"
+    text += "".join(f"from ProjectManagerSdk.models.{model.lower()} import {model}\n" for model in models)
+    text += "from typing import List\nimport dataclasses\n"
+    text += f'''
+@dataclasses.dataclass(slots=True)
+class {name}:
+    """
+{wrap(schema.get("description", ""), 4)}    """
+'''
+    for field, kind in fields:
+        text += f'''
+    {field}: {kind} | None = None
+    """
+{wrap(schema["properties"][field].get("description", ""), 4)}    """
+'''
+    return text + "\n\n"
+
+def client(category, asynchronous: bool = False) -> str:
+    """Render the module of an API category, or with `asynchronous` its asyncio counterpart"""
+    models = sorted({name for operation in category.operations for name in model_names(operation)} | {"AstroResult"}, key=str.lower)
+    operations = category.operations
+    text = HEADER + "\n"
+    text += "".join(f"from ProjectManagerSdk.models.{name.lower()} import {name}\n" for name in models)
+    typing = {"List"}
+    if any(operation.result == "bytes" for operation in operations):
+        text += "from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget\n"
+        typing |= {"Any", "Callable"}
+    if any(parameter.location == "upload" for operation in operations for parameter in operation.parameters):
+        text += "from ProjectManagerSdk.uploads import Upload\n"
+    paged = any(operation.paged for operation in operations)
+    if paged:
+        typing.add("AsyncIterator" if asynchronous else "Iterator")
+    text += f"from typing import {', '.join(sorted(typing))}\n"
+    if paged:
+        text += f"from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, {'paginate_async' if asynchronous else 'paginate'}\n"
+    text += "from ProjectManagerSdk.tools import remove_empty_elements\n"
+    text += "import dataclasses\n"
+    if asynchronous:
+        text += f'''
+class Async{category.className}:
+    """
+    API methods related to {category.name}, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+'''
+    else:
+        text += f'''
+class {category.className}:
+    """
+    API methods related to {category.name}
+    """
+    from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+
+    def __init__(self, client: ProjectManagerClient):
+        self.client = client
+'''
+    for operation in operations:
+        text += "\n" + method(operation, asynchronous)
+        if operation.result == "bytes":
+            text += "\n" + download_method(operation, asynchronous)
+        if operation.paged:
+            text += "\n" + iter_method(operation, asynchronous)
+    return text
+
+def model_names(operation) -> List[str]:
+    """the models used by the arguments and result of an API method"""
+    names = []
+    for kind in [parameter.type for parameter in operation.parameters] + [operation.result]:
+        names += [name for name in re.findall(r"\w+", kind) if name not in BUILTIN_TYPES]
+    return names
+
+def signature(operation) -> str:
+    return ", ".join(["self"] + [f"{parameter.name}: {parameter.type}" for parameter in operation.parameters])
+
+def parameter_docs(operation) -> List[tuple]:
+    return [(parameter.wireName, parameter.type, parameter.description) for parameter in operation.parameters]
+
+def request(operation, asynchronous: bool, download: bool = False) -> str:
+    """the statements that build and send an API call"""
+    path = f'f"{operation.path}"' if "{" in operation.path else f'"{operation.path}"'
+    text = f"        path = {path}\n        queryParams = {{}}\n"
+    for parameter in operation.parameters:
+        if parameter.location == "query":
+            text += f"        if {parameter.name}:\n            queryParams['{parameter.wireName}'] = {parameter.name}\n"
+    body = operation.body
+    payload, upload = "None", "None"
+    if body is not None and body.location == "upload":
+        upload = body.name
+    elif body is not None and body.type.startswith("List["):
+        text += "        bodyArray = []\n        for item in body:\n            bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))\n"
+        payload = "bodyArray"
+    elif body is not None:
+        payload = "remove_empty_elements(dataclasses.asdict(body))"
+    send = "await self.client.send_request" if asynchronous else "self.client.send_request"
+    if download:
+        text += "        download = Download(target, checksum, progress)\n"
+        text += f'        result = {send}("{operation.method}", path, {payload}, queryParams, {upload}, download)\n'
+    else:
+        text += f'        result = {send}("{operation.method}", path, {payload}, queryParams, {upload})\n'
+    return text
+
+def outcome(result: str, data: str | None) -> str:
+    """the statements that return the result of an API call"""
+    text = "        if result.status_code >= 200 and result.status_code < 300:\n"
+    if data is None:
+        text += f"            data = {decoder(result)}\n"
+        data = "data"
+    text += f"            return AstroResult[{result}](None, True, False, result.status_code, {data})\n"
+    text += "        else:\n"
+    text += f"            response = AstroResult[{result}](None, False, True, result.status_code, None)\n"
+    text += "            response.load_error(result)\n"
+    text += "            return response\n"
+    return text
+
+def decoder(result: str) -> str:
+    """the expression decoding the data of a successful API call"""
+    if result.startswith("List[") and result != "List[str]":
+        return f"self.client.decode_list({result[5:-1]}, self.client.jsonCodec.loads(result.content)['data'])"
+    return f"self.client.decode({result}, self.client.jsonCodec.loads(result.content)['data'])"
+
+def method(operation, asynchronous: bool) -> str:
+    """Render an API method"""
+    text = f"    {'async def' if asynchronous else 'def'} {operation.name}({signature(operation)}) -> AstroResult[{operation.result}]:\n"
+    text += docstring(operation.description, parameter_docs(operation))
+    text += '        """\n'
+    text += request(operation, asynchronous)
+    text += outcome(operation.result, "result.content" if operation.result == "bytes" else None)
+    return text
+
+def download_method(operation, asynchronous: bool) -> str:
+    """Render the variant of a download method that streams the file to a target"""
+    text = f"    {'async def' if asynchronous else 'def'} {operation.name}_to({signature(operation)}, {DOWNLOAD_PARAMETERS}) -> AstroResult[DownloadInfo]:\n"
+    text += docstring(f"Streams the file returned by `{operation.name}` to a path, file object or function in chunks, "
+                      "so that only one chunk is held in memory at once. If the API returns an error, the target is "
+                      "left untouched and you will receive a JSON result with error information. If the download "
+                      "fails partway, a path is left as it was, but a file object or function may already have "
+                      "received part of the file.", parameter_docs(operation))
+    text += DOWNLOAD_DOCS
+    text += '        """\n'
+    text += request(operation, asynchronous, download=True)
+    text += outcome("DownloadInfo", "download.info")
+    return text
+
+def iter_method(operation, asynchronous: bool) -> str:
+    """Render the method iterating over every page of an OData query"""
+    options = [parameter for parameter in operation.parameters if parameter.wireName not in ("$top", "$skip")]
+    arguments = ", ".join(["top" if parameter.wireName == "$top" else "skip" if parameter.wireName == "$skip" else parameter.name
+                           for parameter in operation.parameters])
+    required = [f"{parameter.name}: {parameter.type}" for parameter in options if parameter.location == "path"]
+    optional = [f"{parameter.name}: {parameter.type} | None = None" for parameter in options if parameter.location != "path"]
+    item = operation.result[5:-1]
+    text = f"    def iter_{operation.name.split('_', 1)[1]}({', '.join(['self'] + required + optional)}, {PAGING_PARAMETERS}) -> {'AsyncIterator' if asynchronous else 'Iterator'}[{item}]:\n"
+    text += docstring(f"Iterate over every record that matches an [OData formatted query](https://www.odata.org/) by "
+                      f"calling `{operation.name}` one page at a time. Only one page of records is held in memory at once.",
+                      [(parameter.wireName, parameter.type, parameter.description) for parameter in options])
+    text += PAGING_DOCS
+    text += '        """\n'
+    paginate = "paginate_async" if asynchronous else "paginate"
+    text += f"        return {paginate}(lambda top, skip: self.{operation.name}({arguments}), page_size, max_items, prefetch)\n"
+    return text
@@ -1,6 +1,27 @@
 # API client
 from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
 from ProjectManagerSdk.tools import remove_empty_elements
+from ProjectManagerSdk.pagination import paginate, paginate_async
+from ProjectManagerSdk.jsoncodec import JsonCodec, OrjsonCodec, get_json_codec
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.columnar import ColumnarResult, DictionaryColumn, to_columns
+from ProjectManagerSdk.odata import ODataFilter, ODataOrderBy, compile_filter, compile_orderby, query_local
+from ProjectManagerSdk.ratelimiter import RateLimiter
+from ProjectManagerSdk.retry import RetryBudget, RetryPolicy
+from ProjectManagerSdk.circuitbreaker import CircuitBreaker
+from ProjectManagerSdk.endpoints import path_resource, path_template
+from ProjectManagerSdk.singleflight import SingleFlight
+from ProjectManagerSdk.responsecache import REFERENCE_DATA_TTLS, ResponseCache
+from ProjectManagerSdk.diskcache import DiskCache, StoredResponse
+from ProjectManagerSdk.validatorcache import REVALIDATED_ENDPOINTS, ValidatorCache
+from ProjectManagerSdk.compression import ContentDecoder, TransferMeter, TransferStats, available_encodings
+from ProjectManagerSdk.downloads import Download, DownloadInfo
+from ProjectManagerSdk.uploads import Upload
+from ProjectManagerSdk.transfers import FileDownload, FileUpload, TransferManager, TransferReport, TransferResult
+from ProjectManagerSdk.sync import SYNC_SOURCES, SyncEngine, SyncResult, SyncSource
+from ProjectManagerSdk.taskwriter import TaskWriter
+from ProjectManagerSdk.changesettracker import AsyncChangesetTracker, ChangesetTracker
 # API categories
 from ProjectManagerSdk.clients.apikeyclient import ApiKeyClient
 from ProjectManagerSdk.clients.changesetclient import ChangesetClient
@@ -65,6 +86,7 @@ from ProjectManagerSdk.models.apikeydto import ApiKeyDto
 from ProjectManagerSdk.models.assigneedto import AssigneeDto
 from ProjectManagerSdk.models.assigneeupsertdto import AssigneeUpsertDto
 from ProjectManagerSdk.models.astroerror import AstroError
+from ProjectManagerSdk.models.astroexception import AstroException
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.authenticationdto import AuthenticationDto
 from ProjectManagerSdk.models.businessroleslistdto import BusinessRolesListDto
@@ -0,0 +1,267 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+import asyncio
+import typing
+
+from ProjectManagerSdk.clientbase import ProjectManagerClientBase
+from ProjectManagerSdk.compression import ContentDecoder
+from ProjectManagerSdk.downloads import Download
+from ProjectManagerSdk.endpoints import path_template
+from ProjectManagerSdk.uploads import Upload
+
+class AsyncProjectManagerClientBase(ProjectManagerClientBase):
+    """
+    The asyncio transport shared by the generated asyncio API clients
+
+    `AsyncProjectManagerClient` is generated from the OpenAPI file and adds
+    the API categories, whose methods await `send_request`; the requests
+    themselves are sent here through a shared `httpx.AsyncClient`.
+    """
+    session: typing.Any
+
+    def _new_session(self):
+        # The httpx client is opened by the first request, inside the event loop
+        return None
+
+    def with_connection_pool(self, pool_connections: int = 10, pool_maxsize: int = 10,
+        pool_block: bool = False, keep_alive: bool = True):
+        """Configure the HTTP connection pool shared by all API calls
+
+        The pool is opened by the first request. Call this method before
+        sending any requests, or after `aclose`; a pool that is already
+        open cannot be replaced without awaiting its closure, so a
+        `ValueError` is raised instead.
+
+        Parameters
+        ----------
+        pool_connections : int
+            Accepted for compatibility with `ProjectManagerClient`; httpx
+            manages connections for all hosts in a single pool.
+        pool_maxsize : int
+            The maximum number of idle connections kept open.
+        pool_block : bool
+            If true, at most `pool_maxsize` requests are in flight at once
+            and additional requests wait for a free connection.
+        keep_alive : bool
+            If false, connections are closed after each request.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError("AsyncProjectManagerClient requires httpx; install it with `pip install ProjectManagerSdk[async]`") from e
+        if isinstance(getattr(self, "session", None), httpx.AsyncClient):
+            raise ValueError("The connection pool is already open; call with_connection_pool before sending requests, or after aclose")
+        self._limits = httpx.Limits(max_connections=pool_maxsize if pool_block else None,
+                                    max_keepalive_connections=pool_maxsize if keep_alive else 0)
+        self.session = None
+
+    def _session(self):
+        """the shared httpx client, opened on first use"""
+        if self.session is None:
+            import httpx
+            # Like the requests session of ProjectManagerClient, wait as long as the API takes
+            self.session = httpx.AsyncClient(limits=self._limits, timeout=None)
+        return self.session
+
+    async def aclose(self):
+        """Close all pooled connections held by this client
+
+        The client may still be used after calling aclose; a new pool is
+        opened by the next request.
+        """
+        session, self.session = self.session, None
+        if session is not None:
+            await session.aclose()
+
+    def close(self):
+        """Not supported; use `await client.aclose()` instead"""
+        raise TypeError("AsyncProjectManagerClient must be closed with `await client.aclose()`")
+
+    def __enter__(self):
+        raise TypeError("Use `async with` instead of `with` for an AsyncProjectManagerClient")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def send_request(self, method: str, path: str, body: object,
+        query_params: typing.Dict[str, typing.Any] | None, filename: str | Upload | None, download: Download | None = None):
+        """Send a request and parse the result
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method for this request
+        path : str
+            The path of the API endpoint for this request
+        body : object
+            For POST, PUT, or PATCH, represents the body of the request. For other
+            requests, this value should be nil.
+        query_params : object
+            The list of query parameters for the request
+        filename : str | Upload | None
+            The path of a file to upload with this request, or an `Upload`
+        download : Download | None
+            If set, the body of a successful response is written to this
+            download instead of being kept in memory
+        """
+        url = self._build_url(path, query_params)
+
+        upload = self._build_upload(filename)
+        headers = self._build_headers()
+        data = self._build_body(body, headers)
+        if upload is not None:
+            headers.update(upload.headers)
+        cache = self.responseCache
+        if method != "GET" or download is not None:
+            try:
+                return await self._send(method, path, url, headers, data, upload, download)
+            finally:
+                if method != "GET":
+                    await self._invalidate(path)
+        key = (url, headers.get("Authorization"))
+        if cache is not None:
+            response = cache.get(key, path)
+            if response is not None:
+                self._track_reuse(response)
+                return response
+            generation = cache.generation
+        if self.singleFlight is not None:
+            # Identical reads in flight at the same time share one response
+            response = await self.singleFlight.do_async(key, lambda: self._fetch(method, path, url, headers, data, upload, download))
+        else:
+            response = await self._fetch(method, path, url, headers, data, upload, download)
+        if cache is not None:
+            cache.put(key, path, response, generation)
+        self._track_reuse(response)
+        return response
+
+    async def _invalidate(self, path: str):
+        if self.responseCache is not None:
+            self.responseCache.invalidate(path)
+        if self.diskCache is not None:
+            await asyncio.to_thread(self.diskCache.invalidate, path)
+
+    async def _fetch(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None):
+        """sends a GET call, or answers it from the disk cache without blocking the event loop"""
+        disk = self.diskCache
+        if disk is None:
+            return await self._revalidate(method, path, url, headers, data, upload, download)
+        identity = headers.get("Authorization")
+        stored = await asyncio.to_thread(disk.get, method, url, identity, path)
+        if stored is not None:
+            return self._make_response(url, stored.status, stored.headers, stored.body)
+        generation = await asyncio.to_thread(lambda: disk.generation)
+        response = await self._revalidate(method, path, url, headers, data, upload, download)
+        await asyncio.to_thread(disk.put, method, url, identity, path, response.status_code, response.headers, response.content, generation)
+        return response
+
+    async def _revalidate(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None):
+        """sends a GET call with the validators of its previous response, if any"""
+        validators = self.validatorCache
+        if validators is None or not validators.cacheable(path):
+            return await self._send(method, path, url, headers, data, upload, download)
+        key = (url, headers.get("Authorization"))
+        entry = validators.get(key)
+        if entry is not None:
+            headers = {**headers, **entry.conditions}
+        response = await self._send(method, path, url, headers, data, upload, download)
+        return self._validated_response(validators, key, entry, url, response)
+
+    async def _send(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None):
+        """sends a request, retrying it as configured"""
+        import httpx
+        endpoint = path_template(path) if self.circuitBreaker is not None else path
+        if self.retryPolicy is not None:
+            self.retryPolicy.budget.deposit()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if self.circuitBreaker is not None and not self.circuitBreaker.allow(endpoint):
+                    return self._rejected_response(url, endpoint)
+                if self.rateLimiter is not None:
+                    delay = self.rateLimiter.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                try:
+                    session = self._session()
+                    request = session.build_request(method, url, headers=headers, content=data if upload is None else aiter(upload))
+                    response = await self._read_body(method, path, await session.send(request, stream=True), download)
+                except httpx.TransportError:
+                    delay = self._resend_delay(method, endpoint, attempt, None, None, upload)
+                    if delay is None:
+                        raise
+                except BaseException:
+                    # Includes cancellation of the awaiting task
+                    self._abandon(endpoint)
+                    raise
+                else:
+                    delay = self._resend_delay(method, endpoint, attempt, response.status_code, response.headers, upload)
+                    if delay is None:
+                        return response
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            if upload is not None:
+                upload.close()
+
+    async def _read_body(self, method: str, path: str, response, download: Download | None = None):
+        """receives and decodes the body of a streamed response, writing successful downloads to their target"""
+        encoding = response.headers.get("Content-Encoding")
+        # The target of a download may be a file or function of the caller, so it is written in a worker thread
+        download = await asyncio.to_thread(self._begin_download, response, download)
+        parts: typing.List[bytes] = []
+
+        async def write(chunk: bytes):
+            if download is None:
+                parts.append(chunk)
+            elif chunk:
+                await asyncio.to_thread(download.write, chunk)
+        try:
+            if hasattr(response, "_content"):
+                # The transport has already read the body
+                decoder = ContentDecoder(None)
+                await write(decoder.decompress(response.content))
+            else:
+                decoder = ContentDecoder(encoding)
+                try:
+                    async for chunk in response.aiter_raw():
+                        await write(decoder.decompress(chunk))
+                    await write(decoder.flush())
+                finally:
+                    await response.aclose()
+                response._content = b"".join(parts)
+            if download is not None:
+                await asyncio.to_thread(download.finish)
+        except BaseException:
+            if download is not None:
+                download.abort()
+            raise
+        self._record_transfer(method, path, response.status_code, encoding, decoder,
+                              download.info.size if download is not None else len(response.content))
+        return response
+
+    def _make_response(self, url: str, status_code: int, headers, content: bytes):
+        import httpx
+        response = httpx.Response(status_code, headers=headers, content=content)
+        # httpx copies the body; keep the original so that a CachedContent keeps its decoded results
+        response._content = content
+        return response
+
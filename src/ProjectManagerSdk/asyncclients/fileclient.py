@@ -0,0 +1,228 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.updaterequestdto import UpdateRequestDto
+from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget
+from typing import Any, Callable, List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncFileClient:
+    """
+    API methods related to File, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def download_file(self, documentId: str, type: str) -> AstroResult[bytes]:
+        """
+        Downloads the contents of a file that was previously uploaded to
+        ProjectManager.com. ProjectManager allows you to store Files
+        connected to other elements of your Workspace such as a Project,
+        a Task, or Home. Files are maintained separately based on the
+        location where the file was stored. When you upload a File,
+        please allow a few moments for the File to be processed and
+        verified. ProjectManager may reject File uploads that contain
+        problems such as malware. Once a File has completed the upload
+        the process, you may retrieve it using the DownloadFile API. If
+        successful, this API returns the file contents as an
+        octet-stream (raw bytes). If an error occurs, you will receive a
+        JSON result with error information.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document to download
+        type : str
+            If you specify a type of `html`, processes the file using
+            text encoding, otherwise binary
+        """
+        path = f"/api/data/files/{documentId}/download"
+        queryParams = {}
+        if type:
+            queryParams['type'] = type
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[bytes](None, True, False, result.status_code, result.content)
+        else:
+            response = AstroResult[bytes](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def download_file_to(self, documentId: str, type: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_file` to a path, file
+        object or function in chunks, so that only one chunk is held in
+        memory at once. If the API returns an error, the target is left
+        untouched and you will receive a JSON result with error
+        information. If the download fails partway, a path is left as it
+        was, but a file object or function may already have received
+        part of the file.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document to download
+        type : str
+            If you specify a type of `html`, processes the file using
+            text encoding, otherwise binary
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/files/{documentId}/download"
+        queryParams = {}
+        if type:
+            queryParams['type'] = type
+        download = Download(target, checksum, progress)
+        result = await self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def download_a_thumbnail_image(self, documentId: str) -> AstroResult[bytes]:
+        """
+        Downloads a thumbnail image associated with a document that was
+        previously uploaded to ProjectManager.com. ProjectManager allows
+        you to store files linked to various elements within your
+        Workspace, such as Projects, Tasks, or your Home. Files are
+        organized based on their storage location. When uploading a
+        file, please allow some time for the file to undergo processing
+        and verification. ProjectManager may reject file uploads
+        containing issues such as malware. Once a file has completed the
+        upload process, you can retrieve its associated thumbnail using
+        the DownloadThumbnail API. If successful, this API returns the
+        file contents as an octet-stream (raw bytes). If an error
+        occurs, you will receive a JSON result with error information.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document for which to download
+            the thumbnail.
+        """
+        path = f"/api/data/files/{documentId}/thumbnail"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[bytes](None, True, False, result.status_code, result.content)
+        else:
+            response = AstroResult[bytes](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def download_a_thumbnail_image_to(self, documentId: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_a_thumbnail_image` to a
+        path, file object or function in chunks, so that only one chunk
+        is held in memory at once. If the API returns an error, the
+        target is left untouched and you will receive a JSON result with
+        error information. If the download fails partway, a path is left
+        as it was, but a file object or function may already have
+        received part of the file.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document for which to download
+            the thumbnail.
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/files/{documentId}/thumbnail"
+        queryParams = {}
+        download = Download(target, checksum, progress)
+        result = await self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_file(self, fileId: str, body: UpdateRequestDto) -> AstroResult[object]:
+        """
+        Updates information about a File uploaded to your Workspace.
+        ProjectManager allows you to store Files connected to other
+        elements of your Workspace such as a Project, a Task, or Home.
+        Files are maintained separately based on the location where the
+        file was stored. When you upload a File, please allow a few
+        moments for the File to be processed and verified.
+        ProjectManager may reject File uploads that contain problems
+        such as malware. Once a File has completed the upload the
+        process, you may retrieve it using the DownloadFile API. This
+        API returns a JSON response indicating success or failure.
+
+        Parameters
+        ----------
+        fileId : str
+            The unique identifier of the File to update
+        body : UpdateRequestDto
+            Information to change about the File and its location
+        """
+        path = f"/api/data/files/{fileId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_file(self, fileId: str, hard: bool) -> AstroResult[object]:
+        """
+        In case of soft delete moves file to trash folder. For hard
+        delete completely deletes file's metadata from pm database as
+        well as from amazon storage This API returns a JSON response
+        indicating success or failure.
+
+        Parameters
+        ----------
+        fileId : str
+            The unique identifier of the File to delete
+        hard : bool
+            Param indicates that file should be hard deleted
+        """
+        path = f"/api/data/files/{fileId}"
+        queryParams = {}
+        if hard:
+            queryParams['hard'] = hard
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,225 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.countryholidaydto import CountryHolidayDto
+from ProjectManagerSdk.models.globalholidaydto import GlobalHolidayDto
+from ProjectManagerSdk.models.resourceholidaydto import ResourceHolidayDto
+from typing import AsyncIterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate_async
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncHolidayClient:
+    """
+    API methods related to Holiday, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def query_resource_holidays(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[ResourceHolidayDto]]:
+        """
+        Retrieve a list of resource holidays that match an [OData
+        formatted query](https://www.odata.org/).
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/holidays/resource"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ResourceHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ResourceHolidayDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ResourceHolidayDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_resource_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[ResourceHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_resource_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.query_resource_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def query_country_holidays(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[CountryHolidayDto]]:
+        """
+        Retrieve a list of country holidays that match an [OData
+        formatted query](https://www.odata.org/).
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/holidays/country"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(CountryHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[CountryHolidayDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[CountryHolidayDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_country_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[CountryHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_country_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.query_country_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def query_global_holidays(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[GlobalHolidayDto]]:
+        """
+        Retrieve a list of global holidays that match an [OData
+        formatted query](https://www.odata.org/).
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/holidays/global"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(GlobalHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[GlobalHolidayDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[GlobalHolidayDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_global_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[GlobalHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_global_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.query_global_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
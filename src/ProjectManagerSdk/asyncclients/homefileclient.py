@@ -0,0 +1,92 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.filedto import FileDto
+from ProjectManagerSdk.uploads import Upload
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncHomeFileClient:
+    """
+    API methods related to HomeFile, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def upload_home_file(self, fileName: str | Upload) -> AstroResult[FileDto]:
+        """
+        Uploads a file to the My Files folder on your Home Files page.
+        ProjectManager allows you to store Files connected to other
+        elements of your Workspace such as a Project, a Task, or Home.
+        Files are maintained separately based on the location where the
+        file was stored. When you upload a File, please allow a few
+        moments for the File to be processed and verified.
+        ProjectManager may reject File uploads that contain problems
+        such as malware. Once a File has completed the upload the
+        process, you may retrieve it using the DownloadFile API. This
+        API returns a JSON response indicating success or failure.
+
+        Parameters
+        ----------
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
+        """
+        path = "/api/data/home/files"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, fileName)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[FileDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[FileDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def upload_home_file_to_folder(self, folderId: str, fileName: str | Upload) -> AstroResult[FileDto]:
+        """
+        Uploads a file to a specific folder on your Home Files page.
+        ProjectManager allows you to store Files connected to other
+        elements of your Workspace such as a Project, a Task, or Home.
+        Files are maintained separately based on the location where the
+        file was stored. You can organize your files in the Home Files
+        and Project Files pages by adding folders. When you upload a
+        File, please allow a few moments for the File to be processed
+        and verified. ProjectManager may reject File uploads that
+        contain problems such as malware. Once a File has completed the
+        upload the process, you may retrieve it using the DownloadFile
+        API. This API returns a JSON response indicating success or
+        failure.
+
+        Parameters
+        ----------
+        folderId : str
+            The reference to the sub folder to put the file into
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
+        """
+        path = f"/api/data/home/folders/{folderId}/files"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, fileName)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[FileDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[FileDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
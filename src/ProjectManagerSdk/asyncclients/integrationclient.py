@@ -0,0 +1,117 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.integrationdto import IntegrationDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncIntegrationClient:
+    """
+    API methods related to Integration, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_integration(self, integrationId: str) -> AstroResult[IntegrationDto]:
+        """
+        Retrieves an Integration specified by a unique identifier. The
+        Integrations API is intended for use by ProjectManager and its
+        business development partners. Please contact ProjectManager's
+        sales team to request use of this API.
+
+        Parameters
+        ----------
+        integrationId : str
+            The unique identifier of this Integration
+        """
+        path = f"/api/data/integrations/{integrationId}"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[IntegrationDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[IntegrationDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def enable_integration(self, integrationId: str) -> AstroResult[IntegrationDto]:
+        """
+        Enable a specific Integration for the current Workspace. The
+        Integrations API is intended for use by ProjectManager and its
+        business development partners. Please contact ProjectManager's
+        sales team to request use of this API.
+
+        Parameters
+        ----------
+        integrationId : str
+            The unique identifier of the Integration to enable
+        """
+        path = f"/api/data/integrations/{integrationId}"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[IntegrationDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[IntegrationDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def disable_integration(self, integrationId: str) -> AstroResult[object]:
+        """
+        Disable a specific Integration for the current Workspace. The
+        Integrations API is intended for use by ProjectManager and its
+        business development partners. Please contact ProjectManager's
+        sales team to request use of this API.
+
+        Parameters
+        ----------
+        integrationId : str
+            The unique identifier of the Integration to disable
+        """
+        path = f"/api/data/integrations/{integrationId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def retrieve_all_integrations(self) -> AstroResult[List[IntegrationDto]]:
+        """
+        Retrieves all Integrations for the current Workspace. The
+        Integrations API is intended for use by ProjectManager and its
+        business development partners. Please contact ProjectManager's
+        sales team to request use of this API.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/integrations"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[IntegrationDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[IntegrationDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,92 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.workspaceuserinfodto import WorkSpaceUserInfoDto
+from ProjectManagerSdk.uploads import Upload
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncMeClient:
+    """
+    API methods related to Me, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_me(self) -> AstroResult[WorkSpaceUserInfoDto]:
+        """
+        Retrieve information about the currently logged on user. This
+        API call will always succeed with a 200 OK if called with valid
+        authentication information. If the authentication information
+        provided is not valid, calling this API will return a 401
+        Authentication Failed error message. If successful, this API
+        returns information about the user including its home URL, email
+        address, user name, and workspace name.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/me"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(WorkSpaceUserInfoDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[WorkSpaceUserInfoDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[WorkSpaceUserInfoDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def remove_my_avatar(self) -> AstroResult[object]:
+        """
+        Removes the logged in user's custom avatar so the default
+        initials are shown.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/me/avatar"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_my_avatar(self, fileName: str | Upload) -> AstroResult[object]:
+        """
+        Updates the logged in user avatar
+
+        Parameters
+        ----------
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
+        """
+        path = "/api/data/me/avatar"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, fileName)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
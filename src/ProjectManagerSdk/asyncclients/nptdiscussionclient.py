@@ -0,0 +1,136 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.discussioncommentcreatedto import DiscussionCommentCreateDto
+from ProjectManagerSdk.models.discussioncommentcreateresponsedto import DiscussionCommentCreateResponseDto
+from ProjectManagerSdk.models.discussioncommentdto import DiscussionCommentDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncNptDiscussionClient:
+    """
+    API methods related to NptDiscussion, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_npt_comments(self, nptId: str) -> AstroResult[List[DiscussionCommentDto]]:
+        """
+        Retrieve all comments written about a Npt
+
+        Parameters
+        ----------
+        nptId : str
+            The unique ID number of the Npt to retrieve comments
+        """
+        path = f"/api/data/non-project-tasks/{nptId}/comments"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(DiscussionCommentDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[DiscussionCommentDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[DiscussionCommentDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_npt_comments(self, nptId: str, body: DiscussionCommentCreateDto) -> AstroResult[DiscussionCommentCreateResponseDto]:
+        """
+        Adds a Markdown-formatted comment to a Npt. Npts can have
+        discussions attached to them. These discussions can include text
+        with simple formatting. Discussion comments are formatted using
+        [Markdown](https://www.markdownguide.org/) and users should be
+        aware that HTML embedding is not permitted due to the risk of
+        cross-site attacks and other embedding challenges.
+
+        Parameters
+        ----------
+        nptId : str
+            The unique ID number of the Npt being commented upon
+        body : DiscussionCommentCreateDto
+            The Markdown-formatted text of the comment
+        """
+        path = f"/api/data/non-project-tasks/{nptId}/comments"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(DiscussionCommentCreateResponseDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[DiscussionCommentCreateResponseDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[DiscussionCommentCreateResponseDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def like_a_comment(self, commentId: str) -> AstroResult[object]:
+        """
+        Puts a thumbsup on a comment
+
+        Parameters
+        ----------
+        commentId : str
+            the id of the comment
+        """
+        path = f"/api/data/non-project-tasks/comments/{commentId}/like"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def removes_a_thumbsup_from_a_comment(self, commentId: str) -> AstroResult[object]:
+        """
+        Unlike a comment that was previously liked
+
+        Parameters
+        ----------
+        commentId : str
+            the id of the comment
+        """
+        path = f"/api/data/non-project-tasks/comments/{commentId}/like"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def remove_a_comment(self, commentId: str) -> AstroResult[object]:
+        """
+        Removes a comment by it's id
+
+        Parameters
+        ----------
+        commentId : str
+            Remove a comment
+        """
+        path = f"/api/data/non-project-tasks/comments/{commentId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
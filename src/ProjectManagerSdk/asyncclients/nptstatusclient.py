@@ -0,0 +1,112 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.nptstatuscreatedto import NptStatusCreateDto
+from ProjectManagerSdk.models.nptstatusdto import NptStatusDto
+from ProjectManagerSdk.models.nptstatusupdatedto import NptStatusUpdateDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncNptStatusClient:
+    """
+    API methods related to NptStatus, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def get_npt_task_statuses(self) -> AstroResult[List[NptStatusDto]]:
+        """
+        Get a list of task statuses that can be used by non-protect
+        tasks.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/non-project-tasks/statuses"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[NptStatusDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[NptStatusDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_npt_task_status(self, body: NptStatusCreateDto) -> AstroResult[NptStatusDto]:
+        """
+        Creates a new status level for non-project tasks.
+
+        Parameters
+        ----------
+        body : NptStatusCreateDto
+            Information about the new status level to create
+        """
+        path = "/api/data/non-project-tasks/statuses"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[NptStatusDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[NptStatusDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_npt_task_status(self, nptStatusId: str, body: NptStatusUpdateDto) -> AstroResult[NptStatusDto]:
+        """
+        Updates an existing status level for non-project tasks.
+
+        Parameters
+        ----------
+        nptStatusId : str
+            The unique identifier of the status to update
+        body : NptStatusUpdateDto
+            Information about the status level to update
+        """
+        path = f"/api/data/non-project-tasks/statuses/{nptStatusId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[NptStatusDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[NptStatusDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_npt_task_status(self, nptStatusId: str) -> AstroResult[object]:
+        """
+        Deletes an existing status level for non-project tasks. You will
+        not be able to delete a status if there are tasks assigned to it
+        or if it is the default status level.
+
+        Parameters
+        ----------
+        nptStatusId : str
+            The unique identifier of the status to delete
+        """
+        path = f"/api/data/non-project-tasks/statuses/{nptStatusId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,113 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.projectchargecodecreatedto import ProjectChargeCodeCreateDto
+from ProjectManagerSdk.models.projectchargecodedto import ProjectChargeCodeDto
+from ProjectManagerSdk.models.projectchargecodeupdatedto import ProjectChargeCodeUpdateDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncProjectChargeCodeClient:
+    """
+    API methods related to ProjectChargeCode, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_charge_codes(self) -> AstroResult[List[ProjectChargeCodeDto]]:
+        """
+        Retrieve all defined ChargeCodes that can be used when creating
+        Projects. A ChargeCode is a code used to identify costs within
+        your Projects. Each ChargeCode has a name and a unique
+        identifier. ChargeCodes are defined per Workspace and are shared
+        among Projects.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/projects/chargecodes"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ProjectChargeCodeDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ProjectChargeCodeDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_project_charge_code(self, body: ProjectChargeCodeCreateDto) -> AstroResult[ProjectChargeCodeDto]:
+        """
+        Create a project charge code
+
+        Parameters
+        ----------
+        body : ProjectChargeCodeCreateDto
+            The data to create the charge code
+        """
+        path = "/api/data/projects/chargecodes"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectChargeCodeDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectChargeCodeDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_project_charge_code(self, chargeCodeId: str, body: ProjectChargeCodeUpdateDto) -> AstroResult[ProjectChargeCodeDto]:
+        """
+        Update a project charge code
+
+        Parameters
+        ----------
+        chargeCodeId : str
+            The id of the charge code
+        body : ProjectChargeCodeUpdateDto
+            The data to update the charge code
+        """
+        path = f"/api/data/projects/chargecodes/{chargeCodeId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectChargeCodeDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectChargeCodeDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_project_charge_code(self, chargeCodeId: str) -> AstroResult[object]:
+        """
+        Delete a project charge code
+
+        Parameters
+        ----------
+        chargeCodeId : str
+            The id of the charge code
+        """
+        path = f"/api/data/projects/chargecodes/{chargeCodeId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
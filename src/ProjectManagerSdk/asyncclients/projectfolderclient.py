@@ -0,0 +1,111 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.projectfoldercreatedto import ProjectFolderCreateDto
+from ProjectManagerSdk.models.projectfolderdto import ProjectFolderDto
+from ProjectManagerSdk.models.projectfolderupdatedto import ProjectFolderUpdateDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncProjectFolderClient:
+    """
+    API methods related to ProjectFolder, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_project_folders(self) -> AstroResult[List[ProjectFolderDto]]:
+        """
+        Retrieves all ProjectFolders defined within your Workspace. A
+        ProjectFolder is a named storage location that can contain
+        Projects.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/project-folders"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ProjectFolderDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ProjectFolderDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_project_folder(self, body: ProjectFolderCreateDto) -> AstroResult[ProjectFolderDto]:
+        """
+        Create a project folder
+
+        Parameters
+        ----------
+        body : ProjectFolderCreateDto
+            The data to create the folder
+        """
+        path = "/api/data/project-folders"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectFolderDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectFolderDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_project_folder(self, projectFolderId: str, body: ProjectFolderUpdateDto) -> AstroResult[ProjectFolderDto]:
+        """
+        Update a project folder
+
+        Parameters
+        ----------
+        projectFolderId : str
+            The id of the folder
+        body : ProjectFolderUpdateDto
+            The data to update the folder
+        """
+        path = f"/api/data/project-folders/{projectFolderId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectFolderDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectFolderDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_project_folder(self, projectFolderId: str) -> AstroResult[object]:
+        """
+        Delete a project folder
+
+        Parameters
+        ----------
+        projectFolderId : str
+            The id of the folder
+        """
+        path = f"/api/data/project-folders/{projectFolderId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
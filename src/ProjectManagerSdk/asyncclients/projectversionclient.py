@@ -0,0 +1,158 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.projectrestoreprojectdto import ProjectRestoreProjectDto
+from ProjectManagerSdk.models.projectversiondto import ProjectVersionDto
+from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget
+from typing import Any, Callable, List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncProjectVersionClient:
+    """
+    API methods related to ProjectVersion, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_project_versions(self, projectId: str) -> AstroResult[List[ProjectVersionDto]]:
+        """
+        Returns projects versions including version, user who made
+        changes
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project
+        """
+        path = f"/api/data/projects/{projectId}/versions"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ProjectVersionDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ProjectVersionDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ProjectVersionDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def download_msproject_xml(self, projectChangeId: str) -> AstroResult[bytes]:
+        """
+        Exports and returns project version as an MS Project XML
+        attachment
+
+        Parameters
+        ----------
+        projectChangeId : str
+            Project change Guid
+        """
+        path = f"/api/data/projects/{projectChangeId}/version/download"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[bytes](None, True, False, result.status_code, result.content)
+        else:
+            response = AstroResult[bytes](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def download_msproject_xml_to(self, projectChangeId: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_msproject_xml` to a path,
+        file object or function in chunks, so that only one chunk is
+        held in memory at once. If the API returns an error, the target
+        is left untouched and you will receive a JSON result with error
+        information. If the download fails partway, a path is left as it
+        was, but a file object or function may already have received
+        part of the file.
+
+        Parameters
+        ----------
+        projectChangeId : str
+            Project change Guid
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/projects/{projectChangeId}/version/download"
+        queryParams = {}
+        download = Download(target, checksum, progress)
+        result = await self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def restore_project_version(self, projectId: str, version: int) -> AstroResult[ProjectRestoreProjectDto]:
+        """
+        Restores a Project to the state it was in at a specific Version
+        in time. If successful, all changes made to the Project since
+        this Version will be undone and the Project will return to its
+        former state.
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project to restore
+        version : int
+            The version number to restore to
+        """
+        path = f"/api/data/projects/{projectId}/version/{version}/restore"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectRestoreProjectDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectRestoreProjectDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectRestoreProjectDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def copy_project_version(self, projectId: str, version: int, timezoneOffset: int) -> AstroResult[ProjectRestoreProjectDto]:
+        """
+        Create a Copy of a Project as of a specific Version, optionally
+        moving it to a new Timezone.
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project to copy
+        version : int
+            The version number of the Project to copy
+        timezoneOffset : int
+            If specified, sets the default timezone of the newly copied
+            Project to this specified timezone
+        """
+        path = f"/api/data/projects/{projectId}/version/{version}/copy"
+        queryParams = {}
+        if timezoneOffset:
+            queryParams['timezoneOffset'] = timezoneOffset
+        result = await self.client.send_request("POST", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ProjectRestoreProjectDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ProjectRestoreProjectDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ProjectRestoreProjectDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,282 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.resourcecreatedto import ResourceCreateDto
+from ProjectManagerSdk.models.resourcedto import ResourceDto
+from ProjectManagerSdk.models.resourcescreatedto import ResourcesCreateDto
+from ProjectManagerSdk.models.resourcesdto import ResourcesDto
+from ProjectManagerSdk.models.resourceupdatedto import ResourceUpdateDto
+from typing import AsyncIterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate_async
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncResourceClient:
+    """
+    API methods related to Resource, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def create_resource(self, body: ResourceCreateDto) -> AstroResult[ResourceDto]:
+        """
+        Create a new Resource within your Workspace. A Resource
+        represents a person, material, or tool that is used within your
+        Projects. When you attach a Resources to more than one Task, the
+        software will schedule the usage of your Resource so that it is
+        not allocated to more than one Task at the same time. The users
+        in your Workspace are also considered Resources. To invite a new
+        User to your Workspace, create a new Resource for that user.
+
+        Parameters
+        ----------
+        body : ResourceCreateDto
+            The details for the new Resource to create
+        """
+        path = "/api/data/resources"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def query_resources(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[ResourceDto]]:
+        """
+        Retrieve a list of Resources that match an [OData formatted
+        query](https://www.odata.org/). A Resource represents a person,
+        material, or tool that is used within your Projects. When you
+        attach a Resources to more than one Task, the software will
+        schedule the usage of your Resource so that it is not allocated
+        to more than one Task at the same time. The users in your
+        Workspace are also considered Resources. To invite a new User to
+        your Workspace, create a new Resource for that user.
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/resources"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ResourceDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ResourceDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_resources(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[ResourceDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_resources` one
+        page at a time. Only one page of records is held in memory at
+        once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.query_resources(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def update_resource(self, resourceId: str, body: ResourceUpdateDto) -> AstroResult[ResourceDto]:
+        """
+        Updates an existing Resource based on information you provide. A
+        Resource represents a person, material, or tool that is used
+        within your Projects. When you attach a Resources to more than
+        one Task, the software will schedule the usage of your Resource
+        so that it is not allocated to more than one Task at the same
+        time. The users in your Workspace are also considered Resources.
+        To invite a new User to your Workspace, create a new Resource
+        for that user.
+
+        Parameters
+        ----------
+        resourceId : str
+            The id of the resource
+        body : ResourceUpdateDto
+            The information to update the resource
+        """
+        path = f"/api/data/resources/{resourceId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def retrieve_resource(self, resourceId: str) -> AstroResult[ResourceDto]:
+        """
+        Retrieve the Resource matching the specified unique ID. A
+        Resource represents a person, material, or tool that is used
+        within your Projects. When you attach a Resources to more than
+        one Task, the software will schedule the usage of your Resource
+        so that it is not allocated to more than one Task at the same
+        time. The users in your Workspace are also considered Resources.
+        To invite a new User to your Workspace, create a new Resource
+        for that user.
+
+        Parameters
+        ----------
+        resourceId : str
+            The id of the Resource
+        """
+        path = f"/api/data/resources/{resourceId}"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_resource(self, resourceId: str) -> AstroResult[ResourceDto]:
+        """
+        Deletes an existing Resource based on information you provide. A
+        Resource represents a person, material, or tool used within your
+        Projects. When you attach a Resources to more than one Task, the
+        software will schedule the usage of your Resource so that it is
+        not allocated to more than one Task at the same time. The users
+        in your Workspace are also considered Resources. To invite a new
+        User to your Workspace, create a new Resource for that user.
+
+        Parameters
+        ----------
+        resourceId : str
+            The id of the resource
+        """
+        path = f"/api/data/resources/{resourceId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_many_resources(self, body: ResourcesCreateDto) -> AstroResult[ResourcesDto]:
+        """
+        Create new Resources within your Workspace. A Resource
+        represents a person, material, or tool that is used within your
+        Projects. When you attach a Resources to more than one Task, the
+        software will schedule the usage of your Resource so that it is
+        not allocated to more than one Task at the same time. The users
+        in your Workspace are also considered Resources. To invite a new
+        User to your Workspace, create a new Resource for that user.
+
+        Parameters
+        ----------
+        body : ResourcesCreateDto
+            The details for the new Resources to create
+        """
+        path = "/api/data/resources/bulk"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourcesDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourcesDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourcesDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def resend_invite_email(self, resourceId: str) -> AstroResult[object]:
+        """
+        Resend Invite Email to a Resource within your Workspace. When
+        you create a Resource that is a person, ProjectManager sends
+        that person an email inviting them to join your Workspace. If
+        that email is accidentally deleted or sent to a spam folder, you
+        can request this email be sent again using this API.
+
+        Parameters
+        ----------
+        resourceId : str
+            The unique identifier of the Resource to send an invitation
+            email
+        """
+        path = f"/api/data/resources/{resourceId}/resendinvite"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def get_resource_avatar(self, resourceId: str) -> AstroResult[object]:
+        """
+        Get Resource Avatar
+
+        Parameters
+        ----------
+        resourceId : str
+            The id of the resource
+        """
+        path = f"/api/data/resources/{resourceId}/avatar"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,163 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.createresourceskilldto import CreateResourceSkillDto
+from ProjectManagerSdk.models.resourceskilldto import ResourceSkillDto
+from ProjectManagerSdk.models.updateresourceskilldto import UpdateResourceSkillDto
+from typing import AsyncIterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate_async
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncResourceSkillClient:
+    """
+    API methods related to ResourceSkill, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_resource_skills(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[ResourceSkillDto]]:
+        """
+        Retrieves all ResourceSkills defined within your Workspace. A
+        ResourceSkill is a capability possessed by a Resource that can
+        be used to distinguish different classes of Resources suitable
+        for use by a Task. You can specify that a Task requires a
+        Resource with a particular set of ResourceSkills and then
+        allocate Resources based on whether or not they have the
+        suitable ResourceSkills.
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/resources/skills"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ResourceSkillDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ResourceSkillDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ResourceSkillDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_resource_skills(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[ResourceSkillDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `retrieve_resource_skills` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.retrieve_resource_skills(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def create_resource_skill(self, body: CreateResourceSkillDto) -> AstroResult[ResourceSkillDto]:
+        """
+        Create a Resource Skill.
+
+        Parameters
+        ----------
+        body : CreateResourceSkillDto
+            The name of the skill to create.
+        """
+        path = "/api/data/resources/skills"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceSkillDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceSkillDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceSkillDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_resource_skill(self, resourceSkillId: str, body: UpdateResourceSkillDto) -> AstroResult[ResourceSkillDto]:
+        """
+        Update a Resource Skill.
+
+        Parameters
+        ----------
+        resourceSkillId : str
+            The id of the skill to update.
+        body : UpdateResourceSkillDto
+            The data of the skill to update.
+        """
+        path = f"/api/data/resources/skills/{resourceSkillId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceSkillDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceSkillDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceSkillDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_resource_skill(self, resourceSkillId: str) -> AstroResult[object]:
+        """
+        The endpoint is used to delete a resource skill. Users assigned
+        to this skill will no longer be assigned thereafter.
+
+        Parameters
+        ----------
+        resourceSkillId : str
+            The Id of the skill to be removed.
+        """
+        path = f"/api/data/resources/skills/{resourceSkillId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
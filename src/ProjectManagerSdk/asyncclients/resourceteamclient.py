@@ -0,0 +1,162 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.createresourceteamdto import CreateResourceTeamDto
+from ProjectManagerSdk.models.resourceteamdto import ResourceTeamDto
+from ProjectManagerSdk.models.updateresourceteamdto import UpdateResourceTeamDto
+from typing import AsyncIterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate_async
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncResourceTeamClient:
+    """
+    API methods related to ResourceTeam, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_resource_teams(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[ResourceTeamDto]]:
+        """
+        Retrieves all ResourceTeams defined within your Workspace that
+        match an [OData formatted query](https://www.odata.org/). A
+        ResourceTeam is a grouping of Resources that allows you to keep
+        track of assignments in a manner consistent with your business
+        needs. You can assign Resources to be members of zero, one, or
+        many ResourceTeams.
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/resources/teams"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[ResourceTeamDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[ResourceTeamDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_resource_teams(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[ResourceTeamDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `retrieve_resource_teams` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.retrieve_resource_teams(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def create_resource_team(self, body: CreateResourceTeamDto) -> AstroResult[ResourceTeamDto]:
+        """
+        Create a Resource Team.
+
+        Parameters
+        ----------
+        body : CreateResourceTeamDto
+            The name of the team to create.
+        """
+        path = "/api/data/resources/teams"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceTeamDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceTeamDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_resource_team(self, resourceTeamId: str) -> AstroResult[object]:
+        """
+        The endpoint is used to delete a resource team. Users assigned
+        to this team will no longer be assigned thereafter.
+
+        Parameters
+        ----------
+        resourceTeamId : str
+            The Id of the team to be removed.
+        """
+        path = f"/api/data/resources/teams/{resourceTeamId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_resource_team(self, resourceTeamId: str, body: UpdateResourceTeamDto) -> AstroResult[ResourceTeamDto]:
+        """
+        Update a Resource Team.
+
+        Parameters
+        ----------
+        resourceTeamId : str
+            The id of the resource team
+        body : UpdateResourceTeamDto
+            The name of the team to Update.
+        """
+        path = f"/api/data/resources/teams/{resourceTeamId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[ResourceTeamDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[ResourceTeamDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
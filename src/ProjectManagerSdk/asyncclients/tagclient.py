@@ -0,0 +1,164 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.tagcreatedto import TagCreateDto
+from ProjectManagerSdk.models.tagdto import TagDto
+from ProjectManagerSdk.models.tagupdatedto import TagUpdateDto
+from typing import AsyncIterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate_async
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncTagClient:
+    """
+    API methods related to Tag, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def query_tags(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[TagDto]]:
+        """
+        Retrieve a list of Tags that match an [OData formatted
+        query](https://www.odata.org/). A Tag is a named categorization
+        you can use to distinguish objects from each other. Tags each
+        have a unique identifier, a name, and a color.
+
+        Parameters
+        ----------
+        $top : int
+            The number of records to return
+        $skip : int
+            Skips the given number of records and then returns $top
+            records
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        """
+        path = "/api/data/tags"
+        queryParams = {}
+        if top:
+            queryParams['$top'] = top
+        if skip:
+            queryParams['$skip'] = skip
+        if filter:
+            queryParams['$filter'] = filter
+        if orderby:
+            queryParams['$orderby'] = orderby
+        if expand:
+            queryParams['$expand'] = expand
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(TagDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[TagDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[TagDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    def iter_tags(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[TagDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_tags` one page
+        at a time. Only one page of records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate_async(lambda top, skip: self.query_tags(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
+    async def create_tag(self, body: TagCreateDto) -> AstroResult[TagDto]:
+        """
+        Creates a new Tag based on information you provide. A Tag is a
+        named categorization you can use to distinguish objects from
+        each other. Tags each have a unique identifier, a name, and a
+        color.
+
+        Parameters
+        ----------
+        body : TagCreateDto
+            The information for the new Tag to create
+        """
+        path = "/api/data/tags"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(TagDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[TagDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[TagDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_tag(self, tagId: str, body: TagUpdateDto) -> AstroResult[TagDto]:
+        """
+        Updates an existing Tag based on information you provide. A Tag
+        is a named categorization you can use to distinguish objects
+        from each other. Tags each have a unique identifier, a name, and
+        a color.
+
+        Parameters
+        ----------
+        tagId : str
+            The id of the tag
+        body : TagUpdateDto
+            The information to update the tag
+        """
+        path = f"/api/data/tags/{tagId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(TagDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[TagDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[TagDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_tag(self, tagId: str) -> AstroResult[object]:
+        """
+        Permanently removes the specified Tag.
+
+        Parameters
+        ----------
+        tagId : str
+            The id of the tag to delete
+        """
+        path = f"/api/data/tags/{tagId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
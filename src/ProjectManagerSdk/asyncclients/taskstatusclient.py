@@ -0,0 +1,132 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.taskstatuscreatedto import TaskStatusCreateDto
+from ProjectManagerSdk.models.taskstatusdto import TaskStatusDto
+from ProjectManagerSdk.models.taskstatusupdatedto import TaskStatusUpdateDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncTaskStatusClient:
+    """
+    API methods related to TaskStatus, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_task_statuses(self, projectId: str) -> AstroResult[List[TaskStatusDto]]:
+        """
+        Retrieves the list of TaskStatus levels for a specific Project
+        within your Workspace. A TaskStatus is a named status level used
+        by your business to determine how to measure the progress of
+        Tasks. You can define your own named status levels that are
+        appropriate for your business and determine which status levels
+        are considered done.
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project to retrieve
+            TaskStatuses
+        """
+        path = f"/api/data/projects/{projectId}/tasks/statuses"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[TaskStatusDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[TaskStatusDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def create_taskstatus(self, projectId: str, body: TaskStatusCreateDto) -> AstroResult[TaskStatusDto]:
+        """
+        Creates a new TaskStatus level for a specific Project within
+        your Workspace. A TaskStatus is a named status level used by
+        your business to determine how to measure the progress of Tasks.
+        You can define your own named status levels that are appropriate
+        for your business.
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project for the new TaskStatus
+        body : TaskStatusCreateDto
+            Information about the new TaskStatus level to create within
+            this Project
+        """
+        path = f"/api/data/projects/{projectId}/tasks/statuses"
+        queryParams = {}
+        result = await self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[TaskStatusDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[TaskStatusDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def update_taskstatus(self, taskStatusId: str, body: TaskStatusUpdateDto) -> AstroResult[TaskStatusDto]:
+        """
+        Updates an existing TaskStatus level for a specific Project
+        within your Workspace. A TaskStatus is a named status level used
+        by your business to determine how to measure the progress of
+        Tasks. You can define your own named status levels that are
+        appropriate for your business.
+
+        Parameters
+        ----------
+        taskStatusId : str
+            The id of the task status
+        body : TaskStatusUpdateDto
+            Information about the existing TaskStatus to update within
+            this Project
+        """
+        path = f"/api/data/tasks/statuses/{taskStatusId}"
+        queryParams = {}
+        result = await self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[TaskStatusDto](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[TaskStatusDto](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
+    async def delete_taskstatus(self, taskStatusId: str) -> AstroResult[object]:
+        """
+        The endpoint is used to delete a TaskStatus. You will not be
+        able to delete a TaskStatus if there are tasks that have been
+        assigned to this status level or if the TaskStatus is the
+        default status level.
+
+        Parameters
+        ----------
+        taskStatusId : str
+            The id of the TaskStatus to be removed.
+        """
+        path = f"/api/data/tasks/statuses/{taskStatusId}"
+        queryParams = {}
+        result = await self.client.send_request("DELETE", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[object](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[object](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -0,0 +1,51 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.workspacedto import WorkSpaceDto
+from typing import List
+from ProjectManagerSdk.tools import remove_empty_elements
+import dataclasses
+
+class AsyncWorkSpaceClient:
+    """
+    API methods related to WorkSpace, as coroutines
+    """
+    from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+
+    def __init__(self, client: AsyncProjectManagerClient):
+        self.client = client
+
+    async def retrieve_workspaces(self) -> AstroResult[List[WorkSpaceDto]]:
+        """
+        Retrieve the list of Workspaces to which the currently logged on
+        user has access. A single User may have access to multiple
+        Workspaces, although they can only be logged on to one Workspace
+        at a time. This API lists all Workspaces to which the currently
+        logged on user is entitled to access. To determine which
+        Workspace a user is currently logged on use the `/api/data/me`
+        endpoint.
+
+        Parameters
+        ----------
+        """
+        path = "/api/data/workspaces"
+        queryParams = {}
+        result = await self.client.send_request("GET", path, None, queryParams, None)
+        if result.status_code >= 200 and result.status_code < 300:
+            data = self.client.decode_list(WorkSpaceDto, self.client.jsonCodec.loads(result.content)['data'])
+            return AstroResult[List[WorkSpaceDto]](None, True, False, result.status_code, data)
+        else:
+            response = AstroResult[List[WorkSpaceDto]](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
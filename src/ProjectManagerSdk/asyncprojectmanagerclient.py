@@ -0,0 +1,166 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+import platform
+
+from ProjectManagerSdk.asyncclientbase import AsyncProjectManagerClientBase
+
+class AsyncProjectManagerClient(AsyncProjectManagerClientBase):
+    """
+    ProjectManager API API Client object for asyncio applications
+
+    This client exposes the same API categories as `ProjectManagerClient`,
+    but every API method is a coroutine that must be awaited.  Requests are
+    sent through a shared `httpx.AsyncClient`, so many calls can be in
+    flight at once from a single thread.
+
+    Close the client with `await client.aclose()` or use it as an async
+    context manager; the synchronous `close` and `with` are not supported.
+    """
+
+    def __init__(self, env: str, appname: str):
+        """Construct a new AsyncProjectManagerClient client object
+        
+        Parameters
+        ----------
+        env : str
+            Select the environment to use for this client. You may either 
+            provide an environment name or a full URL of a custom environment.
+        appname : str
+            Provide a name for your application for logging and debugging. This
+            name will be recorded alongside API calls so that you can identify
+            the source of errors. 
+        """
+        from ProjectManagerSdk.asyncclients.apikeyclient import AsyncApiKeyClient
+        from ProjectManagerSdk.asyncclients.changesetclient import AsyncChangesetClient
+        from ProjectManagerSdk.asyncclients.dashboardclient import AsyncDashboardClient
+        from ProjectManagerSdk.asyncclients.discussionclient import AsyncDiscussionClient
+        from ProjectManagerSdk.asyncclients.fileclient import AsyncFileClient
+        from ProjectManagerSdk.asyncclients.holidayclient import AsyncHolidayClient
+        from ProjectManagerSdk.asyncclients.homefileclient import AsyncHomeFileClient
+        from ProjectManagerSdk.asyncclients.hourlyrateclient import AsyncHourlyRateClient
+        from ProjectManagerSdk.asyncclients.hourlyrateperiodclient import AsyncHourlyRatePeriodClient
+        from ProjectManagerSdk.asyncclients.integrationcategoryclient import AsyncIntegrationCategoryClient
+        from ProjectManagerSdk.asyncclients.integrationclient import AsyncIntegrationClient
+        from ProjectManagerSdk.asyncclients.integrationproviderclient import AsyncIntegrationProviderClient
+        from ProjectManagerSdk.asyncclients.licenseclient import AsyncLicenseClient
+        from ProjectManagerSdk.asyncclients.meclient import AsyncMeClient
+        from ProjectManagerSdk.asyncclients.meetingsclient import AsyncMeetingsClient
+        from ProjectManagerSdk.asyncclients.meetingtagclient import AsyncMeetingTagClient
+        from ProjectManagerSdk.asyncclients.meetingtodosclient import AsyncMeetingTodosClient
+        from ProjectManagerSdk.asyncclients.notificationclient import AsyncNotificationClient
+        from ProjectManagerSdk.asyncclients.nptclient import AsyncNptClient
+        from ProjectManagerSdk.asyncclients.nptdiscussionclient import AsyncNptDiscussionClient
+        from ProjectManagerSdk.asyncclients.nptfilesclient import AsyncNptFilesClient
+        from ProjectManagerSdk.asyncclients.nptrecurrencyclient import AsyncNptRecurrencyClient
+        from ProjectManagerSdk.asyncclients.nptstatusclient import AsyncNptStatusClient
+        from ProjectManagerSdk.asyncclients.npttagclient import AsyncNptTagClient
+        from ProjectManagerSdk.asyncclients.npttodosclient import AsyncNptTodosClient
+        from ProjectManagerSdk.asyncclients.projectchargecodeclient import AsyncProjectChargeCodeClient
+        from ProjectManagerSdk.asyncclients.projectclient import AsyncProjectClient
+        from ProjectManagerSdk.asyncclients.projectcustomerclient import AsyncProjectCustomerClient
+        from ProjectManagerSdk.asyncclients.projectfieldclient import AsyncProjectFieldClient
+        from ProjectManagerSdk.asyncclients.projectfileclient import AsyncProjectFileClient
+        from ProjectManagerSdk.asyncclients.projectfolderclient import AsyncProjectFolderClient
+        from ProjectManagerSdk.asyncclients.projectmembersclient import AsyncProjectMembersClient
+        from ProjectManagerSdk.asyncclients.projectpriorityclient import AsyncProjectPriorityClient
+        from ProjectManagerSdk.asyncclients.projectstatusclient import AsyncProjectStatusClient
+        from ProjectManagerSdk.asyncclients.projecttemplateclient import AsyncProjectTemplateClient
+        from ProjectManagerSdk.asyncclients.projectversionclient import AsyncProjectVersionClient
+        from ProjectManagerSdk.asyncclients.resourceclient import AsyncResourceClient
+        from ProjectManagerSdk.asyncclients.resourceskillclient import AsyncResourceSkillClient
+        from ProjectManagerSdk.asyncclients.resourceteamclient import AsyncResourceTeamClient
+        from ProjectManagerSdk.asyncclients.riskclient import AsyncRiskClient
+        from ProjectManagerSdk.asyncclients.riskfileclient import AsyncRiskFileClient
+        from ProjectManagerSdk.asyncclients.risktagclient import AsyncRiskTagClient
+        from ProjectManagerSdk.asyncclients.securityclient import AsyncSecurityClient
+        from ProjectManagerSdk.asyncclients.tagclient import AsyncTagClient
+        from ProjectManagerSdk.asyncclients.taskassigneeclient import AsyncTaskAssigneeClient
+        from ProjectManagerSdk.asyncclients.taskclient import AsyncTaskClient
+        from ProjectManagerSdk.asyncclients.taskfieldclient import AsyncTaskFieldClient
+        from ProjectManagerSdk.asyncclients.taskfileclient import AsyncTaskFileClient
+        from ProjectManagerSdk.asyncclients.taskmetadataclient import AsyncTaskMetadataClient
+        from ProjectManagerSdk.asyncclients.taskrecurrencyclient import AsyncTaskRecurrencyClient
+        from ProjectManagerSdk.asyncclients.taskstatusclient import AsyncTaskStatusClient
+        from ProjectManagerSdk.asyncclients.tasktagclient import AsyncTaskTagClient
+        from ProjectManagerSdk.asyncclients.tasktodoclient import AsyncTaskTodoClient
+        from ProjectManagerSdk.asyncclients.teamsclient import AsyncTeamsClient
+        from ProjectManagerSdk.asyncclients.timesheetclient import AsyncTimesheetClient
+        from ProjectManagerSdk.asyncclients.userroleclient import AsyncUserRoleClient
+        from ProjectManagerSdk.asyncclients.workspaceclient import AsyncWorkSpaceClient
+        self.apiKey = AsyncApiKeyClient(self)
+        self.changeset = AsyncChangesetClient(self)
+        self.dashboard = AsyncDashboardClient(self)
+        self.discussion = AsyncDiscussionClient(self)
+        self.file = AsyncFileClient(self)
+        self.holiday = AsyncHolidayClient(self)
+        self.homeFile = AsyncHomeFileClient(self)
+        self.hourlyRate = AsyncHourlyRateClient(self)
+        self.hourlyRatePeriod = AsyncHourlyRatePeriodClient(self)
+        self.integrationCategory = AsyncIntegrationCategoryClient(self)
+        self.integration = AsyncIntegrationClient(self)
+        self.integrationProvider = AsyncIntegrationProviderClient(self)
+        self.license = AsyncLicenseClient(self)
+        self.me = AsyncMeClient(self)
+        self.meetings = AsyncMeetingsClient(self)
+        self.meetingTag = AsyncMeetingTagClient(self)
+        self.meetingTodos = AsyncMeetingTodosClient(self)
+        self.notification = AsyncNotificationClient(self)
+        self.npt = AsyncNptClient(self)
+        self.nptDiscussion = AsyncNptDiscussionClient(self)
+        self.nptFiles = AsyncNptFilesClient(self)
+        self.nptRecurrency = AsyncNptRecurrencyClient(self)
+        self.nptStatus = AsyncNptStatusClient(self)
+        self.nptTag = AsyncNptTagClient(self)
+        self.nptTodos = AsyncNptTodosClient(self)
+        self.projectChargeCode = AsyncProjectChargeCodeClient(self)
+        self.project = AsyncProjectClient(self)
+        self.projectCustomer = AsyncProjectCustomerClient(self)
+        self.projectField = AsyncProjectFieldClient(self)
+        self.projectFile = AsyncProjectFileClient(self)
+        self.projectFolder = AsyncProjectFolderClient(self)
+        self.projectMembers = AsyncProjectMembersClient(self)
+        self.projectPriority = AsyncProjectPriorityClient(self)
+        self.projectStatus = AsyncProjectStatusClient(self)
+        self.projectTemplate = AsyncProjectTemplateClient(self)
+        self.projectVersion = AsyncProjectVersionClient(self)
+        self.resource = AsyncResourceClient(self)
+        self.resourceSkill = AsyncResourceSkillClient(self)
+        self.resourceTeam = AsyncResourceTeamClient(self)
+        self.risk = AsyncRiskClient(self)
+        self.riskFile = AsyncRiskFileClient(self)
+        self.riskTag = AsyncRiskTagClient(self)
+        self.security = AsyncSecurityClient(self)
+        self.tag = AsyncTagClient(self)
+        self.taskAssignee = AsyncTaskAssigneeClient(self)
+        self.task = AsyncTaskClient(self)
+        self.taskField = AsyncTaskFieldClient(self)
+        self.taskFile = AsyncTaskFileClient(self)
+        self.taskMetadata = AsyncTaskMetadataClient(self)
+        self.taskRecurrency = AsyncTaskRecurrencyClient(self)
+        self.taskStatus = AsyncTaskStatusClient(self)
+        self.taskTag = AsyncTaskTagClient(self)
+        self.taskTodo = AsyncTaskTodoClient(self)
+        self.teams = AsyncTeamsClient(self)
+        self.timesheet = AsyncTimesheetClient(self)
+        self.userRole = AsyncUserRoleClient(self)
+        self.workSpace = AsyncWorkSpaceClient(self)
+        self.serverUrl = env
+        if env == "production":
+            self.serverUrl = "https://api.projectmanager.com"
+        self.sdkName = "Python"
+        self.sdkVersion = "154.0.181"
+        self.machineName = platform.uname().node
+        self.applicationName = appname
+        self.bearerToken = None
+        super().__init__()
@@ -0,0 +1,419 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.changesetstatusdto import ChangeSetStatusDto
+from ProjectManagerSdk.models.projectchangestatusdto import ProjectChangeStatusDto
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List
+import asyncio
+import concurrent.futures
+import contextvars
+import dataclasses
+import heapq
+import itertools
+import random
+import threading
+import time
+
+# Failed polls with these statuses mean the changeset is still being processed, or the API is briefly unavailable
+_STILL_PROCESSING = frozenset({408, 409, 423, 425, 429, 500, 502, 503, 504})
+
+def _changeset_id(changeset: str | ChangeSetStatusDto) -> str:
+    changeSetId = changeset.changeSetId if isinstance(changeset, ChangeSetStatusDto) else changeset
+    if not changeSetId:
+        raise ValueError("A changeset id is required")
+    return changeSetId
+
+def _outcome(result: AstroResult[ProjectChangeStatusDto]) -> str:
+    """whether a poll found its changeset "done", "failed" or still "pending\""""
+    if result.success:
+        return "done" if result.data is not None and result.data.success is not None else "pending"
+    return "pending" if result.statusCode in _STILL_PROCESSING else "failed"
+
+def _resolve(future: Future, result: Any = None, exception: BaseException | None = None):
+    """resolves a future unless it was cancelled meanwhile"""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except concurrent.futures.InvalidStateError:
+        pass
+
+def _copy(source: Future, future: Future):
+    if source.cancelled():
+        future.cancel()
+    else:
+        _resolve(future, None if source.exception() is not None else source.result(), source.exception())
+
+
+@dataclasses.dataclass(slots=True)
+class _Tracked:
+    changeSetId: str
+    future: Future
+    deadline: float
+    interval: float
+
+
+class ChangesetTracker:
+    """
+    Waits for many changesets to finish processing at once.
+
+    Every call that changes a project returns a `ChangeSetStatusDto`,
+    whose changeset the API applies in the background. Pass it, or its
+    `changeSetId`, to `track` to get a future that resolves to the
+    changeset's `ProjectChangeStatusDto` once it has been applied or
+    rejected; check its `success` to tell which. Futures returned by
+    `TaskWriter.add` may be tracked too, so writes and their confirmation
+    overlap instead of waiting for each other.
+
+    Changesets are polled with `retrieve_completed_changeset_status` by up
+    to `max_workers` threads. A changeset still being processed is polled
+    again after `interval` seconds, doubling up to `max_interval` each
+    time, with jitter so that changesets tracked together do not keep
+    polling together. A changeset that has not finished within `timeout`
+    seconds resolves with a `TimeoutError`; one the API reports an error
+    for resolves with an `AstroException`.
+    """
+
+    def __init__(self, client: Any, max_workers: int = 16, interval: float = 0.25, max_interval: float = 5.0,
+        timeout: float = 300.0):
+        """Construct a new changeset tracker
+
+        Parameters
+        ----------
+        client : ProjectManagerClient
+            The client used to poll changesets
+        max_workers : int
+            The number of changesets polled at once; use a connection pool
+            at least this large, see `ProjectManagerClient.with_connection_pool`
+        interval : float
+            The delay in seconds before a changeset is polled again
+        max_interval : float
+            The longest delay in seconds between polls of one changeset
+        timeout : float
+            How many seconds to wait for each changeset
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if interval <= 0 or max_interval < interval:
+            raise ValueError("interval must be positive and no more than max_interval")
+        self.client = client
+        self.max_workers = max_workers
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.polls = 0
+        self.completed = 0
+        self.failed = 0
+        self._context = contextvars.copy_context()
+        self._condition = threading.Condition()
+        self._tracked: Dict[str, _Tracked] = {}
+        self._due: List[tuple] = []
+        self._sequence = itertools.count()
+        self._futures: List[Future] = []
+        self._known: Dict[str, Future] = {}
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def track(self, changeset: "str | ChangeSetStatusDto | Future[ChangeSetStatusDto]") -> "Future[ProjectChangeStatusDto]":
+        """Start waiting for a changeset
+
+        Tracking the same changeset again returns the same future, even
+        once it has finished.
+
+        Parameters
+        ----------
+        changeset : str | ChangeSetStatusDto | Future[ChangeSetStatusDto]
+            The changeset, its id, or a future of the call that creates it
+        """
+        if isinstance(changeset, Future):
+            future: Future = Future()
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("The changeset tracker is closed")
+                self._futures.append(future)
+            changeset.add_done_callback(lambda write: self._chain(write, future))
+            return future
+        changeSetId = _changeset_id(changeset)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The changeset tracker is closed")
+            known = self._known.get(changeSetId)
+            if known is not None:
+                return known
+            tracked = _Tracked(changeSetId, Future(), time.monotonic() + self.timeout, self.interval)
+            self._tracked[changeSetId] = tracked
+            self._known[changeSetId] = tracked.future
+            self._futures.append(tracked.future)
+            heapq.heappush(self._due, (0.0, next(self._sequence), tracked))
+            if len(self._workers) < min(self.max_workers, len(self._tracked)):
+                worker = threading.Thread(target=self._context.copy().run, args=(self._work,), name="ChangesetTracker", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+            self._condition.notify()
+            return tracked.future
+
+    def track_many(self, changesets: "Iterable[str | ChangeSetStatusDto | Future[ChangeSetStatusDto]]") -> "List[Future[ProjectChangeStatusDto]]":
+        """Start waiting for several changesets
+
+        Parameters
+        ----------
+        changesets : Iterable[str | ChangeSetStatusDto | Future[ChangeSetStatusDto]]
+            The changesets, their ids, or futures of the calls that create them
+        """
+        return [self.track(changeset) for changeset in changesets]
+
+    def wait_all(self, timeout: float | None = None) -> bool:
+        """Wait for every tracked changeset to finish
+
+        Parameters
+        ----------
+        timeout : float | None
+            How many seconds to wait at most; None waits until all are done
+
+        Returns
+        -------
+        True if every changeset tracked so far has finished, false if the
+        timeout passed first
+        """
+        with self._condition:
+            futures = list(self._futures)
+        _, pending = concurrent.futures.wait(futures, timeout)
+        return not pending
+
+    @property
+    def pending(self) -> int:
+        """The number of changesets still being waited for"""
+        return len(self._tracked)
+
+    def close(self):
+        """Stop polling; the futures of changesets not finished yet are cancelled"""
+        with self._condition:
+            self._closed = True
+            for tracked in self._tracked.values():
+                tracked.future.cancel()
+            self._tracked.clear()
+            self._due.clear()
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    def _chain(self, write: Future, future: Future):
+        """tracks the changeset of a finished write, passing on its outcome"""
+        if future.cancelled():
+            return
+        if write.cancelled():
+            future.cancel()
+            return
+        try:
+            tracked = self.track(write.result())
+        except BaseException as e:
+            _resolve(future, exception=e)
+            return
+        tracked.add_done_callback(lambda done: _copy(done, future))
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    if self._due:
+                        due = self._due[0][0] - time.monotonic()
+                        if due <= 0:
+                            tracked = heapq.heappop(self._due)[2]
+                            break
+                        self._condition.wait(due)
+                    else:
+                        self._condition.wait()
+            error: BaseException | None = None
+            if not tracked.future.cancelled():
+                try:
+                    with self.client.result_mode("model"):
+                        result = self.client.changeset.retrieve_completed_changeset_status(tracked.changeSetId)
+                    outcome = _outcome(result)
+                except Exception as e:
+                    outcome, error = "failed", e
+            with self._condition:
+                if self._tracked.get(tracked.changeSetId) is not tracked:
+                    continue
+                if tracked.future.cancelled():
+                    del self._tracked[tracked.changeSetId]
+                    continue
+                self.polls += 1
+                if outcome == "pending":
+                    if time.monotonic() + tracked.interval <= tracked.deadline:
+                        heapq.heappush(self._due, (time.monotonic() + tracked.interval * random.uniform(0.5, 1.0),
+                                                   next(self._sequence), tracked))
+                        tracked.interval = min(self.max_interval, tracked.interval * 2)
+                        continue
+                    outcome, error = "failed", TimeoutError(f"Changeset {tracked.changeSetId} did not finish in time")
+                del self._tracked[tracked.changeSetId]
+                if outcome == "done":
+                    self.completed += 1
+                    _resolve(tracked.future, result.data)
+                else:
+                    self.failed += 1
+                    _resolve(tracked.future, exception=error or AstroException(result))
+
+
+class AsyncChangesetTracker:
+    """
+    Waits for many changesets to finish processing at once, using an
+    `AsyncProjectManagerClient`.
+
+    This is the asyncio counterpart of `ChangesetTracker`: `track` returns
+    an awaitable `asyncio.Future`, and at most `max_concurrency` polls are
+    in flight at a time. It must be used from a running event loop.
+    """
+
+    def __init__(self, client: Any, max_concurrency: int = 16, interval: float = 0.25, max_interval: float = 5.0,
+        timeout: float = 300.0):
+        """Construct a new changeset tracker
+
+        Parameters
+        ----------
+        client : AsyncProjectManagerClient
+            The client used to poll changesets
+        max_concurrency : int
+            The number of changesets polled at once
+        interval : float
+            The delay in seconds before a changeset is polled again
+        max_interval : float
+            The longest delay in seconds between polls of one changeset
+        timeout : float
+            How many seconds to wait for each changeset
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if interval <= 0 or max_interval < interval:
+            raise ValueError("interval must be positive and no more than max_interval")
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.interval = interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.polls = 0
+        self.completed = 0
+        self.failed = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tracked: Dict[str, asyncio.Future] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def track(self, changeset: str | ChangeSetStatusDto) -> "asyncio.Future[ProjectChangeStatusDto]":
+        """Start waiting for a changeset
+
+        Tracking the same changeset again returns the same future, even
+        once it has finished.
+
+        Parameters
+        ----------
+        changeset : str | ChangeSetStatusDto
+            The changeset or its id
+        """
+        changeSetId = _changeset_id(changeset)
+        future = self._tracked.get(changeSetId)
+        if future is None:
+            future = self._tracked[changeSetId] = asyncio.get_running_loop().create_future()
+            self._tasks[changeSetId] = asyncio.ensure_future(self._poll(changeSetId, future))
+        return future
+
+    def track_many(self, changesets: Iterable[str | ChangeSetStatusDto]) -> "List[asyncio.Future[ProjectChangeStatusDto]]":
+        """Start waiting for several changesets
+
+        Parameters
+        ----------
+        changesets : Iterable[str | ChangeSetStatusDto]
+            The changesets or their ids
+        """
+        return [self.track(changeset) for changeset in changesets]
+
+    async def wait_all(self, timeout: float | None = None) -> bool:
+        """Wait for every tracked changeset to finish
+
+        Parameters
+        ----------
+        timeout : float | None
+            How many seconds to wait at most; None waits until all are done
+
+        Returns
+        -------
+        True if every changeset tracked so far has finished, false if the
+        timeout passed first
+        """
+        futures = list(self._tracked.values())
+        if not futures:
+            return True
+        _, pending = await asyncio.wait(futures, timeout=timeout)
+        return not pending
+
+    @property
+    def pending(self) -> int:
+        """The number of changesets still being waited for"""
+        return len(self._tasks)
+
+    async def close(self):
+        """Stop polling; changesets not finished yet are cancelled"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for future in self._tracked.values():
+            future.cancel()
+        self._tasks.clear()
+
+    async def _poll(self, changeSetId: str, future: asyncio.Future):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        interval = self.interval
+        try:
+            while True:
+                async with self._semaphore:
+                    with self.client.result_mode("model"):
+                        result = await self.client.changeset.retrieve_completed_changeset_status(changeSetId)
+                self.polls += 1
+                outcome = _outcome(result)
+                if outcome == "done":
+                    self.completed += 1
+                    future.set_result(result.data)
+                    return
+                if outcome == "failed":
+                    raise AstroException(result)
+                if loop.time() + interval > deadline:
+                    raise TimeoutError(f"Changeset {changeSetId} did not finish in time")
+                await asyncio.sleep(interval * random.uniform(0.5, 1.0))
+                interval = min(self.max_interval, interval * 2)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.failed += 1
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self._tasks.pop(changeSetId, None)
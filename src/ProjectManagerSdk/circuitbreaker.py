@@ -0,0 +1,189 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from collections import deque
+from typing import Deque, Dict
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+class _Circuit:
+    """the state of the circuit for one endpoint"""
+
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "in_flight", "trials", "successes")
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.in_flight = 0
+        self.trials = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """
+    Stops sending calls to an API endpoint that keeps failing.
+
+    Each endpoint, such as `/api/data/tasks/{taskId}`, has its own circuit.
+    While a circuit is closed, calls are sent and their outcomes recorded;
+    a call fails if it is answered with a 5xx status or gets no response.
+    Once at least `minimum_calls` of the last `window` calls were sent and
+    `failure_rate` of them failed, the circuit opens and calls fail
+    immediately without being sent. After `open_duration` seconds the
+    circuit is half-open and lets `half_open_calls` trial calls through:
+    if they all succeed the circuit closes again, otherwise it reopens.
+
+    With `max_concurrent`, calls beyond that many in flight to the same
+    endpoint are rejected as well, so a slow endpoint cannot tie up every
+    worker.
+
+    A breaker is thread-safe and may be shared by several clients,
+    threads and asyncio tasks.
+    """
+
+    rejected: int
+    """
+    The number of calls that were not sent because a circuit was open or
+    an endpoint had too many calls in flight.
+    """
+
+    def __init__(self, failure_rate: float = 0.5, minimum_calls: int = 20, window: int = 100,
+        open_duration: float = 30.0, half_open_calls: int = 3, max_concurrent: int | None = None, clock=time.monotonic):
+        """Construct a new circuit breaker
+
+        Parameters
+        ----------
+        failure_rate : float
+            The share of failed calls, between 0 and 1, that opens a circuit
+        minimum_calls : int
+            The number of calls recorded before a circuit may open
+        window : int
+            The number of most recent calls the failure rate is computed over
+        open_duration : float
+            The number of seconds an open circuit rejects calls before
+            sending trial calls
+        half_open_calls : int
+            The number of successful trial calls that close a circuit
+        max_concurrent : int | None
+            If set, the maximum number of calls in flight to one endpoint
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be greater than zero and at most one")
+        self.failure_rate = failure_rate
+        self.minimum_calls = max(1, min(minimum_calls, window))
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_calls = max(1, half_open_calls)
+        self.max_concurrent = max_concurrent
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self.rejected = 0
+
+    def state(self, endpoint: str) -> str:
+        """The state of the circuit for an endpoint: "closed", "open" or "half-open"
+
+        Parameters
+        ----------
+        endpoint : str
+            The path template of the endpoint
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._clock() - circuit.opened_at >= self.open_duration:
+                return HALF_OPEN
+            return circuit.state
+
+    def allow(self, endpoint: str) -> bool:
+        """Decide whether a call to an endpoint may be sent
+
+        Every allowed call must be followed by a call to `record`.
+
+        Parameters
+        ----------
+        endpoint : str
+            The path template of the endpoint
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(self.window)
+            if circuit.state == OPEN and self._clock() - circuit.opened_at >= self.open_duration:
+                circuit.state = HALF_OPEN
+                circuit.trials = 0
+                circuit.successes = 0
+            if (circuit.state == OPEN
+                    or (circuit.state == HALF_OPEN and circuit.trials >= self.half_open_calls)
+                    or (self.max_concurrent is not None and circuit.in_flight >= self.max_concurrent)):
+                self.rejected += 1
+                return False
+            if circuit.state == HALF_OPEN:
+                circuit.trials += 1
+            circuit.in_flight += 1
+            return True
+
+    def record(self, endpoint: str, success: bool | None):
+        """Record the outcome of a call that was allowed
+
+        Parameters
+        ----------
+        endpoint : str
+            The path template of the endpoint
+        success : bool | None
+            Whether the call succeeded, or None if it was abandoned for a
+            reason unrelated to the endpoint's health
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                # The breaker was reset while this call was in flight
+                return
+            circuit.in_flight = max(0, circuit.in_flight - 1)
+            if circuit.state == HALF_OPEN:
+                if success is None:
+                    circuit.trials -= 1
+                elif not success:
+                    self._open(circuit)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self.half_open_calls:
+                        circuit.state = CLOSED
+                        circuit.outcomes.clear()
+                        circuit.failures = 0
+                return
+            if circuit.state == OPEN or success is None:
+                return
+            if len(circuit.outcomes) == circuit.outcomes.maxlen and not circuit.outcomes[0]:
+                circuit.failures -= 1
+            circuit.outcomes.append(success)
+            if not success:
+                circuit.failures += 1
+                if (len(circuit.outcomes) >= self.minimum_calls
+                        and circuit.failures >= self.failure_rate * len(circuit.outcomes)):
+                    self._open(circuit)
+
+    def _open(self, circuit: _Circuit):
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+
+    def reset(self):
+        """Close all circuits and forget all recorded calls"""
+        with self._lock:
+            self._circuits.clear()
@@ -0,0 +1,662 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+import contextlib
+import contextvars
+import requests
+import time
+import typing
+import urllib.parse
+import urllib3
+
+from ProjectManagerSdk.circuitbreaker import CircuitBreaker
+from ProjectManagerSdk.columnar import ColumnarResult, to_columns
+from ProjectManagerSdk.compression import ContentDecoder, TransferStats, accept_encoding, available_encodings
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.diskcache import DiskCache
+from ProjectManagerSdk.downloads import Download
+from ProjectManagerSdk.endpoints import path_template
+from ProjectManagerSdk.jsoncodec import CachedContent, JsonCodec, get_json_codec
+from ProjectManagerSdk.ratelimiter import RateLimiter
+from ProjectManagerSdk.responsecache import ResponseCache
+from ProjectManagerSdk.retry import RetryPolicy
+from ProjectManagerSdk.singleflight import SingleFlight
+from ProjectManagerSdk.uploads import Upload
+from ProjectManagerSdk.validatorcache import ValidatorCache
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+
+T = typing.TypeVar('T')
+
+RESULT_MODES = ("model", "raw", "lazy", "columnar")
+
+# Result modes selected with ProjectManagerClient.result_mode for the current thread or task
+_result_mode_overrides: contextvars.ContextVar[typing.Dict[typing.Any, str]] = contextvars.ContextVar("result_mode_overrides", default={})
+
+# The body of the last GET call made in the current thread or task, if its results may be reused
+_reused_content: contextvars.ContextVar[CachedContent | None] = contextvars.ContextVar("reused_content", default=None)
+
+class ProjectManagerClientBase:
+    """
+    The transport and configuration shared by the generated API clients
+
+    `ProjectManagerClient` is generated from the OpenAPI file and adds the
+    API categories; everything else a client does lives here, so that it
+    is not overwritten when the client is generated again.
+    """
+    bearerToken: str | None
+    session: requests.Session
+    jsonCodec: JsonCodec
+    resultMode: str
+    rateLimiter: RateLimiter | None
+    retryPolicy: RetryPolicy | None
+    circuitBreaker: CircuitBreaker | None
+    contentEncodings: typing.List[str]
+    transferListener: typing.Callable[[TransferStats], None] | None
+    singleFlight: SingleFlight | None
+    responseCache: ResponseCache | None
+    diskCache: DiskCache | None
+    validatorCache: ValidatorCache | None
+
+    def __init__(self):
+        """Set up the default configuration and open the connection pool"""
+        self.jsonCodec = get_json_codec()
+        self.resultMode = "model"
+        self.rateLimiter = None
+        self.retryPolicy = None
+        self.circuitBreaker = None
+        self.contentEncodings = available_encodings()
+        self.transferListener = None
+        self.singleFlight = None
+        self.responseCache = None
+        self.diskCache = None
+        self.validatorCache = None
+        self.session = self._new_session()
+        self.with_connection_pool()
+
+    def _new_session(self):
+        """the session that sends every request of this client"""
+        return requests.Session()
+    
+    def with_api_key(self, key: str):
+        """Configure this API client to use API Key authentication
+        
+        
+        
+        Parameters
+        ----------
+        key : str
+            The API Key to use for authentication.
+        """
+        self.bearerToken = key
+
+    def with_json_codec(self, codec: JsonCodec | str):
+        """Select the JSON library used to encode requests and decode responses
+        
+        By default the client uses orjson when it is installed and the
+        standard library otherwise.
+        
+        Parameters
+        ----------
+        codec : JsonCodec | str
+            Either a codec name ("orjson" or "json") or a `JsonCodec` instance.
+        """
+        self.jsonCodec = get_json_codec(codec) if isinstance(codec, str) else codec
+
+    def with_result_mode(self, mode: str):
+        """Select how API results are returned by this client
+        
+        Parameters
+        ----------
+        mode : str
+            "model" (the default) decodes results into model objects such as
+            `TaskDto`. "raw" skips model construction and returns the
+            decoded JSON dictionaries and lists in `AstroResult.data`, which
+            is much cheaper when results are immediately converted back into
+            dictionaries. "lazy" returns model objects that decode each field
+            the first time it is read, which is cheaper when only a few
+            fields of wide models such as `TaskDetailsDto` are used.
+            "columnar" returns lists of results as a `ColumnarResult` of
+            typed numpy arrays, one per field, for vectorized analysis;
+            single results are returned as model objects. This mode 
+            requires numpy, and is not supported by the `iter_*` methods,
+            which raise a `ValueError` instead.
+        """
+        if mode not in RESULT_MODES:
+            raise ValueError(f"Unknown result mode '{mode}'; expected one of {', '.join(RESULT_MODES)}")
+        self.resultMode = mode
+
+    @contextlib.contextmanager
+    def result_mode(self, mode: str):
+        """Select how API results are returned for calls made inside a `with` block
+        
+        The mode applies only to the current thread or asyncio task, and
+        overrides the mode selected with `with_result_mode`.
+        
+        Parameters
+        ----------
+        mode : str
+            One of "model", "raw", "lazy" or "columnar"; see 
+            `with_result_mode`.
+        """
+        if mode not in RESULT_MODES:
+            raise ValueError(f"Unknown result mode '{mode}'; expected one of {', '.join(RESULT_MODES)}")
+        token = _result_mode_overrides.set({**_result_mode_overrides.get(), self: mode})
+        try:
+            yield self
+        finally:
+            _result_mode_overrides.reset(token)
+
+    def with_rate_limiter(self, limiter: RateLimiter | None):
+        """Throttle API calls made by this client
+        
+        The limiter slows calls down before the API starts rejecting them,
+        learns the sustainable rate from 429 Too Many Requests responses,
+        and sends throttled calls again after the Retry-After period. Pass
+        the same limiter to several clients to share one budget between
+        them, or None to stop throttling.
+        
+        Parameters
+        ----------
+        limiter : RateLimiter | None
+            The rate limiter to use.
+        """
+        self.rateLimiter = limiter
+
+    def with_retry_policy(self, policy: RetryPolicy | None):
+        """Resend API calls that fail with a transient error
+        
+        By default, failed calls are returned as they are. With a retry 
+        policy, calls that fail with a 502, 503 or 504 response or a 
+        dropped connection are sent again after a jittered exponential
+        backoff. Only GET, PUT and DELETE calls are retried unless the 
+        policy says otherwise.
+        
+        Parameters
+        ----------
+        policy : RetryPolicy | None
+            The retry policy to use, or None to stop retrying.
+        """
+        self.retryPolicy = policy
+
+    def with_circuit_breaker(self, breaker: CircuitBreaker | None):
+        """Stop sending calls to API endpoints that keep failing
+        
+        While the circuit for an endpoint is open, API calls to it are not
+        sent; they immediately return an `AstroResult` with status 503 
+        and an error message explaining that the circuit is open. A 
+        breaker may be shared between several clients.
+        
+        Parameters
+        ----------
+        breaker : CircuitBreaker | None
+            The circuit breaker to use, or None to send all calls.
+        """
+        self.circuitBreaker = breaker
+
+    def with_content_encodings(self, encodings: typing.Sequence[str]):
+        """Choose which compressed encodings the API may send responses in
+        
+        By default, every encoding this installation can decode is 
+        accepted, preferring zstd, then br, gzip and deflate. zstd and br
+        require the optional `zstandard` and `brotli` packages.
+        
+        Parameters
+        ----------
+        encodings : Sequence[str]
+            The accepted encodings, best first; an empty list asks for 
+            uncompressed responses.
+        """
+        available = available_encodings()
+        for encoding in encodings:
+            if encoding not in available:
+                raise ValueError(f"Content encoding '{encoding}' is not available; expected one of {', '.join(available)}")
+        self.contentEncodings = list(encodings)
+
+    def with_transfer_listener(self, listener: typing.Callable[[TransferStats], None] | None):
+        """Measure the size and decompression time of every response
+        
+        The listener is called with a `TransferStats` once the body of a
+        response has been received. Pass a `TransferMeter` to total the 
+        statistics of many calls.
+        
+        Parameters
+        ----------
+        listener : Callable[[TransferStats], None] | None
+            The function to call for each response, or None to stop.
+        """
+        self.transferListener = listener
+
+    def with_request_coalescing(self, enabled: bool = True):
+        """Share one response between identical GET calls in flight at the same time
+        
+        When several threads or asyncio tasks make the same GET call, with
+        the same path, query parameters and credentials, while it is 
+        already in flight, only the first one is sent and all of them 
+        receive its result. Each caller still decodes the result in its 
+        own result mode.
+        
+        Parameters
+        ----------
+        enabled : bool
+            True to coalesce identical GET calls, false to send every call.
+        """
+        self.singleFlight = SingleFlight() if enabled else None
+
+    def with_response_cache(self, cache: ResponseCache | None):
+        """Answer calls for slow-changing reference data from memory
+        
+        Successful GET calls to the endpoints configured in the cache, by
+        default statuses, priorities, tags, roles, workspaces, licenses
+        and custom field definitions, are answered from memory until 
+        their time to live expires. Every other call made through this 
+        client invalidates the cached responses it may have changed.
+        
+        Parameters
+        ----------
+        cache : ResponseCache | None
+            The cache to use, or None to send every call.
+        """
+        self.responseCache = cache
+
+    def with_disk_cache(self, cache: DiskCache | None):
+        """Answer GET calls from a cache on disk shared by several processes
+        
+        Successful GET calls to the endpoints listed in the cache's `ttls`
+        are kept in its SQLite database for their time to live, so other
+        processes using the same database, and later runs of the same
+        program, are answered without calling the API. Every other call
+        made through this client invalidates the cached responses it may
+        have changed. When a `ResponseCache` is also used, it is checked
+        first.
+        
+        Parameters
+        ----------
+        cache : DiskCache | None
+            The cache to use, or None to send every call.
+        """
+        self.diskCache = cache
+
+    def with_validator_cache(self, cache: ValidatorCache | None):
+        """Revalidate repeated GET calls instead of receiving unchanged data again
+        
+        Calls to the endpoints configured in the cache, by default 
+        `retrieve_project`, `retrieve_task`, `retrieve_project_members` 
+        and `retrieve_task_fields`, are sent with the ETag and 
+        Last-Modified validators of their previous response. When the API
+        answers 304 Not Modified, the call returns a copy of the results
+        decoded from the previous response without receiving, parsing or
+        decoding it again.
+        
+        Parameters
+        ----------
+        cache : ValidatorCache | None
+            The cache to use, or None to always receive full responses.
+        """
+        self.validatorCache = cache
+
+    def with_connection_pool(self, pool_connections: int = 10, pool_maxsize: int = 10, 
+        pool_block: bool = False, keep_alive: bool = True):
+        """Configure the HTTP connection pool shared by all API calls
+        
+        Every API category on this client sends its requests through a single
+        long-lived session, so TCP and TLS connections are reused between 
+        calls instead of being negotiated again for each request.
+        
+        Parameters
+        ----------
+        pool_connections : int
+            The number of distinct hosts for which connections are kept.
+        pool_maxsize : int
+            The maximum number of connections kept open for each host. Set
+            this to at least the number of threads sharing this client.
+        pool_block : bool
+            If true, a request waits for a free connection once `pool_maxsize`
+            connections are in use instead of opening a throwaway connection.
+        keep_alive : bool
+            If false, connections are closed after each request.
+        """
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        # Close the connections held by the adapters being replaced
+        for replaced in {self.session.adapters.get(prefix) for prefix in ("https://", "http://")} - {None}:
+            replaced.close()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if keep_alive:
+            self.session.headers.pop("Connection", None)
+        else:
+            self.session.headers["Connection"] = "close"
+
+    def close(self):
+        """Close all pooled connections held by this client
+        
+        The client may still be used after calling close; new connections
+        will be opened as needed.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def decode(self, data_class: typing.Type[T], data: typing.Any) -> T:
+        """Create a model object from a value returned by the API
+        
+        All API categories call this method to turn response data into
+        model objects. Decoding uses a compiled decoder per model class and
+        produces the same objects as `dacite.from_dict`. In "raw" result
+        mode the data is returned unchanged, and in "lazy" result mode 
+        fields are decoded when they are first read.
+        
+        Parameters
+        ----------
+        data_class : Type[T]
+            The model class to create
+        data : Any
+            The decoded JSON value
+        """
+        mode = self._current_result_mode()
+        content = _reused_content.get()
+        if content is not None and content.holds(data):
+            return content.decoded((data_class, mode), lambda: self._decode(data_class, mode, data))
+        return self._decode(data_class, mode, data)
+
+    def _decode(self, data_class: typing.Type[T], mode: str, data: typing.Any) -> T:
+        if mode == "raw":
+            return data
+        if mode == "lazy":
+            return lazy_from_dict(data_class, data)
+        return from_dict(data_class, data)
+
+    def decode_list(self, data_class: typing.Type[T], data: typing.List[typing.Any]) -> typing.List[T] | ColumnarResult:
+        """Create a list of model objects from a list returned by the API
+        
+        In "columnar" result mode, returns a `ColumnarResult` instead.
+        
+        Parameters
+        ----------
+        data_class : Type[T]
+            The model class to create for each item
+        data : List[Any]
+            The decoded JSON list
+        """
+        mode = self._current_result_mode()
+        content = _reused_content.get()
+        if content is not None and content.holds(data):
+            return content.decoded((data_class, mode, "list"), lambda: self._decode_list(data_class, mode, data))
+        return self._decode_list(data_class, mode, data)
+
+    def _decode_list(self, data_class: typing.Type[T], mode: str, data: typing.List[typing.Any]) -> typing.List[T] | ColumnarResult:
+        if mode == "raw":
+            return data
+        if mode == "lazy":
+            return [lazy_from_dict(data_class, item) for item in data]
+        if mode == "columnar":
+            return to_columns(data_class, data)
+        return [from_dict(data_class, item) for item in data]
+
+    def _current_result_mode(self) -> str:
+        return _result_mode_overrides.get().get(self, self.resultMode)
+
+    def send_request(self, method: str, path: str, body: object, 
+        query_params: typing.Dict[str, typing.Any] | None, filename: str | Upload | None, download: Download | None = None) -> Response:
+        """Send a request and parse the result
+        
+        Parameters
+        ----------
+        method : str
+            The HTTP method for this request
+        path : str
+            The path of the API endpoint for this request
+        body : object
+            For POST, PUT, or PATCH, represents the body of the request. For other
+            requests, this value should be nil.
+        query_params : object
+            The list of query parameters for the request
+        filename : str | Upload | None
+            The path of a file to upload with this request, or an `Upload`
+        download : Download | None
+            If set, the body of a successful response is written to this
+            download instead of being kept in memory
+        """
+        url = self._build_url(path, query_params)
+
+        upload = self._build_upload(filename)
+        headers = self._build_headers()
+        data = self._build_body(body, headers)
+        if upload is not None:
+            headers.update(upload.headers)
+        cache = self.responseCache
+        if method != "GET" or download is not None:
+            try:
+                return self._send(method, path, url, headers, data, upload, download)
+            finally:
+                if method != "GET":
+                    self._invalidate(path)
+        key = (url, headers.get("Authorization"))
+        if cache is not None:
+            response = cache.get(key, path)
+            if response is not None:
+                self._track_reuse(response)
+                return response
+            generation = cache.generation
+        if self.singleFlight is not None:
+            # Identical reads in flight at the same time share one response
+            response = self.singleFlight.do(key, lambda: self._fetch(method, path, url, headers, data, upload, download))
+        else:
+            response = self._fetch(method, path, url, headers, data, upload, download)
+        if cache is not None:
+            cache.put(key, path, response, generation)
+        self._track_reuse(response)
+        return response
+
+    def _invalidate(self, path: str):
+        if self.responseCache is not None:
+            self.responseCache.invalidate(path)
+        if self.diskCache is not None:
+            self.diskCache.invalidate(path)
+
+    def _fetch(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None) -> Response:
+        """sends a GET call, or answers it from the disk cache"""
+        disk = self.diskCache
+        if disk is None:
+            return self._revalidate(method, path, url, headers, data, upload, download)
+        identity = headers.get("Authorization")
+        stored = disk.get(method, url, identity, path)
+        if stored is not None:
+            return self._make_response(url, stored.status, stored.headers, stored.body)
+        generation = disk.generation
+        response = self._revalidate(method, path, url, headers, data, upload, download)
+        disk.put(method, url, identity, path, response.status_code, response.headers, response.content, generation)
+        return response
+
+    def _revalidate(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None) -> Response:
+        """sends a GET call with the validators of its previous response, if any"""
+        validators = self.validatorCache
+        if validators is None or not validators.cacheable(path):
+            return self._send(method, path, url, headers, data, upload, download)
+        key = (url, headers.get("Authorization"))
+        entry = validators.get(key)
+        if entry is not None:
+            headers = {**headers, **entry.conditions}
+        response = self._send(method, path, url, headers, data, upload, download)
+        return self._validated_response(validators, key, entry, url, response)
+
+    def _validated_response(self, validators: ValidatorCache, key: typing.Hashable, entry: typing.Any, url: str, response: typing.Any) -> typing.Any:
+        """hands out a new response with the kept body if the API answered 304, and keeps new bodies that carry validators"""
+        if response.status_code == 304 and entry is not None:
+            validators.not_modified(key)
+            # The kept body decodes its results once and hands each call its own copy
+            return self._make_response(url, entry.status, entry.headers, entry.content)
+        validators.put(key, response.status_code, response.headers, response.content)
+        return response
+
+    def _track_reuse(self, response: typing.Any):
+        """remembers the body of a GET call whose decoded results may be reused"""
+        if self.validatorCache is not None:
+            content = response.content
+            _reused_content.set(content if content.__class__ is CachedContent else None)
+
+    def _send(self, method: str, path: str, url: str, headers: typing.Dict[str, str], data: bytes | None,
+        upload: Upload | None, download: Download | None) -> Response:
+        """sends a request, retrying it as configured"""
+        endpoint = path_template(path) if self.circuitBreaker is not None else path
+        if self.retryPolicy is not None:
+            self.retryPolicy.budget.deposit()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                if self.circuitBreaker is not None and not self.circuitBreaker.allow(endpoint):
+                    return self._rejected_response(url, endpoint)
+                if self.rateLimiter is not None:
+                    delay = self.rateLimiter.reserve()
+                    if delay > 0:
+                        time.sleep(delay)
+                try:
+                    response = self.session.request(method, url, headers=headers, data=data if upload is None else upload, stream=True)
+                    self._read_body(method, path, response, download)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError):
+                    delay = self._resend_delay(method, endpoint, attempt, None, None, upload)
+                    if delay is None:
+                        raise
+                except BaseException:
+                    self._abandon(endpoint)
+                    raise
+                else:
+                    delay = self._resend_delay(method, endpoint, attempt, response.status_code, response.headers, upload)
+                    if delay is None:
+                        return response
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            if upload is not None:
+                upload.close()
+
+    def _resend_delay(self, method: str, endpoint: str, attempt: int, status_code: int | None,
+        response_headers: typing.Mapping[str, str] | None, upload: Upload | None = None) -> float | None:
+        """returns how long to wait before sending a call again, or None to stop"""
+        if self.circuitBreaker is not None:
+            self.circuitBreaker.record(endpoint, status_code is not None and status_code < 500)
+        retry_after = response_headers.get("Retry-After") if response_headers is not None else None
+        if status_code is not None and self.rateLimiter is not None:
+            self.rateLimiter.record(status_code, retry_after)
+        if upload is not None and not upload.replayable:
+            return None
+        if status_code == 429 and self.rateLimiter is not None:
+            # The rate limiter itself holds the call back for the Retry-After period
+            return 0.0 if attempt <= self.rateLimiter.max_retries else None
+        if self.retryPolicy is not None and self.retryPolicy.should_retry(method, attempt, status_code):
+            return self.retryPolicy.delay(attempt, retry_after)
+        return None
+
+    def _abandon(self, endpoint: str):
+        if self.circuitBreaker is not None:
+            self.circuitBreaker.record(endpoint, None)
+
+    def _rejected_response(self, url: str, endpoint: str) -> Response:
+        """the response returned in place of a call the circuit breaker did not send"""
+        return self._make_response(url, 503, {"Content-Type": "application/json"},
+                                   self.jsonCodec.dumps({"error": {"message": self._rejected_message(endpoint)}}))
+
+    def _make_response(self, url: str, status_code: int, headers: typing.Mapping[str, str], content: bytes) -> Response:
+        """a response that was not received from the API, with its body already read"""
+        response = Response()
+        response.status_code = status_code
+        response.url = url
+        response.headers.update(headers)
+        response._content = content
+        return response
+
+    def _rejected_message(self, endpoint: str) -> str:
+        if self.circuitBreaker.state(endpoint) == "closed":
+            return f"Too many calls to {endpoint} are in flight; the call was not sent"
+        return f"The circuit breaker for {endpoint} is open after repeated failures; the call was not sent"
+
+    def _build_upload(self, filename: str | Upload | None) -> Upload | None:
+        if not filename:
+            return None
+        return filename if isinstance(filename, Upload) else Upload(filename)
+
+    def _read_body(self, method: str, path: str, response: Response, download: Download | None = None):
+        """receives and decodes the body of a streamed response, writing successful downloads to their target"""
+        encoding = response.headers.get("Content-Encoding")
+        download = self._begin_download(response, download)
+        parts: typing.List[bytes] = []
+        write = download.write if download is not None else parts.append
+        try:
+            if response._content is not False or response.raw is None:
+                # The transport has already read the body
+                decoder = ContentDecoder(None)
+                write(decoder.decompress(response.content or b""))
+            else:
+                decoder = ContentDecoder(encoding)
+                try:
+                    for chunk in response.raw.stream(65536, decode_content=False):
+                        write(decoder.decompress(chunk))
+                    write(decoder.flush())
+                except urllib3.exceptions.ProtocolError as e:
+                    raise requests.exceptions.ChunkedEncodingError(e)
+                except urllib3.exceptions.ReadTimeoutError as e:
+                    raise requests.exceptions.ConnectionError(e)
+                finally:
+                    response._content_consumed = True
+                    response.close()
+                response._content = b"".join(parts)
+            if download is not None:
+                download.finish()
+        except BaseException:
+            if download is not None:
+                download.abort()
+            raise
+        self._record_transfer(method, path, response.status_code, encoding, decoder,
+                              download.info.size if download is not None else len(response.content))
+
+    def _begin_download(self, response: typing.Any, download: Download | None) -> Download | None:
+        """starts a download if the response was successful; error responses are read as usual"""
+        if download is None or not 200 <= response.status_code < 300:
+            return None
+        length = response.headers.get("Content-Length")
+        compressed = response.headers.get("Content-Encoding", "identity") != "identity"
+        download.begin(int(length) if length and not compressed else None, response.headers.get("Content-Type"))
+        return download
+
+    def _record_transfer(self, method: str, path: str, status_code: int, encoding: str | None, decoder: ContentDecoder, size: int):
+        if self.transferListener is not None:
+            self.transferListener(TransferStats(method, path, status_code, encoding, decoder.received, size, decoder.seconds))
+
+    def _build_body(self, body: object, headers: typing.Dict[str, str]) -> bytes | None:
+        if body is None:
+            return None
+        headers["Content-Type"] = "application/json"
+        return self.jsonCodec.dumps(body)
+
+    def _build_url(self, path: str, query_params: typing.Dict[str, typing.Any] | None) -> str:
+        if query_params:
+            return urllib.parse.urljoin(self.serverUrl, path) + "?" + urllib.parse.urlencode(query_params)
+        return urllib.parse.urljoin(self.serverUrl, path)
+
+    def _build_headers(self) -> typing.Dict[str, str]:
+        headers = {"Accept": "application/json",
+                   "Accept-Encoding": accept_encoding(self.contentEncodings),
+                   "SdkName": self.sdkName,
+                   "SdkVersion": self.sdkVersion,
+                   "MachineName": self.machineName,
+                   "ApplicationName": self.applicationName}
+        if self.bearerToken:
+            headers["Authorization"] = "Bearer " + self.bearerToken
+        return headers
@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.astroresult import AstroResult
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ApiKeyClient:
     """
@@ -55,7 +53,7 @@ class ApiKeyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ApiKeyDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ApiKeyDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ApiKeyDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ApiKeyDto](None, False, True, result.status_code, None)
@@ -86,9 +84,7 @@ class ApiKeyClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ApiKeyDto, data=dict))
+            data = self.client.decode_list(ApiKeyDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ApiKeyDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ApiKeyDto]](None, False, True, result.status_code, None)
@@ -123,7 +119,7 @@ class ApiKeyClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -156,7 +152,7 @@ class ApiKeyClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
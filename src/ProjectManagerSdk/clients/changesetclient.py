@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.projectchangestatusdto import ProjectChangeStatusD
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ChangesetClient:
     """
@@ -51,7 +49,7 @@ class ChangesetClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectChangeStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectChangeStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectChangeStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectChangeStatusDto](None, False, True, result.status_code, None)
@@ -88,7 +86,7 @@ class ChangesetClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectChangeStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectChangeStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectChangeStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectChangeStatusDto](None, False, True, result.status_code, None)
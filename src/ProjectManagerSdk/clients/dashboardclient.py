@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.dashboardsettingdto import DashboardSettingDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class DashboardClient:
     """
@@ -42,7 +40,7 @@ class DashboardClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=DashboardSettingDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(DashboardSettingDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[DashboardSettingDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[DashboardSettingDto](None, False, True, result.status_code, None)
@@ -62,7 +60,7 @@ class DashboardClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=DashboardSettingDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(DashboardSettingDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[DashboardSettingDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[DashboardSettingDto](None, False, True, result.status_code, None)
@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.discussioncommentdto import DiscussionCommentDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class DiscussionClient:
     """
@@ -43,9 +41,7 @@ class DiscussionClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=DiscussionCommentDto, data=dict))
+            data = self.client.decode_list(DiscussionCommentDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[DiscussionCommentDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[DiscussionCommentDto]](None, False, True, result.status_code, None)
@@ -72,7 +68,7 @@ class DiscussionClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=DiscussionCommentCreateResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(DiscussionCommentCreateResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[DiscussionCommentCreateResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[DiscussionCommentCreateResponseDto](None, False, True, result.status_code, None)
@@ -92,7 +88,7 @@ class DiscussionClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -112,7 +108,7 @@ class DiscussionClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -132,7 +128,7 @@ class DiscussionClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -13,11 +13,10 @@
 
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.updaterequestdto import UpdateRequestDto
-from typing import List
+from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget
+from typing import Any, Callable, List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class FileClient:
     """
@@ -63,6 +62,46 @@ class FileClient:
             response.load_error(result)
             return response
 
+    def download_file_to(self, documentId: str, type: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_file` to a path, file
+        object or function in chunks, so that only one chunk is held in
+        memory at once. If the API returns an error, the target is left
+        untouched and you will receive a JSON result with error
+        information. If the download fails partway, a path is left as it
+        was, but a file object or function may already have received
+        part of the file.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document to download
+        type : str
+            If you specify a type of `html`, processes the file using
+            text encoding, otherwise binary
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/files/{documentId}/download"
+        queryParams = {}
+        if type:
+            queryParams['type'] = type
+        download = Download(target, checksum, progress)
+        result = self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
     def download_a_thumbnail_image(self, documentId: str) -> AstroResult[bytes]:
         """
         Downloads a thumbnail image associated with a document that was
@@ -94,6 +133,42 @@ class FileClient:
             response.load_error(result)
             return response
 
+    def download_a_thumbnail_image_to(self, documentId: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_a_thumbnail_image` to a
+        path, file object or function in chunks, so that only one chunk
+        is held in memory at once. If the API returns an error, the
+        target is left untouched and you will receive a JSON result with
+        error information. If the download fails partway, a path is left
+        as it was, but a file object or function may already have
+        received part of the file.
+
+        Parameters
+        ----------
+        documentId : str
+            The unique identifier of the document for which to download
+            the thumbnail.
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/files/{documentId}/thumbnail"
+        queryParams = {}
+        download = Download(target, checksum, progress)
+        result = self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
     def update_file(self, fileId: str, body: UpdateRequestDto) -> AstroResult[object]:
         """
         Updates information about a File uploaded to your Workspace.
@@ -118,7 +193,7 @@ class FileClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -145,7 +220,7 @@ class FileClient:
             queryParams['hard'] = hard
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
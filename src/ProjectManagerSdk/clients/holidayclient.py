@@ -15,11 +15,10 @@ from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.countryholidaydto import CountryHolidayDto
 from ProjectManagerSdk.models.globalholidaydto import GlobalHolidayDto
 from ProjectManagerSdk.models.resourceholidaydto import ResourceHolidayDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class HolidayClient:
     """
@@ -63,15 +62,38 @@ class HolidayClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ResourceHolidayDto, data=dict))
+            data = self.client.decode_list(ResourceHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ResourceHolidayDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ResourceHolidayDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_resource_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[ResourceHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_resource_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_resource_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def query_country_holidays(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[CountryHolidayDto]]:
         """
         Retrieve a list of country holidays that match an [OData
@@ -105,15 +127,38 @@ class HolidayClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=CountryHolidayDto, data=dict))
+            data = self.client.decode_list(CountryHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[CountryHolidayDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[CountryHolidayDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_country_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[CountryHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_country_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_country_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def query_global_holidays(self, top: int, skip: int, filter: str, orderby: str, expand: str) -> AstroResult[List[GlobalHolidayDto]]:
         """
         Retrieve a list of global holidays that match an [OData
@@ -147,11 +192,34 @@ class HolidayClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=GlobalHolidayDto, data=dict))
+            data = self.client.decode_list(GlobalHolidayDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[GlobalHolidayDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[GlobalHolidayDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
+
+    def iter_global_holidays(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[GlobalHolidayDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_global_holidays` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_global_holidays(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
@@ -13,11 +13,10 @@
 
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.filedto import FileDto
+from ProjectManagerSdk.uploads import Upload
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class HomeFileClient:
     """
@@ -28,7 +27,7 @@ class HomeFileClient:
     def __init__(self, client: ProjectManagerClient):
         self.client = client
 
-    def upload_home_file(self, fileName: str) -> AstroResult[FileDto]:
+    def upload_home_file(self, fileName: str | Upload) -> AstroResult[FileDto]:
         """
         Uploads a file to the My Files folder on your Home Files page.
         ProjectManager allows you to store Files connected to other
@@ -43,21 +42,22 @@ class HomeFileClient:
 
         Parameters
         ----------
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = "/api/data/home/files"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=FileDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[FileDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[FileDto](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
-    def upload_home_file_to_folder(self, folderId: str, fileName: str) -> AstroResult[FileDto]:
+    def upload_home_file_to_folder(self, folderId: str, fileName: str | Upload) -> AstroResult[FileDto]:
         """
         Uploads a file to a specific folder on your Home Files page.
         ProjectManager allows you to store Files connected to other
@@ -76,14 +76,15 @@ class HomeFileClient:
         ----------
         folderId : str
             The reference to the sub folder to put the file into
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = f"/api/data/home/folders/{folderId}/files"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=FileDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[FileDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[FileDto](None, False, True, result.status_code, None)
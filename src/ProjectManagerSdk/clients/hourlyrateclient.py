@@ -20,8 +20,6 @@ from ProjectManagerSdk.models.hourlyratevalueupdatedto import HourlyRateValueUpd
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class HourlyRateClient:
     """
@@ -45,7 +43,7 @@ class HourlyRateClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=HourlyRateDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(HourlyRateDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[HourlyRateDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[HourlyRateDto](None, False, True, result.status_code, None)
@@ -63,9 +61,7 @@ class HourlyRateClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=HourlyRateDto, data=dict))
+            data = self.client.decode_list(HourlyRateDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[HourlyRateDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[HourlyRateDto]](None, False, True, result.status_code, None)
@@ -87,7 +83,7 @@ class HourlyRateClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=HourlyRateValueDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(HourlyRateValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[HourlyRateValueDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[HourlyRateValueDto](None, False, True, result.status_code, None)
@@ -107,7 +103,7 @@ class HourlyRateClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=HourlyRateDetailsDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(HourlyRateDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[HourlyRateDetailsDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[HourlyRateDetailsDto](None, False, True, result.status_code, None)
@@ -127,7 +123,7 @@ class HourlyRateClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
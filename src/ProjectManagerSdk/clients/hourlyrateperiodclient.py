@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.hourlyrateperioddto import HourlyRatePeriodDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class HourlyRatePeriodClient:
     """
@@ -40,9 +38,7 @@ class HourlyRatePeriodClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=HourlyRatePeriodDto, data=dict))
+            data = self.client.decode_list(HourlyRatePeriodDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[HourlyRatePeriodDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[HourlyRatePeriodDto]](None, False, True, result.status_code, None)
@@ -62,7 +58,7 @@ class HourlyRatePeriodClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=HourlyRatePeriodDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(HourlyRatePeriodDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[HourlyRatePeriodDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[HourlyRatePeriodDto](None, False, True, result.status_code, None)
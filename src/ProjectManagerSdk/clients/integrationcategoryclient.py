@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.integrationcategorydto import IntegrationCategoryD
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class IntegrationCategoryClient:
     """
@@ -44,9 +42,7 @@ class IntegrationCategoryClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=IntegrationCategoryDto, data=dict))
+            data = self.client.decode_list(IntegrationCategoryDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[IntegrationCategoryDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[IntegrationCategoryDto]](None, False, True, result.status_code, None)
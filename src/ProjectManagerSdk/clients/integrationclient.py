@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.integrationdto import IntegrationDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class IntegrationClient:
     """
@@ -44,7 +42,7 @@ class IntegrationClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=IntegrationDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[IntegrationDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[IntegrationDto](None, False, True, result.status_code, None)
@@ -67,7 +65,7 @@ class IntegrationClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=IntegrationDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[IntegrationDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[IntegrationDto](None, False, True, result.status_code, None)
@@ -90,7 +88,7 @@ class IntegrationClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -111,9 +109,7 @@ class IntegrationClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=IntegrationDto, data=dict))
+            data = self.client.decode_list(IntegrationDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[IntegrationDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[IntegrationDto]](None, False, True, result.status_code, None)
@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.integrationproviderdto import IntegrationProviderD
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class IntegrationProviderClient:
     """
@@ -46,9 +44,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=IntegrationProviderDto, data=dict))
+            data = self.client.decode_list(IntegrationProviderDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[IntegrationProviderDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[IntegrationProviderDto]](None, False, True, result.status_code, None)
@@ -75,7 +71,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ConnectionSchemaDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ConnectionSchemaDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ConnectionSchemaDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ConnectionSchemaDto](None, False, True, result.status_code, None)
@@ -102,7 +98,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -127,7 +123,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -155,7 +151,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ConnectionSchemaDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ConnectionSchemaDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ConnectionSchemaDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ConnectionSchemaDto](None, False, True, result.status_code, None)
@@ -182,7 +178,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -207,7 +203,7 @@ class IntegrationProviderClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
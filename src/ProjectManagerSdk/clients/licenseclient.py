@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.licensedto import LicenseDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class LicenseClient:
     """
@@ -44,9 +42,7 @@ class LicenseClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=LicenseDto, data=dict))
+            data = self.client.decode_list(LicenseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[LicenseDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[LicenseDto]](None, False, True, result.status_code, None)
@@ -71,9 +67,7 @@ class LicenseClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=LicenseDto, data=dict))
+            data = self.client.decode_list(LicenseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[LicenseDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[LicenseDto]](None, False, True, result.status_code, None)
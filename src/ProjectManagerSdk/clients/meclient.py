@@ -13,11 +13,10 @@
 
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.workspaceuserinfodto import WorkSpaceUserInfoDto
+from ProjectManagerSdk.uploads import Upload
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class MeClient:
     """
@@ -45,7 +44,7 @@ class MeClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=WorkSpaceUserInfoDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(WorkSpaceUserInfoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[WorkSpaceUserInfoDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[WorkSpaceUserInfoDto](None, False, True, result.status_code, None)
@@ -64,27 +63,28 @@ class MeClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
-    def update_my_avatar(self, fileName: str) -> AstroResult[object]:
+    def update_my_avatar(self, fileName: str | Upload) -> AstroResult[object]:
         """
         Updates the logged in user avatar
 
         Parameters
         ----------
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = "/api/data/me/avatar"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -27,8 +27,6 @@ from ProjectManagerSdk.models.yearlyrecurringsettingsdto import YearlyRecurringS
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class MeetingsClient:
     """
@@ -55,9 +53,7 @@ class MeetingsClient:
             queryParams['projectId'] = projectId
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=MeetingDto, data=dict))
+            data = self.client.decode_list(MeetingDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[MeetingDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[MeetingDto]](None, False, True, result.status_code, None)
@@ -80,7 +76,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=MeetingDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(MeetingDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[MeetingDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[MeetingDto](None, False, True, result.status_code, None)
@@ -103,7 +99,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=MeetingDetailsDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(MeetingDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[MeetingDetailsDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[MeetingDetailsDto](None, False, True, result.status_code, None)
@@ -125,7 +121,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=MeetingDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(MeetingDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[MeetingDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[MeetingDto](None, False, True, result.status_code, None)
@@ -145,7 +141,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -175,7 +171,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -205,7 +201,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -235,7 +231,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -265,7 +261,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -297,7 +293,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=DeletedTasksDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(DeletedTasksDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[DeletedTasksDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[DeletedTasksDto](None, False, True, result.status_code, None)
@@ -332,7 +328,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskValidationResultDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskValidationResultDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskValidationResultDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskValidationResultDto](None, False, True, result.status_code, None)
@@ -367,7 +363,7 @@ class MeetingsClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.meetingtodoupdatedto import MeetingTodoUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class MeetingTodosClient:
     """
@@ -43,9 +41,7 @@ class MeetingTodosClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=MeetingTodoDto, data=dict))
+            data = self.client.decode_list(MeetingTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[MeetingTodoDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[MeetingTodoDto]](None, False, True, result.status_code, None)
@@ -67,7 +63,7 @@ class MeetingTodosClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=MeetingTodoDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(MeetingTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[MeetingTodoDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[MeetingTodoDto](None, False, True, result.status_code, None)
@@ -89,7 +85,7 @@ class MeetingTodosClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=MeetingTodoDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(MeetingTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[MeetingTodoDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[MeetingTodoDto](None, False, True, result.status_code, None)
@@ -109,7 +105,7 @@ class MeetingTodosClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.notificationunreadcountdto import NotificationUnre
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class NotificationClient:
     """
@@ -74,7 +72,7 @@ class NotificationClient:
             queryParams['asFlatList'] = asFlatList
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NotificationResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NotificationResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NotificationResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NotificationResponseDto](None, False, True, result.status_code, None)
@@ -98,7 +96,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NotificationTotalCountDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NotificationTotalCountDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NotificationTotalCountDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NotificationTotalCountDto](None, False, True, result.status_code, None)
@@ -122,7 +120,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NotificationUnreadCountDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NotificationUnreadCountDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NotificationUnreadCountDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NotificationUnreadCountDto](None, False, True, result.status_code, None)
@@ -146,7 +144,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -171,7 +169,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NotificationTimestampDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NotificationTimestampDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NotificationTimestampDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NotificationTimestampDto](None, False, True, result.status_code, None)
@@ -195,7 +193,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NotificationTimestampDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NotificationTimestampDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NotificationTimestampDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NotificationTimestampDto](None, False, True, result.status_code, None)
@@ -221,7 +219,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -246,7 +244,7 @@ class NotificationClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.nptupdatedto import NptUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class NptClient:
     """
@@ -43,9 +41,7 @@ class NptClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=NptDto, data=dict))
+            data = self.client.decode_list(NptDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[NptDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[NptDto]](None, False, True, result.status_code, None)
@@ -73,7 +69,7 @@ class NptClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NptDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NptDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NptDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NptDto](None, False, True, result.status_code, None)
@@ -102,7 +98,7 @@ class NptClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NptDetailsDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NptDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NptDetailsDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NptDetailsDto](None, False, True, result.status_code, None)
@@ -131,7 +127,7 @@ class NptClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NptDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NptDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NptDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NptDto](None, False, True, result.status_code, None)
@@ -157,7 +153,7 @@ class NptClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
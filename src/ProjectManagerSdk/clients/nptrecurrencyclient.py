@@ -23,8 +23,6 @@ from ProjectManagerSdk.models.yearlyrecurringsettingsdto import YearlyRecurringS
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class NptRecurrencyClient:
     """
@@ -58,7 +56,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -88,7 +86,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -118,7 +116,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -148,7 +146,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
@@ -180,7 +178,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=DeletedTasksDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(DeletedTasksDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[DeletedTasksDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[DeletedTasksDto](None, False, True, result.status_code, None)
@@ -215,7 +213,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskValidationResultDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskValidationResultDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskValidationResultDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskValidationResultDto](None, False, True, result.status_code, None)
@@ -250,7 +248,7 @@ class NptRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
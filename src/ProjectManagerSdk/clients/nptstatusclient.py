@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.nptstatusupdatedto import NptStatusUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class NptStatusClient:
     """
@@ -42,9 +40,7 @@ class NptStatusClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=NptStatusDto, data=dict))
+            data = self.client.decode_list(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[NptStatusDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[NptStatusDto]](None, False, True, result.status_code, None)
@@ -64,7 +60,7 @@ class NptStatusClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NptStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NptStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NptStatusDto](None, False, True, result.status_code, None)
@@ -86,7 +82,7 @@ class NptStatusClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=NptStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(NptStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[NptStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[NptStatusDto](None, False, True, result.status_code, None)
@@ -108,7 +104,7 @@ class NptStatusClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
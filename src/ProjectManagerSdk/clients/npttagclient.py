@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.tasktagdto import TaskTagDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class NptTagClient:
     """
@@ -52,9 +50,7 @@ class NptTagClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("POST", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskTagDto, data=dict))
+            data = self.client.decode_list(TaskTagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskTagDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskTagDto]](None, False, True, result.status_code, None)
@@ -84,9 +80,7 @@ class NptTagClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("PUT", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskTagDto, data=dict))
+            data = self.client.decode_list(TaskTagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskTagDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskTagDto]](None, False, True, result.status_code, None)
@@ -116,7 +110,7 @@ class NptTagClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("DELETE", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -141,9 +135,7 @@ class NptTagClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskTagDto, data=dict))
+            data = self.client.decode_list(TaskTagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskTagDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskTagDto]](None, False, True, result.status_code, None)
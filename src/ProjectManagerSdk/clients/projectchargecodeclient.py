@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.projectchargecodeupdatedto import ProjectChargeCod
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectChargeCodeClient:
     """
@@ -45,9 +43,7 @@ class ProjectChargeCodeClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectChargeCodeDto, data=dict))
+            data = self.client.decode_list(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectChargeCodeDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectChargeCodeDto]](None, False, True, result.status_code, None)
@@ -67,7 +63,7 @@ class ProjectChargeCodeClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectChargeCodeDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectChargeCodeDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectChargeCodeDto](None, False, True, result.status_code, None)
@@ -89,7 +85,7 @@ class ProjectChargeCodeClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectChargeCodeDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectChargeCodeDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectChargeCodeDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectChargeCodeDto](None, False, True, result.status_code, None)
@@ -109,7 +105,7 @@ class ProjectChargeCodeClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -16,11 +16,10 @@ from ProjectManagerSdk.models.projectcreatedto import ProjectCreateDto
 from ProjectManagerSdk.models.projectdto import ProjectDto
 from ProjectManagerSdk.models.projectreopenstatusdto import ProjectReopenStatusDto
 from ProjectManagerSdk.models.projectupdatedto import ProjectUpdateDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectClient:
     """
@@ -68,15 +67,38 @@ class ProjectClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectDto, data=dict))
+            data = self.client.decode_list(ProjectDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_projects(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[ProjectDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_projects` one
+        page at a time. Only one page of records is held in memory at
+        once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_projects(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def create_project(self, body: ProjectCreateDto) -> AstroResult[ProjectDto]:
         """
         Create a new project based on the details provided. A Project is
@@ -94,7 +116,7 @@ class ProjectClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectDto](None, False, True, result.status_code, None)
@@ -118,7 +140,7 @@ class ProjectClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectDto](None, False, True, result.status_code, None)
@@ -146,7 +168,7 @@ class ProjectClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -174,7 +196,7 @@ class ProjectClient:
             queryParams['hardDelete'] = hardDelete
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -198,7 +220,7 @@ class ProjectClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectReopenStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectReopenStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectReopenStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectReopenStatusDto](None, False, True, result.status_code, None)
@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.projectcustomerdto import ProjectCustomerDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectCustomerClient:
     """
@@ -44,9 +42,7 @@ class ProjectCustomerClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectCustomerDto, data=dict))
+            data = self.client.decode_list(ProjectCustomerDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectCustomerDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectCustomerDto]](None, False, True, result.status_code, None)
@@ -66,7 +62,7 @@ class ProjectCustomerClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectCustomerDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectCustomerDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectCustomerDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectCustomerDto](None, False, True, result.status_code, None)
@@ -88,7 +84,7 @@ class ProjectCustomerClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectCustomerDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectCustomerDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectCustomerDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectCustomerDto](None, False, True, result.status_code, None)
@@ -109,7 +105,7 @@ class ProjectCustomerClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.updateprojectfieldvaluedto import UpdateProjectFie
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectFieldClient:
     """
@@ -47,9 +45,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectFieldDto, data=dict))
+            data = self.client.decode_list(ProjectFieldDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectFieldDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectFieldDto]](None, False, True, result.status_code, None)
@@ -74,7 +70,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectFieldDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectFieldDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectFieldDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectFieldDto](None, False, True, result.status_code, None)
@@ -99,7 +95,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -134,7 +130,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -164,7 +160,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectFieldValueDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectFieldValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectFieldValueDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectFieldValueDto](None, False, True, result.status_code, None)
@@ -190,9 +186,7 @@ class ProjectFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectFieldValueDto, data=dict))
+            data = self.client.decode_list(ProjectFieldValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectFieldValueDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectFieldValueDto]](None, False, True, result.status_code, None)
@@ -13,11 +13,10 @@
 
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.filedto import FileDto
+from ProjectManagerSdk.uploads import Upload
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectFileClient:
     """
@@ -28,7 +27,7 @@ class ProjectFileClient:
     def __init__(self, client: ProjectManagerClient):
         self.client = client
 
-    def upload_project_file(self, projectId: str, fileName: str) -> AstroResult[FileDto]:
+    def upload_project_file(self, projectId: str, fileName: str | Upload) -> AstroResult[FileDto]:
         """
         Uploads a file to the All Files folder on the Files page within
         the project that you specify. ProjectManager allows you to store
@@ -46,21 +45,22 @@ class ProjectFileClient:
         ----------
         projectId : str
             The reference to the project
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = f"/api/data/projects/{projectId}/files"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=FileDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[FileDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[FileDto](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
-    def upload_project_file_to_folder(self, projectId: str, folderId: str, fileName: str) -> AstroResult[FileDto]:
+    def upload_project_file_to_folder(self, projectId: str, folderId: str, fileName: str | Upload) -> AstroResult[FileDto]:
         """
         Uploads a file to a specific folder on the Files page within the
         project that you specify. ProjectManager allows you to store
@@ -81,14 +81,15 @@ class ProjectFileClient:
             The reference to the project
         folderId : str
             The reference to the sub folder to put the file into
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = f"/api/data/projects/{projectId}/folders/{folderId}/files"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=FileDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[FileDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[FileDto](None, False, True, result.status_code, None)
@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.projectfolderupdatedto import ProjectFolderUpdateD
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectFolderClient:
     """
@@ -43,9 +41,7 @@ class ProjectFolderClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectFolderDto, data=dict))
+            data = self.client.decode_list(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectFolderDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectFolderDto]](None, False, True, result.status_code, None)
@@ -65,7 +61,7 @@ class ProjectFolderClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectFolderDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectFolderDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectFolderDto](None, False, True, result.status_code, None)
@@ -87,7 +83,7 @@ class ProjectFolderClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectFolderDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectFolderDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectFolderDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectFolderDto](None, False, True, result.status_code, None)
@@ -107,7 +103,7 @@ class ProjectFolderClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.projectmembersaccessdto import ProjectMembersAcces
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectMembersClient:
     """
@@ -48,9 +46,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectMemberDto, data=dict))
+            data = self.client.decode_list(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectMemberDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectMemberDto]](None, False, True, result.status_code, None)
@@ -68,9 +64,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectAccessDto, data=dict))
+            data = self.client.decode_list(ProjectAccessDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectAccessDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectAccessDto]](None, False, True, result.status_code, None)
@@ -102,9 +96,7 @@ class ProjectMembersClient:
             queryParams['includeAllUsers'] = includeAllUsers
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectMemberDto, data=dict))
+            data = self.client.decode_list(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectMemberDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectMemberDto]](None, False, True, result.status_code, None)
@@ -132,7 +124,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectMemberDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectMemberDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectMemberDto](None, False, True, result.status_code, None)
@@ -159,7 +151,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectMemberDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectMemberDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectMemberDto](None, False, True, result.status_code, None)
@@ -189,7 +181,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectMemberDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectMemberDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectMemberDto](None, False, True, result.status_code, None)
@@ -219,7 +211,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectMemberDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectMemberDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectMemberDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectMemberDto](None, False, True, result.status_code, None)
@@ -246,7 +238,7 @@ class ProjectMembersClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
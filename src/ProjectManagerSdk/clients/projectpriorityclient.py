@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.projectprioritydto import ProjectPriorityDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectPriorityClient:
     """
@@ -48,9 +46,7 @@ class ProjectPriorityClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectPriorityDto, data=dict))
+            data = self.client.decode_list(ProjectPriorityDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectPriorityDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectPriorityDto]](None, False, True, result.status_code, None)
@@ -70,7 +66,7 @@ class ProjectPriorityClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectPriorityDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectPriorityDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectPriorityDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectPriorityDto](None, False, True, result.status_code, None)
@@ -92,7 +88,7 @@ class ProjectPriorityClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectPriorityDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectPriorityDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectPriorityDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectPriorityDto](None, False, True, result.status_code, None)
@@ -113,7 +109,7 @@ class ProjectPriorityClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.projectstatusupdatedto import ProjectStatusUpdateD
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectStatusClient:
     """
@@ -46,9 +44,7 @@ class ProjectStatusClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectStatusDto, data=dict))
+            data = self.client.decode_list(ProjectStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectStatusDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectStatusDto]](None, False, True, result.status_code, None)
@@ -68,7 +64,7 @@ class ProjectStatusClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectStatusDto](None, False, True, result.status_code, None)
@@ -90,7 +86,7 @@ class ProjectStatusClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectStatusDto](None, False, True, result.status_code, None)
@@ -110,7 +106,7 @@ class ProjectStatusClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.projecttemplatedto import ProjectTemplateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectTemplateClient:
     """
@@ -44,9 +42,7 @@ class ProjectTemplateClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectTemplateDto, data=dict))
+            data = self.client.decode_list(ProjectTemplateDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectTemplateDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectTemplateDto]](None, False, True, result.status_code, None)
@@ -68,9 +64,7 @@ class ProjectTemplateClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectTemplateCategoryDto, data=dict))
+            data = self.client.decode_list(ProjectTemplateCategoryDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectTemplateCategoryDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectTemplateCategoryDto]](None, False, True, result.status_code, None)
@@ -14,11 +14,10 @@
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.projectrestoreprojectdto import ProjectRestoreProjectDto
 from ProjectManagerSdk.models.projectversiondto import ProjectVersionDto
-from typing import List
+from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget
+from typing import Any, Callable, List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ProjectVersionClient:
     """
@@ -43,9 +42,7 @@ class ProjectVersionClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ProjectVersionDto, data=dict))
+            data = self.client.decode_list(ProjectVersionDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ProjectVersionDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ProjectVersionDto]](None, False, True, result.status_code, None)
@@ -72,6 +69,41 @@ class ProjectVersionClient:
             response.load_error(result)
             return response
 
+    def download_msproject_xml_to(self, projectChangeId: str, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by `download_msproject_xml` to a path,
+        file object or function in chunks, so that only one chunk is
+        held in memory at once. If the API returns an error, the target
+        is left untouched and you will receive a JSON result with error
+        information. If the download fails partway, a path is left as it
+        was, but a file object or function may already have received
+        part of the file.
+
+        Parameters
+        ----------
+        projectChangeId : str
+            Project change Guid
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = f"/api/data/projects/{projectChangeId}/version/download"
+        queryParams = {}
+        download = Download(target, checksum, progress)
+        result = self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
+
     def restore_project_version(self, projectId: str, version: int) -> AstroResult[ProjectRestoreProjectDto]:
         """
         Restores a Project to the state it was in at a specific Version
@@ -90,7 +122,7 @@ class ProjectVersionClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectRestoreProjectDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectRestoreProjectDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectRestoreProjectDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectRestoreProjectDto](None, False, True, result.status_code, None)
@@ -118,7 +150,7 @@ class ProjectVersionClient:
             queryParams['timezoneOffset'] = timezoneOffset
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ProjectRestoreProjectDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ProjectRestoreProjectDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ProjectRestoreProjectDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ProjectRestoreProjectDto](None, False, True, result.status_code, None)
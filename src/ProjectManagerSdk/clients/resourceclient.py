@@ -17,11 +17,10 @@ from ProjectManagerSdk.models.resourcedto import ResourceDto
 from ProjectManagerSdk.models.resourcescreatedto import ResourcesCreateDto
 from ProjectManagerSdk.models.resourcesdto import ResourcesDto
 from ProjectManagerSdk.models.resourceupdatedto import ResourceUpdateDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ResourceClient:
     """
@@ -51,7 +50,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
@@ -97,15 +96,38 @@ class ResourceClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ResourceDto, data=dict))
+            data = self.client.decode_list(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ResourceDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ResourceDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_resources(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[ResourceDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_resources` one
+        page at a time. Only one page of records is held in memory at
+        once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_resources(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def update_resource(self, resourceId: str, body: ResourceUpdateDto) -> AstroResult[ResourceDto]:
         """
         Updates an existing Resource based on information you provide. A
@@ -128,7 +150,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
@@ -155,7 +177,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
@@ -181,7 +203,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceDto](None, False, True, result.status_code, None)
@@ -207,7 +229,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourcesDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourcesDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourcesDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourcesDto](None, False, True, result.status_code, None)
@@ -232,7 +254,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -252,7 +274,7 @@ class ResourceClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
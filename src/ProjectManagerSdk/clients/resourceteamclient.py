@@ -15,11 +15,10 @@ from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.createresourceteamdto import CreateResourceTeamDto
 from ProjectManagerSdk.models.resourceteamdto import ResourceTeamDto
 from ProjectManagerSdk.models.updateresourceteamdto import UpdateResourceTeamDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class ResourceTeamClient:
     """
@@ -67,15 +66,38 @@ class ResourceTeamClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ResourceTeamDto, data=dict))
+            data = self.client.decode_list(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ResourceTeamDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ResourceTeamDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_resource_teams(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[ResourceTeamDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `retrieve_resource_teams` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.retrieve_resource_teams(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def create_resource_team(self, body: CreateResourceTeamDto) -> AstroResult[ResourceTeamDto]:
         """
         Create a Resource Team.
@@ -89,7 +111,7 @@ class ResourceTeamClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceTeamDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceTeamDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceTeamDto](None, False, True, result.status_code, None)
@@ -110,7 +132,7 @@ class ResourceTeamClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -132,7 +154,7 @@ class ResourceTeamClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ResourceTeamDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ResourceTeamDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ResourceTeamDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ResourceTeamDto](None, False, True, result.status_code, None)
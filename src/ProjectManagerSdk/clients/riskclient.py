@@ -18,11 +18,10 @@ from ProjectManagerSdk.models.riskdetailsdto import RiskDetailsDto
 from ProjectManagerSdk.models.riskdto import RiskDto
 from ProjectManagerSdk.models.riskexportsettingsdto import RiskExportSettingsDto
 from ProjectManagerSdk.models.riskupdatedto import RiskUpdateDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class RiskClient:
     """
@@ -48,7 +47,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RiskDetailsDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RiskDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RiskDetailsDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RiskDetailsDto](None, False, True, result.status_code, None)
@@ -73,7 +72,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RiskDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RiskDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RiskDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RiskDto](None, False, True, result.status_code, None)
@@ -97,7 +96,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -120,9 +119,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=RiskDetailsDto, data=dict))
+            data = self.client.decode_list(RiskDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[RiskDetailsDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[RiskDetailsDto]](None, False, True, result.status_code, None)
@@ -147,7 +144,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RiskDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RiskDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RiskDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RiskDto](None, False, True, result.status_code, None)
@@ -171,7 +168,7 @@ class RiskClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ExportDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ExportDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ExportDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ExportDto](None, False, True, result.status_code, None)
@@ -213,11 +210,33 @@ class RiskClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=RiskDto, data=dict))
+            data = self.client.decode_list(RiskDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[RiskDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[RiskDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
+
+    def iter_risks(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[RiskDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_risks` one page
+        at a time. Only one page of records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_risks(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.roleupdatechangeitemdto import RoleUpdateChangeIte
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class SecurityClient:
     """
@@ -45,7 +43,7 @@ class SecurityClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=BusinessRolesListDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(BusinessRolesListDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[BusinessRolesListDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[BusinessRolesListDto](None, False, True, result.status_code, None)
@@ -67,7 +65,7 @@ class SecurityClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RoleDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RoleDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RoleDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RoleDto](None, False, True, result.status_code, None)
@@ -98,7 +96,7 @@ class SecurityClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("PUT", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RoleDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RoleDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RoleDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RoleDto](None, False, True, result.status_code, None)
@@ -119,7 +117,7 @@ class SecurityClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -138,7 +136,7 @@ class SecurityClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -15,11 +15,10 @@ from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.tagcreatedto import TagCreateDto
 from ProjectManagerSdk.models.tagdto import TagDto
 from ProjectManagerSdk.models.tagupdatedto import TagUpdateDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TagClient:
     """
@@ -65,15 +64,37 @@ class TagClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TagDto, data=dict))
+            data = self.client.decode_list(TagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TagDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TagDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_tags(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[TagDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_tags` one page
+        at a time. Only one page of records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_tags(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def create_tag(self, body: TagCreateDto) -> AstroResult[TagDto]:
         """
         Creates a new Tag based on information you provide. A Tag is a
@@ -90,7 +111,7 @@ class TagClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TagDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TagDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TagDto](None, False, True, result.status_code, None)
@@ -115,7 +136,7 @@ class TagClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TagDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TagDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TagDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TagDto](None, False, True, result.status_code, None)
@@ -135,7 +156,7 @@ class TagClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
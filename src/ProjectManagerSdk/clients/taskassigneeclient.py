@@ -19,8 +19,6 @@ from ProjectManagerSdk.models.iddto import IdDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskAssigneeClient:
     """
@@ -58,7 +56,7 @@ class TaskAssigneeClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("POST", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -90,7 +88,7 @@ class TaskAssigneeClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("PUT", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -119,7 +117,7 @@ class TaskAssigneeClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("DELETE", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -142,9 +140,7 @@ class TaskAssigneeClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=AssigneeDto, data=dict))
+            data = self.client.decode_list(AssigneeDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[AssigneeDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[AssigneeDto]](None, False, True, result.status_code, None)
@@ -18,11 +18,10 @@ from ProjectManagerSdk.models.taskdetailsdto import TaskDetailsDto
 from ProjectManagerSdk.models.taskdto import TaskDto
 from ProjectManagerSdk.models.taskprioritydto import TaskPriorityDto
 from ProjectManagerSdk.models.taskupdatedto import TaskUpdateDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskClient:
     """
@@ -70,15 +69,37 @@ class TaskClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskDto, data=dict))
+            data = self.client.decode_list(TaskDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_tasks(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[TaskDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_tasks` one page
+        at a time. Only one page of records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_tasks(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def retrieve_task(self, taskId: str) -> AstroResult[TaskDetailsDto]:
         """
         Retrieve a Task by its unique identifier or by its short ID. A
@@ -100,7 +121,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskDetailsDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskDetailsDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskDetailsDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskDetailsDto](None, False, True, result.status_code, None)
@@ -135,7 +156,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -163,7 +184,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -183,9 +204,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskDto, data=dict))
+            data = self.client.decode_list(TaskDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskDto]](None, False, True, result.status_code, None)
@@ -212,7 +231,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -237,9 +256,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskPriorityDto, data=dict))
+            data = self.client.decode_list(TaskPriorityDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskPriorityDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskPriorityDto]](None, False, True, result.status_code, None)
@@ -270,9 +287,7 @@ class TaskClient:
             bodyArray.append(remove_empty_elements(dataclasses.asdict(item)))
         result = self.client.send_request("POST", path, bodyArray, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=ChangeSetStatusDto, data=dict))
+            data = self.client.decode_list(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[ChangeSetStatusDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[ChangeSetStatusDto]](None, False, True, result.status_code, None)
@@ -294,7 +309,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -316,7 +331,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -336,7 +351,7 @@ class TaskClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -17,11 +17,10 @@ from ProjectManagerSdk.models.createtaskfielddto import CreateTaskFieldDto
 from ProjectManagerSdk.models.taskfielddto import TaskFieldDto
 from ProjectManagerSdk.models.taskfieldvaluedto import TaskFieldValueDto
 from ProjectManagerSdk.models.updatetaskfieldvaluedto import UpdateTaskFieldValueDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskFieldClient:
     """
@@ -51,9 +50,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskFieldDto, data=dict))
+            data = self.client.decode_list(TaskFieldDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskFieldDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskFieldDto]](None, False, True, result.status_code, None)
@@ -82,7 +79,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -127,15 +124,38 @@ class TaskFieldClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskFieldDto, data=dict))
+            data = self.client.decode_list(TaskFieldDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskFieldDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskFieldDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_task_fields(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[TaskFieldDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_task_fields`
+        one page at a time. Only one page of records is held in memory
+        at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_task_fields(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def delete_task_field(self, projectId: str, fieldId: str) -> AstroResult[object]:
         """
         Deletes a TaskField for a specific Project within your
@@ -158,7 +178,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -184,9 +204,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskFieldValueDto, data=dict))
+            data = self.client.decode_list(TaskFieldValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskFieldValueDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskFieldValueDto]](None, False, True, result.status_code, None)
@@ -231,15 +249,38 @@ class TaskFieldClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskFieldValueDto, data=dict))
+            data = self.client.decode_list(TaskFieldValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskFieldValueDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskFieldValueDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_task_field_values(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[TaskFieldValueDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling
+        `query_task_field_values` one page at a time. Only one page of
+        records is held in memory at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_task_field_values(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def retrieve_task_field_value(self, taskId: str, fieldId: str) -> AstroResult[TaskFieldValueDto]:
         """
         Retrieves the current TaskField value for a particular Task and
@@ -262,7 +303,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskFieldValueDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskFieldValueDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskFieldValueDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskFieldValueDto](None, False, True, result.status_code, None)
@@ -294,7 +335,7 @@ class TaskFieldClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -14,11 +14,10 @@
 from ProjectManagerSdk.models.astroresult import AstroResult
 from ProjectManagerSdk.models.filedto import FileDto
 from ProjectManagerSdk.models.taskfiledto import TaskFileDto
+from ProjectManagerSdk.uploads import Upload
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskFileClient:
     """
@@ -29,7 +28,7 @@ class TaskFileClient:
     def __init__(self, client: ProjectManagerClient):
         self.client = client
 
-    def upload_task_file(self, taskId: str, fileName: str) -> AstroResult[FileDto]:
+    def upload_task_file(self, taskId: str, fileName: str | Upload) -> AstroResult[FileDto]:
         """
         Uploads a file to a task. ProjectManager allows you to store
         Files connected to other elements of your Workspace such as a
@@ -46,14 +45,15 @@ class TaskFileClient:
         ----------
         taskId : str
             The reference to the task
-        fileName : str
-            The full path of a file to upload to the API
+        fileName : str | Upload
+            The full path of a file to upload to the API, or an `Upload`
+            that streams bytes, a file object or chunks
         """
         path = f"/api/data/tasks/{taskId}/files"
         queryParams = {}
         result = self.client.send_request("POST", path, None, queryParams, fileName)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=FileDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(FileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[FileDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[FileDto](None, False, True, result.status_code, None)
@@ -73,9 +73,7 @@ class TaskFileClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskFileDto, data=dict))
+            data = self.client.decode_list(TaskFileDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskFileDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskFileDto]](None, False, True, result.status_code, None)
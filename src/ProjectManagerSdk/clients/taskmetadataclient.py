@@ -17,8 +17,6 @@ from ProjectManagerSdk.models.taskmetadataupdatedto import TaskMetadataUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskMetadataClient:
     """
@@ -53,7 +51,7 @@ class TaskMetadataClient:
             queryParams['isOverride'] = isOverride
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -82,9 +80,7 @@ class TaskMetadataClient:
             queryParams['isSystem'] = isSystem
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskMetadataSearchDto, data=dict))
+            data = self.client.decode_list(TaskMetadataSearchDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskMetadataSearchDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskMetadataSearchDto]](None, False, True, result.status_code, None)
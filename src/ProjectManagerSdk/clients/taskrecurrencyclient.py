@@ -24,8 +24,6 @@ from ProjectManagerSdk.models.yearlyrecurringsettingsdto import YearlyRecurringS
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskRecurrencyClient:
     """
@@ -58,7 +56,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetailsChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetailsChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -87,7 +85,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetailsChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetailsChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -116,7 +114,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetailsChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetailsChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -145,7 +143,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetailsChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetailsChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetailsChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -177,7 +175,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=ChangeSetStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(ChangeSetStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[ChangeSetStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[ChangeSetStatusDto](None, False, True, result.status_code, None)
@@ -212,7 +210,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskValidationResultDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskValidationResultDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskValidationResultDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskValidationResultDto](None, False, True, result.status_code, None)
@@ -246,7 +244,7 @@ class TaskRecurrencyClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=RecurringTaskChangeSetDetails, data=json.loads(result.content)['data'])
+            data = self.client.decode(RecurringTaskChangeSetDetails, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[RecurringTaskChangeSetDetails](None, True, False, result.status_code, data)
         else:
             response = AstroResult[RecurringTaskChangeSetDetails](None, False, True, result.status_code, None)
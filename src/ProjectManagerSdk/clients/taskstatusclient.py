@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.taskstatusupdatedto import TaskStatusUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskStatusClient:
     """
@@ -49,9 +47,7 @@ class TaskStatusClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskStatusDto, data=dict))
+            data = self.client.decode_list(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskStatusDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskStatusDto]](None, False, True, result.status_code, None)
@@ -78,7 +74,7 @@ class TaskStatusClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskStatusDto](None, False, True, result.status_code, None)
@@ -105,7 +101,7 @@ class TaskStatusClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskStatusDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskStatusDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskStatusDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskStatusDto](None, False, True, result.status_code, None)
@@ -128,7 +124,7 @@ class TaskStatusClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
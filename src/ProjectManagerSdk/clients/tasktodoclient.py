@@ -18,8 +18,6 @@ from ProjectManagerSdk.models.tasktodoupdatedto import TaskTodoUpdateDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TaskTodoClient:
     """
@@ -43,9 +41,7 @@ class TaskTodoClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TaskTodoDto, data=dict))
+            data = self.client.decode_list(TaskTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TaskTodoDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TaskTodoDto]](None, False, True, result.status_code, None)
@@ -67,7 +63,7 @@ class TaskTodoClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskTodoDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskTodoDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskTodoDto](None, False, True, result.status_code, None)
@@ -89,7 +85,7 @@ class TaskTodoClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TaskTodoDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TaskTodoDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TaskTodoDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TaskTodoDto](None, False, True, result.status_code, None)
@@ -109,7 +105,7 @@ class TaskTodoClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -12,11 +12,10 @@
 #
 
 from ProjectManagerSdk.models.astroresult import AstroResult
-from typing import List
+from ProjectManagerSdk.downloads import Download, DownloadInfo, DownloadTarget
+from typing import Any, Callable, List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TeamsClient:
     """
@@ -46,3 +45,37 @@ class TeamsClient:
             response = AstroResult[bytes](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
+
+    def retrieve_zip_file_for_teams_integrations_to(self, target: DownloadTarget, checksum: str | None = None, progress: Callable[[int, int | None], Any] | None = None) -> AstroResult[DownloadInfo]:
+        """
+        Streams the file returned by
+        `retrieve_zip_file_for_teams_integrations` to a path, file
+        object or function in chunks, so that only one chunk is held in
+        memory at once. If the API returns an error, the target is left
+        untouched and you will receive a JSON result with error
+        information. If the download fails partway, a path is left as it
+        was, but a file object or function may already have received
+        part of the file.
+
+        Parameters
+        ----------
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known
+        """
+        path = "/api/data/integrations/teams/application"
+        queryParams = {}
+        download = Download(target, checksum, progress)
+        result = self.client.send_request("GET", path, None, queryParams, None, download)
+        if result.status_code >= 200 and result.status_code < 300:
+            return AstroResult[DownloadInfo](None, True, False, result.status_code, download.info)
+        else:
+            response = AstroResult[DownloadInfo](None, False, True, result.status_code, None)
+            response.load_error(result)
+            return response
@@ -20,11 +20,10 @@ from ProjectManagerSdk.models.timesheetcreaterequestdto import TimesheetCreateRe
 from ProjectManagerSdk.models.timesheetdto import TimesheetDto
 from ProjectManagerSdk.models.timesheetresponsedto import TimesheetResponseDto
 from ProjectManagerSdk.models.timesheetupdaterequestdto import TimesheetUpdateRequestDto
-from typing import List
+from typing import Iterator, List
+from ProjectManagerSdk.pagination import DEFAULT_PAGE_SIZE, paginate
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class TimesheetClient:
     """
@@ -67,7 +66,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TimesheetResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TimesheetResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TimesheetResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TimesheetResponseDto](None, False, True, result.status_code, None)
@@ -125,15 +124,38 @@ class TimesheetClient:
             queryParams['$expand'] = expand
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TimesheetDto, data=dict))
+            data = self.client.decode_list(TimesheetDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TimesheetDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TimesheetDto]](None, False, True, result.status_code, None)
             response.load_error(result)
             return response
 
+    def iter_time_entries(self, filter: str | None = None, orderby: str | None = None, expand: str | None = None, page_size: int = DEFAULT_PAGE_SIZE, max_items: int | None = None, prefetch: int = 0) -> Iterator[TimesheetDto]:
+        """
+        Iterate over every record that matches an [OData formatted
+        query](https://www.odata.org/) by calling `query_time_entries`
+        one page at a time. Only one page of records is held in memory
+        at once.
+
+        Parameters
+        ----------
+        $filter : str
+            Filter the expression according to oData queries
+        $orderby : str
+            Order collection by this field.
+        $expand : str
+            Include related data in the response
+        page_size : int
+            The number of records to retrieve with each API call
+        max_items : int
+            If set, stop after this many records have been returned
+        prefetch : int
+            The number of following pages to request in parallel while
+            the current page is being consumed
+        """
+        return paginate(lambda top, skip: self.query_time_entries(top, skip, filter, orderby, expand), page_size, max_items, prefetch)
+
     def delete_time_entry(self, timesheetId: str) -> AstroResult[object]:
         """
         Delete time entry by its unique identifier. A Timesheet is a
@@ -166,7 +188,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("DELETE", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=object, data=json.loads(result.content)['data'])
+            data = self.client.decode(object, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[object](None, True, False, result.status_code, data)
         else:
             response = AstroResult[object](None, False, True, result.status_code, None)
@@ -208,7 +230,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("PUT", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TimesheetResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TimesheetResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TimesheetResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TimesheetResponseDto](None, False, True, result.status_code, None)
@@ -248,9 +270,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=TimesheetAdminTypeDto, data=dict))
+            data = self.client.decode_list(TimesheetAdminTypeDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[TimesheetAdminTypeDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[TimesheetAdminTypeDto]](None, False, True, result.status_code, None)
@@ -289,7 +309,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TimeSheetApprovalResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TimeSheetApprovalResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TimeSheetApprovalResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TimeSheetApprovalResponseDto](None, False, True, result.status_code, None)
@@ -328,7 +348,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TimeSheetApprovalResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TimeSheetApprovalResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TimeSheetApprovalResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TimeSheetApprovalResponseDto](None, False, True, result.status_code, None)
@@ -368,7 +388,7 @@ class TimesheetClient:
         queryParams = {}
         result = self.client.send_request("POST", path, remove_empty_elements(dataclasses.asdict(body)), queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = dacite.from_dict(data_class=TimeSheetApprovalResponseDto, data=json.loads(result.content)['data'])
+            data = self.client.decode(TimeSheetApprovalResponseDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[TimeSheetApprovalResponseDto](None, True, False, result.status_code, data)
         else:
             response = AstroResult[TimeSheetApprovalResponseDto](None, False, True, result.status_code, None)
@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.userroledto import UserRoleDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class UserRoleClient:
     """
@@ -43,9 +41,7 @@ class UserRoleClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=UserRoleDto, data=dict))
+            data = self.client.decode_list(UserRoleDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[UserRoleDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[UserRoleDto]](None, False, True, result.status_code, None)
@@ -16,8 +16,6 @@ from ProjectManagerSdk.models.workspacedto import WorkSpaceDto
 from typing import List
 from ProjectManagerSdk.tools import remove_empty_elements
 import dataclasses
-import json
-import dacite
 
 class WorkSpaceClient:
     """
@@ -45,9 +43,7 @@ class WorkSpaceClient:
         queryParams = {}
         result = self.client.send_request("GET", path, None, queryParams, None)
         if result.status_code >= 200 and result.status_code < 300:
-            data = []
-            for dict in json.loads(result.content)['data']:
-                data.append(dacite.from_dict(data_class=WorkSpaceDto, data=dict))
+            data = self.client.decode_list(WorkSpaceDto, self.client.jsonCodec.loads(result.content)['data'])
             return AstroResult[List[WorkSpaceDto]](None, True, False, result.status_code, data)
         else:
             response = AstroResult[List[WorkSpaceDto]](None, False, True, result.status_code, None)
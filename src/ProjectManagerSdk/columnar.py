@@ -0,0 +1,256 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, Dict, Iterator, List, Sequence
+import dataclasses
+import types
+import typing
+import warnings
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Columnar results require numpy; install it with `pip install ProjectManagerSdk[columnar]`") from e
+    return numpy
+
+def _is_date_field(name: str) -> bool:
+    return name == "date" or name.endswith("Date")
+
+class DictionaryColumn:
+    """
+    A string column stored as integer codes into a table of distinct
+    values. Identifiers such as `projectId` or `resourceId` repeat across
+    many rows, so each distinct value is stored only once and grouping or
+    filtering can be done on the integer codes.
+    """
+
+    codes: Any
+    """
+    An int32 array with the index of each row's value in `values`, or -1
+    if the row has no value.
+    """
+
+    values: Any
+    """
+    An object array of the distinct values in this column.
+    """
+
+    def __init__(self, codes: Any, values: Any):
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str | None:
+        code = self.codes[index]
+        return None if code < 0 else self.values[code]
+
+    def decode(self) -> Any:
+        """Return the column as an object array of strings, with None for missing values"""
+        numpy = _numpy()
+        result = numpy.empty(len(self.codes), dtype=object)
+        present = self.codes >= 0
+        result[present] = self.values[self.codes[present]]
+        return result
+
+    @staticmethod
+    def encode(strings: Sequence[str | None]) -> "DictionaryColumn":
+        """Dictionary-encode a sequence of strings"""
+        numpy = _numpy()
+        lookup: Dict[str, int] = {}
+        codes = numpy.fromiter((-1 if value is None else lookup.setdefault(value, len(lookup)) for value in strings),
+                               dtype=numpy.int32, count=len(strings))
+        values = numpy.empty(len(lookup), dtype=object)
+        values[:] = list(lookup)
+        return DictionaryColumn(codes, values)
+
+
+class ColumnarResult:
+    """
+    A page of API results stored as one typed array per field instead of
+    one object per row.
+
+    * `float` fields become float64 masked arrays
+    * `int` and `bool` fields become int64 and bool masked arrays
+    * date fields such as `date` or `modifyDate` become datetime64[ms]
+      arrays, with NaT for missing values
+    * other string fields become a `DictionaryColumn`
+    * nested objects and lists are kept as object arrays of dictionaries
+
+    Missing values in masked arrays are masked, so numpy aggregations
+    such as `result["hours"].sum()` skip them.
+    """
+
+    columns: Dict[str, Any]
+    """
+    The arrays for this result, keyed by field name.
+    """
+
+    def __init__(self, columns: Dict[str, Any], length: int):
+        self.columns = columns
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the rows of this result as dictionaries"""
+        for index in range(self._length):
+            yield {name: _scalar(column, index) for name, column in self.columns.items()}
+
+    @property
+    def names(self) -> List[str]:
+        """The field names of the columns in this result"""
+        return list(self.columns)
+
+    @staticmethod
+    def concat(results: Sequence["ColumnarResult"]) -> "ColumnarResult":
+        """Combine several pages of results with the same columns into one"""
+        numpy = _numpy()
+        if not results:
+            return ColumnarResult({}, 0)
+        columns = {}
+        for name, first in results[0].columns.items():
+            parts = [result.columns[name] for result in results]
+            if isinstance(first, DictionaryColumn):
+                columns[name] = DictionaryColumn.encode([value for part in parts for value in part.decode()])
+            elif isinstance(first, numpy.ma.MaskedArray):
+                columns[name] = numpy.ma.concatenate(parts)
+            else:
+                columns[name] = numpy.concatenate(parts)
+        return ColumnarResult(columns, sum(len(result) for result in results))
+
+    def take(self, indices: Any) -> "ColumnarResult":
+        """Select rows by position
+
+        Parameters
+        ----------
+        indices : Any
+            An integer array of row positions, in the order to return them,
+            or a boolean array with one value per row
+        """
+        numpy = _numpy()
+        indices = numpy.asarray(indices)
+        if indices.dtype == bool:
+            indices = numpy.flatnonzero(indices)
+        columns = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                columns[name] = DictionaryColumn(column.codes[indices], column.values)
+            else:
+                columns[name] = column[indices]
+        return ColumnarResult(columns, len(indices))
+
+    def to_arrow(self) -> Any:
+        """Convert this result to a `pyarrow.Table`
+
+        String columns become dictionary arrays and missing values become
+        nulls. Nested objects and lists are not converted.
+        """
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("to_arrow requires pyarrow; install it with `pip install pyarrow`") from e
+        numpy = _numpy()
+        arrays = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                arrays[name] = pyarrow.DictionaryArray.from_arrays(pyarrow.array(column.codes, mask=column.codes < 0),
+                                                                   pyarrow.array(column.values, type=pyarrow.string()))
+            elif isinstance(column, numpy.ma.MaskedArray):
+                arrays[name] = pyarrow.array(column.data, mask=numpy.ma.getmaskarray(column))
+            elif column.dtype.kind == "M":
+                arrays[name] = pyarrow.array(column, mask=numpy.isnat(column))
+        return pyarrow.table(arrays)
+
+
+def _scalar(column: Any, index: int) -> Any:
+    if isinstance(column, DictionaryColumn):
+        return column[index]
+    value = column[index]
+    if value is _numpy().ma.masked:
+        return None
+    return value
+
+def _column_kind(field_type: Any, name: str) -> str:
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+        field_type = args[0] if len(args) == 1 else object
+    if field_type is bool:
+        return "bool"
+    if field_type is int:
+        return "int"
+    if field_type is float:
+        return "float"
+    if field_type is str:
+        return "datetime" if _is_date_field(name) else "string"
+    return "object"
+
+def _masked(numpy: Any, values: List[Any], dtype: Any, fill: Any) -> Any:
+    mask = numpy.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    if mask.any():
+        return numpy.ma.MaskedArray(numpy.array([fill if value is None else value for value in values], dtype=dtype), mask=mask)
+    return numpy.ma.MaskedArray(numpy.array(values, dtype=dtype))
+
+def _datetimes(numpy: Any, values: List[Any]) -> Any:
+    with warnings.catch_warnings():
+        # Timestamps with a UTC offset are converted to UTC
+        warnings.simplefilter("ignore", UserWarning)
+        return numpy.array(["NaT" if value is None else value for value in values], dtype="datetime64[ms]")
+
+def to_columns(data_class: type, rows: Sequence[Dict[str, Any]], fields: Sequence[str] | None = None) -> ColumnarResult:
+    """Convert a page of API results into typed arrays
+
+    Parameters
+    ----------
+    data_class : type
+        The model class describing each row, such as `TimesheetDto`
+    rows : Sequence[Dict[str, Any]]
+        The decoded JSON objects for each row
+    fields : Sequence[str] | None
+        If set, only these fields are converted; otherwise every field of
+        the model is converted
+    """
+    numpy = _numpy()
+    hints = typing.get_type_hints(data_class)
+    names = fields if fields is not None else [field.name for field in dataclasses.fields(data_class)]
+    columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        kind = _column_kind(hints[name], name)
+        if kind == "float":
+            columns[name] = _masked(numpy, values, numpy.float64, 0.0)
+        elif kind == "int":
+            columns[name] = _masked(numpy, values, numpy.int64, 0)
+        elif kind == "bool":
+            columns[name] = _masked(numpy, values, bool, False)
+        elif kind == "datetime":
+            try:
+                columns[name] = _datetimes(numpy, values)
+            except ValueError:
+                columns[name] = DictionaryColumn.encode(values)
+        elif kind == "string":
+            columns[name] = DictionaryColumn.encode(values)
+        else:
+            column = numpy.empty(len(values), dtype=object)
+            column[:] = values
+            columns[name] = column
+    return ColumnarResult(columns, len(rows))
@@ -0,0 +1,243 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, Callable, Dict, List, Sequence
+import dataclasses
+import threading
+import time
+import zlib
+
+class _ZlibDecoder:
+    """decodes gzip, or deflate with or without the zlib header some servers omit"""
+
+    def __init__(self, wbits: int):
+        self._decoder = zlib.decompressobj(wbits)
+        self._first = wbits == zlib.MAX_WBITS
+        self._received = b""
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if not chunk or not self._first:
+            return self._decoder.decompress(chunk)
+        self._received += chunk
+        try:
+            result = self._decoder.decompress(chunk)
+        except zlib.error:
+            # A raw deflate stream without the zlib header
+            self._first = False
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decoder.decompress(self._received)
+        if result:
+            self._first = False
+            self._received = b""
+        return result
+
+    def flush(self) -> bytes:
+        return self._decoder.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        import brotli
+        self._decoder = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decoder.process(chunk)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _ZstdDecoder:
+    def __init__(self):
+        import zstandard
+        self._zstandard = zstandard
+        self._decoder = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if not chunk:
+            return b""
+        parts = [self._decoder.decompress(chunk)]
+        while self._decoder.eof and self._decoder.unused_data:
+            # The body may consist of several zstd frames
+            unused = self._decoder.unused_data
+            self._decoder = self._zstandard.ZstdDecompressor().decompressobj()
+            parts.append(self._decoder.decompress(unused))
+        return b"".join(parts)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+# Content encodings in order of preference
+_DECODERS: Dict[str, Callable[[], Any]] = {
+    "zstd": _ZstdDecoder,
+    "br": _BrotliDecoder,
+    "gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    "deflate": lambda: _ZlibDecoder(zlib.MAX_WBITS),
+}
+
+def available_encodings() -> List[str]:
+    """The content encodings this installation can decode, best first
+
+    zstd and br require the optional `zstandard` and `brotli` packages;
+    install them with `pip install ProjectManagerSdk[compression]`.
+    """
+    encodings = []
+    for encoding, decoder in _DECODERS.items():
+        try:
+            decoder()
+        except ImportError:
+            continue
+        encodings.append(encoding)
+    return encodings
+
+def accept_encoding(encodings: Sequence[str]) -> str:
+    """Build an Accept-Encoding header that prefers encodings in the given order"""
+    if not encodings:
+        return "identity"
+    return ", ".join(encoding if index == 0 else f"{encoding};q={max(0.1, 1 - index / 10):.1f}"
+                     for index, encoding in enumerate(encodings))
+
+class ContentDecoder:
+    """
+    Decodes a response body chunk by chunk as it is received, counting
+    the bytes received and the time spent decompressing.
+    """
+
+    received: int
+    """
+    The number of bytes received so far, before decoding.
+    """
+
+    seconds: float
+    """
+    The time spent decompressing so far, in seconds.
+    """
+
+    def __init__(self, encoding: str | None):
+        """Construct a decoder for a response body
+
+        Like requests, a body with a content encoding this installation
+        cannot decode is passed through unchanged rather than rejected.
+
+        Parameters
+        ----------
+        encoding : str | None
+            The Content-Encoding header of the response
+        """
+        names = [name.strip().lower() for name in (encoding or "").split(",")]
+        names = [name for name in names if name and name != "identity"]
+        try:
+            # Encodings are listed in the order they were applied
+            self._decoders = [_DECODERS[name]() for name in reversed(names)]
+        except (KeyError, ImportError):
+            self._decoders = []
+        self.received = 0
+        self.seconds = 0.0
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """Decode the next chunk of the body"""
+        self.received += len(chunk)
+        if not self._decoders:
+            return chunk
+        started = time.perf_counter()
+        for decoder in self._decoders:
+            chunk = decoder.decompress(chunk)
+        self.seconds += time.perf_counter() - started
+        return chunk
+
+    def flush(self) -> bytes:
+        """Decode any data still buffered once the body is complete"""
+        started = time.perf_counter()
+        tail = b""
+        for decoder in self._decoders:
+            tail = decoder.decompress(tail) + decoder.flush()
+        self.seconds += time.perf_counter() - started
+        return tail
+
+
+@dataclasses.dataclass(slots=True)
+class TransferStats:
+    """
+    The size and decompression cost of the response to one API call.
+    """
+
+    method: str
+    """
+    The HTTP method of the call.
+    """
+
+    path: str
+    """
+    The path of the API endpoint.
+    """
+
+    statusCode: int
+    """
+    The HTTP status code of the response.
+    """
+
+    encoding: str | None
+    """
+    The content encoding chosen by the server, or None if the response
+    was not compressed.
+    """
+
+    wireBytes: int
+    """
+    The size of the response body as received.
+    """
+
+    contentBytes: int
+    """
+    The size of the response body after decompression.
+    """
+
+    decompressSeconds: float
+    """
+    The time spent decompressing the response body.
+    """
+
+
+class TransferMeter:
+    """
+    Totals the `TransferStats` of many API calls.
+
+    Pass a meter to `ProjectManagerClient.with_transfer_listener` to
+    measure how much bandwidth compression saves. A meter is thread-safe
+    and may be shared by several clients.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.wireBytes = 0
+        self.contentBytes = 0
+        self.decompressSeconds = 0.0
+        self.encodings: Dict[str, int] = {}
+
+    def __call__(self, stats: TransferStats):
+        with self._lock:
+            self.calls += 1
+            self.wireBytes += stats.wireBytes
+            self.contentBytes += stats.contentBytes
+            self.decompressSeconds += stats.decompressSeconds
+            encoding = stats.encoding or "identity"
+            self.encodings[encoding] = self.encodings.get(encoding, 0) + 1
+
+    @property
+    def savings(self) -> float:
+        """The share of response bytes that compression kept off the wire"""
+        if self.contentBytes == 0:
+            return 0.0
+        return 1 - self.wireBytes / self.contentBytes
@@ -0,0 +1,253 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, Callable, Dict, List, Type, TypeVar
+import dacite
+import dataclasses
+import threading
+import types
+import typing
+
+T = TypeVar('T')
+
+class _Mismatch(Exception):
+    """raised by a compiled decoder when the data does not have the expected shape"""
+
+class _Unsupported(Exception):
+    """raised while compiling when a field type has no fast path"""
+
+_decoders: Dict[type, Callable[[Any], Any]] = {}
+_compiling: Dict[type, bool] = {}
+_lock = threading.RLock()
+
+def from_dict(data_class: Type[T], data: Any) -> T:
+    """Create an instance of a model class from a dictionary returned by the API
+
+    This produces the same objects as `dacite.from_dict` with its default
+    configuration, but uses a decoder compiled once per model class instead
+    of inspecting type hints for every object. Unknown fields are ignored.
+    Data that does not match the model is handed to dacite, so the same
+    errors are raised.
+
+    Parameters
+    ----------
+    data_class : Type[T]
+        The model class to create
+    data : Any
+        The decoded JSON value
+    """
+    try:
+        return decoder_for(data_class)(data)
+    except _Mismatch:
+        return dacite.from_dict(data_class=data_class, data=data)
+
+def decoder_for(data_class: type) -> Callable[[Any], Any]:
+    """Retrieve the compiled decoder for a model class, compiling it on first use
+
+    The returned function raises an internal exception when the data does
+    not match the model; use `from_dict` unless you handle that yourself.
+
+    Parameters
+    ----------
+    data_class : type
+        The model class to decode
+    """
+    decoder = _decoders.get(data_class)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(data_class)
+            if decoder is None:
+                decoder = _compile(data_class)
+                _decoders[data_class] = decoder
+    return decoder
+
+def _passthrough(data: Any) -> Any:
+    return data
+
+def _mismatch(data: Any) -> Any:
+    raise _Mismatch()
+
+def _compile(data_class: type) -> Callable[[Any], Any]:
+    if not dataclasses.is_dataclass(data_class):
+        # Untyped payloads such as `object` are returned exactly as decoded from JSON
+        return _passthrough
+    _compiling[data_class] = True
+    try:
+        return _compile_dataclass(data_class)
+    except _Unsupported:
+        return _mismatch
+    finally:
+        del _compiling[data_class]
+
+def _nested_decoder(data_class: type) -> Callable[[Any], Any]:
+    if data_class in _compiling:
+        # Recursive models look up their own decoder once it has been compiled
+        return lambda data: _decoders[data_class](data)
+    return decoder_for(data_class)
+
+def _strip_optional(field_type: Any) -> typing.Tuple[Any, bool]:
+    if typing.get_origin(field_type) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+        if len(args) != 1:
+            raise _Unsupported()
+        return args[0], len(args) < len(typing.get_args(field_type))
+    return field_type, False
+
+def _instance_check(field_type: Any) -> tuple | None:
+    """the isinstance() argument dacite accepts for a plain type, or None for any value"""
+    if field_type in (object, Any):
+        return None
+    if field_type in (float, complex):
+        return (int, float, complex) if field_type is complex else (int, float)
+    if isinstance(field_type, type) and not dataclasses.is_dataclass(field_type) and not typing.get_args(field_type):
+        return (field_type,)
+    raise _Unsupported()
+
+def _compile_value(name: str, field_type: Any, namespace: Dict[str, Any], indent: str) -> List[str]:
+    """emits statements that validate and convert the variable `name` in place"""
+    if dataclasses.is_dataclass(field_type):
+        namespace["_dec_" + name] = _nested_decoder(field_type)
+        return [f"{indent}{name} = _dec_{name}({name})"]
+    if typing.get_origin(field_type) in (list, List):
+        item_type = (typing.get_args(field_type) or (Any,))[0]
+        lines = [f"{indent}if {name}.__class__ is not list:", f"{indent}    raise _Mismatch()"]
+        if dataclasses.is_dataclass(item_type):
+            namespace["_dec_" + name] = _nested_decoder(item_type)
+            lines.append(f"{indent}{name} = [_dec_{name}(item) for item in {name}]")
+            return lines
+        check = _instance_check(item_type)
+        if check is not None:
+            namespace["_type_" + name] = check
+            lines += [f"{indent}for item in {name}:",
+                      f"{indent}    if not isinstance(item, _type_{name}):",
+                      f"{indent}        raise _Mismatch()"]
+        lines.append(f"{indent}{name} = list({name})")
+        return lines
+    check = _instance_check(field_type)
+    if check is None:
+        return []
+    namespace["_type_" + name] = check
+    return [f"{indent}if not isinstance({name}, _type_{name}):", f"{indent}    raise _Mismatch()"]
+
+def _compile_dataclass(data_class: type) -> Callable[[Any], Any]:
+    hints = typing.get_type_hints(data_class)
+    namespace: Dict[str, Any] = {"_Mismatch": _Mismatch, "_cls": data_class}
+    lines = ["def decode(data):",
+             "    if data.__class__ is not dict:",
+             "        raise _Mismatch()",
+             "    get = data.get"]
+    args = []
+    for index, field in enumerate(dataclasses.fields(data_class)):
+        if not field.init or field.default_factory is not dataclasses.MISSING:
+            raise _Unsupported()
+        name = f"v{index}"
+        args.append(name)
+        field_type, optional = _strip_optional(hints[field.name])
+        if field.default is dataclasses.MISSING:
+            lines += [f"    if {field.name!r} not in data:",
+                      f"        raise _Mismatch()",
+                      f"    {name} = data[{field.name!r}]"]
+        else:
+            namespace["_default_" + name] = field.default
+            lines.append(f"    {name} = get({field.name!r}, _default_{name})")
+        lines.append(f"    if {name} is not None:")
+        lines += _compile_value(name, field_type, namespace, "        ") or ["        pass"]
+        if not optional and field_type not in (object, Any):
+            lines += [f"    else:",
+                      f"        raise _Mismatch()"]
+    lines.append(f"    return _cls({', '.join(args)})")
+    exec(compile("\n".join(lines), f"<decoder {data_class.__qualname__}>", "exec"), namespace)
+    return namespace["decode"]
+
+class _LazyField:
+    """decodes one field of a lazy model from its raw dictionary on first access"""
+
+    def __init__(self, name: str, default: Any, convert: Callable[[Any], Any] | None):
+        self.name = name
+        self.default = default
+        self.convert = convert
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self.default
+        value = instance._raw.get(self.name, self.default)
+        if value is not None and self.convert is not None:
+            value = self.convert(value)
+        # Cached values in the instance dictionary take precedence over this descriptor
+        instance.__dict__[self.name] = value
+        return value
+
+_lazy_classes: Dict[type, type] = {}
+
+def lazy_from_dict(data_class: Type[T], data: Any) -> T:
+    """Create a lazy instance of a model class from a dictionary returned by the API
+
+    The returned object is an instance of a subclass of `data_class` that
+    keeps a reference to `data` and decodes each field the first time it
+    is read. Nested models and lists of models are decoded lazily as well.
+    Field values are not validated against the model's type hints.
+
+    Parameters
+    ----------
+    data_class : Type[T]
+        The model class to create
+    data : Any
+        The decoded JSON value
+    """
+    if not dataclasses.is_dataclass(data_class):
+        return data
+    if data.__class__ is not dict:
+        return from_dict(data_class, data)
+    lazy_class = _lazy_classes.get(data_class)
+    if lazy_class is None:
+        with _lock:
+            lazy_class = _lazy_classes.get(data_class)
+            if lazy_class is None:
+                lazy_class = _lazy_classes[data_class] = _lazy_class(data_class)
+    instance = object.__new__(lazy_class)
+    instance._raw = data
+    return instance
+
+def _lazy_converter(field_type: Any) -> Callable[[Any], Any] | None:
+    try:
+        field_type, optional = _strip_optional(field_type)
+    except _Unsupported:
+        return None
+    if dataclasses.is_dataclass(field_type):
+        return lambda value: lazy_from_dict(field_type, value)
+    if typing.get_origin(field_type) in (list, List):
+        item_type = (typing.get_args(field_type) or (Any,))[0]
+        if dataclasses.is_dataclass(item_type):
+            return lambda value: [lazy_from_dict(item_type, item) for item in value] if value.__class__ is list else value
+    return None
+
+def _lazy_class(data_class: type) -> type:
+    hints = typing.get_type_hints(data_class)
+    fields = dataclasses.fields(data_class)
+    namespace: Dict[str, Any] = {}
+    for field in fields:
+        default = None if field.default is dataclasses.MISSING else field.default
+        namespace[field.name] = _LazyField(field.name, default, _lazy_converter(hints[field.name]))
+
+    def __eq__(self, other):
+        if not isinstance(other, data_class):
+            return NotImplemented
+        return all(getattr(self, field.name) == getattr(other, field.name) for field in fields)
+
+    def __reduce__(self):
+        # Lazy models are pickled and copied as regular models
+        return (data_class, tuple(getattr(self, field.name) for field in fields if field.init))
+
+    namespace.update(__eq__=__eq__, __reduce__=__reduce__, __module__=data_class.__module__,
+                     __qualname__="Lazy" + data_class.__qualname__, __doc__=data_class.__doc__)
+    return type("Lazy" + data_class.__name__, (data_class,), namespace)
@@ -0,0 +1,305 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.endpoints import path_resource, path_template
+from ProjectManagerSdk.endpointtemplates import QUERY_TEMPLATES
+from typing import Dict, Iterator, List, Mapping, Tuple
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE INDEX IF NOT EXISTS responses_resource ON responses (resource);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('generation', 0);
+"""
+
+# Response headers kept with a cached body; the body is stored decompressed
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# Endpoints never kept on disk: changesets are polled until their response changes, and each
+# OData query can be written in countless ways, so its responses would only fill the cache
+_UNCACHED_ENDPOINTS = frozenset(("/api/data/changesets/{changeSetId}", "/api/data/changesets/{changeSetId}/poll") + QUERY_TEMPLATES)
+
+@dataclasses.dataclass(slots=True)
+class StoredResponse:
+    """
+    A response read back from a `DiskCache`.
+    """
+
+    status: int
+    """
+    The HTTP status code of the response.
+    """
+
+    headers: Dict[str, str]
+    """
+    The headers kept with the response, such as its Content-Type.
+    """
+
+    body: bytes
+    """
+    The decompressed body of the response.
+    """
+
+
+class DiskCache:
+    """
+    Keeps successful GET responses in an SQLite database on disk, so that
+    they survive restarts and can be shared by every process on the
+    machine, such as the workers of a web application or a series of
+    scheduled jobs.
+
+    Responses are kept per HTTP method, URL including the query string,
+    and API key; the key is stored only as a hash. Only GET calls to
+    endpoints listed in `ttls` are cached, for the number of seconds given
+    there, so a cache without `ttls` stores nothing; `REFERENCE_DATA_TTLS`
+    is a good start. Changeset status and OData query endpoints are never
+    cached. Once the stored bodies exceed `max_bytes`, expired responses
+    and then the least recently used ones are removed.
+
+    Writes made through a client using the cache remove the responses they
+    may have changed, following the same rules as `ResponseCache`. Writes
+    made elsewhere, such as in the ProjectManager web application, are
+    only seen once cached responses expire.
+
+    The database uses write-ahead logging, so readers in several processes
+    do not block each other, and each thread uses its own connection.
+    """
+
+    hits: int
+    """
+    The number of calls this instance answered from the cache.
+    """
+
+    misses: int
+    """
+    The number of cacheable calls this instance did not find in the cache.
+    """
+
+    evictions: int
+    """
+    The number of responses this instance removed to stay within `max_bytes`.
+    """
+
+    def __init__(self, path: str | os.PathLike, ttls: Dict[str, float] | None = None,
+        max_bytes: int = 256 * 1024 * 1024, timeout: float = 30.0, clock=time.time):
+        """Open or create a disk cache
+
+        Parameters
+        ----------
+        path : str | PathLike
+            The file name of the SQLite database
+        ttls : Dict[str, float] | None
+            How many seconds to keep responses for, keyed by endpoint path
+            template such as `/api/data/projects/{projectId}`; endpoints
+            that are not listed are not cached
+        max_bytes : int
+            The maximum total size of the cached bodies
+        timeout : float
+            How many seconds to wait for another process that is writing
+            to the database
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = os.fspath(path)
+        self.ttls = {template: ttl for template, ttl in (ttls or {}).items() if template not in _UNCACHED_ENDPOINTS}
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """the connection of the current thread, opened again after a fork"""
+        current = getattr(self._local, "connection", None)
+        if current is not None and current[0] == os.getpid():
+            return current[1]
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        self._local.connection = (os.getpid(), connection)
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def close(self):
+        """Close the connections opened by this instance
+
+        The cache may still be used afterwards; connections are opened
+        again as needed.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """The total size in bytes of the cached bodies"""
+        return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @property
+    def generation(self) -> int:
+        """A number that changes every time cached responses are invalidated by any process"""
+        return self._connect().execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0]
+
+    def ttl_for(self, path: str) -> float:
+        """The number of seconds responses for a request path are cached, or zero"""
+        return self.ttls.get(path_template(path), 0.0)
+
+    def get(self, method: str, url: str, identity: str | None, path: str) -> StoredResponse | None:
+        """Look up the cached response for a call, or None
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the call
+        url : str
+            The URL of the call, including the query string
+        identity : str | None
+            The credentials of the call, such as its Authorization header
+        path : str
+            The path of the call
+        """
+        if method != "GET" or self.ttl_for(path) <= 0:
+            return None
+        key = _key(method, url, identity)
+        now = self._clock()
+        connection = self._connect()
+        row = connection.execute("SELECT status, headers, body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or row[3] <= now:
+            with self._lock:
+                self.misses += 1
+            return None
+        # Concurrent readers may both touch the row; the last access time only needs to be roughly right
+        connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        with self._lock:
+            self.hits += 1
+        return StoredResponse(row[0], json.loads(row[1]), bytes(row[2]))
+
+    def put(self, method: str, url: str, identity: str | None, path: str, status: int,
+        headers: Mapping[str, str], body: bytes, generation: int):
+        """Cache the response of a call if it succeeded and its endpoint is cached
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the call
+        url : str
+            The URL of the call, including the query string
+        identity : str | None
+            The credentials of the call, such as its Authorization header
+        path : str
+            The path of the call
+        status : int
+            The HTTP status code of the response
+        headers : Mapping[str, str]
+            The headers of the response
+        body : bytes
+            The decompressed body of the response
+        generation : int
+            The value of `generation` when the call was sent; the response
+            is not cached if the cache was invalidated since
+        """
+        ttl = self.ttl_for(path)
+        if method != "GET" or ttl <= 0 or not 200 <= status < 300 or len(body) > self.max_bytes:
+            return
+        stored = json.dumps({name: headers[name] for name in _STORED_HEADERS if name in headers})
+        now = self._clock()
+        with _transaction(self._connect()) as connection:
+            if connection.execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0] != generation:
+                # A write may have changed the data while this call was in flight
+                return
+            connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               (_key(method, url, identity), path, "/".join(path_resource(path)), status, stored,
+                                body, len(body), now + ttl, now))
+            self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        removed = connection.execute("DELETE FROM responses WHERE expires <= ?", (now,)).rowcount
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        victims: List[Tuple[str, int]] = []
+        if total > self.max_bytes:
+            for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                victims.append((key, size))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key, _ in victims])
+        with self._lock:
+            self.evictions += removed + len(victims)
+
+    def invalidate(self, path: str | None = None):
+        """Remove cached responses that a change to a path may affect
+
+        Parameters
+        ----------
+        path : str | None
+            The path that was changed, such as `/api/data/projects/1234`;
+            if not specified, the whole cache is cleared
+        """
+        with _transaction(self._connect()) as connection:
+            connection.execute("UPDATE meta SET value = value + 1 WHERE name = 'generation'")
+            if path is None:
+                connection.execute("DELETE FROM responses")
+            else:
+                # Responses for the same kind of resource, and for any collection the path belongs to
+                connection.execute("DELETE FROM responses WHERE resource = ? OR path = ? OR substr(?, 1, length(path) + 1) = path || '/'",
+                                   ("/".join(path_resource(path)), path, path))
+
+
+@contextlib.contextmanager
+def _transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """a write transaction that holds the database lock from its start"""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+def _key(method: str, url: str, identity: str | None) -> str:
+    """identifies a call without storing its credentials"""
+    return hashlib.sha256(f"{method} {url}\n{identity or ''}".encode()).hexdigest()
@@ -0,0 +1,167 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, BinaryIO, Callable, Union
+import dataclasses
+import hashlib
+import os
+
+DownloadTarget = Union[str, "os.PathLike[str]", BinaryIO, Callable[[bytes], Any]]
+"""
+Where a download is written: a file path, a binary file object opened
+for writing, or a function called with each chunk of the file.
+"""
+
+@dataclasses.dataclass(slots=True)
+class DownloadInfo:
+    """
+    Describes a file that was downloaded to a path, file object or
+    callback instead of being returned as bytes.
+    """
+
+    size: int
+    """
+    The number of bytes written.
+    """
+
+    checksum: str | None = None
+    """
+    The hex digest of the file contents, if a checksum was requested.
+    """
+
+    path: str | None = None
+    """
+    The path the file was written to, if the target was a path.
+    """
+
+    contentType: str | None = None
+    """
+    The Content-Type of the file as reported by the API.
+    """
+
+
+class Download:
+    """
+    Writes the body of a successful API response to a target chunk by
+    chunk, so that a file of any size is downloaded in constant memory.
+
+    Paths are written to a temporary file next to the target, which
+    replaces the target once the download is complete; an interrupted
+    download leaves no partial file behind. File objects and functions
+    receive each chunk as it arrives, so they may already hold part of
+    the file when a download fails.
+    """
+
+    info: DownloadInfo | None
+    """
+    The result of the download once it is complete.
+    """
+
+    def __init__(self, target: DownloadTarget, checksum: str | None = None,
+        progress: Callable[[int, int | None], Any] | None = None):
+        """Prepare a download
+
+        Parameters
+        ----------
+        target : DownloadTarget
+            A file path, a binary file object opened for writing, or a
+            function called with each chunk of the file
+        checksum : str | None
+            The name of a hashlib algorithm, such as "sha256", used to
+            compute a checksum of the file while it is written
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes written so
+            far and the expected size, or None if the size is not known;
+            the async client calls it from a worker thread
+        """
+        if checksum is not None:
+            hashlib.new(checksum)
+        self.target = target
+        self.checksum = checksum
+        self.progress = progress
+        self.info = None
+        self._file: BinaryIO | None = None
+        self._start: int | None = None
+        self._hash: Any = None
+        self._written = 0
+        self._total: int | None = None
+        self._content_type: str | None = None
+
+    @property
+    def _is_path(self) -> bool:
+        return isinstance(self.target, (str, os.PathLike))
+
+    def begin(self, total: int | None, content_type: str | None):
+        """Start writing the file, discarding anything written by an earlier attempt
+
+        Parameters
+        ----------
+        total : int | None
+            The expected size of the file, if known
+        content_type : str | None
+            The Content-Type of the response
+        """
+        if self._is_path:
+            self.abort()
+            self._file = open(os.fspath(self.target) + ".part", "wb")
+        elif hasattr(self.target, "write"):
+            if self._start is None:
+                self._start = self.target.tell() if self.target.seekable() else -1
+            elif self._written:
+                if self._start < 0:
+                    raise IOError("The download was interrupted and the target cannot be rewound")
+                self.target.seek(self._start)
+                self.target.truncate()
+        elif self._written:
+            raise IOError("The download was interrupted after data was passed to the target function")
+        self._hash = hashlib.new(self.checksum) if self.checksum is not None else None
+        self._written = 0
+        self._total = total
+        self._content_type = content_type
+
+    def write(self, chunk: bytes):
+        """Write the next chunk of the file"""
+        if not chunk:
+            return
+        if self._file is not None:
+            self._file.write(chunk)
+        elif hasattr(self.target, "write"):
+            self.target.write(chunk)
+        else:
+            self.target(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self._written += len(chunk)
+        if self.progress is not None:
+            self.progress(self._written, self._total)
+
+    def finish(self):
+        """Complete the download and fill in `info`"""
+        path = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            path = os.fspath(self.target)
+            os.replace(path + ".part", path)
+        self.info = DownloadInfo(self._written, self._hash.hexdigest() if self._hash is not None else None,
+                                 path, self._content_type)
+
+    def abort(self):
+        """Discard a partially written file at a path target"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            try:
+                os.remove(os.fspath(self.target) + ".part")
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,63 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.endpointtemplates import PATH_TEMPLATES
+from typing import Dict, List, Tuple
+import functools
+
+def _index(templates: Tuple[str, ...]) -> Dict[int, List[Tuple[str, Tuple[str | None, ...]]]]:
+    """indexes endpoint paths by segment count, with parameters as `None`"""
+    index: Dict[int, List[Tuple[str, Tuple[str | None, ...]]]] = {}
+    for template in templates:
+        segments = tuple(None if segment.startswith("{") else segment for segment in template.split("/"))
+        index.setdefault(len(segments), []).append((template, segments))
+    for candidates in index.values():
+        # Prefer literal segments over parameters, so that `/tasks/priorities` is not taken for `/tasks/{taskId}`
+        candidates.sort(key=lambda candidate: [segment is None for segment in candidate[1]])
+    return index
+
+_templates = _index(PATH_TEMPLATES)
+
+@functools.lru_cache(maxsize=4096)
+def path_template(path: str) -> str:
+    """Find the API endpoint a request path belongs to
+
+    Returns the path as written in the API documentation, such as
+    `/api/data/tasks/{taskId}` for `/api/data/tasks/8a2f...`, or the path
+    itself if it does not match any known endpoint.
+
+    Parameters
+    ----------
+    path : str
+        The path of a request, without the query string
+    """
+    segments = path.split("/")
+    for template, pattern in _templates.get(len(segments), ()):
+        if all(expected is None or expected == segment for expected, segment in zip(pattern, segments)):
+            return template
+    return path
+
+def path_resource(path: str) -> Tuple[str, ...]:
+    """Find the kind of resource a request path reads or writes
+
+    Returns the last two fixed segments of the path's endpoint, such as
+    `("tasks", "statuses")` for both `/api/data/tasks/statuses/{id}` and
+    `/api/data/projects/{projectId}/tasks/statuses`.
+
+    Parameters
+    ----------
+    path : str
+        The path of a request, without the query string
+    """
+    literals = [segment for segment in path_template(path).split("/") if segment and not segment.startswith("{")]
+    return tuple(literals[-2:])
@@ -0,0 +1,193 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+# The path of every API method, as written in the API documentation
+
+PATH_TEMPLATES = (
+    "/api/data/api-keys",
+    "/api/data/api-keys/revoke-all",
+    "/api/data/api-keys/{id}/revoke",
+    "/api/data/changesets/{changeSetId}",
+    "/api/data/changesets/{changeSetId}/poll",
+    "/api/data/comments/{commentId}",
+    "/api/data/comments/{commentId}/like",
+    "/api/data/dashboards/settings",
+    "/api/data/dashboards/settings/{type}",
+    "/api/data/files/{documentId}/download",
+    "/api/data/files/{documentId}/thumbnail",
+    "/api/data/files/{fileId}",
+    "/api/data/holidays/country",
+    "/api/data/holidays/global",
+    "/api/data/holidays/resource",
+    "/api/data/home/files",
+    "/api/data/home/folders/{folderId}/files",
+    "/api/data/hourly-rate-periods",
+    "/api/data/hourly-rates",
+    "/api/data/hourly-rates/values/{rateValueId}",
+    "/api/data/hourly-rates/{rateId}",
+    "/api/data/integrations",
+    "/api/data/integrations/categories",
+    "/api/data/integrations/providers",
+    "/api/data/integrations/providers/{providerId}",
+    "/api/data/integrations/providers/{providerId}/user-connection",
+    "/api/data/integrations/teams/application",
+    "/api/data/integrations/{integrationId}",
+    "/api/data/license",
+    "/api/data/license/{bundleSku}/try",
+    "/api/data/me",
+    "/api/data/me/avatar",
+    "/api/data/meetings",
+    "/api/data/meetings/todos/{todoId}",
+    "/api/data/meetings/{meetingId}",
+    "/api/data/meetings/{meetingId}/recurring/daily",
+    "/api/data/meetings/{meetingId}/recurring/monthly",
+    "/api/data/meetings/{meetingId}/recurring/settings",
+    "/api/data/meetings/{meetingId}/recurring/settings/validate",
+    "/api/data/meetings/{meetingId}/recurring/weekly",
+    "/api/data/meetings/{meetingId}/recurring/yearly",
+    "/api/data/meetings/{meetingId}/recurring/{option}",
+    "/api/data/meetings/{meetingId}/tags",
+    "/api/data/meetings/{meetingId}/todos",
+    "/api/data/non-project-tasks",
+    "/api/data/non-project-tasks/comments/{commentId}",
+    "/api/data/non-project-tasks/comments/{commentId}/like",
+    "/api/data/non-project-tasks/statuses",
+    "/api/data/non-project-tasks/statuses/{nptStatusId}",
+    "/api/data/non-project-tasks/todos/{todoId}",
+    "/api/data/non-project-tasks/{nptId}",
+    "/api/data/non-project-tasks/{nptId}/comments",
+    "/api/data/non-project-tasks/{nptId}/todos",
+    "/api/data/non-project-tasks/{taskId}/files",
+    "/api/data/non-project-tasks/{taskId}/tags",
+    "/api/data/notifications",
+    "/api/data/notifications/count",
+    "/api/data/notifications/delete/{id}",
+    "/api/data/notifications/deleteall",
+    "/api/data/notifications/markallread",
+    "/api/data/notifications/unreadcount",
+    "/api/data/notifications/{id}/markread",
+    "/api/data/notifications/{id}/markunread",
+    "/api/data/npt/{taskId}/recurring/daily",
+    "/api/data/npt/{taskId}/recurring/monthly",
+    "/api/data/npt/{taskId}/recurring/settings",
+    "/api/data/npt/{taskId}/recurring/settings/validate",
+    "/api/data/npt/{taskId}/recurring/weekly",
+    "/api/data/npt/{taskId}/recurring/yearly",
+    "/api/data/npt/{taskId}/recurring/{option}",
+    "/api/data/project-folders",
+    "/api/data/project-folders/{projectFolderId}",
+    "/api/data/projects",
+    "/api/data/projects/chargecodes",
+    "/api/data/projects/chargecodes/{chargeCodeId}",
+    "/api/data/projects/customers",
+    "/api/data/projects/customers/{customerId}",
+    "/api/data/projects/fields",
+    "/api/data/projects/fields/{fieldId}",
+    "/api/data/projects/members",
+    "/api/data/projects/membership",
+    "/api/data/projects/priorities",
+    "/api/data/projects/priorities/{priorityId}",
+    "/api/data/projects/statuses",
+    "/api/data/projects/statuses/{projectStatusId}",
+    "/api/data/projects/tasks/fields",
+    "/api/data/projects/templates",
+    "/api/data/projects/templates/categories",
+    "/api/data/projects/{projectChangeId}/version/download",
+    "/api/data/projects/{projectId}",
+    "/api/data/projects/{projectId}/fields",
+    "/api/data/projects/{projectId}/fields/{fieldId}",
+    "/api/data/projects/{projectId}/files",
+    "/api/data/projects/{projectId}/folders/{folderId}/files",
+    "/api/data/projects/{projectId}/members",
+    "/api/data/projects/{projectId}/members/{userId}",
+    "/api/data/projects/{projectId}/reopen/status",
+    "/api/data/projects/{projectId}/risks/export",
+    "/api/data/projects/{projectId}/tasks",
+    "/api/data/projects/{projectId}/tasks/bulk",
+    "/api/data/projects/{projectId}/tasks/fields",
+    "/api/data/projects/{projectId}/tasks/fields/{fieldId}",
+    "/api/data/projects/{projectId}/tasks/metadata",
+    "/api/data/projects/{projectId}/tasks/statuses",
+    "/api/data/projects/{projectId}/version/{version}/copy",
+    "/api/data/projects/{projectId}/version/{version}/restore",
+    "/api/data/projects/{projectId}/versions",
+    "/api/data/resources",
+    "/api/data/resources/bulk",
+    "/api/data/resources/skills",
+    "/api/data/resources/skills/{resourceSkillId}",
+    "/api/data/resources/teams",
+    "/api/data/resources/teams/{resourceTeamId}",
+    "/api/data/resources/{resourceId}",
+    "/api/data/resources/{resourceId}/avatar",
+    "/api/data/resources/{resourceId}/resendinvite",
+    "/api/data/risks",
+    "/api/data/risks/projects/{projectId}",
+    "/api/data/risks/{riskId}",
+    "/api/data/risks/{riskId}/files",
+    "/api/data/risks/{riskId}/tags",
+    "/api/data/security/businessroles",
+    "/api/data/security/businessroles/{roleId}",
+    "/api/data/security/email/validation/resend",
+    "/api/data/tags",
+    "/api/data/tags/{tagId}",
+    "/api/data/tasks",
+    "/api/data/tasks/fields/values",
+    "/api/data/tasks/priorities",
+    "/api/data/tasks/statuses/{taskStatusId}",
+    "/api/data/tasks/todos/{todoId}",
+    "/api/data/tasks/{taskId}",
+    "/api/data/tasks/{taskId}/assignees",
+    "/api/data/tasks/{taskId}/comments",
+    "/api/data/tasks/{taskId}/fields/values",
+    "/api/data/tasks/{taskId}/fields/{fieldId}/values",
+    "/api/data/tasks/{taskId}/files",
+    "/api/data/tasks/{taskId}/metadata",
+    "/api/data/tasks/{taskId}/parent",
+    "/api/data/tasks/{taskId}/parent/{parentTaskId}",
+    "/api/data/tasks/{taskId}/recurring/daily",
+    "/api/data/tasks/{taskId}/recurring/monthly",
+    "/api/data/tasks/{taskId}/recurring/settings",
+    "/api/data/tasks/{taskId}/recurring/settings/validate",
+    "/api/data/tasks/{taskId}/recurring/weekly",
+    "/api/data/tasks/{taskId}/recurring/yearly",
+    "/api/data/tasks/{taskId}/recurring/{option}",
+    "/api/data/tasks/{taskId}/subtasks",
+    "/api/data/tasks/{taskId}/tags",
+    "/api/data/tasks/{taskId}/todos",
+    "/api/data/timesheets",
+    "/api/data/timesheets/admin-tasks",
+    "/api/data/timesheets/approvals",
+    "/api/data/timesheets/approvals/approve",
+    "/api/data/timesheets/approvals/reject",
+    "/api/data/timesheets/{timesheetId}",
+    "/api/data/users/roles",
+    "/api/data/workspaces",
+)
+
+# The endpoints of OData queries, which take $filter, $top and $skip
+
+QUERY_TEMPLATES = (
+    "/api/data/holidays/country",
+    "/api/data/holidays/global",
+    "/api/data/holidays/resource",
+    "/api/data/projects",
+    "/api/data/projects/tasks/fields",
+    "/api/data/resources",
+    "/api/data/resources/skills",
+    "/api/data/resources/teams",
+    "/api/data/risks",
+    "/api/data/tags",
+    "/api/data/tasks",
+    "/api/data/tasks/fields/values",
+    "/api/data/timesheets",
+)
@@ -0,0 +1,128 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, Callable, Dict, Hashable
+import copy
+import json
+
+_UNPARSED = object()
+
+class CachedContent(bytes):
+    """
+    A response body that is handed out more than once, such as a body
+    revalidated with a 304 Not Modified response. It keeps the JSON
+    document and the results decoded from it, so that they are only
+    built the first time; every caller receives its own copy of them.
+    """
+
+    def __init__(self, content: bytes):
+        self._document = _UNPARSED
+        self._results: Dict[Hashable, Any] = {}
+
+    def document(self, parse: Callable[[bytes], Any]) -> Any:
+        """Return the JSON document of this body, parsing it on first use"""
+        document = self._document
+        if document is _UNPARSED:
+            document = self._document = parse(bytes(self))
+        return document
+
+    def holds(self, data: Any) -> bool:
+        """Whether a value is the `data` of the document already parsed from this body"""
+        document = self._document
+        return document.__class__ is dict and document.get("data") is data
+
+    def decoded(self, key: Hashable, decode: Callable[[], Any]) -> Any:
+        """Return a copy of the results decoded from this body, decoding them on first use
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the decoding, such as the model class and result mode
+        decode : Callable[[], Any]
+            Decodes the results
+        """
+        result = self._results.get(key, _UNPARSED)
+        if result is _UNPARSED:
+            result = self._results[key] = decode()
+        # Callers may modify their results, which must not change those of the next caller
+        return copy.deepcopy(result)
+
+class JsonCodec:
+    """
+    Encodes request bodies and decodes response bodies.
+
+    Subclass this to plug a different JSON library into a client with
+    `ProjectManagerClient.with_json_codec`.
+    """
+
+    name: str = "json"
+    """
+    The name used to select this codec.
+    """
+
+    def loads(self, content: bytes | str) -> Any:
+        """Decode a JSON document"""
+        if content.__class__ is CachedContent:
+            return content.document(json.loads)
+        return json.loads(content)
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value as a UTF-8 JSON document"""
+        return json.dumps(value, allow_nan=False).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    A JSON codec backed by the orjson package, which decodes large
+    responses several times faster than the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, content: bytes | str) -> Any:
+        if content.__class__ is CachedContent:
+            return content.document(self._orjson.loads)
+        return self._orjson.loads(content)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "json": JsonCodec,
+}
+
+def get_json_codec(name: str | None = None) -> JsonCodec:
+    """Create a JSON codec by name
+
+    Parameters
+    ----------
+    name : str | None
+        Either "orjson" or "json". If not specified, the fastest installed
+        codec is used.
+    """
+    if name is not None:
+        if name not in _CODECS:
+            raise ValueError(f"Unknown JSON codec '{name}'; expected one of {', '.join(_CODECS)}")
+        return _CODECS[name]()
+    for codec_class in _CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JsonCodec()
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ApiKeyCreateDto:
     """
     Represents a new api access key entity
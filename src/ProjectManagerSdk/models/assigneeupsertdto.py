@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AssigneeUpsertDto:
     """
     An AssigneeUpsert is a create-or-update process that will either
@@ -0,0 +1,32 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+
+from ProjectManagerSdk.models.astroresult import AstroResult
+
+class AstroException(Exception):
+    """
+    Raised by helpers that make several API calls on your behalf, such as
+    the `iter_*` pagination methods, when one of those calls fails. The
+    failed `AstroResult` is available as `result`.
+    """
+
+    result: AstroResult
+    """
+    The result of the API call that failed.
+    """
+
+    def __init__(self, result: AstroResult):
+        self.result = result
+        message = result.error.message if result.error and result.error.message else None
+        super().__init__(f"API call failed with status {result.statusCode}: {message}" if message else f"API call failed with status {result.statusCode}")
@@ -67,4 +67,9 @@ class AstroResult(Generic[T]):
         return dataclass.asdict(self)
     
     def load_error(self, result: Response):
-        self.error = dacite.from_dict(data_class=AstroError, data=json.loads(result.content)['error'])
+        try:
+            self.error = dacite.from_dict(data_class=AstroError, data=json.loads(result.content)['error'])
+        except (ValueError, KeyError, TypeError, AttributeError, dacite.DaciteError):
+            # The body of proxy and gateway errors is usually not a JSON error object
+            body = result.content.decode("utf-8", errors="replace") if isinstance(result.content, bytes) else str(result.content)
+            self.error = AstroError(technicalError=body[:1000] or None, message=f"The API returned HTTP {result.status_code}")
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.roledto import RoleDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class BusinessRolesListDto:
     """
     Business roles for the account security UI. Each role includes a
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ChangeSetStatusDto:
     """
     Returns the id of a specific ChangeSet
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConnectionSchemaDto:
     """
     This class contains the URL or AuthScheme to use to authenticate
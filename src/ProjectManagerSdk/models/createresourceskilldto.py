@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateResourceSkillDto:
     """
     This is a skill that can be allocated to a resource.
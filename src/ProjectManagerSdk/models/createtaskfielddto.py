@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CreateTaskFieldDto:
     """
     A TaskField is a custom field defined within your Workspace for a
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.reactgridlayoutdto import ReactGridLayoutDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DashboardSettingCreateDto:
     """
     User dashboard create or update dto
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.reactgridlayoutdto import ReactGridLayoutDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DashboardSettingDto:
     """
     The Dashboards API is intended for use by ProjectManager
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DiscussionCommentCreateDto:
     """
     Tasks can have discussions attached to them. These discussions can
@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.discussionemoji import DiscussionEmoji
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DiscussionCommentDto:
     """
     Tasks can have discussions attached to them. These discussions can
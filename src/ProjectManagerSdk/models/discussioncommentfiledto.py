@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DiscussionCommentFileDto:
     """
     The DiscussionCommentFile represents a file that has been attached
@@ -19,7 +19,7 @@ from ProjectManagerSdk.models.taskprojectdto import TaskProjectDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class HourlyRateDto:
     """
     Hourly rate
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.hourlyratevaluedto import HourlyRateValueDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class HourlyRatePeriodDto:
     """
     Represents a period of time for which a specific hourly rate is
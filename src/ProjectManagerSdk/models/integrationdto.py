@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.integrationinstancedto import IntegrationInstanceD
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IntegrationDto:
     """
     The Integrations API is intended for use by ProjectManager and its
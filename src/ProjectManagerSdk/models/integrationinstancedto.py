@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IntegrationInstanceDto:
     """
     The Integrations API is intended for use by ProjectManager and its
@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.integrationdto import IntegrationDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class IntegrationProviderDto:
     """
     The Integrations API is intended for use by ProjectManager and its
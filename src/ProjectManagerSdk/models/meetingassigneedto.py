@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingAssigneeDto:
     """
     A MeetingAssignee is a Resource to whom a Meeting is assigned. A
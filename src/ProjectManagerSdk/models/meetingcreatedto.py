@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingCreateDto:
     """
     A Meeting is a task that does not belong to the project. It is only
@@ -23,7 +23,7 @@ from ProjectManagerSdk.models.tasktododto import TaskTodoDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingDetailsDto:
     """
     A Meeting is a task that either does not belong to a project or is
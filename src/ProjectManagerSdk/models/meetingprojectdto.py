@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingProjectDto:
     """
     A Project is a collection of Tasks that contributes towards a goal.
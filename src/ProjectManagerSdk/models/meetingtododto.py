@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingTodoDto:
     """
     A MeetingTodo is a sub-item that represents a unit of work on the
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MeetingUpdateDto:
     """
     A Meeting is a task that does not belong to the project or is part
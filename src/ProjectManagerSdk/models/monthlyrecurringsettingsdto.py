@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class MonthlyRecurringSettingsDto:
     """
     Settings for Monthly Recurring Tasks
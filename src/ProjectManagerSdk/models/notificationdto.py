@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.notificationdatadto import NotificationDataDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NotificationDto:
     """
     A notification represents a message sent to a user to inform them of
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.notificationdto import NotificationDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NotificationResponseDto:
     """
     Information about notifications for the current user. A notification
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NotificationTimestampDto:
     """
     A notification represents a message sent to a user to inform them of
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NotificationTotalCountDto:
     """
     Information about notifications for the current user. A notification
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NptAssigneeDto:
     """
     A NptAssignee is a Resource to whom a Npt is assigned. A single Npt
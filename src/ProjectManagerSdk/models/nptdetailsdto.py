@@ -23,7 +23,7 @@ from ProjectManagerSdk.models.tasktododto import TaskTodoDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NptDetailsDto:
     """
     A Npt is a task that does not belong to the project. It is only
@@ -20,7 +20,7 @@ from ProjectManagerSdk.models.tasktododto import TaskTodoDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NptDto:
     """
     A Npt is a task that does not belong to the project. It is only
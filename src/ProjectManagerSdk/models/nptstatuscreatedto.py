@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NptStatusCreateDto:
     """
     A TaskStatus is a named status level used by your business to
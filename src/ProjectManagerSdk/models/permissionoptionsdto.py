@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PermissionOptionsDto:
     """
     Specifies the permissions a member can be changed to on a project.
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectAccessEntryDto:
     """
     Represents the access permissions assigned to a single user within a
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectChangeStatusDto:
     """
     A ProjectChange is an individual edit that has been made to a
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectChargeCodeUpdateDto:
     """
     A Charge code is a code used to identify costs within your Projects.
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.projectcreateaccessmemberdto import ProjectCreateA
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectCreateAccessDto:
     """
     Specify who has access to a newly created project
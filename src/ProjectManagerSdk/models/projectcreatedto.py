@@ -18,7 +18,7 @@ from ProjectManagerSdk.models.taskstatuscreatedto import TaskStatusCreateDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectCreateDto:
     """
     A Project is a collection of Tasks that contributes towards a goal.
@@ -25,7 +25,7 @@ from ProjectManagerSdk.models.projectworkingdaysdto import ProjectWorkingDaysDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectDto:
     """
     A Project is a collection of Tasks that contributes towards a goal.
@@ -65,9 +65,10 @@ class ProjectDto:
     be used for APIs that accept Project unique identifiers. You can
     observe the short ID within the application by observing the URL of
     the page you visit when you click on this project. The page's URL
-    will appear in the form `https://pm.app.projectmanager.com/project/board/D16`
-    - in this example, the `ShortId` is `D16`. This code is assigned on
-    creation and cannot be changed.
+    will appear in the form
+    `https://pm.app.projectmanager.com/project/board/D16` - in this
+    example, the `ShortId` is `D16`. This code is assigned on creation
+    and cannot be changed.
     """
 
     folder: ProjectFolderDto | None = None
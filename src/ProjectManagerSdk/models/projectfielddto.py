@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectFieldDto:
     """
     Represents either a ProjectField or a TaskField, depending on the
@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.projectfiletaskdto import ProjectFileTaskDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectFileDto:
     """
     The ProjectFile represents an attached file that is connected to a
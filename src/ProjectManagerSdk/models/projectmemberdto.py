@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.permissionoptionsdto import PermissionOptionsDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectMemberDto:
     """
     A ProjectMember is a user who can collaborate on a Project. You can
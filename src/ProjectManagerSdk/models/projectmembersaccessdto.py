@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.projectaccessentrydto import ProjectAccessEntryDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectMembersAccessDto:
     """
     DTO to assign roles to a list of project members
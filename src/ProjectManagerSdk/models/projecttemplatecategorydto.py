@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.projecttemplatedto import ProjectTemplateDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectTemplateCategoryDto:
     """
     Information about a Category of ProjectTemplates.
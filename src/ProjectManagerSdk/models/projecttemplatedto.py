@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectTemplateDto:
     """
     A ProjectTemplate is a named document that contains default Project
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectVersionChangeDataDto:
     """
     A ProjectVersionChangeData is information about a change made to a
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.projectversionchangedatadto import ProjectVersionC
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectVersionDto:
     """
     A ProjectVersion is a snapshot of a Project at a specific moment in
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ProjectWorkingDaysDto:
     """
     Indicate which days of the week are considered working days for this
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.reactgridlayoutitemdto import ReactGridLayoutItemD
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ReactGridLayoutDto:
     """
     A setting for react grid layout sizes
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.recurringtaskchangesetdetails import RecurringTask
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RecurringTaskChangeSetDetailsChangeSetStatusDto:
     """
     Returns the id of a specific ChangeSet
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourceApproverDto:
     """
     When managing users, you can choose who will approve a person's
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourceCreateDto:
     """
     A Resource represents a person, material, or tool that is used
@@ -18,7 +18,7 @@ from ProjectManagerSdk.models.resourceteamdto import ResourceTeamDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourceDto:
     """
     A Resource represents a person, material, or tool that is used
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.resourcecreatedto import ResourceCreateDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourcesCreateDto:
     """
     The ResourcesCreate object allows you to create multiple Users with
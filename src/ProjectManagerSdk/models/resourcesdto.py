@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.usererror import UserError
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourcesDto:
     """
     The Resources object represents the results of a bulk Resource
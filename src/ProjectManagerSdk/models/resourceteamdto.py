@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ResourceTeamDto:
     """
     A ResourceTeam is a group of Resources that can be referred to as a
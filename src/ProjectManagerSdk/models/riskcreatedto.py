@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RiskCreateDto:
     """
     Represents the data required to create a new Risk within a Project.
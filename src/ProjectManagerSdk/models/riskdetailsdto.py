@@ -22,7 +22,7 @@ from ProjectManagerSdk.models.tasktagdto import TaskTagDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RiskDetailsDto:
     """
     A Risk represents an item of potential impact or uncertainty. It is
@@ -19,7 +19,7 @@ from ProjectManagerSdk.models.tasktagdto import TaskTagDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RiskDto:
     """
     Represents a potential threat or uncertainty that could impact a
@@ -18,7 +18,7 @@ from ProjectManagerSdk.models.riskexportprogressfilterdto import RiskExportProgr
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RiskExportSettingsDto:
     """
     Export Settings for Risk Export
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RiskUpdateDto:
     """
     A Risk represents an item of potential impact or uncertainty. Risks
@@ -16,15 +16,16 @@ from ProjectManagerSdk.models.workspacepermissionsdto import WorkSpacePermission
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RoleCreateDto:
     """
     Request body for POST /api/data/security/businessroles. Creates a
     custom workspace role; the server assigns the role id and the name
     must be unique in the workspace. Permission flags use the same shape
-    as RetrieveMe `permissions` (Astro.Common.Dto.WorkSpaces.WorkSpacePermissionsDto).
-    Subscription entitlements are applied server-side; nothing in
-    Chargebee is updated by this request.
+    as RetrieveMe `permissions`
+    (Astro.Common.Dto.WorkSpaces.WorkSpacePermissionsDto). Subscription
+    entitlements are applied server-side; nothing in Chargebee is
+    updated by this request.
     """
 
     name: str | None = None
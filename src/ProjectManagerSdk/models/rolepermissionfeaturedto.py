@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RolePermissionFeatureDto:
     """
     One cell in the workspace role permissions matrix: grant state plus
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RoleUpdateChangeItemDto:
     """
     One property change when updating a business role (batch change-set
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TagDto:
     """
     A Tag is a named categorization you can use to distinguish objects
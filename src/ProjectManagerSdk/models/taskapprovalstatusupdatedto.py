@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskApprovalStatusUpdateDto:
     """
     Represents a request to update the approval status of a Task.
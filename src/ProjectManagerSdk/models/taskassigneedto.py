@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskAssigneeDto:
     """
     A TaskAssignee is the person to whom a Task is assigned. A single
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.taskfieldprojectdto import TaskFieldProjectDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskFieldDto:
     """
     A TaskField is a custom field defined within your Workspace for a
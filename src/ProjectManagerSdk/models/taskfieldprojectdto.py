@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskFieldProjectDto:
     """
     The TaskFieldProject is a summary of the Project that this TaskField
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.taskfieldvaluetaskdto import TaskFieldValueTaskDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskFieldValueDto:
     """
     A model that contains the value for a TaskField.
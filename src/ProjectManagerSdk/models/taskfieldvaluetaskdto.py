@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskFieldValueTaskDto:
     """
     The TaskFieldTask is a summary of the Task that this TaskFieldValue
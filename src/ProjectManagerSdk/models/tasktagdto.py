@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskTagDto:
     """
     A TaskTag is a connection between a Task and a Tag. Each Task can
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TaskTodoDto:
     """
     A TaskTodo is a sub-task that represents a unit of work on the Task.
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimeSheetApprovalRejectDto:
     """
     Data for rejecting a timesheet approval
@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.pendingtimesheetapprovaldto import PendingTimeShee
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimeSheetApprovalResponseDto:
     """
     Holds the list of pending timesheet approvals
@@ -20,7 +20,7 @@ from ProjectManagerSdk.models.timesheettaskdto import TimesheetTaskDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimesheetDto:
     """
     A Timesheet entry is a single record that contains information about
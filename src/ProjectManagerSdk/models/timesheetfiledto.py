@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimesheetFileDto:
     """
     Represents information about a file attached to a Timesheet.
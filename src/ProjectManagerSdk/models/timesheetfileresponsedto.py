@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimesheetFileResponseDto:
     """
     Represents a document or file attached to a timesheet day entry.
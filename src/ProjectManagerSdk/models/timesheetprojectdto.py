@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimeSheetProjectDto:
     """
     A Project is a collection of Tasks that contributes towards a goal.
@@ -53,9 +53,10 @@ class TimeSheetProjectDto:
     be used for APIs that accept Project unique identifiers. You can
     observe the short ID within the application by observing the URL of
     the page you visit when you click on this project. The page's URL
-    will appear in the form `https://pm.app.projectmanager.com/project/board/D16`
-    - in this example, the `ShortId` is `D16`. This code is
-    automatically assigned for you and cannot be changed.
+    will appear in the form
+    `https://pm.app.projectmanager.com/project/board/D16` - in this
+    example, the `ShortId` is `D16`. This code is automatically assigned
+    for you and cannot be changed.
     """
 
     startDate: str | None = None
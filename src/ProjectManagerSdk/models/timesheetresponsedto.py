@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.timesheetfileresponsedto import TimesheetFileRespo
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TimesheetResponseDto:
     """
     Time entry representation
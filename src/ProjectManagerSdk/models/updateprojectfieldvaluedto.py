@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateProjectFieldValueDto:
     """
     A model that contains a new value to be set for a ProjectField.
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UpdateRequestDto:
     """
     Represents an update request for a File within ProjectManager.
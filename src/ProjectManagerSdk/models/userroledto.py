@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.userrolepermissionsdto import UserRolePermissionsD
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UserRoleDto:
     """
     A UserRole is a name for a privilege level granted to a specific
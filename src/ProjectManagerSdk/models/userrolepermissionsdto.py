@@ -16,7 +16,7 @@ from ProjectManagerSdk.models.userrolepermissiondto import UserRolePermissionDto
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class UserRolePermissionsDto:
     """
     The permissions available to the role
@@ -15,7 +15,7 @@
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WorkSpaceLinksDto:
     """
     A shortcut link within the currently logged in Workspace.
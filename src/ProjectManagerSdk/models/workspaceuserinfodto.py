@@ -17,7 +17,7 @@ from ProjectManagerSdk.models.workspacepermissionsdto import WorkSpacePermission
 from typing import List
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class WorkSpaceUserInfoDto:
     """
     Information about a currently logged in user. You can call the
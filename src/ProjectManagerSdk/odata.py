@@ -0,0 +1,523 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.columnar import ColumnarResult, DictionaryColumn, _numpy
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Tuple, TypeVar
+import functools
+import operator
+import re
+
+T = TypeVar('T')
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<string>'(?:[^']|'')*')
+  | (?P<guid>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?![\w-])
+  | (?P<datetime>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:\d{2})?)?)(?![\w:.-])
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)(?![\w.])
+  | (?P<name>[A-Za-z_]\w*(?:/[A-Za-z_]\w*)*)
+  | (?P<punct>[(),])
+)""", re.VERBOSE)
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq, "ne": operator.ne, "gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le,
+}
+
+# The comparison that gives the same result with its operands swapped
+_SWAPPED = {"eq": "eq", "ne": "ne", "gt": "lt", "ge": "le", "lt": "gt", "le": "ge"}
+
+_FUNCTIONS: Dict[str, Tuple[int, Callable[..., Any]]] = {
+    "contains": (2, lambda text, part: text is not None and part is not None and _fold(part) in _fold(text)),
+    "startswith": (2, lambda text, part: text is not None and part is not None and _fold(text).startswith(_fold(part))),
+    "endswith": (2, lambda text, part: text is not None and part is not None and _fold(text).endswith(_fold(part))),
+    "tolower": (1, lambda text: text.lower() if text is not None else None),
+    "toupper": (1, lambda text: text.upper() if text is not None else None),
+}
+
+def _fold(value: Any) -> Any:
+    """string comparisons ignore case, like the API's database"""
+    return value.casefold() if value.__class__ is str else value
+
+@functools.lru_cache(maxsize=4096)
+def _datetime(value: str) -> datetime | None:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+def _as_datetime(value: Any) -> datetime | None:
+    if value.__class__ is str:
+        return _datetime(value)
+    if isinstance(value, datetime):
+        return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+    return None
+
+# Nodes of a parsed expression are tuples whose first item is their kind
+_Node = Tuple[Any, ...]
+
+class _Parser:
+    """parses the OData $filter subset accepted by the API into nodes"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens: List[Tuple[str, str, int]] = []
+        position = 0
+        while position < len(expression):
+            if expression[position:].strip() == "":
+                break
+            match = _TOKEN.match(expression, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"Unexpected character at position {position} in OData expression '{expression}'")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup), match.start(match.lastgroup)))
+            position = match.end()
+        self.index = 0
+
+    def peek(self) -> Tuple[str, str, int] | None:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self) -> Tuple[str, str, int]:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of OData expression '{self.expression}'")
+        self.index += 1
+        return token
+
+    def expect(self, text: str):
+        kind, value, position = self.take()
+        if value != text:
+            raise ValueError(f"Expected '{text}' at position {position} in OData expression '{self.expression}'")
+
+    def keyword(self, *words: str) -> str | None:
+        token = self.peek()
+        if token is not None and token[0] == "name" and token[1].lower() in words:
+            self.index += 1
+            return token[1].lower()
+        return None
+
+    def parse(self) -> _Node:
+        node = self.parse_or()
+        token = self.peek()
+        if token is not None:
+            raise ValueError(f"Unexpected '{token[1]}' at position {token[2]} in OData expression '{self.expression}'")
+        return node
+
+    def parse_or(self) -> _Node:
+        node = self.parse_and()
+        while self.keyword("or"):
+            node = ("or", node, self.parse_and())
+        return node
+
+    def parse_and(self) -> _Node:
+        node = self.parse_not()
+        while self.keyword("and"):
+            node = ("and", node, self.parse_not())
+        return node
+
+    def parse_not(self) -> _Node:
+        if self.keyword("not"):
+            return ("not", self.parse_not())
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> _Node:
+        left = self.parse_operand()
+        comparison = self.keyword(*_COMPARISONS)
+        if comparison is None:
+            return left
+        return ("compare", comparison, left, self.parse_operand())
+
+    def parse_operand(self) -> _Node:
+        kind, value, position = self.take()
+        if value == "(":
+            node = self.parse_or()
+            self.expect(")")
+            return node
+        if kind == "string":
+            return ("literal", value[1:-1].replace("''", "'"))
+        if kind == "guid":
+            return ("literal", value.lower())
+        if kind == "datetime":
+            parsed = _datetime(value)
+            if parsed is None:
+                raise ValueError(f"Invalid date '{value}' at position {position} in OData expression '{self.expression}'")
+            return ("datetime", parsed)
+        if kind == "number":
+            return ("literal", float(value) if any(c in value for c in ".eE") else int(value))
+        if kind == "name":
+            lowered = value.lower()
+            if lowered in ("true", "false"):
+                return ("literal", lowered == "true")
+            if lowered == "null":
+                return ("literal", None)
+            token = self.peek()
+            if token is not None and token[1] == "(" and lowered in _FUNCTIONS:
+                self.index += 1
+                arguments = [self.parse_or()]
+                while self.peek() is not None and self.peek()[1] == ",":
+                    self.index += 1
+                    arguments.append(self.parse_or())
+                self.expect(")")
+                if len(arguments) != _FUNCTIONS[lowered][0]:
+                    raise ValueError(f"{lowered} expects {_FUNCTIONS[lowered][0]} arguments in OData expression '{self.expression}'")
+                return ("call", lowered, tuple(arguments))
+            return ("path", tuple(value.split("/")))
+        raise ValueError(f"Unexpected '{value}' at position {position} in OData expression '{self.expression}'")
+
+
+def _getter(segments: Tuple[str, ...]) -> Callable[[Any], Any]:
+    def get(record: Any) -> Any:
+        for segment in segments:
+            if record is None:
+                return None
+            record = record.get(segment) if isinstance(record, dict) else getattr(record, segment, None)
+        return record
+    return get
+
+def _compare(comparison: str, left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        # Only equality is defined for null, as in OData
+        if comparison == "eq":
+            return left is right
+        return comparison == "ne" and left is not right
+    try:
+        return _COMPARISONS[comparison](_fold(left), _fold(right))
+    except TypeError:
+        return comparison == "ne"
+
+def _compile_row(node: _Node) -> Callable[[Any], Any]:
+    """turns a node into a function of one record; logical operators return None for null, as in OData"""
+    kind = node[0]
+    if kind == "literal" or kind == "datetime":
+        value = node[1]
+        return lambda record: value
+    if kind == "path":
+        return _getter(node[1])
+    if kind == "not":
+        operand = _compile_row(node[1])
+
+        def negate(record: Any) -> bool | None:
+            value = operand(record)
+            return None if value is None else not value
+        return negate
+    if kind == "and" or kind == "or":
+        left, right = _compile_row(node[1]), _compile_row(node[2])
+        # `and` is decided by a false operand and `or` by a true one; otherwise a null operand makes the result null
+        decisive = kind == "or"
+
+        def combine(record: Any) -> bool | None:
+            left_value = left(record)
+            if left_value is not None and bool(left_value) is decisive:
+                return decisive
+            right_value = right(record)
+            if right_value is not None and bool(right_value) is decisive:
+                return decisive
+            return None if left_value is None or right_value is None else not decisive
+        return combine
+    if kind == "call":
+        function = _FUNCTIONS[node[1]][1]
+        arguments = [_compile_row(argument) for argument in node[2]]
+        return lambda record: function(*[argument(record) for argument in arguments])
+    comparison, left_node, right_node = node[1], node[2], node[3]
+    left, right = _compile_row(left_node), _compile_row(right_node)
+    if left_node[0] == "datetime" or right_node[0] == "datetime":
+        # Dates in records are strings in various formats; compare them as points in time
+        left_value = left if left_node[0] == "datetime" else lambda record: _as_datetime(left(record))
+        right_value = right if right_node[0] == "datetime" else lambda record: _as_datetime(right(record))
+        return lambda record: _compare(comparison, left_value(record), right_value(record))
+    return lambda record: _compare(comparison, left(record), right(record))
+
+def _paths(node: _Node) -> set:
+    """the record paths an expression reads"""
+    kind = node[0]
+    if kind == "path":
+        return {node[1]}
+    if kind in ("literal", "datetime"):
+        return set()
+    children = node[2] if kind == "call" else node[2:] if kind == "compare" else node[1:]
+    return set().union(*(_paths(child) for child in children))
+
+def _python(value: Any) -> Any:
+    """converts a numpy scalar from a columnar result into the equivalent Python value"""
+    if not hasattr(value, "dtype"):
+        return value
+    value = value.item()
+    return value.replace(tzinfo=timezone.utc) if isinstance(value, datetime) else value
+
+def _rows(columns: ColumnarResult) -> Iterable[Dict[str, Any]]:
+    for row in columns:
+        yield {name: _python(value) for name, value in row.items()}
+
+def _truth(numpy: Any, values: List[Any]) -> Tuple[Any, Any]:
+    """the boolean arrays marking which values are true and which are null"""
+    return (numpy.array([value is not None and bool(value) for value in values], dtype=bool),
+            numpy.array([value is None for value in values], dtype=bool))
+
+def _compile_columns(node: _Node, row: Callable[[Any], Any]) -> Callable[[ColumnarResult], Tuple[Any, Any]]:
+    """turns a node into a function returning two boolean arrays with one value per row of a columnar
+    result, marking the rows where the node is true and those where it is null"""
+    kind = node[0]
+    numpy = _numpy()
+    if kind in ("and", "or", "not"):
+        operands = [_compile_columns(child, _compile_row(child)) for child in node[1:]]
+        if kind == "not":
+            def negate(columns: ColumnarResult) -> Tuple[Any, Any]:
+                true, null = operands[0](columns)
+                return ~(true | null), null
+            return negate
+
+        def combine(columns: ColumnarResult) -> Tuple[Any, Any]:
+            (left, left_null), (right, right_null) = operands[0](columns), operands[1](columns)
+            left_false, right_false = ~(left | left_null), ~(right | right_null)
+            if kind == "and":
+                true, false = left & right, left_false | right_false
+            else:
+                true, false = left | right, left_false & right_false
+            return true, ~(true | false)
+        return combine
+    paths = _paths(node)
+
+    def evaluate(columns: ColumnarResult) -> Tuple[Any, Any]:
+        if len(paths) == 1:
+            (path,) = paths
+            column = columns.columns.get(path[0]) if len(path) == 1 else None
+            if isinstance(column, DictionaryColumn):
+                # Evaluate once per distinct value; code -1 (no value) selects the last entry
+                true, null = _truth(numpy, [row({path[0]: value}) for value in column.values] + [row({})])
+                return true[column.codes], null[column.codes]
+            if column is not None and kind == "compare":
+                vectorized = _compare_column(numpy, node, column)
+                if vectorized is not None:
+                    return vectorized, numpy.zeros(len(column), dtype=bool)
+        return _truth(numpy, [row(record) for record in _rows(columns)])
+    return evaluate
+
+def _compare_column(numpy: Any, node: _Node, column: Any) -> Any:
+    """compares a numeric, boolean or date column with a literal, or returns None"""
+    comparison, left, right = node[1], node[2], node[3]
+    if left[0] != "path":
+        comparison, left, right = _SWAPPED[comparison], right, left
+    if left[0] != "path" or right[0] not in ("literal", "datetime"):
+        return None
+    value = right[1]
+    function = _COMPARISONS[comparison]
+    if column.dtype.kind == "M":
+        missing = numpy.isnat(column)
+        if value is None:
+            return missing if comparison == "eq" else ~missing if comparison == "ne" else numpy.zeros(len(column), dtype=bool)
+        if right[0] != "datetime":
+            return None
+        literal = numpy.datetime64(value.astimezone(timezone.utc).replace(tzinfo=None), "ms")
+        return numpy.where(missing, comparison == "ne", function(column, literal))
+    if not isinstance(column, numpy.ma.MaskedArray) or column.dtype.kind not in "biuf":
+        return None
+    missing = numpy.ma.getmaskarray(column)
+    if value is None:
+        return missing if comparison == "eq" else ~missing if comparison == "ne" else numpy.zeros(len(column), dtype=bool)
+    if value.__class__ not in (int, float, bool):
+        return None
+    return numpy.where(missing, comparison == "ne", function(column.data, value))
+
+
+class ODataFilter:
+    """
+    A compiled OData `$filter` expression that can be evaluated against
+    local records.
+
+    Records may be model objects such as `TaskDto`, lazy models, or
+    dictionaries as returned by the API in "raw" result mode. Paths such
+    as `project/id` follow nested objects.
+    """
+
+    expression: str
+    """
+    The expression this filter was compiled from.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        node = _Parser(expression).parse()
+        self._row = _compile_row(node)
+        self._node = node
+        self._columns: Callable[[ColumnarResult], Any] | None = None
+
+    def __call__(self, record: Any) -> bool:
+        """Whether a record matches the filter"""
+        return bool(self._row(record))
+
+    def filter(self, records: Iterable[T]) -> List[T]:
+        """Return the records that match the filter, in their original order"""
+        row = self._row
+        return [record for record in records if row(record)]
+
+    def mask(self, columns: ColumnarResult) -> Any:
+        """Return a boolean numpy array marking the rows of a columnar result that match the filter"""
+        if self._columns is None:
+            self._columns = _compile_columns(self._node, self._row)
+        return self._columns(columns)[0]
+
+
+class ODataOrderBy:
+    """
+    A compiled OData `$orderby` expression, such as
+    `priorityId desc, name`, that can sort local records.
+
+    Like the API, missing values sort before all others in ascending
+    order and after them in descending order, and strings are compared
+    without regard to case.
+    """
+
+    expression: str
+    """
+    The expression this ordering was compiled from.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.keys: List[Tuple[Tuple[str, ...], bool]] = []
+        for part in expression.split(","):
+            words = part.split()
+            if not words or len(words) > 2 or (len(words) == 2 and words[1].lower() not in ("asc", "desc")):
+                raise ValueError(f"Invalid OData ordering '{part.strip()}' in '{expression}'")
+            if not re.fullmatch(r"[A-Za-z_]\w*(?:/[A-Za-z_]\w*)*", words[0]):
+                raise ValueError(f"Invalid OData path '{words[0]}' in '{expression}'")
+            self.keys.append((tuple(words[0].split("/")), len(words) == 2 and words[1].lower() == "desc"))
+        self._getters = [(_getter(path), descending) for path, descending in self.keys]
+
+    def sort(self, records: Iterable[T]) -> List[T]:
+        """Return the records sorted by this ordering; the sort is stable"""
+        result = list(records)
+        for get, descending in reversed(self._getters):
+            result.sort(key=lambda record: _sort_key(get(record)), reverse=descending)
+        return result
+
+    def argsort(self, columns: ColumnarResult) -> Any:
+        """Return the row positions of a columnar result in the order of this ordering"""
+        numpy = _numpy()
+        order = numpy.arange(len(columns))
+        for path, descending in reversed(self.keys):
+            keys = _column_sort_keys(numpy, columns, path)
+            if descending:
+                # Reverse the ranks instead of the order so that equal rows keep their positions
+                keys = keys.max(initial=0) - keys
+            order = order[numpy.argsort(keys[order], kind="stable")]
+        return order
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    if value is None:
+        return (0, 0)
+    if value.__class__ is str:
+        return (1, value.casefold())
+    return (1, value)
+
+def _column_sort_keys(numpy: Any, columns: ColumnarResult, path: Tuple[str, ...]) -> Any:
+    """ranks each row of a columnar result by the value at a path, with missing values first"""
+    column = columns.columns.get(path[0]) if len(path) == 1 else None
+    if isinstance(column, DictionaryColumn):
+        # Rank each distinct value once; code -1 (no value) selects the last entry
+        return _dense_ranks(numpy, [_sort_key(value) for value in column.values] + [_sort_key(None)])[column.codes]
+    if column is None or column.dtype.kind not in "biufM":
+        getter = _getter(path)
+        return _dense_ranks(numpy, [_sort_key(getter(row)) for row in _rows(columns)])
+    if column.dtype.kind == "M":
+        missing, data = numpy.isnat(column), column.astype(numpy.int64)
+    else:
+        missing, data = numpy.ma.getmaskarray(column), numpy.ma.getdata(column)
+    unique, inverse = numpy.unique(data[~missing], return_inverse=True)
+    ranks = numpy.zeros(len(column), dtype=numpy.int64)
+    ranks[~missing] = inverse + 1
+    return ranks
+
+def _dense_ranks(numpy: Any, keys: List[Any]) -> Any:
+    """ranks sort keys so that equal keys share a rank and later orderings can decide between them"""
+    ranks = numpy.empty(len(keys), dtype=numpy.int64)
+    rank = 0
+    previous = None
+    for position, index in enumerate(sorted(range(len(keys)), key=keys.__getitem__)):
+        if position > 0 and keys[index] != previous:
+            rank += 1
+        ranks[index] = rank
+        previous = keys[index]
+    return ranks
+
+
+@functools.lru_cache(maxsize=256)
+def compile_filter(expression: str) -> ODataFilter:
+    """Compile an OData `$filter` expression for evaluation against local records
+
+    The supported subset is the one the API accepts: the comparisons
+    `eq`, `ne`, `gt`, `ge`, `lt` and `le`; `and`, `or`, `not` and
+    parentheses; the functions `contains`, `startswith`, `endswith`,
+    `tolower` and `toupper`; paths such as `project/id`; and string,
+    number, boolean, null, date and GUID literals. As in the API, string
+    comparisons ignore case, dates are compared as points in time, and
+    comparing a missing value with `gt`, `ge`, `lt` or `le` never matches;
+    `not`, `and` and `or` treat a missing value as null, so `not approved`
+    does not match records without `approved`.
+
+    Compiled filters are cached, so repeating an expression is cheap.
+
+    Parameters
+    ----------
+    expression : str
+        The expression, such as `project/id eq 'abc' and contains(name, 'api')`
+    """
+    return ODataFilter(expression)
+
+@functools.lru_cache(maxsize=256)
+def compile_orderby(expression: str) -> ODataOrderBy:
+    """Compile an OData `$orderby` expression for sorting local records
+
+    Parameters
+    ----------
+    expression : str
+        A comma-separated list of paths, each optionally followed by `asc`
+        or `desc`, such as `priorityId desc, name`
+    """
+    return ODataOrderBy(expression)
+
+def query_local(records: Iterable[T] | ColumnarResult, top: int | None = None, skip: int | None = None,
+    filter: str | None = None, orderby: str | None = None) -> List[T] | ColumnarResult:
+    """Run an OData query against local records instead of the API
+
+    This takes the same `$top`, `$skip`, `$filter` and `$orderby` values as
+    methods such as `query_tasks`, and returns the same records the API
+    would return for data in the same state.
+
+    Parameters
+    ----------
+    records : Iterable[T] | ColumnarResult
+        Model objects, dictionaries, or a `ColumnarResult`
+    top : int | None
+        The maximum number of records to return
+    skip : int | None
+        The number of matching records to skip
+    filter : str | None
+        An OData `$filter` expression
+    orderby : str | None
+        An OData `$orderby` expression
+    """
+    start = skip or 0
+    stop = None if top is None else start + top
+    if isinstance(records, ColumnarResult):
+        numpy = _numpy()
+        positions = numpy.arange(len(records))
+        if filter:
+            positions = numpy.flatnonzero(compile_filter(filter).mask(records))
+        if orderby:
+            positions = positions[compile_orderby(orderby).argsort(records.take(positions))]
+        return records.take(positions[start:stop])
+    result = compile_filter(filter).filter(records) if filter else list(records)
+    if orderby:
+        result = compile_orderby(orderby).sort(result)
+    return result[start:stop]
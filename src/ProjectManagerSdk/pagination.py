@@ -0,0 +1,150 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.columnar import ColumnarResult
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.astroresult import AstroResult
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Tuple, TypeVar
+import asyncio
+import contextlib
+import contextvars
+
+T = TypeVar('T')
+
+DEFAULT_PAGE_SIZE = 500
+
+def _records(result: AstroResult) -> list:
+    """the records of a page, or an error if the page was fetched in columnar result mode"""
+    if not result.success:
+        raise AstroException(result)
+    page = result.data or []
+    if isinstance(page, ColumnarResult):
+        raise ValueError("Pagination yields one record at a time and does not support the columnar result mode; "
+                         "call the query method for each page, or select another result mode")
+    return page
+
+def _page_offsets(page_size: int, max_items: int | None) -> Iterator[Tuple[int, int]]:
+    """yields the $top and $skip values for each successive page"""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    skip = 0
+    while max_items is None or skip < max_items:
+        top = page_size if max_items is None else min(page_size, max_items - skip)
+        yield top, skip
+        skip += top
+
+def _fetch_pages(fetch: Callable[[int, int], AstroResult[List[T]]], page_size: int, max_items: int | None, 
+    prefetch: int) -> Iterator[Tuple[int, AstroResult[List[T]]]]:
+    """yields each page in order, keeping up to `prefetch` further pages in flight"""
+    if prefetch < 1:
+        for top, skip in _page_offsets(page_size, max_items):
+            yield top, fetch(top, skip)
+        return
+    with ThreadPoolExecutor(max_workers=prefetch + 1) as executor:
+        pending = deque()
+        try:
+            for top, skip in _page_offsets(page_size, max_items):
+                # Pages are fetched with the caller's context so per-call settings such as result modes apply
+                pending.append((top, executor.submit(contextvars.copy_context().run, fetch, top, skip)))
+                if len(pending) > prefetch:
+                    top, future = pending.popleft()
+                    yield top, future.result()
+            while pending:
+                top, future = pending.popleft()
+                yield top, future.result()
+        finally:
+            for top, future in pending:
+                future.cancel()
+
+async def _fetch_pages_async(fetch: Callable[[int, int], Awaitable[AstroResult[List[T]]]], page_size: int, 
+    max_items: int | None, prefetch: int) -> AsyncIterator[Tuple[int, AstroResult[List[T]]]]:
+    """yields each page in order, keeping up to `prefetch` further pages in flight"""
+    pending = deque()
+    try:
+        for top, skip in _page_offsets(page_size, max_items):
+            pending.append((top, asyncio.ensure_future(fetch(top, skip))))
+            if len(pending) > prefetch:
+                top, task = pending.popleft()
+                yield top, await task
+        while pending:
+            top, task = pending.popleft()
+            yield top, await task
+    finally:
+        for top, task in pending:
+            task.cancel()
+
+def paginate(fetch: Callable[[int, int], AstroResult[List[T]]], page_size: int = DEFAULT_PAGE_SIZE, 
+    max_items: int | None = None, prefetch: int = 0) -> Iterator[T]:
+    """Iterate over every record of an OData query, one page at a time
+
+    Only one page of records is held in memory at once, plus any pages
+    being prefetched. Iteration stops when a page comes back with fewer
+    records than requested, or once `max_items` records have been 
+    returned. Records are always returned in order.
+
+    Records are model objects, or dictionaries in the "raw" result mode.
+    The "columnar" result mode is not supported, since it builds arrays
+    for a whole page rather than one record at a time: a `ValueError` is
+    raised instead. To analyze a large query in columnar form, call the
+    query method for each page and join the pages with
+    `ColumnarResult.concat`.
+
+    Parameters
+    ----------
+    fetch : Callable[[int, int], AstroResult[List[T]]]
+        Retrieves one page given its `$top` and `$skip` values
+    page_size : int
+        The number of records to request with each API call
+    max_items : int | None
+        If set, stop after this many records have been returned
+    prefetch : int
+        The number of following pages to request in the background
+        while the current page is being consumed. Up to this many 
+        extra requests may be wasted past the end of the results.
+    """
+    with contextlib.closing(_fetch_pages(fetch, page_size, max_items, prefetch)) as pages:
+        for top, result in pages:
+            page = _records(result)
+            yield from page
+            if len(page) < top:
+                return
+
+async def paginate_async(fetch: Callable[[int, int], Awaitable[AstroResult[List[T]]]], page_size: int = DEFAULT_PAGE_SIZE, 
+    max_items: int | None = None, prefetch: int = 0) -> AsyncIterator[T]:
+    """Iterate over every record of an OData query, one page at a time
+
+    This is the asyncio counterpart of `paginate`, used by the `iter_*`
+    methods of `AsyncProjectManagerClient`. Like `paginate`, it does not
+    support the "columnar" result mode.
+
+    Parameters
+    ----------
+    fetch : Callable[[int, int], Awaitable[AstroResult[List[T]]]]
+        Retrieves one page given its `$top` and `$skip` values
+    page_size : int
+        The number of records to request with each API call
+    max_items : int | None
+        If set, stop after this many records have been returned
+    prefetch : int
+        The number of following pages to request concurrently while
+        the current page is being consumed
+    """
+    async with contextlib.aclosing(_fetch_pages_async(fetch, page_size, max_items, prefetch)) as pages:
+        async for top, result in pages:
+            page = _records(result)
+            for item in page:
+                yield item
+            if len(page) < top:
+                return
@@ -1,32 +1,26 @@
 #
 # ProjectManager API for Python
 #
-# (c) 2023-2026 ProjectManager.com, Inc.
+# (c) ProjectManager.com, Inc.
 #
 # For the full copyright and license information, please view the LICENSE
 # file that was distributed with this source code.
 #
 # @author     ProjectManager.com <support@projectmanager.com>
-#             
-# @copyright  2023-2026 ProjectManager.com, Inc.
-# @version    154.0.181
+# @copyright  ProjectManager.com, Inc.
 # @link       https://github.com/projectmgr/projectmanager-sdk-python
 #
 
 import platform
-import requests
-import typing
-import urllib.parse
 
-from requests.models import Response
+from ProjectManagerSdk.clientbase import ProjectManagerClientBase
 
-class ProjectManagerClient:
+class ProjectManagerClient(ProjectManagerClientBase):
     """
     ProjectManager API API Client object
     
     Use this object to connect to the API.
     """
-    bearerToken: str | None
 
     def __init__(self, env: str, appname: str):
         """Construct a new ProjectManagerClient client object
@@ -163,52 +157,4 @@ class ProjectManagerClient:
         self.machineName = platform.uname().node
         self.applicationName = appname
         self.bearerToken = None
-    
-    def with_api_key(self, key: str):
-        """Configure this API client to use API Key authentication
-        
-        
-        
-        Parameters
-        ----------
-        key : str
-            The API Key to use for authentication.
-        """
-        self.bearerToken = key
-    
-    def send_request(self, method: str, path: str, body: object, 
-        query_params: typing.Dict[str, typing.Any] | None, filename: str | None) -> Response:
-        """Send a request and parse the result
-        
-        Parameters
-        ----------
-        method : str
-            The HTTP method for this request
-        path : str
-            The path of the API endpoint for this request
-        body : object
-            For POST, PUT, or PATCH, represents the body of the request. For other
-            requests, this value should be nil.
-        query_params : object
-            The list of query parameters for the request
-        """
-        if query_params:
-            url = urllib.parse.urljoin(self.serverUrl, path) + "?" + urllib.parse.urlencode(query_params)
-        else:
-            url = urllib.parse.urljoin(self.serverUrl, path)
-
-        # Determine if we're uploading a file
-        files = None
-        if filename:
-            files = { "files": open(filename, "rb") }
-
-        headers = {"Accept": "application/json",
-                   "SdkName": self.sdkName,
-                   "SdkVersion": self.sdkVersion,
-                   "MachineName": self.machineName,
-                   "ApplicationName": self.applicationName}
-        if self.bearerToken:
-            headers["Authorization"] = "Bearer " + self.bearerToken
-    
-        return requests.request(method, url, headers=headers, json=body, files=files)
-        
+        super().__init__()
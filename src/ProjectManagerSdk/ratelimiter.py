@@ -0,0 +1,135 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from email.utils import parsedate_to_datetime
+import threading
+import time
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a Retry-After header into a number of seconds
+
+    Parameters
+    ----------
+    value : str | None
+        Either a number of seconds or an HTTP date
+    now : float | None
+        The current time as returned by time.time(); defaults to now
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class RateLimiter:
+    """
+    A token bucket that throttles API calls to a sustainable rate.
+
+    The limiter starts at `rate` calls per second. Each time the API
+    answers 429 Too Many Requests, the rate is cut by `backoff_factor`
+    and every caller waits for the Retry-After period; each successful
+    call then raises the rate again by `increase` calls per second, up
+    to `rate`. Bulk jobs therefore settle just below the rate the server
+    accepts instead of repeatedly running into 429 responses.
+
+    A limiter is thread-safe and may be shared by several clients,
+    threads and asyncio tasks.
+    """
+
+    max_retries: int
+    """
+    The number of times a call that was answered with 429 is sent again
+    after waiting.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int | None = None, min_rate: float = 0.5,
+        backoff_factor: float = 0.5, increase: float | None = None, max_retries: int = 3, clock=time.monotonic):
+        """Construct a new rate limiter
+
+        Parameters
+        ----------
+        rate : float
+            The maximum number of calls per second
+        burst : int | None
+            The number of calls that may be sent at once after a quiet
+            period; defaults to `rate`
+        min_rate : float
+            The lowest rate the limiter will back off to
+        backoff_factor : float
+            The rate is multiplied by this factor after each 429 response
+        increase : float | None
+            The rate is increased by this many calls per second after each
+            successful call; defaults to 1% of `rate`
+        max_retries : int
+            The number of times a throttled call is sent again
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than zero")
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.backoff_factor = backoff_factor
+        self.increase = increase if increase is not None else self.max_rate / 100
+        self.max_retries = max_retries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self.throttled = 0
+
+    def reserve(self) -> float:
+        """Reserve a slot for one call
+
+        Returns the number of seconds the caller must wait before sending
+        it. Waiting is left to the caller, so the same limiter works for
+        threads and asyncio tasks.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def record(self, status_code: int, retry_after: str | None = None):
+        """Adjust the rate after a response
+
+        Parameters
+        ----------
+        status_code : int
+            The HTTP status code of the response
+        retry_after : str | None
+            The value of the response's Retry-After header, if any
+        """
+        with self._lock:
+            if status_code == 429:
+                self.throttled += 1
+                self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+                delay = parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 1.0 / self.rate
+                self._blocked_until = max(self._blocked_until, self._clock() + delay)
+                # Calls already reserved must also wait out the penalty
+                self._tokens = min(self._tokens, 0.0)
+            elif status_code < 500:
+                self.rate = min(self.max_rate, self.rate + self.increase)
@@ -0,0 +1,183 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.endpoints import path_resource, path_template
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+import threading
+import time
+
+REFERENCE_DATA_TTLS: Dict[str, float] = {
+    "/api/data/projects/{projectId}/tasks/statuses": 300.0,
+    "/api/data/projects/statuses": 300.0,
+    "/api/data/projects/priorities": 300.0,
+    "/api/data/tasks/priorities": 300.0,
+    "/api/data/tags": 300.0,
+    "/api/data/users/roles": 900.0,
+    "/api/data/workspaces": 900.0,
+    "/api/data/license": 900.0,
+    "/api/data/projects/fields": 300.0,
+    "/api/data/projects/{projectId}/tasks/fields": 300.0,
+}
+"""
+The endpoints cached by default and how many seconds their responses
+are kept: statuses, priorities, tags, roles, workspaces, licenses and
+custom field definitions, which are read often and rarely change.
+"""
+
+class _Entry:
+    __slots__ = ("response", "expires", "segments", "resource")
+
+    def __init__(self, response: Any, expires: float, path: str):
+        self.response = response
+        self.expires = expires
+        self.segments = path.split("/")
+        self.resource = path_resource(path)
+
+
+class ResponseCache:
+    """
+    Keeps successful responses of slow-changing endpoints in memory for
+    a limited time.
+
+    Only GET calls to endpoints listed in `ttls` are cached, for the
+    number of seconds given there; by default these are the endpoints in
+    `REFERENCE_DATA_TTLS`. Responses are kept per URL, including the
+    query string, and per API key. When the cache holds `max_entries`
+    responses, the least recently used one is dropped.
+
+    Any other call through the same client, such as `create_taskstatus`
+    or `update_project_priority`, removes the cached responses it may
+    have changed: those of the same kind of resource, such as all task
+    statuses, and those of any collection the changed path belongs to.
+
+    A cache is thread-safe and may be shared by several clients.
+    """
+
+    hits: int
+    """
+    The number of calls answered from the cache.
+    """
+
+    misses: int
+    """
+    The number of calls to cached endpoints that were sent to the API.
+    """
+
+    evictions: int
+    """
+    The number of responses dropped to make room for newer ones.
+    """
+
+    def __init__(self, max_entries: int = 256, ttls: Dict[str, float] | None = None, clock=time.monotonic):
+        """Construct a new response cache
+
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of responses kept
+        ttls : Dict[str, float] | None
+            How many seconds to keep responses for, keyed by endpoint path
+            template such as `/api/data/tags`; defaults to
+            `REFERENCE_DATA_TTLS`
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttls = dict(REFERENCE_DATA_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, path: str) -> bool:
+        """Whether responses for a request path are cached"""
+        return path_template(path) in self.ttls
+
+    def get(self, key: Hashable, path: str) -> Any:
+        """Look up the cached response for a GET call, or None
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the call, such as its URL and credentials
+        path : str
+            The path of the call
+        """
+        if not self.cacheable(path):
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.response
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, path: str, response: Any, generation: int):
+        """Cache the response of a GET call if it succeeded and its endpoint is cached
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the call, such as its URL and credentials
+        path : str
+            The path of the call
+        response : Any
+            The response
+        generation : int
+            The value of `generation` when the call was sent; the response
+            is not cached if the cache was invalidated since
+        """
+        ttl = self.ttls.get(path_template(path))
+        if ttl is None or not 200 <= response.status_code < 300:
+            return
+        with self._lock:
+            if generation != self.generation:
+                # A write may have changed the data while this call was in flight
+                return
+            self._entries[key] = _Entry(response, self._clock() + ttl, path)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: str | None = None):
+        """Remove cached responses that a change to a path may affect
+
+        Parameters
+        ----------
+        path : str | None
+            The path that was changed, such as
+            `/api/data/projects/priorities/1234`; if not specified, the
+            whole cache is cleared
+        """
+        with self._lock:
+            self.generation += 1
+            if path is None:
+                self._entries.clear()
+                return
+            segments = path.split("/")
+            resource = path_resource(path)
+            for key in [key for key, entry in self._entries.items()
+                        if entry.resource == resource or segments[:len(entry.segments)] == entry.segments]:
+                del self._entries[key]
@@ -0,0 +1,144 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.ratelimiter import parse_retry_after
+from typing import Collection
+import random
+import threading
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of all calls, so that a struggling API
+    is not flooded with retries on top of regular traffic.
+
+    Every call adds `ratio` to the budget and every retry spends one
+    unit of it. The budget starts with, and never grows beyond,
+    `min_retries` plus the retries earned by the last `window` calls.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: int = 1000):
+        """Construct a new retry budget
+
+        Parameters
+        ----------
+        ratio : float
+            The number of retries allowed per call
+        min_retries : int
+            The number of retries always available, even with little traffic
+        window : int
+            The number of recent calls whose unused retries are kept
+        """
+        self.ratio = ratio
+        self.capacity = min_retries + ratio * window
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Record a new call"""
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry; returns false if the budget is exhausted"""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Resends API calls that failed with a transient error: a 502, 503 or
+    504 response, a dropped connection, or a timeout.
+
+    Retries wait for an exponentially growing, randomly jittered delay,
+    or for the Retry-After period if the server sent one. By default only
+    GET, PUT and DELETE calls are retried, since repeating them has no
+    additional effect; add "POST" to `methods` to also retry calls such as
+    `create_task`, which may then create duplicates.
+    """
+
+    DEFAULT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+    DEFAULT_STATUS_CODES = frozenset({502, 503, 504})
+
+    def __init__(self, max_attempts: int = 4, backoff: float = 0.5, max_backoff: float = 30.0,
+        methods: Collection[str] = DEFAULT_METHODS, status_codes: Collection[int] = DEFAULT_STATUS_CODES,
+        budget: RetryBudget | None = None):
+        """Construct a new retry policy
+
+        Parameters
+        ----------
+        max_attempts : int
+            The maximum number of times a call is sent, including the first
+        backoff : float
+            The delay in seconds before the first retry; each further retry
+            doubles the delay
+        max_backoff : float
+            The longest delay in seconds between two attempts
+        methods : Collection[str]
+            The HTTP methods that may be retried
+        status_codes : Collection[int]
+            The HTTP status codes that are retried
+        budget : RetryBudget | None
+            Limits the share of retries across all calls; defaults to a
+            budget of 20% of calls
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.budget = budget if budget is not None else RetryBudget()
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """The number of seconds to wait before the given retry
+
+        Parameters
+        ----------
+        attempt : int
+            The number of attempts made so far
+        retry_after : str | None
+            The Retry-After header of the failed response, if any
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            delay = max(delay, min(requested, self.max_backoff))
+        return delay
+
+    def should_retry(self, method: str, attempt: int, status_code: int | None = None) -> bool:
+        """Decide whether a failed call is sent again
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the call
+        attempt : int
+            The number of attempts made so far
+        status_code : int | None
+            The HTTP status code of the response, or None if the call
+            failed without a response
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        if status_code is not None and status_code not in self.status_codes:
+            return False
+        if not self.budget.withdraw():
+            return False
+        # The policy is shared by every thread of a client
+        with self._lock:
+            self.retries += 1
+        return True
@@ -0,0 +1,115 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+import threading
+
+T = TypeVar('T')
+
+class _Call:
+    """a call in flight and the callers waiting for it"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapses identical calls that are in flight at the same time into
+    one: the first caller makes the call, and every caller that asks for
+    the same key before it completes receives the same result or error.
+    Nothing is cached; a call made after the previous one completed is
+    made again.
+
+    The same instance coalesces calls from threads with `do` and from
+    asyncio tasks with `do_async`.
+    """
+
+    coalesced: int
+    """
+    The number of calls that were not made because an identical call was
+    already in flight.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        """Make a call, or wait for the identical call already in flight
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies calls that have the same result
+        call : Callable[[], T]
+            Makes the call
+        """
+        with self._lock:
+            flight = self._calls.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            flight.done.set()
+
+    async def do_async(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Make a call, or wait for the identical call already in flight
+
+        The call runs in its own task, so cancelling one of the waiting
+        callers does not cancel it for the others.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies calls that have the same result
+        call : Callable[[], Awaitable[T]]
+            Makes the call
+        """
+        # Tasks cannot be awaited from another event loop
+        key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(call())
+                task.add_done_callback(lambda _: self._forget(key, task))
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
@@ -0,0 +1,295 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroexception import AstroException
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+import contextlib
+import dataclasses
+import json
+import os
+import sqlite3
+import threading
+import time
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SyncSource:
+    """
+    An API collection that a `SyncEngine` copies into a local table.
+    """
+
+    table: str
+    """
+    The name of the local table.
+    """
+
+    category: str
+    """
+    The API category of the client that queries the collection, such as
+    "task".
+    """
+
+    method: str
+    """
+    The OData query method of the category, such as "query_tasks".
+    """
+
+    modifiedField: str
+    """
+    The field holding when a record was last modified, such as "modifyDate".
+    """
+
+
+SYNC_SOURCES: Dict[str, SyncSource] = {
+    "tasks": SyncSource("tasks", "task", "query_tasks", "modifyDate"),
+    "projects": SyncSource("projects", "project", "query_projects", "modifyDate"),
+    "resources": SyncSource("resources", "resource", "query_resources", "modifiedDate"),
+    "time_entries": SyncSource("time_entries", "timesheet", "query_time_entries", "modifiedDate"),
+}
+"""
+The collections a `SyncEngine` copies by default, keyed by table name.
+"""
+
+@dataclasses.dataclass(slots=True)
+class SyncResult:
+    """
+    The outcome of synchronizing one table.
+    """
+
+    table: str
+    """
+    The name of the table.
+    """
+
+    full: bool
+    """
+    True if every record was loaded, false if only changed records were.
+    """
+
+    rows: int = 0
+    """
+    The number of records received and stored.
+    """
+
+    deleted: int = 0
+    """
+    The number of local records removed by a full load because the API no
+    longer returned them.
+    """
+
+    calls: int = 0
+    """
+    The number of API calls made.
+    """
+
+    highWater: str | None = None
+    """
+    The latest modification time stored, from which the next sync starts.
+    """
+
+    seconds: float = 0.0
+    """
+    The time the sync took.
+    """
+
+
+class SyncEngine:
+    """
+    Keeps a local SQLite copy of tasks, projects, resources and time
+    entries up to date.
+
+    The first sync of a table loads every record. Each later sync only
+    asks for records whose `modifyDate` or `modifiedDate` is at or after
+    the latest one already stored, so its cost depends on how many
+    records changed rather than on the size of the workspace. Records
+    are requested in order of modification and paged by that time
+    instead of by position, so records changed while a sync runs are
+    neither skipped nor lost; they are received again by the next sync.
+
+    Each table holds the `id`, the modification time and the record as
+    JSON in a `data` column, which SQLite's JSON functions can query.
+    Records are written in batches of `batch_size`, each in one
+    transaction together with the table's new high-water mark, so an
+    interrupted sync resumes where it stopped.
+
+    Deleted records are not reported by incremental queries; pass
+    `full=True` to `sync` from time to time to reload every record and
+    remove those the API no longer returns.
+    """
+
+    def __init__(self, client: Any, path: str | os.PathLike, sources: Sequence[str | SyncSource] = tuple(SYNC_SOURCES),
+        page_size: int = 500, batch_size: int = 1000):
+        """Open or create a local copy
+
+        Parameters
+        ----------
+        client : ProjectManagerClient
+            The client used to query the API
+        path : str | PathLike
+            The file name of the SQLite database
+        sources : Sequence[str | SyncSource]
+            The table names from `SYNC_SOURCES`, or custom sources, to copy
+        page_size : int
+            The number of records requested with each API call
+        batch_size : int
+            The number of records written in each transaction
+        """
+        if page_size < 1 or batch_size < 1:
+            raise ValueError("page_size and batch_size must be at least 1")
+        self.client = client
+        self.path = os.fspath(path)
+        self.sources = {source.table: source for source in
+                        (SYNC_SOURCES[source] if isinstance(source, str) else source for source in sources)}
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, high_water TEXT, "
+                                 "run INTEGER NOT NULL DEFAULT 0, synced_at REAL)")
+        for table in self.sources:
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} (id TEXT PRIMARY KEY, modified TEXT, "
+                                     "data TEXT NOT NULL, run INTEGER NOT NULL)")
+
+    def close(self):
+        """Close the database"""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The SQLite connection, for queries against the local copy"""
+        return self._connection
+
+    def high_water(self, table: str) -> str | None:
+        """The latest modification time stored in a table, or None before its first sync"""
+        row = self._connection.execute("SELECT high_water FROM sync_state WHERE name = ?", (table,)).fetchone()
+        return row[0] if row is not None else None
+
+    def count(self, table: str) -> int:
+        """The number of records in a table"""
+        return self._connection.execute(f"SELECT COUNT(*) FROM {_quote(self.sources[table].table)}").fetchone()[0]
+
+    def records(self, table: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the records in a table as dictionaries, in the form the API returned them"""
+        for (data,) in self._connection.execute(f"SELECT data FROM {_quote(self.sources[table].table)} ORDER BY id"):
+            yield json.loads(data)
+
+    def sync(self, tables: Iterable[str] | None = None, full: bool = False) -> Dict[str, SyncResult]:
+        """Bring tables up to date
+
+        Parameters
+        ----------
+        tables : Iterable[str] | None
+            The tables to synchronize; defaults to all of them
+        full : bool
+            If true, reload every record and remove local records the API
+            no longer returns, even for tables synchronized before
+        """
+        return {table: self._sync_table(self.sources[table], full) for table in (self.sources if tables is None else tables)}
+
+    def _sync_table(self, source: SyncSource, full: bool) -> SyncResult:
+        with self._lock:
+            started = time.monotonic()
+            connection = self._connection
+            state = connection.execute("SELECT high_water, run FROM sync_state WHERE name = ?", (source.table,)).fetchone()
+            full = full or state is None
+            run = (state[1] if state is not None else 0) + 1
+            result = SyncResult(source.table, full, highWater=None if full else state[0])
+            batch: List[Dict[str, Any]] = []
+            for record in self._changed(source, result):
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    self._store(source, batch, run, result)
+                    batch = []
+            self._store(source, batch, run, result)
+            if full:
+                with _transaction(connection):
+                    result.deleted = connection.execute(f"DELETE FROM {_quote(source.table)} WHERE run < ?", (run,)).rowcount
+            result.seconds = time.monotonic() - started
+            return result
+
+    def _changed(self, source: SyncSource, result: SyncResult) -> Iterator[Dict[str, Any]]:
+        """yields the records modified at or after the high-water mark, oldest first"""
+        field = source.modifiedField
+        query = getattr(getattr(self.client, source.category), source.method)
+        # Each page starts at the modification time the previous one ended with, since more records may share it
+        mark, after = result.highWater, False
+        seen: set = set()
+        while True:
+            if mark is None:
+                condition = f"{field} ne null" if after else None
+            else:
+                condition = f"{field} {'gt' if after else 'ge'} {mark}"
+            page = self._query(source, query, 0, condition, result)
+            yield from (record for record in page if record.get(field) != mark or record.get("id") not in seen)
+            if len(page) < self.page_size:
+                return
+            last = page[-1].get(field)
+            if last == mark and not after:
+                # A whole page shares one modification time; page through those by position, then move past them
+                skip = len(page)
+                while len(page) == self.page_size:
+                    page = self._query(source, query, skip, f"{field} eq {'null' if mark is None else mark}", result)
+                    yield from page
+                    skip += len(page)
+                after = True
+            else:
+                mark, after = last, False
+                seen = {record.get("id") for record in page if record.get(field) == last}
+
+    def _query(self, source: SyncSource, query: Any, skip: int, condition: str | None, result: SyncResult) -> List[Dict[str, Any]]:
+        with self.client.result_mode("raw"):
+            # Records sharing a modification time are paged by position, which needs a defined order
+            response = query(self.page_size, skip, condition, f"{source.modifiedField} asc, id asc", None)
+        result.calls += 1
+        if not response.success:
+            raise AstroException(response)
+        return response.data or []
+
+    def _store(self, source: SyncSource, batch: List[Dict[str, Any]], run: int, result: SyncResult):
+        """upserts one batch and advances the high-water mark in the same transaction"""
+        field = source.modifiedField
+        dumps = self.client.jsonCodec.dumps
+        rows = [(record.get("id"), record.get(field), dumps(record).decode("utf-8"), run) for record in batch if record.get("id")]
+        for record in batch:
+            modified = record.get(field)
+            if modified is not None and (result.highWater is None or modified > result.highWater):
+                result.highWater = modified
+        with _transaction(self._connection) as connection:
+            connection.executemany(f"INSERT INTO {_quote(source.table)} (id, modified, data, run) VALUES (?, ?, ?, ?) "
+                                   "ON CONFLICT (id) DO UPDATE SET modified = excluded.modified, data = excluded.data, run = excluded.run",
+                                   rows)
+            connection.execute("INSERT INTO sync_state (name, high_water, run, synced_at) VALUES (?, ?, ?, ?) "
+                               "ON CONFLICT (name) DO UPDATE SET high_water = excluded.high_water, run = excluded.run, "
+                               "synced_at = excluded.synced_at", (source.table, result.highWater, run, time.time()))
+        result.rows += len(rows)
+
+
+@contextlib.contextmanager
+def _transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """a write transaction on a connection in autocommit mode"""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
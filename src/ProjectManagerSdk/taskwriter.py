@@ -0,0 +1,233 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.changesetstatusdto import ChangeSetStatusDto
+from ProjectManagerSdk.models.taskcreatedto import TaskCreateDto
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Tuple
+import contextvars
+import threading
+import time
+
+_Pending = Tuple[TaskCreateDto, Future]
+
+class TaskWriter:
+    """
+    Creates tasks in bulk, a chunk of tasks per API call.
+
+    Tasks added to the writer are buffered per project and sent with
+    `TaskClient.create_many_tasks` once `batch_size` tasks are waiting for
+    the same project, or once the oldest of them has waited
+    `flush_interval` seconds, so a slow trickle of tasks is not held back
+    indefinitely. Each call to `add` returns a future that resolves to the
+    `ChangeSetStatusDto` of that task, or raises an `AstroException` if
+    the call that carried it failed.
+
+    Chunks for different projects are sent concurrently by up to
+    `max_workers` threads; chunks for the same project are sent one after
+    another, in the order their tasks were added. At most `max_pending`
+    tasks are held at once, after which `add` blocks until earlier chunks
+    have been sent, so importing a large file does not buffer all of it in
+    memory.
+
+    Bulk creation is not retried by the writer, since a repeated call
+    would create the same tasks twice; configure the client's
+    `RetryPolicy` if transient errors should be retried.
+    """
+
+    def __init__(self, client: Any, batch_size: int = 100, flush_interval: float = 1.0, max_workers: int = 4,
+        max_pending: int = 10000):
+        """Construct a new task writer
+
+        Parameters
+        ----------
+        client : ProjectManagerClient
+            The client used to create tasks
+        batch_size : int
+            The largest number of tasks sent with each API call
+        flush_interval : float
+            The longest time in seconds a task waits in the buffer before
+            it is sent
+        max_workers : int
+            The number of API calls made at once; use a connection pool at
+            least this large, see `ProjectManagerClient.with_connection_pool`
+        max_pending : int
+            The number of tasks that may be buffered or in flight before
+            `add` blocks
+        """
+        if batch_size < 1 or max_workers < 1:
+            raise ValueError("batch_size and max_workers must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_pending < batch_size:
+            raise ValueError("max_pending must be at least batch_size")
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.calls = 0
+        self.created = 0
+        self.failed = 0
+        self._context = contextvars.copy_context()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._condition = threading.Condition()
+        self._buffers: Dict[str, List[_Pending]] = {}
+        self._oldest: Dict[str, float] = {}
+        self._queued: Dict[str, Deque[List[_Pending]]] = {}
+        self._pending = 0
+        self._closed = False
+        self._timer: threading.Thread | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, projectId: str, task: TaskCreateDto) -> "Future[ChangeSetStatusDto]":
+        """Queue a task to be created
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project that will contain the Task
+        task : TaskCreateDto
+            The new Task
+        """
+        future: Future = Future()
+        with self._condition:
+            while self._pending >= self.max_pending and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("The task writer is closed")
+            buffer = self._buffers.get(projectId)
+            if buffer is None:
+                buffer = self._buffers[projectId] = []
+                self._oldest[projectId] = time.monotonic()
+                self._condition.notify_all()
+            buffer.append((task, future))
+            self._pending += 1
+            if len(buffer) >= self.batch_size:
+                self._dispatch(projectId)
+            if self._timer is None:
+                self._timer = threading.Thread(target=self._flush_expired, name="TaskWriter", daemon=True)
+                self._timer.start()
+        return future
+
+    def add_many(self, projectId: str, tasks: List[TaskCreateDto]) -> "List[Future[ChangeSetStatusDto]]":
+        """Queue several tasks to be created in the same project
+
+        Parameters
+        ----------
+        projectId : str
+            The unique identifier of the Project that will contain the Tasks
+        tasks : List[TaskCreateDto]
+            The new Tasks
+        """
+        return [self.add(projectId, task) for task in tasks]
+
+    def flush(self, wait: bool = True):
+        """Send all buffered tasks now
+
+        Parameters
+        ----------
+        wait : bool
+            If true, return only once every task added so far has been sent
+        """
+        with self._condition:
+            for projectId in list(self._buffers):
+                self._dispatch(projectId)
+            if wait:
+                while self._pending:
+                    self._condition.wait()
+
+    def close(self):
+        """Send all buffered tasks, wait for them, and stop the writer"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self.flush()
+        if self._timer is not None:
+            self._timer.join()
+        self._executor.shutdown()
+
+    @property
+    def pending(self) -> int:
+        """The number of tasks buffered or being sent"""
+        return self._pending
+
+    def _dispatch(self, projectId: str):
+        """moves a project's buffer to its send queue; called with the condition held"""
+        chunk = self._buffers.pop(projectId)
+        del self._oldest[projectId]
+        queue = self._queued.get(projectId)
+        if queue is not None:
+            # A chunk for this project is being sent; this one follows it
+            queue.append(chunk)
+            return
+        self._queued[projectId] = deque()
+        self._submit(projectId, chunk)
+
+    def _submit(self, projectId: str, chunk: List[_Pending]):
+        self._executor.submit(self._context.copy().run, self._send, projectId, chunk)
+
+    def _flush_expired(self):
+        """sends buffers whose oldest task has waited the flush interval"""
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                for projectId, oldest in list(self._oldest.items()):
+                    if now - oldest >= self.flush_interval:
+                        self._dispatch(projectId)
+                if self._oldest:
+                    self._condition.wait(max(0.0, min(self._oldest.values()) + self.flush_interval - now))
+                else:
+                    self._condition.wait()
+
+    def _send(self, projectId: str, chunk: List[_Pending]):
+        count = len(chunk)
+        # Tasks whose futures were cancelled while buffered are left out
+        chunk = [(task, future) for task, future in chunk if future.set_running_or_notify_cancel()]
+        try:
+            if not chunk:
+                created = 0
+            else:
+                with self.client.result_mode("model"):
+                    result = self.client.task.create_many_tasks(projectId, [task for task, _ in chunk])
+                if not result.success:
+                    raise AstroException(result)
+                statuses = result.data or []
+                for index, (_, future) in enumerate(chunk):
+                    if index < len(statuses):
+                        future.set_result(statuses[index])
+                    else:
+                        future.set_exception(AstroException(result))
+                created = min(len(statuses), len(chunk))
+        except BaseException as e:
+            for _, future in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            created = sum(1 for _, future in chunk if future.exception() is None)
+        with self._condition:
+            self.calls += 1 if chunk else 0
+            self.created += created
+            self.failed += len(chunk) - created
+            self._pending -= count
+            queue = self._queued[projectId]
+            if queue:
+                self._submit(projectId, queue.popleft())
+            else:
+                del self._queued[projectId]
+            self._condition.notify_all()
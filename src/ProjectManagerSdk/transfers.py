@@ -0,0 +1,430 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.astroresult import AstroResult
+from ProjectManagerSdk.models.filedto import FileDto
+from ProjectManagerSdk.models.taskfiledto import TaskFileDto
+from ProjectManagerSdk.retry import RetryPolicy
+from ProjectManagerSdk.uploads import Upload, UploadSource
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Tuple
+import contextvars
+import dataclasses
+import os
+import requests
+import threading
+import time
+
+@dataclasses.dataclass(slots=True)
+class FileDownload:
+    """
+    A file to download with a `TransferManager`.
+    """
+
+    documentId: str
+    """
+    The unique identifier of the document to download.
+    """
+
+    path: str
+    """
+    The local path to write the file to.
+    """
+
+    size: int | None = None
+    """
+    The size of the file, if known; a local file of this size is not
+    downloaded again.
+    """
+
+    modifiedDate: str | None = None
+    """
+    When the contents of the file were last changed, if known; a local
+    file modified at or after this time is not downloaded again.
+    """
+
+
+@dataclasses.dataclass(slots=True)
+class FileUpload:
+    """
+    A file to upload with a `TransferManager`. The file is attached to
+    the task, project or risk whose id is set, or to the Home area if
+    none is set.
+    """
+
+    source: UploadSource
+    """
+    A file path, bytes, a seekable binary file object, or an iterable of
+    chunks; iterables are not retried.
+    """
+
+    taskId: str | None = None
+    """
+    The task to attach the file to.
+    """
+
+    projectId: str | None = None
+    """
+    The project to attach the file to.
+    """
+
+    riskId: str | None = None
+    """
+    The risk to attach the file to.
+    """
+
+    folderId: str | None = None
+    """
+    The project or Home folder to store the file in.
+    """
+
+    filename: str | None = None
+    """
+    The name to store the file under; defaults to the name of the source.
+    """
+
+
+@dataclasses.dataclass(slots=True)
+class TransferResult:
+    """
+    The outcome of one file transfer.
+    """
+
+    item: FileDownload | FileUpload
+    """
+    The file that was transferred.
+    """
+
+    status: str
+    """
+    Either "downloaded", "uploaded", "skipped" or "failed".
+    """
+
+    size: int = 0
+    """
+    The number of bytes transferred.
+    """
+
+    attempts: int = 0
+    """
+    The number of times the transfer was attempted.
+    """
+
+    error: str | None = None
+    """
+    Why the transfer failed.
+    """
+
+    data: Any = None
+    """
+    For uploads, the `FileDto` of the uploaded file.
+    """
+
+
+class TransferReport:
+    """
+    The progress and throughput of a bulk file transfer. A report is
+    updated while the transfer runs and may be read from the progress
+    callback.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._finished: float | None = None
+        self.results: List[TransferResult] = []
+        self.transferred = 0
+        self.skipped = 0
+        self.failed = 0
+        self.bytes = 0
+
+    def _add(self, result: TransferResult):
+        with self._lock:
+            self.results.append(result)
+            if result.status == "skipped":
+                self.skipped += 1
+            elif result.status == "failed":
+                self.failed += 1
+            else:
+                self.transferred += 1
+                self.bytes += result.size
+
+    @property
+    def completed(self) -> int:
+        """The number of files transferred, skipped or failed so far"""
+        return len(self.results)
+
+    @property
+    def seconds(self) -> float:
+        """The time taken by the transfer so far"""
+        return (self._finished if self._finished is not None else time.perf_counter()) - self._started
+
+    @property
+    def throughput(self) -> float:
+        """The number of bytes transferred per second"""
+        seconds = self.seconds
+        return self.bytes / seconds if seconds > 0 else 0.0
+
+    @property
+    def errors(self) -> List[TransferResult]:
+        """The transfers that failed"""
+        return [result for result in self.results if result.status == "failed"]
+
+
+def _timestamp(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+def _unique_path(directory: str, name: str, documentId: str, used: set) -> str:
+    # File names come from the API and must not escape the target directory
+    name = os.path.basename(name.replace("\\", "/"))
+    if name in ("", ".", ".."):
+        name = documentId
+    path = os.path.join(directory, name)
+    if path in used:
+        stem, extension = os.path.splitext(name)
+        path = os.path.join(directory, f"{stem} ({documentId}){extension}")
+    used.add(path)
+    return path
+
+
+class TransferManager:
+    """
+    Downloads or uploads many files concurrently.
+
+    Files are transferred by a bounded pool of worker threads sharing the
+    client's connection pool. Each download that fails with a transient
+    error (a 502, 503 or 504 response or a dropped connection) is retried
+    on its own with a jittered backoff, unless the client's own
+    `RetryPolicy` already retries it; other errors are reported without
+    stopping the remaining transfers. Uploads are only retried if
+    `retry_uploads` is set, since the API may have stored a file whose
+    response was lost, and retrying would store it twice.
+
+    Downloads are skipped if the local file already has the expected size
+    and, when one is given, was modified no earlier than the file's
+    `modifiedDate`, so mirroring the same files again only fetches what
+    changed. The API reports the size of a `FileDto` but neither the size
+    nor the modification date of a `TaskFileDto`, so task files are
+    always downloaded.
+    """
+
+    def __init__(self, client: Any, max_workers: int = 8, max_attempts: int = 3, backoff: float = 0.5,
+        progress: Callable[[TransferReport], Any] | None = None, retry_uploads: bool = False):
+        """Construct a new transfer manager
+
+        Parameters
+        ----------
+        client : ProjectManagerClient
+            The client used for all transfers
+        max_workers : int
+            The number of files transferred at once; use a connection pool
+            at least this large, see `ProjectManagerClient.with_connection_pool`
+        max_attempts : int
+            The number of times each file is attempted
+        backoff : float
+            The delay in seconds before the first retry of a file
+        progress : Callable[[TransferReport], Any] | None
+            Called with the report of the transfer each time a file is done
+        retry_uploads : bool
+            If true, uploads that fail with a transient error are retried,
+            which may store the same file twice
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.client = client
+        self.max_workers = max_workers
+        self.retryPolicy = RetryPolicy(max_attempts=max_attempts, backoff=backoff,
+                                       methods={"GET", "POST"} if retry_uploads else {"GET"})
+        self.progress = progress
+
+    def download(self, files: Iterable[FileDownload | FileDto | TaskFileDto], directory: str | None = None,
+        skip_unchanged: bool = True) -> TransferReport:
+        """Download files concurrently
+
+        Parameters
+        ----------
+        files : Iterable[FileDownload | FileDto | TaskFileDto]
+            The files to download. Files returned by the API, such as the
+            result of `TaskFileClient.get_task_files`, are saved in
+            `directory` under their names.
+        directory : str | None
+            The directory to save files returned by the API in
+        skip_unchanged : bool
+            If true, files that already exist locally with the expected
+            size, and modification date if one is given, are not
+            downloaded again
+        """
+        used: set = set()
+
+        def items():
+            for file in files:
+                if isinstance(file, FileDownload):
+                    yield file
+                    continue
+                if directory is None:
+                    raise ValueError("A directory is required to download files returned by the API")
+                # The API reports when files were created, not when they were modified
+                size = file.size if isinstance(file, FileDto) else None
+                yield FileDownload(file.id, _unique_path(directory, file.name or file.id, file.id, used), size)
+
+        return self._run(items(), lambda item: self._download(item, skip_unchanged))
+
+    def download_task_files(self, taskIds: Iterable[str], directory: str) -> TransferReport:
+        """Download all files attached to some tasks concurrently
+
+        The files of each task are saved in a subdirectory of `directory`
+        named after the task's id. Since task file listings carry neither
+        a size nor a modification date, every file is downloaded. If the
+        files of a task cannot be listed, an `AstroException` is raised.
+
+        Parameters
+        ----------
+        taskIds : Iterable[str]
+            The tasks whose files are downloaded
+        directory : str
+            The directory to save the files in
+        """
+        taskIds = list(taskIds)
+
+        def listings():
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for taskId, result in zip(taskIds, executor.map(self._list_task_files, taskIds)):
+                    used: set = set()
+                    for file in result.data or []:
+                        yield FileDownload(file.id, _unique_path(os.path.join(directory, taskId), file.name or file.id, file.id, used))
+
+        return self._run(listings(), lambda item: self._download(item, False))
+
+    def upload(self, files: Iterable[FileUpload]) -> TransferReport:
+        """Upload files concurrently
+
+        Parameters
+        ----------
+        files : Iterable[FileUpload]
+            The files to upload and where to attach them
+        """
+        return self._run(files, self._upload)
+
+    def _run(self, items: Iterable[Any], transfer: Callable[[Any], TransferResult]) -> TransferReport:
+        """transfers items on the worker pool, keeping a bounded number of them queued"""
+        report = TransferReport()
+
+        def done(future: Future):
+            report._add(future.result())
+            if self.progress is not None:
+                self.progress(report)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: deque = deque()
+            for item in items:
+                pending.append(executor.submit(contextvars.copy_context().run, transfer, item))
+                while len(pending) >= 2 * self.max_workers:
+                    done(pending.popleft())
+            while pending:
+                done(pending.popleft())
+        report._finished = time.perf_counter()
+        return report
+
+    def _list_task_files(self, taskId: str) -> AstroResult[List[TaskFileDto]]:
+        with self.client.result_mode("model"):
+            result = self._attempt("GET", lambda: self.client.taskFile.get_task_files(taskId))[0]
+        if not result.success:
+            raise AstroException(result)
+        return result
+
+    def _attempt(self, method: str, call: Callable[[], AstroResult], replayable: bool = True) -> Tuple[AstroResult, int]:
+        """makes a call, retrying it on its own after transient failures"""
+        clientPolicy = getattr(self.client, "retryPolicy", None)
+        if clientPolicy is not None and method in clientPolicy.methods:
+            # The client already retries this call; retrying it here too would multiply the attempts
+            replayable = False
+        attempt = 0
+        while True:
+            attempt += 1
+            self.retryPolicy.budget.deposit()
+            try:
+                result = call()
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError):
+                if not replayable or not self.retryPolicy.should_retry(method, attempt):
+                    raise
+            else:
+                if result.success or not replayable or not self.retryPolicy.should_retry(method, attempt, result.statusCode):
+                    return result, attempt
+            time.sleep(self.retryPolicy.delay(attempt))
+
+    def _download(self, item: FileDownload, skip_unchanged: bool) -> TransferResult:
+        modified = _timestamp(item.modifiedDate)
+        if skip_unchanged and self._unchanged(item, modified):
+            return TransferResult(item, "skipped")
+        try:
+            directory = os.path.dirname(item.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            result, attempts = self._attempt("GET", lambda: self.client.file.download_file_to(item.documentId, None, item.path))
+        except Exception as e:
+            return TransferResult(item, "failed", error=str(e) or type(e).__name__)
+        if not result.success:
+            message = result.error.message if result.error is not None else None
+            return TransferResult(item, "failed", attempts=attempts, error=message or f"HTTP {result.statusCode}")
+        if modified is not None:
+            # Later runs compare the local modification date with the API's
+            os.utime(item.path, (modified, modified))
+        return TransferResult(item, "downloaded", result.data.size, attempts)
+
+    def _unchanged(self, item: FileDownload, modified: float | None) -> bool:
+        try:
+            stat = os.stat(item.path)
+        except FileNotFoundError:
+            return False
+        if item.size is None and modified is None:
+            return False
+        if item.size is not None and stat.st_size != item.size:
+            return False
+        return modified is None or stat.st_mtime >= modified
+
+    def _upload(self, item: FileUpload) -> TransferResult:
+        try:
+            upload = Upload(item.source, item.filename)
+        except OSError as e:
+            return TransferResult(item, "failed", error=str(e))
+
+        def send() -> AstroResult:
+            if item.taskId is not None:
+                return self.client.taskFile.upload_task_file(item.taskId, upload)
+            if item.projectId is not None:
+                if item.folderId is not None:
+                    return self.client.projectFile.upload_project_file_to_folder(item.projectId, item.folderId, upload)
+                return self.client.projectFile.upload_project_file(item.projectId, upload)
+            if item.riskId is not None:
+                return self.client.riskFile.upload_risk_file(item.riskId, upload)
+            if item.folderId is not None:
+                return self.client.homeFile.upload_home_file_to_folder(item.folderId, upload)
+            return self.client.homeFile.upload_home_file(upload)
+
+        try:
+            with self.client.result_mode("model"):
+                result, attempts = self._attempt("POST", send, upload.replayable)
+        except Exception as e:
+            return TransferResult(item, "failed", error=str(e) or type(e).__name__)
+        if not result.success:
+            message = result.error.message if result.error is not None else None
+            return TransferResult(item, "failed", attempts=attempts, error=message or f"HTTP {result.statusCode}")
+        return TransferResult(item, "uploaded", upload.sent, attempts, data=result.data)
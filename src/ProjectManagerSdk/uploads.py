@@ -0,0 +1,189 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from typing import Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Union
+import asyncio
+import mimetypes
+import os
+import secrets
+import time
+
+UploadSource = Union[str, "os.PathLike[str]", bytes, BinaryIO, Iterable[bytes]]
+"""
+What an upload reads from: a file path, bytes, a binary file object
+opened for reading, or an iterable of chunks.
+"""
+
+def _quote(value: str) -> str:
+    """escapes a form field parameter the way browsers do"""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+class Upload:
+    """
+    Encodes a file as a multipart/form-data request body, read and sent
+    one chunk at a time so that a file of any size is uploaded in
+    constant memory.
+
+    Pass an `Upload` wherever an API method accepts `fileName` to upload
+    bytes, a file object or a stream of chunks, or to follow progress.
+    Files opened from a path are closed as soon as the request completes;
+    file objects passed in are left open for the caller to close.
+
+    Requests whose body is a path, bytes or a seekable file object are
+    sent with a Content-Length and can be retried; other sources are sent
+    with chunked transfer encoding and only once.
+    """
+
+    len: int | None
+    """
+    The size of the encoded request body, or None if it is not known in
+    advance. The name follows the convention the `requests` library uses
+    to size streamed bodies.
+    """
+
+    sent: int
+    """
+    The number of bytes of the file sent so far by the latest attempt.
+    """
+
+    seconds: float
+    """
+    The time taken by the latest attempt to send the request body.
+    """
+
+    def __init__(self, source: UploadSource, filename: str | None = None, content_type: str | None = None,
+        progress: Callable[[int, int | None], Any] | None = None, chunk_size: int = 65536):
+        """Prepare a file upload
+
+        Parameters
+        ----------
+        source : UploadSource
+            A file path, bytes, a binary file object opened for reading,
+            or an iterable of chunks
+        filename : str | None
+            The name of the file as stored by ProjectManager; defaults to
+            the name of the path or file object
+        content_type : str | None
+            The media type of the file; guessed from the file name if not
+            specified
+        progress : Callable[[int, int | None], Any] | None
+            Called after each chunk with the number of bytes of the file
+            sent so far and the size of the file, or None if the size is
+            not known; the async client calls it from a worker thread
+        chunk_size : int
+            The number of bytes read from the source at once
+        """
+        self.source = source
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._file: BinaryIO | None = None
+        self._start: int | None = None
+        self._consumed = False
+        if isinstance(source, (str, os.PathLike)):
+            default_name = os.path.basename(os.fspath(source))
+            self.size: int | None = os.path.getsize(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            default_name = "file"
+            self.size = len(source)
+        elif hasattr(source, "read"):
+            name = getattr(source, "name", None)
+            default_name = os.path.basename(name) if isinstance(name, str) else "file"
+            self.size = None
+            if source.seekable():
+                self._start = source.tell()
+                self.size = source.seek(0, os.SEEK_END) - self._start
+                source.seek(self._start)
+        else:
+            default_name = "file"
+            self.size = None
+        self.filename = filename or default_name
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.boundary = secrets.token_hex(16)
+        self._head = (f'--{self.boundary}\r\n'
+                      f'Content-Disposition: form-data; name="files"; filename="{_quote(self.filename)}"\r\n'
+                      f'Content-Type: {self.content_type}\r\n\r\n').encode("utf-8")
+        self._tail = f'\r\n--{self.boundary}--\r\n'.encode("ascii")
+        self.len = len(self._head) + self.size + len(self._tail) if self.size is not None else None
+        self.sent = 0
+        self.seconds = 0.0
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent again, for example to retry a failed request"""
+        return self.size is not None and (self._start is not None or not hasattr(self.source, "read"))
+
+    @property
+    def headers(self) -> dict:
+        """The Content-Type and, if known, the Content-Length headers for this body"""
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self.len is not None:
+            headers["Content-Length"] = str(self.len)
+        return headers
+
+    @property
+    def throughput(self) -> float:
+        """The number of bytes per second sent by the latest attempt"""
+        return self.sent / self.seconds if self.seconds > 0 else 0.0
+
+    def _chunks(self) -> Iterator[bytes]:
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, "rb")
+            try:
+                while chunk := self._file.read(self.chunk_size):
+                    yield chunk
+            finally:
+                self.close()
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            for offset in range(0, len(source), self.chunk_size):
+                yield bytes(source[offset:offset + self.chunk_size])
+        elif hasattr(source, "read"):
+            if self._start is not None:
+                source.seek(self._start)
+            while chunk := source.read(self.chunk_size):
+                yield chunk
+        else:
+            yield from source
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._consumed and not self.replayable:
+            raise RuntimeError("This upload reads from a stream and cannot be sent twice")
+        self._consumed = True
+        self.sent = 0
+        started = time.perf_counter()
+        yield self._head
+        for chunk in self._chunks():
+            if chunk:
+                yield chunk
+                self.sent += len(chunk)
+                self.seconds = time.perf_counter() - started
+                if self.progress is not None:
+                    self.progress(self.sent, self.size)
+        yield self._tail
+        self.seconds = time.perf_counter() - started
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if isinstance(self.source, (bytes, bytearray, memoryview)):
+            for chunk in self:
+                yield chunk
+            return
+        # Files and other sources are read in a worker thread so the event loop is not blocked
+        chunks = iter(self)
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            yield chunk
+
+    def close(self):
+        """Close the file opened for a path source, if any"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,156 @@
+#
+# ProjectManager API for Python
+#
+# (c) ProjectManager.com, Inc.
+#
+# For the full copyright and license information, please view the LICENSE
+# file that was distributed with this source code.
+#
+# @author     ProjectManager.com <support@projectmanager.com>
+# @copyright  ProjectManager.com, Inc.
+# @link       https://github.com/projectmgr/projectmanager-sdk-python
+#
+
+from ProjectManagerSdk.endpoints import path_template
+from ProjectManagerSdk.jsoncodec import CachedContent
+from collections import OrderedDict
+from typing import Collection, FrozenSet, Hashable, Mapping
+import threading
+
+REVALIDATED_ENDPOINTS: FrozenSet[str] = frozenset({
+    "/api/data/projects/{projectId}",
+    "/api/data/tasks/{taskId}",
+    "/api/data/projects/{projectId}/members",
+    "/api/data/projects/{projectId}/tasks/fields",
+})
+"""
+The endpoints revalidated by default: single projects and tasks, and the
+members and task fields of a project, which are often polled.
+"""
+
+# Response headers kept with a validated body
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+class _Validated:
+    """a kept response body, with the request headers that revalidate it"""
+
+    __slots__ = ("status", "headers", "content", "conditions")
+
+    def __init__(self, status: int, headers: Mapping[str, str], content: CachedContent):
+        self.status = status
+        self.headers = {name: headers[name] for name in _STORED_HEADERS if name in headers}
+        self.content = content
+        self.conditions = {}
+        if "ETag" in self.headers:
+            self.conditions["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            self.conditions["If-Modified-Since"] = self.headers["Last-Modified"]
+
+
+class ValidatorCache:
+    """
+    Revalidates GET calls with the ETag and Last-Modified headers the API
+    sent with their last successful response.
+
+    The next call to the same URL with the same API key is sent with
+    If-None-Match and If-Modified-Since headers. If the API answers 304
+    Not Modified, the call returns the previous result without receiving
+    the body again, and without parsing or decoding it again: the results
+    decoded from the kept body are copied, so every call gets its own
+    model objects and may modify them freely. When the cache holds
+    `max_entries` responses, the least recently used one is dropped.
+
+    A cache is thread-safe and may be shared by several clients.
+    """
+
+    revalidated: int
+    """
+    The number of calls the API answered with 304 Not Modified.
+    """
+
+    evictions: int
+    """
+    The number of responses dropped to make room for newer ones.
+    """
+
+    def __init__(self, max_entries: int = 1024, endpoints: Collection[str] = REVALIDATED_ENDPOINTS):
+        """Construct a new validator cache
+
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of responses kept
+        endpoints : Collection[str]
+            The endpoint path templates, such as `/api/data/tasks/{taskId}`,
+            whose calls are revalidated
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.endpoints = frozenset(endpoints)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Validated]" = OrderedDict()
+        self.revalidated = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, path: str) -> bool:
+        """Whether calls to a request path are revalidated"""
+        return path_template(path) in self.endpoints
+
+    def get(self, key: Hashable) -> _Validated | None:
+        """Look up the last successful response for a call, or None
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the call, such as its URL and credentials
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def not_modified(self, key: Hashable):
+        """Record that the API confirmed a response is unchanged"""
+        with self._lock:
+            self.revalidated += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def put(self, key: Hashable, status: int, headers: Mapping[str, str], content: bytes):
+        """Keep a response if it succeeded and carries a validator
+
+        Parameters
+        ----------
+        key : Hashable
+            Identifies the call, such as its URL and credentials
+        status : int
+            The HTTP status code of the response
+        headers : Mapping[str, str]
+            The headers of the response
+        content : bytes
+            The decompressed body of the response
+        """
+        if status >= 500:
+            return
+        if not 200 <= status < 300 or ("ETag" not in headers and "Last-Modified" not in headers):
+            with self._lock:
+                # The previous validators no longer describe what the API returns
+                self._entries.pop(key, None)
+            return
+        entry = _Validated(status, headers, CachedContent(content))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all responses"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,39 @@
+import json
+import threading
+from requests.adapters import BaseAdapter
+from requests.models import Response
+
+
+class FakeAdapter(BaseAdapter):
+    """A requests transport adapter that answers from a handler function
+    instead of the network, recording every request it receives"""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+        status, payload, headers = self.handler(request)
+        response = Response()
+        response.status_code = status
+        response.headers.update(headers or {})
+        response._content = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+def install(client, handler) -> FakeAdapter:
+    """Route all requests made by this ProjectManagerClient to a fake handler"""
+    adapter = FakeAdapter(handler)
+    client.session.mount("https://", adapter)
+    client.session.mount("http://", adapter)
+    return adapter
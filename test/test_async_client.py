@@ -0,0 +1,124 @@
+import asyncio
+import inspect
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.models.taskdetailsdto import TaskDetailsDto
+from ProjectManagerSdk.models.taskdto import TaskDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+
+
+def create_client(handler) -> AsyncProjectManagerClient:
+    client = AsyncProjectManagerClient("production", "UNIT_TEST")
+    client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestAsyncClient(unittest.TestCase):
+
+    # Every generated API method should have an awaitable counterpart with the same signature
+    def test_all_categories_mirrored(self):
+        sync_client = ProjectManagerClient("production", "UNIT_TEST")
+        async_client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        count = 0
+        for name, sync_category in vars(sync_client).items():
+            if not type(sync_category).__module__.startswith("ProjectManagerSdk.clients."):
+                continue
+            async_category = getattr(async_client, name)
+            self.assertIs(async_client, async_category.client)
+            self.assertEqual("ProjectManagerSdk.asyncclients." + type(sync_category).__module__.rsplit(".", 1)[1], type(async_category).__module__)
+            for method_name, method in inspect.getmembers(type(sync_category), inspect.isfunction):
+                if method_name.startswith("_"):
+                    continue
+                async_method = getattr(type(async_category), method_name)
+                self.assertEqual(not method_name.startswith("iter_"), inspect.iscoroutinefunction(async_method), method_name)
+                self.assertEqual(inspect.signature(method).parameters, inspect.signature(async_method).parameters)
+                self.assertEqual(method.__doc__, async_method.__doc__)
+            count += 1
+        self.assertEqual(57, count)
+
+    def test_lifecycle(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        self.assertIsNone(client.session)
+        client.with_connection_pool(pool_maxsize=4)
+        with self.assertRaises(TypeError):
+            client.close()
+        with self.assertRaises(TypeError):
+            with client:
+                pass
+
+        async def run():
+            async with client:
+                session = client._session()
+                self.assertEqual(httpx.Timeout(None), session.timeout)
+                with self.assertRaises(ValueError):
+                    client.with_connection_pool(pool_maxsize=8)
+            self.assertTrue(session.is_closed)
+            self.assertIsNone(client.session)
+            client.with_connection_pool(pool_maxsize=8)
+            await client.aclose()
+
+        asyncio.run(run())
+
+    def test_concurrent_requests(self):
+        def handler(request: httpx.Request):
+            task_id = request.url.path.rsplit("/", 1)[1]
+            return httpx.Response(200, json={"data": {"id": task_id, "name": "Task " + task_id}})
+
+        async def run():
+            async with create_client(handler) as client:
+                return await asyncio.gather(*(client.task.retrieve_task(str(i)) for i in range(20)))
+
+        results = asyncio.run(run())
+        self.assertEqual(20, len(results))
+        for i, result in enumerate(results):
+            self.assertTrue(result.success)
+            self.assertIsInstance(result.data, TaskDetailsDto)
+            self.assertEqual(str(i), result.data.id)
+
+    def test_query_and_error(self):
+        def handler(request: httpx.Request):
+            if request.url.path == "/api/data/tasks":
+                self.assertEqual("5", request.url.params["$top"])
+                self.assertEqual("Bearer KEY", request.headers["Authorization"])
+                return httpx.Response(200, json={"data": [{"id": "a"}, {"id": "b"}]})
+            return httpx.Response(404, json={"error": {"message": "Not found"}})
+
+        async def run():
+            client = create_client(handler)
+            client.with_api_key("KEY")
+            tasks = await client.task.query_tasks(5, None, None, None, None)
+            missing = await client.project.retrieve_project("missing")
+            await client.aclose()
+            return tasks, missing
+
+        tasks, missing = asyncio.run(run())
+        self.assertEqual(["a", "b"], [task.id for task in tasks.data])
+        self.assertIsInstance(tasks.data[0], TaskDto)
+        self.assertTrue(missing.hasError)
+        self.assertEqual(404, missing.statusCode)
+        self.assertEqual("Not found", missing.error.message)
+
+    def test_async_pagination(self):
+        def handler(request: httpx.Request):
+            top = int(request.url.params["$top"])
+            skip = int(request.url.params.get("$skip", 0))
+            return httpx.Response(200, json={"data": [{"id": str(i)} for i in range(skip, min(skip + top, 7))]})
+
+        async def run():
+            client = create_client(handler)
+            return [task.id async for task in client.task.iter_tasks(page_size=3)]
+
+        self.assertEqual([str(i) for i in range(7)], asyncio.run(run()))
+
+    def test_async_prefetch(self):
+        def handler(request: httpx.Request):
+            top = int(request.url.params["$top"])
+            skip = int(request.url.params.get("$skip", 0))
+            return httpx.Response(200, json={"data": [{"id": str(i)} for i in range(skip, min(skip + top, 23))]})
+
+        async def run():
+            client = create_client(handler)
+            return [entry.id async for entry in client.timesheet.iter_time_entries(page_size=5, prefetch=3)]
+
+        self.assertEqual([str(i) for i in range(23)], asyncio.run(run()))
@@ -0,0 +1,136 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+import time
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.changesettracker import AsyncChangesetTracker, ChangesetTracker
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.changesetstatusdto import ChangeSetStatusDto
+from ProjectManagerSdk.models.taskcreatedto import TaskCreateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.taskwriter import TaskWriter
+from test.fakeserver import install
+
+
+class FakeChangesetServer:
+    """applies changeset `slow-N` after N polls, rejects `rejected`, never applies `stuck`, and does not know `missing`"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.polls = {}
+        self.active = 0
+        self.concurrency = 0
+
+    def status(self, path: str):
+        changeSetId = path.split("/")[4]
+        with self.lock:
+            self.polls[changeSetId] = polls = self.polls.get(changeSetId, 0) + 1
+        if changeSetId == "missing":
+            return 404, {"error": {"message": "Not found"}}
+        if changeSetId == "busy" and polls == 1:
+            return 503, b"Service Unavailable"
+        applied = None
+        if changeSetId == "rejected":
+            applied = False
+        elif changeSetId != "stuck" and polls > (int(changeSetId.split("-")[1]) if changeSetId.startswith("slow-") else 0):
+            applied = True
+        return 200, {"success": True, "data": {"id": changeSetId, "success": applied, "state": "Completed" if applied is not None else "Pending"}}
+
+    def __call__(self, request):
+        with self.lock:
+            self.active += 1
+            self.concurrency = max(self.concurrency, self.active)
+        time.sleep(0.002)
+        with self.lock:
+            self.active -= 1
+        if request.method == "POST":
+            names = [task["name"] for task in json.loads(request.body)]
+            return 200, {"success": True, "data": [{"changeSetId": f"slow-1-{name}", "id": name} for name in names]}, None
+        status, payload = self.status(request.path_url)
+        return status, payload, None
+
+
+class TestChangesetTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.server = FakeChangesetServer()
+        install(self.client, self.server)
+
+    def test_resolves_many_changesets_concurrently(self):
+        with ChangesetTracker(self.client, max_workers=8, interval=0.01) as tracker:
+            futures = tracker.track_many([f"c{index}" for index in range(100)] + [ChangeSetStatusDto("slow-3", "t1")])
+            self.assertIs(futures[0], tracker.track("c0"))
+            self.assertTrue(tracker.wait_all(timeout=10))
+
+        self.assertEqual("c42", futures[42].result().id)
+        self.assertTrue(futures[-1].result().success)
+        self.assertEqual(4, self.server.polls["slow-3"])
+        self.assertEqual(104, tracker.polls)
+        self.assertEqual(101, tracker.completed)
+        self.assertGreater(self.server.concurrency, 1)
+
+    def test_rejections_errors_and_timeouts(self):
+        with ChangesetTracker(self.client, interval=0.01, max_interval=0.02, timeout=0.2) as tracker:
+            rejected, missing, busy, stuck = tracker.track_many(["rejected", "missing", "busy", "stuck"])
+            self.assertFalse(tracker.wait_all(timeout=0.05))
+            self.assertTrue(tracker.wait_all(timeout=5))
+
+        self.assertFalse(rejected.result().success)
+        self.assertTrue(busy.result().success)
+        with self.assertRaises(AstroException) as context:
+            missing.result()
+        self.assertEqual(404, context.exception.result.statusCode)
+        with self.assertRaises(TimeoutError):
+            stuck.result()
+        self.assertGreater(self.server.polls["stuck"], 3)
+        self.assertEqual(2, tracker.failed)
+
+    def test_close_cancels_unfinished_changesets(self):
+        tracker = ChangesetTracker(self.client, interval=0.01)
+        future = tracker.track("stuck")
+        tracker.close()
+        self.assertTrue(future.cancelled())
+        with self.assertRaises(RuntimeError):
+            tracker.track("c1")
+        with self.assertRaises(RuntimeError):
+            tracker.track(concurrent.futures.Future())
+
+    def test_pipelines_task_writes(self):
+        with ChangesetTracker(self.client, interval=0.01) as tracker, TaskWriter(self.client, batch_size=10) as writer:
+            confirmations = [tracker.track(writer.add("p1", TaskCreateDto(name=f"t{index}"))) for index in range(25)]
+            writer.flush()
+            self.assertTrue(tracker.wait_all(timeout=10))
+        self.assertEqual(["slow-1-t0", "slow-1-t24"], [confirmations[0].result().id, confirmations[-1].result().id])
+        self.assertTrue(all(confirmation.result().success for confirmation in confirmations))
+
+    def test_async_tracker(self):
+        server = FakeChangesetServer()
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+
+        def handler(request):
+            status, payload = server.status(request.url.path)
+            return httpx.Response(status, json=payload) if isinstance(payload, dict) else httpx.Response(status, content=payload)
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def track():
+            async with AsyncChangesetTracker(client, max_concurrency=4, interval=0.01, timeout=0.2) as tracker:
+                futures = tracker.track_many(["c1", "slow-2", "busy", "missing", "rejected"])
+                self.assertTrue(await tracker.wait_all(timeout=5))
+                stuck = tracker.track("stuck")
+                self.assertFalse(await tracker.wait_all(timeout=0.02))
+            self.assertTrue(stuck.cancelled())
+            return futures
+
+        futures = asyncio.run(track())
+        self.assertEqual([True, True, True], [future.result().success for future in futures[:3]])
+        self.assertIsInstance(futures[3].exception(), AstroException)
+        self.assertFalse(futures[4].result().success)
+        self.assertEqual(3, server.polls["slow-2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.circuitbreaker import CircuitBreaker
+from ProjectManagerSdk.endpoints import path_template
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_path_template(self):
+        self.assertEqual("/api/data/tasks/{taskId}", path_template("/api/data/tasks/1234"))
+        self.assertEqual("/api/data/tasks/priorities", path_template("/api/data/tasks/priorities"))
+        self.assertEqual("/api/data/projects/{projectId}/tasks", path_template("/api/data/projects/abc/tasks"))
+        self.assertEqual("/not/an/endpoint", path_template("/not/an/endpoint"))
+
+    def call(self, breaker, success):
+        self.assertTrue(breaker.allow("/endpoint"))
+        breaker.record("/endpoint", success)
+
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_rate=0.5, minimum_calls=4, window=10)
+
+        self.call(breaker, True)
+        self.call(breaker, False)
+        self.call(breaker, True)
+        self.assertEqual("closed", breaker.state("/endpoint"))
+        self.call(breaker, False)
+
+        self.assertEqual("open", breaker.state("/endpoint"))
+        self.assertFalse(breaker.allow("/endpoint"))
+        self.assertTrue(breaker.allow("/other"))
+        self.assertEqual(1, breaker.rejected)
+
+    def test_half_open_trials(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(minimum_calls=1, open_duration=10, half_open_calls=2, clock=clock)
+        self.call(breaker, False)
+
+        clock.now += 10
+        self.assertEqual("half-open", breaker.state("/endpoint"))
+        self.assertTrue(breaker.allow("/endpoint"))
+        self.assertTrue(breaker.allow("/endpoint"))
+        self.assertFalse(breaker.allow("/endpoint"))
+        breaker.record("/endpoint", True)
+        breaker.record("/endpoint", False)
+        self.assertEqual("open", breaker.state("/endpoint"))
+
+        clock.now += 10
+        self.call(breaker, True)
+        self.call(breaker, True)
+        self.assertEqual("closed", breaker.state("/endpoint"))
+
+    def test_sheds_concurrent_calls(self):
+        breaker = CircuitBreaker(max_concurrent=2)
+
+        self.assertTrue(breaker.allow("/endpoint"))
+        self.assertTrue(breaker.allow("/endpoint"))
+        self.assertFalse(breaker.allow("/endpoint"))
+        breaker.record("/endpoint", None)
+        self.assertTrue(breaker.allow("/endpoint"))
+
+    def test_client_fails_fast(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        breaker = CircuitBreaker(minimum_calls=2)
+        client.with_circuit_breaker(breaker)
+        adapter = install(client, lambda request: (500, {"error": {"message": "Internal error"}}, None))
+
+        client.task.retrieve_task("1")
+        client.task.retrieve_task("2")
+        result = client.task.retrieve_task("3")
+
+        self.assertEqual(2, len(adapter.requests))
+        self.assertEqual(503, result.statusCode)
+        self.assertIn("/api/data/tasks/{taskId}", result.error.message)
+        self.assertEqual("open", breaker.state("/api/data/tasks/{taskId}"))
+        self.assertTrue(client.me.retrieve_me().hasError)
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_async_client_fails_fast(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_circuit_breaker(CircuitBreaker(minimum_calls=1))
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("Connection refused")
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with self.assertRaises(httpx.ConnectError):
+            asyncio.run(client.me.retrieve_me())
+        result = asyncio.run(client.me.retrieve_me())
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(503, result.statusCode)
+
+
+if __name__ == '__main__':
+    unittest.main()
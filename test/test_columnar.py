@@ -0,0 +1,73 @@
+import unittest
+import numpy
+from ProjectManagerSdk.columnar import ColumnarResult, DictionaryColumn, to_columns
+from ProjectManagerSdk.models.timesheetdto import TimesheetDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+ENTRIES = [
+    {"id": "e1", "projectId": "p1", "date": "2026-01-05", "hours": 1.5, "minutes": 90, "approved": True,
+     "modifiedDate": "2026-01-05T10:30:00Z", "project": {"id": "p1"}},
+    {"id": "e2", "projectId": "p2", "date": "2026-01-06", "hours": 2, "minutes": None, "approved": False},
+    {"id": "e3", "projectId": "p1", "date": None, "hours": None, "minutes": 30, "approved": None},
+]
+
+
+class TestColumnar(unittest.TestCase):
+
+    def test_typed_columns(self):
+        result = to_columns(TimesheetDto, ENTRIES)
+
+        self.assertEqual(3, len(result))
+        self.assertEqual(numpy.float64, result["hours"].dtype)
+        self.assertEqual(3.5, result["hours"].sum())
+        self.assertEqual(numpy.int64, result["minutes"].dtype)
+        self.assertEqual(120, result["minutes"].sum())
+        self.assertEqual([True, False, True], list(numpy.ma.getmaskarray(result["approved"]) | result["approved"].filled(False)))
+        self.assertEqual(numpy.dtype("datetime64[ms]"), result["date"].dtype)
+        self.assertEqual(numpy.datetime64("2026-01-06"), result["date"][1])
+        self.assertTrue(numpy.isnat(result["date"][2]))
+        self.assertEqual(numpy.datetime64("2026-01-05T10:30:00"), result["modifiedDate"][0])
+        self.assertEqual({"id": "p1"}, result["project"][0])
+
+    def test_dictionary_encoded_strings(self):
+        result = to_columns(TimesheetDto, ENTRIES, fields=["projectId", "notes"])
+
+        self.assertEqual(["projectId", "notes"], result.names)
+        project_ids = result["projectId"]
+        self.assertIsInstance(project_ids, DictionaryColumn)
+        self.assertEqual([0, 1, 0], list(project_ids.codes))
+        self.assertEqual(["p1", "p2"], list(project_ids.values))
+        self.assertEqual([None, None, None], list(result["notes"].decode()))
+
+    def test_rows_and_concat(self):
+        first = to_columns(TimesheetDto, ENTRIES[:2], fields=["id", "hours"])
+        second = to_columns(TimesheetDto, ENTRIES[2:], fields=["id", "hours"])
+
+        combined = ColumnarResult.concat([first, second])
+
+        self.assertEqual([{"id": "e1", "hours": 1.5}, {"id": "e2", "hours": 2.0}, {"id": "e3", "hours": None}], list(combined))
+
+    def test_to_arrow(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        table = to_columns(TimesheetDto, ENTRIES, fields=["projectId", "hours", "date"]).to_arrow()
+
+        self.assertEqual(["p1", "p2", "p1"], table.column("projectId").to_pylist())
+        self.assertEqual([1.5, 2.0, None], table.column("hours").to_pylist())
+        self.assertEqual(1, table.column("date").null_count)
+
+    def test_client_columnar_mode(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_result_mode("columnar")
+        install(client, lambda request: (200, {"data": ENTRIES}, None))
+
+        result = client.timesheet.query_time_entries(None, None, None, None, None)
+
+        self.assertIsInstance(result.data, ColumnarResult)
+        self.assertEqual(3.5, result.data["hours"].sum())
+
+        with self.assertRaises(ValueError):
+            next(client.timesheet.iter_time_entries())
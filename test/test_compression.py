@@ -0,0 +1,107 @@
+import asyncio
+import gzip
+import http.server
+import json
+import threading
+import unittest
+import zlib
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.compression import ContentDecoder, TransferMeter, accept_encoding, available_encodings
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+
+BODY = json.dumps({"success": True, "data": {"id": "me", "fullName": "Unit Test " * 200}}).encode("utf-8")
+
+
+class CompressingHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every request with BODY, gzip-compressed if the client accepts it"""
+
+    def do_GET(self):
+        self.server.accept_encodings.append(self.headers.get("Accept-Encoding"))
+        body = BODY
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(BODY)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), CompressingHandler)
+        self.server.accept_encodings = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_decoder(self):
+        compressed = zlib.compress(BODY)
+        for body in (compressed, compressed[2:-4]):
+            decoder = ContentDecoder("deflate")
+            parts = [decoder.decompress(body[i:i + 100]) for i in range(0, len(body), 100)]
+            self.assertEqual(BODY, b"".join(parts) + decoder.flush())
+            self.assertEqual(len(body), decoder.received)
+        decoder = ContentDecoder("gzip, compress")
+        self.assertEqual(b"opaque", decoder.decompress(b"opaque") + decoder.flush())
+
+    def test_accept_encoding(self):
+        self.assertEqual("gzip, deflate;q=0.9", accept_encoding(["gzip", "deflate"]))
+        self.assertEqual("identity", accept_encoding([]))
+        self.assertIn("gzip", available_encodings())
+
+    def test_client_measures_compressed_responses(self):
+        meter = TransferMeter()
+        with ProjectManagerClient(self.url, "UNIT_TEST") as client:
+            client.with_transfer_listener(meter)
+            result = client.me.retrieve_me()
+
+        self.assertTrue(result.success)
+        self.assertEqual("me", result.data.id)
+        self.assertEqual(1, meter.calls)
+        self.assertEqual({"gzip": 1}, meter.encodings)
+        self.assertEqual(len(BODY), meter.contentBytes)
+        self.assertEqual(len(gzip.compress(BODY)), meter.wireBytes)
+        self.assertGreater(meter.savings, 0.9)
+        self.assertEqual(accept_encoding(available_encodings()), self.server.accept_encodings[0])
+
+    def test_client_without_compression(self):
+        meter = TransferMeter()
+        with ProjectManagerClient(self.url, "UNIT_TEST") as client:
+            client.with_content_encodings([])
+            client.with_transfer_listener(meter)
+            self.assertTrue(client.me.retrieve_me().success)
+
+        self.assertEqual("identity", self.server.accept_encodings[0])
+        self.assertEqual(len(BODY), meter.wireBytes)
+        self.assertEqual(0, meter.savings)
+        with self.assertRaises(ValueError):
+            client.with_content_encodings(["compress"])
+
+    def test_async_client_measures_compressed_responses(self):
+        meter = TransferMeter()
+
+        async def retrieve():
+            async with AsyncProjectManagerClient(self.url, "UNIT_TEST") as client:
+                client.with_content_encodings(["gzip"])
+                client.with_transfer_listener(meter)
+                return await client.me.retrieve_me()
+
+        result = asyncio.run(retrieve())
+
+        self.assertEqual("me", result.data.id)
+        self.assertEqual(len(gzip.compress(BODY)), meter.wireBytes)
+        self.assertEqual(len(BODY), meter.contentBytes)
+        self.assertEqual("gzip", self.server.accept_encodings[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
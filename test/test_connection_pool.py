@@ -0,0 +1,41 @@
+import unittest
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    # All API categories should send their requests through the same session
+    def test_clients_share_session(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        adapter = install(client, lambda request: (200, {"data": {"id": "abc", "fullName": "Test User"}}, None))
+
+        client.me.retrieve_me()
+        client.task.retrieve_task("abc")
+
+        self.assertEqual(2, len(adapter.requests))
+        self.assertEqual("https://api.projectmanager.com/api/data/me", adapter.requests[0].url)
+        self.assertEqual("https://api.projectmanager.com/api/data/tasks/abc", adapter.requests[1].url)
+
+    def test_pool_configuration(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_connection_pool(pool_connections=2, pool_maxsize=32, keep_alive=False)
+
+        adapter = client.session.get_adapter("https://api.projectmanager.com")
+        self.assertEqual(32, adapter._pool_maxsize)
+        self.assertEqual(2, adapter._pool_connections)
+        self.assertEqual("close", client.session.headers["Connection"])
+
+        client.with_connection_pool()
+        self.assertNotIn("Connection", client.session.headers)
+
+    def test_replaced_adapter_is_closed(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        fake = install(client, lambda request: (200, {"data": {}}, None))
+        client.with_connection_pool(pool_maxsize=4)
+        self.assertTrue(fake.closed)
+
+    def test_context_manager_closes_session(self):
+        with ProjectManagerClient("production", "UNIT_TEST") as client:
+            adapter = install(client, lambda request: (200, {"data": {}}, None))
+        self.assertTrue(adapter.closed)
@@ -0,0 +1,91 @@
+import dataclasses
+import json
+import pickle
+import unittest
+import dacite
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.models.astroerror import AstroError
+from ProjectManagerSdk.models.taskdetailsdto import TaskDetailsDto
+from ProjectManagerSdk.models.taskdto import TaskDto
+from ProjectManagerSdk.models.taskprojectdto import TaskProjectDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+class TestDecoders(unittest.TestCase):
+
+    def test_matches_dacite(self):
+        content = '''{ "data": {"id": "d71246fa-22e5-47e5-bbd8-42e10ff69fc9", "name": "Test Task",
+            "project": {"id": "p1", "name": "Project"}, "percentComplete": 50, "plannedCost": 10,
+            "assignees": [{"id": "a1", "name": "Someone"}], "todos": [], "fieldValues": null,
+            "some_random_new_Field": "hello" } }'''
+        data = json.loads(content)['data']
+
+        for data_class in (TaskDto, TaskDetailsDto):
+            expected = dacite.from_dict(data_class=data_class, data=data)
+            actual = from_dict(data_class, data)
+            self.assertEqual(expected, actual)
+            self.assertEqual("Project", actual.project.name)
+            self.assertEqual("Someone", actual.assignees[0].name)
+
+    # Invalid data must raise the same errors as dacite
+    def test_wrong_types_raise_dacite_errors(self):
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(TaskDto, {"id": 5})
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(TaskDto, {"assignees": [None]})
+        with self.assertRaises(dacite.WrongTypeError):
+            from_dict(AstroError, {"additionalErrors": "not a list"})
+
+    def test_untyped_data_is_returned_unchanged(self):
+        self.assertEqual({"anything": [1, 2]}, from_dict(object, {"anything": [1, 2]}))
+
+    def test_clients_use_decoder(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (200, {"data": {"id": "abc", "name": "Test Task", "project": {"name": "Project"}}}, None))
+
+        result = client.task.retrieve_task("abc")
+
+        self.assertTrue(result.success)
+        self.assertEqual(TaskDetailsDto(id="abc", name="Test Task", project=result.data.project), result.data)
+        self.assertEqual("Project", result.data.project.name)
+
+
+class TestLazyDecoders(unittest.TestCase):
+
+    DATA = {"id": "abc", "name": "Test Task", "project": {"id": "p1", "name": "Project"},
+            "assignees": [{"id": "a1", "name": "Someone"}], "some_random_new_Field": "hello"}
+
+    def test_decodes_on_first_access(self):
+        task = lazy_from_dict(TaskDetailsDto, self.DATA)
+
+        self.assertIsInstance(task, TaskDetailsDto)
+        self.assertNotIn("project", vars(task))
+        self.assertEqual("Project", task.project.name)
+        self.assertIsInstance(task.project, TaskProjectDto)
+        self.assertIs(task.project, task.project)
+        self.assertIsNone(task.description)
+
+    def test_equivalent_to_eager_model(self):
+        eager = from_dict(TaskDetailsDto, self.DATA)
+        lazy = lazy_from_dict(TaskDetailsDto, self.DATA)
+
+        self.assertEqual(eager, lazy)
+        self.assertEqual(lazy, eager)
+        self.assertEqual(dataclasses.asdict(eager), dataclasses.asdict(lazy))
+        self.assertIs(TaskDetailsDto, type(pickle.loads(pickle.dumps(lazy))))
+
+    def test_assignment(self):
+        task = lazy_from_dict(TaskDto, self.DATA)
+        task.name = "Renamed"
+        self.assertEqual("Renamed", task.name)
+
+    def test_client_lazy_mode(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_result_mode("lazy")
+        install(client, lambda request: (200, {"data": self.DATA}, None))
+
+        result = client.task.retrieve_task("abc")
+
+        self.assertIsInstance(result.data, TaskDetailsDto)
+        self.assertEqual("Someone", result.data.assignees[0].name)
@@ -0,0 +1,195 @@
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.diskcache import DiskCache
+from ProjectManagerSdk.models.projectupdatedto import ProjectUpdateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+TTLS = {
+    "/api/data/projects/{projectId}": 60,
+    "/api/data/projects/{projectId}/members": 60,
+    "/api/data/projects": 60,
+    "/api/data/changesets/{changeSetId}": 60,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def fill_cache(path: str, worker: int) -> int:
+    """stores and reads back responses from a separate process"""
+    cache = DiskCache(path, ttls=TTLS, max_bytes=100_000)
+    for index in range(50):
+        url = f"https://api.projectmanager.com/api/data/projects/{worker}-{index}"
+        cache.put("GET", url, "Bearer KEY", f"/api/data/projects/{worker}-{index}", 200,
+                  {"Content-Type": "application/json"}, b"x" * 1000, cache.generation)
+        cache.get("GET", url, "Bearer KEY", f"/api/data/projects/{worker}-{index}")
+    cache.close()
+    return cache.hits
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "responses.db")
+        self.clock = FakeClock()
+        self.cache = DiskCache(self.path, ttls=TTLS, clock=self.clock)
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.client.with_api_key("KEY")
+        self.client.with_disk_cache(self.cache)
+        self.adapter = install(self.client, self.handler)
+
+    @staticmethod
+    def handler(request):
+        if request.method == "GET" and (request.path_url.startswith("/api/data/projects?") or "/members" in request.path_url):
+            return 200, {"success": True, "data": []}, None
+        return 200, {"success": True, "data": {"id": request.path_url}}, {"ETag": '"v1"'}
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def gets(self):
+        return len([request for request in self.adapter.requests if request.method == "GET"])
+
+    def test_survives_restarts(self):
+        self.client.project.retrieve_project("p1")
+        self.cache.close()
+
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_api_key("KEY")
+        client.with_disk_cache(DiskCache(self.path, ttls=TTLS, clock=self.clock))
+        adapter = install(client, lambda request: (500, {}, None))
+        result = client.project.retrieve_project("p1")
+
+        self.assertTrue(result.success)
+        self.assertEqual("/api/data/projects/p1", result.data.id)
+        self.assertEqual(0, len(adapter.requests))
+        client.diskCache.close()
+
+    def test_keeps_headers_but_not_credentials(self):
+        self.client.project.retrieve_project("p1")
+        response = self.client._fetch("GET", "/api/data/projects/p1", "https://api.projectmanager.com/api/data/projects/p1",
+                                      self.client._build_headers(), None, None, None)
+
+        self.assertEqual('"v1"', response.headers["ETag"])
+        with open(self.path, "rb") as database:
+            self.assertNotIn(b"Bearer KEY", database.read())
+
+    def test_expires_and_respects_endpoint_ttls(self):
+        self.client.project.retrieve_project("p1")
+        self.clock.now += 59
+        self.client.project.retrieve_project("p1")
+        self.assertEqual(1, self.gets())
+        self.clock.now += 1
+        self.client.project.retrieve_project("p1")
+        self.assertEqual(2, self.gets())
+
+        self.client.me.retrieve_me()
+        self.client.me.retrieve_me()
+        self.assertEqual(4, self.gets())
+
+    def test_never_caches_changesets_or_queries(self):
+        self.client.changeset.retrieve_completed_changeset_status("c1")
+        self.client.changeset.retrieve_completed_changeset_status("c1")
+        self.client.project.query_projects(10, 0, None, None, None)
+        self.client.project.query_projects(10, 0, None, None, None)
+        self.assertEqual(4, self.gets())
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0.0, self.cache.ttl_for("/api/data/projects"))
+
+    def test_caches_nothing_by_default(self):
+        self.client.with_disk_cache(DiskCache(os.path.join(self.directory.name, "default.db")))
+        self.client.project.retrieve_project("p1")
+        self.client.project.retrieve_project("p1")
+        self.assertEqual(2, self.gets())
+        self.assertEqual(0, len(self.client.diskCache))
+        self.client.diskCache.close()
+
+    def test_credentials_and_urls_are_separate(self):
+        self.client.project.retrieve_project("p1")
+        self.client.project.retrieve_project("p2")
+        self.client.with_api_key("OTHER")
+        self.client.project.retrieve_project("p1")
+        self.assertEqual(3, self.gets())
+        self.assertEqual(3, len(self.cache))
+
+    def test_writes_invalidate(self):
+        self.client.project.retrieve_project("p1")
+        self.client.project.retrieve_project("p2")
+        self.client.project.query_projects(10, 0, None, None, None)
+        self.client.projectMembers.retrieve_project_members("p2", False)
+
+        self.client.project.update_project("p1", ProjectUpdateDto(name="Renamed"))
+
+        self.assertEqual(1, len(self.cache))
+        self.client.projectMembers.retrieve_project_members("p2", False)
+        self.assertEqual(4, self.gets())
+
+    def test_stale_responses_are_not_stored(self):
+        generation = self.cache.generation
+        self.cache.invalidate("/api/data/projects/p1")
+        self.cache.put("GET", "https://api.projectmanager.com/api/data/projects/p1", None, "/api/data/projects/p1",
+                       200, {}, b"{}", generation)
+        self.assertEqual(0, len(self.cache))
+
+    def test_evicts_least_recently_used(self):
+        cache = DiskCache(os.path.join(self.directory.name, "small.db"), ttls={"/a": 60, "/b": 60, "/c": 60}, max_bytes=2500, clock=self.clock)
+        for name in ["a", "b"]:
+            self.clock.now += 1
+            cache.put("GET", f"https://example.com/{name}", None, f"/{name}", 200, {}, b"x" * 1000, cache.generation)
+        self.clock.now += 1
+        self.assertIsNotNone(cache.get("GET", "https://example.com/a", None, "/a"))
+        self.clock.now += 1
+        cache.put("GET", "https://example.com/c", None, "/c", 200, {}, b"x" * 1000, cache.generation)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertIsNone(cache.get("GET", "https://example.com/b", None, "/b"))
+        self.assertIsNotNone(cache.get("GET", "https://example.com/a", None, "/a"))
+        cache.close()
+
+    def test_shared_between_processes(self):
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(4, mp_context=context) as pool:
+            hits = list(pool.map(fill_cache, [self.path] * 4, range(4)))
+
+        # Responses written by other processes may be evicted before they are read back
+        self.assertGreater(sum(hits), 100)
+        self.assertLessEqual(self.cache.size, 100_000)
+        self.assertEqual(self.cache.size, 1000 * len(self.cache))
+
+    def test_async_client(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_disk_cache(self.cache)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"success": True, "data": {"id": "p1"}})
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def retrieve():
+            await client.project.retrieve_project("p1")
+            return await client.project.retrieve_project("p1")
+
+        result = asyncio.run(retrieve())
+        self.assertEqual("p1", result.data.id)
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+import http.server
+import io
+import os
+import tempfile
+import threading
+import unittest
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+CONTENT = os.urandom(1024 * 1024)
+
+
+class FileHandler(http.server.BaseHTTPRequestHandler):
+    """Serves CONTENT for any document except `missing`"""
+
+    def do_GET(self):
+        if "/missing/" in self.path:
+            body = b'{"error": {"message": "Not found"}}'
+            self.send_response(404)
+        else:
+            body = CONTENT
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDownloads(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.client = ProjectManagerClient(f"http://127.0.0.1:{self.server.server_address[1]}", "UNIT_TEST")
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def test_download_to_path(self):
+        target = os.path.join(self.directory.name, "file.bin")
+        progress = []
+
+        result = self.client.file.download_file_to("doc", None, target, checksum="sha256",
+                                                   progress=lambda written, total: progress.append((written, total)))
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(CONTENT), result.data.size)
+        self.assertEqual(hashlib.sha256(CONTENT).hexdigest(), result.data.checksum)
+        self.assertEqual(target, result.data.path)
+        self.assertEqual("application/octet-stream", result.data.contentType)
+        with open(target, "rb") as file:
+            self.assertEqual(CONTENT, file.read())
+        self.assertEqual([target], [os.path.join(self.directory.name, name) for name in os.listdir(self.directory.name)])
+        self.assertGreater(len(progress), 1)
+        self.assertEqual((len(CONTENT), len(CONTENT)), progress[-1])
+
+    def test_download_to_file_object_and_function(self):
+        buffer = io.BytesIO()
+        chunks = []
+
+        self.assertTrue(self.client.projectVersion.download_msproject_xml_to("change", buffer).success)
+        self.assertTrue(self.client.teams.retrieve_zip_file_for_teams_integrations_to(chunks.append).success)
+
+        self.assertEqual(CONTENT, buffer.getvalue())
+        self.assertEqual(CONTENT, b"".join(chunks))
+        self.assertTrue(all(len(chunk) <= 65536 for chunk in chunks))
+
+    def test_error_leaves_target_untouched(self):
+        target = os.path.join(self.directory.name, "file.bin")
+
+        result = self.client.file.download_a_thumbnail_image_to("missing", target)
+
+        self.assertEqual(404, result.statusCode)
+        self.assertEqual("Not found", result.error.message)
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_interrupted_download_is_discarded(self):
+        target = os.path.join(self.directory.name, "file.bin")
+
+        def fail(written, total):
+            raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.client.file.download_file_to("doc", None, target, progress=fail)
+        self.assertEqual([], os.listdir(self.directory.name))
+
+    def test_download_from_buffered_transport(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (200, b"contents", {"Content-Length": "8"}))
+        buffer = io.BytesIO()
+
+        result = client.file.download_file_to("doc", None, buffer, checksum="md5")
+
+        self.assertEqual(8, result.data.size)
+        self.assertEqual(hashlib.md5(b"contents").hexdigest(), result.data.checksum)
+        self.assertEqual(b"contents", buffer.getvalue())
+
+    def test_async_download(self):
+        target = os.path.join(self.directory.name, "file.bin")
+
+        async def download():
+            async with AsyncProjectManagerClient(self.client.serverUrl, "UNIT_TEST") as client:
+                return await client.file.download_file_to("doc", None, target, checksum="sha1")
+
+        result = asyncio.run(download())
+
+        self.assertEqual(hashlib.sha1(CONTENT).hexdigest(), result.data.checksum)
+        with open(target, "rb") as file:
+            self.assertEqual(CONTENT, file.read())
+
+
+    def test_async_download_writes_off_the_event_loop(self):
+        class Target(io.BytesIO):
+            def write(self, chunk):
+                threads.add(threading.get_ident())
+                return super().write(chunk)
+        threads = set()
+        buffer = Target()
+
+        async def download():
+            async with AsyncProjectManagerClient(self.client.serverUrl, "UNIT_TEST") as client:
+                return await client.file.download_file_to("doc", None, buffer)
+
+        self.assertTrue(asyncio.run(download()).success)
+        self.assertEqual(CONTENT, buffer.getvalue())
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from generator.generate import ROOT, changed, generate, load, main, stale
+
+
+class TestGenerated(unittest.TestCase):
+
+    # Generated files are rewritten by the weekly update, so changes must be made to the generator templates
+    def test_generated_files_are_up_to_date(self):
+        api = load()
+        files = generate(api)
+        self.assertEqual([], changed(ROOT, files))
+        self.assertEqual([], stale(ROOT, api, files))
+
+    def test_every_query_has_an_iterator(self):
+        api = load()
+        files = generate(api)
+        queries = [(category, operation) for category in api.categories for operation in category.operations if operation.paged]
+        self.assertEqual(13, len(queries))
+        for category, operation in queries:
+            self.assertIn(f"def iter_{operation.name.split('_', 1)[1]}(", files[f"src/ProjectManagerSdk/clients/{category.moduleName}.py"])
+
+    def test_every_endpoint_is_matched(self):
+        from ProjectManagerSdk.endpoints import path_template
+        for category in load().categories:
+            for operation in category.operations:
+                self.assertEqual(operation.path, path_template(operation.path.replace("{", "").replace("}", "")), operation.name)
+
+    def test_check_reports_outdated_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            for name in ["sdk-config.json"] + [os.path.join("swagger", "swagger-154.0.181.json")]:
+                os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+                with open(os.path.join(ROOT, name), "rb") as source, open(os.path.join(root, name), "wb") as target:
+                    target.write(source.read())
+            self.assertEqual(1, main(["--root", root, "--check"]))
+            self.assertEqual(0, main(["--root", root]))
+            self.assertEqual(0, main(["--root", root, "--check"]))
+            stray = os.path.join(root, "src", "ProjectManagerSdk", "clients", "removedclient.py")
+            open(stray, "w").close()
+            self.assertEqual(1, main(["--root", root, "--check"]))
+            main(["--root", root])
+            self.assertFalse(os.path.exists(stray))
+
+
+if __name__ == '__main__':
+    unittest.main()
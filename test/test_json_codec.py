@@ -0,0 +1,69 @@
+import json
+import unittest
+from ProjectManagerSdk.jsoncodec import JsonCodec, OrjsonCodec, get_json_codec
+from ProjectManagerSdk.models.taskupdatedto import TaskUpdateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+class CountingCodec(JsonCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def loads(self, content):
+        self.calls += 1
+        return super().loads(content)
+
+    def dumps(self, value):
+        self.calls += 1
+        return super().dumps(value)
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_selection(self):
+        try:
+            import orjson
+            self.assertIsInstance(get_json_codec(), OrjsonCodec)
+        except ImportError:
+            self.assertEqual("json", get_json_codec().name)
+        self.assertEqual("json", get_json_codec("json").name)
+        with self.assertRaises(ValueError):
+            get_json_codec("unknown")
+
+    def test_codecs_agree(self):
+        value = {"name": "Täsk", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+        codecs = [JsonCodec()]
+        try:
+            codecs.append(OrjsonCodec())
+        except ImportError:
+            pass
+        for codec in codecs:
+            self.assertEqual(value, json.loads(codec.dumps(value)))
+            self.assertEqual(value, codec.loads(json.dumps(value).encode("utf-8")))
+
+    def test_client_uses_codec_both_ways(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        codec = CountingCodec()
+        client.with_json_codec(codec)
+        adapter = install(client, lambda request: (200, {"data": {"id": "cs1"}}, None))
+
+        result = client.task.update_task("abc", TaskUpdateDto(name="Renamed", percentComplete=50))
+
+        self.assertEqual("cs1", result.data.id)
+        self.assertEqual(2, codec.calls)
+        request = adapter.requests[0]
+        self.assertEqual("application/json", request.headers["Content-Type"])
+        self.assertEqual({"name": "Renamed", "percentComplete": 50}, json.loads(request.body))
+
+    def test_no_body_for_get(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_json_codec("json")
+        adapter = install(client, lambda request: (200, {"data": {}}, None))
+
+        client.me.retrieve_me()
+
+        self.assertIsNone(adapter.requests[0].body)
+        self.assertNotIn("Content-Type", adapter.requests[0].headers)
@@ -0,0 +1,30 @@
+import dataclasses
+import importlib
+import os
+import unittest
+import ProjectManagerSdk.models
+
+
+def generated_models():
+    folder = os.path.dirname(ProjectManagerSdk.models.__file__)
+    for filename in sorted(os.listdir(folder)):
+        if filename.endswith(".py") and filename not in ("__init__.py", "astroresult.py", "astroexception.py"):
+            module = importlib.import_module("ProjectManagerSdk.models." + filename[:-3])
+            for value in vars(module).values():
+                if dataclasses.is_dataclass(value) and value.__module__ == module.__name__:
+                    yield value
+
+
+class TestModels(unittest.TestCase):
+
+    # Models are slotted so that large result sets do not carry a __dict__ per instance
+    def test_models_are_slotted(self):
+        count = 0
+        for model in generated_models():
+            instance = model()
+            self.assertFalse(hasattr(instance, "__dict__"), model.__name__)
+            self.assertEqual(tuple(field.name for field in dataclasses.fields(model)), model.__slots__)
+            for field in dataclasses.fields(model):
+                self.assertIsNone(getattr(instance, field.name))
+            count += 1
+        self.assertGreater(count, 190)
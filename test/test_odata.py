@@ -0,0 +1,128 @@
+import unittest
+import numpy
+from ProjectManagerSdk.columnar import to_columns
+from ProjectManagerSdk.decoders import from_dict, lazy_from_dict
+from ProjectManagerSdk.models.taskdto import TaskDto
+from ProjectManagerSdk.models.timesheetdto import TimesheetDto
+from ProjectManagerSdk.odata import compile_filter, compile_orderby, query_local
+
+TASKS = [
+    {"id": "t1", "name": "Design API", "priorityId": 300, "percentComplete": 100,
+     "project": {"id": "3fa85f64-5717-4562-b3fc-2c963f66afa6", "name": "Alpha"}, "modifyDate": "2024-01-05T10:00:00Z"},
+    {"id": "t2", "name": "write docs", "priorityId": 200, "percentComplete": 20,
+     "project": {"id": "3fa85f64-5717-4562-b3fc-2c963f66afa6", "name": "Alpha"}, "modifyDate": "2024-01-06T09:00:00+02:00"},
+    {"id": "t3", "name": "Ship it", "priorityId": None, "percentComplete": 0,
+     "project": {"id": "p2", "name": "Beta"}, "modifyDate": None},
+    {"id": "t4", "name": "API review", "priorityId": 200, "percentComplete": 50, "project": None,
+     "modifyDate": "2024-01-07T00:00:00Z"},
+]
+
+ENTRIES = [
+    {"id": "e1", "projectId": "p1", "date": "2026-01-05", "hours": 1.5, "notes": "Kickoff", "project": {"id": "p1"}, "approved": True},
+    {"id": "e2", "projectId": "p2", "date": "2026-01-06", "hours": 2, "notes": "kickoff follow-up", "project": {"id": "p2"}, "approved": False},
+    {"id": "e3", "projectId": "p1", "date": None, "hours": None, "notes": None, "project": None, "approved": None},
+    {"id": "e4", "projectId": None, "date": "2026-01-04", "hours": 4, "notes": "Review", "project": {"id": "p1"}},
+]
+
+
+class TestODataFilter(unittest.TestCase):
+
+    def ids(self, expression, records=TASKS):
+        return [record["id"] for record in compile_filter(expression).filter(records)]
+
+    def test_comparisons_and_logic(self):
+        self.assertEqual(["t1"], self.ids("priorityId gt 200"))
+        self.assertEqual(["t2", "t4"], self.ids("priorityId eq 200"))
+        self.assertEqual(["t1", "t2", "t4"], self.ids("priorityId ge 200"))
+        self.assertEqual(["t1", "t3"], self.ids("priorityId ne 200"))
+        self.assertEqual(["t3"], self.ids("priorityId eq null"))
+        self.assertEqual(["t2"], self.ids("priorityId eq 200 and percentComplete lt 50"))
+        self.assertEqual(["t1", "t2", "t3"], self.ids("not (priorityId eq 200) or percentComplete le 20"))
+        self.assertEqual([], self.ids("priorityId lt null"))
+
+    def test_strings_ignore_case(self):
+        self.assertEqual(["t2"], self.ids("name eq 'Write Docs'"))
+        self.assertEqual(["t1", "t4"], self.ids("contains(name, 'api')"))
+        self.assertEqual(["t4"], self.ids("startswith(name, 'API')"))
+        self.assertEqual(["t2"], self.ids("endswith(tolower(name), 'DOCS')"))
+        self.assertEqual(["t3"], self.ids("name eq 'Ship it' and 'ship it' eq name"))
+        self.assertEqual([], self.ids("name eq 'it''s'"))
+
+    def test_nested_paths_guids_and_dates(self):
+        self.assertEqual(["t1", "t2"], self.ids("project/id eq 3FA85F64-5717-4562-B3FC-2C963F66AFA6"))
+        self.assertEqual(["t3"], self.ids("project/name eq 'beta'"))
+        self.assertEqual(["t4"], self.ids("project eq null"))
+        # 09:00+02:00 is 07:00 UTC
+        self.assertEqual(["t2", "t4"], self.ids("modifyDate gt 2024-01-06T06:59:00Z"))
+        self.assertEqual(["t1"], self.ids("modifyDate lt 2024-01-06"))
+
+    def test_model_objects(self):
+        tasks = [from_dict(TaskDto, task) for task in TASKS]
+        lazy = [lazy_from_dict(TaskDto, task) for task in TASKS]
+
+        self.assertEqual(["t1", "t2"], [task.id for task in compile_filter("project/name eq 'Alpha'").filter(tasks)])
+        self.assertEqual(["t1", "t2"], [task.id for task in compile_filter("project/name eq 'Alpha'").filter(lazy)])
+
+    def test_invalid_expressions(self):
+        for expression in ["name eq", "name eq 'x' and", "(name eq 'x'", "name ~ 'x'", "contains(name)", "name eq 'x' 'y'"]:
+            with self.assertRaises(ValueError, msg=expression):
+                compile_filter(expression)
+
+    def test_compiled_filters_are_cached(self):
+        self.assertIs(compile_filter("name eq 'x'"), compile_filter("name eq 'x'"))
+
+
+class TestODataOrderBy(unittest.TestCase):
+
+    def test_sort(self):
+        order = compile_orderby("priorityId desc, name")
+        self.assertEqual(["t1", "t4", "t2", "t3"], [task["id"] for task in order.sort(TASKS)])
+        self.assertEqual(["t3", "t2", "t4", "t1"], [task["id"] for task in compile_orderby("priorityId, name desc").sort(TASKS)])
+        self.assertEqual(["t4", "t1", "t2", "t3"], [task["id"] for task in compile_orderby("project/name, id").sort(TASKS)])
+
+    def test_invalid(self):
+        for expression in ["", "name sideways", "name asc desc", "na-me"]:
+            with self.assertRaises(ValueError, msg=expression):
+                compile_orderby(expression)
+
+
+class TestQueryLocal(unittest.TestCase):
+
+    def test_records(self):
+        result = query_local(TASKS, top=2, skip=1, filter="percentComplete lt 100", orderby="percentComplete")
+        self.assertEqual(["t2", "t4"], [task["id"] for task in result])
+
+    def test_columnar_matches_rows(self):
+        columns = to_columns(TimesheetDto, ENTRIES, fields=["id", "projectId", "date", "hours", "notes", "project", "approved"])
+        cases = [
+            ("projectId eq 'P1'", None),
+            ("projectId ne 'p1'", None),
+            ("contains(notes, 'KICK') or hours gt 3", None),
+            ("hours ge 2", "hours desc"),
+            ("hours eq null or date eq null", None),
+            ("date lt 2026-01-06", "date"),
+            ("project/id eq 'p1'", "projectId desc, id"),
+            ("not approved", None),
+            ("not (approved and hours gt 1)", None),
+            ("not (approved or projectId eq 'p2')", None),
+            (None, "notes"),
+            (None, "project/id desc, hours"),
+        ]
+        for filter, orderby in cases:
+            expected = [entry["id"] for entry in query_local(ENTRIES, filter=filter, orderby=orderby)]
+            result = query_local(columns, filter=filter, orderby=orderby)
+            self.assertEqual(expected, list(result["id"].decode()), msg=(filter, orderby))
+
+    def test_not_null_is_null(self):
+        self.assertEqual(["e2"], [entry["id"] for entry in query_local(ENTRIES, filter="not approved")])
+        self.assertEqual(["e2", "e3"], [entry["id"] for entry in query_local(ENTRIES, filter="not (approved and hours gt 1)")])
+        self.assertEqual(["e1", "e3", "e4"], [entry["id"] for entry in query_local(ENTRIES, filter="not not approved or hours ne 2")])
+
+    def test_columnar_mask(self):
+        columns = to_columns(TimesheetDto, ENTRIES, fields=["projectId", "hours"])
+        self.assertEqual([True, False, False, False], list(compile_filter("projectId eq 'p1' and hours gt 1").mask(columns)))
+        self.assertEqual(numpy.bool_, compile_filter("hours lt 3").mask(columns).dtype.type)
+
+
+if __name__ == '__main__':
+    unittest.main()
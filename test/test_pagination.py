@@ -0,0 +1,111 @@
+import threading
+import time
+import unittest
+import urllib.parse
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.timesheetdto import TimesheetDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+
+def paged_handler(total: int):
+    """Serves `total` records, honoring $top and $skip"""
+    def handler(request):
+        query = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(request.url).query))
+        top = int(query["$top"])
+        skip = int(query.get("$skip", 0))
+        return 200, {"data": [{"id": str(i)} for i in range(skip, min(skip + top, total))]}, None
+    return handler
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_iterates_all_pages(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        adapter = install(client, paged_handler(25))
+
+        ids = [entry.id for entry in client.timesheet.iter_time_entries(filter="hours gt 0", page_size=10)]
+
+        self.assertEqual([str(i) for i in range(25)], ids)
+        self.assertEqual(3, len(adapter.requests))
+        self.assertIn("%24filter=hours+gt+0", adapter.requests[2].url)
+        self.assertIn("%24skip=20", adapter.requests[2].url)
+
+    def test_yields_lazily(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        adapter = install(client, paged_handler(100))
+
+        iterator = client.task.iter_tasks(page_size=10)
+        self.assertEqual(0, len(adapter.requests))
+        next(iterator)
+        self.assertEqual(1, len(adapter.requests))
+
+    def test_exact_multiple_stops_on_empty_page(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        adapter = install(client, paged_handler(20))
+
+        self.assertEqual(20, len(list(client.project.iter_projects(page_size=10))))
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_max_items(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        adapter = install(client, paged_handler(100))
+
+        entries = list(client.timesheet.iter_time_entries(page_size=10, max_items=15))
+
+        self.assertEqual(15, len(entries))
+        self.assertIsInstance(entries[0], TimesheetDto)
+        self.assertEqual(2, len(adapter.requests))
+        self.assertIn("%24top=5", adapter.requests[1].url)
+
+    def test_failed_page_raises(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (500, {"error": {"message": "Server error"}}, None))
+
+        with self.assertRaises(AstroException) as context:
+            list(client.risk.iter_risks())
+        self.assertEqual(500, context.exception.result.statusCode)
+        self.assertEqual("Server error", context.exception.result.error.message)
+
+    def test_prefetch_keeps_order(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        handler = paged_handler(95)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_handler(request):
+            with lock:
+                in_flight.append(request)
+                peak.append(len(in_flight))
+            # Later pages answer first, so ordering depends on the pager
+            skip = int(dict(urllib.parse.parse_qsl(urllib.parse.urlparse(request.url).query)).get("$skip", 0))
+            time.sleep(0.05 if skip % 20 == 0 else 0.01)
+            with lock:
+                in_flight.remove(request)
+            return handler(request)
+
+        adapter = install(client, slow_handler)
+        ids = [task.id for task in client.task.iter_tasks(page_size=10, prefetch=4)]
+
+        self.assertEqual([str(i) for i in range(95)], ids)
+        self.assertGreater(max(peak), 1)
+        self.assertLessEqual(max(peak), 5)
+        # Pages past the short final page may already have been requested, but no more than the prefetch depth
+        self.assertLessEqual(len(adapter.requests), 10 + 4)
+
+    def test_prefetch_failure_raises(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        handler = paged_handler(100)
+
+        def failing_handler(request):
+            if "%24skip=30" in request.url:
+                return 503, {"error": {"message": "Unavailable"}}, None
+            return handler(request)
+
+        install(client, failing_handler)
+        ids = []
+        with self.assertRaises(AstroException):
+            for task in client.task.iter_tasks(page_size=10, prefetch=3):
+                ids.append(task.id)
+        self.assertEqual([str(i) for i in range(30)], ids)
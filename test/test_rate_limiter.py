@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.ratelimiter import RateLimiter, parse_retry_after
+from test.fakeserver import install
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_token_bucket(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=2, clock=clock)
+
+        self.assertEqual(0, limiter.reserve())
+        self.assertEqual(0, limiter.reserve())
+        self.assertAlmostEqual(0.1, limiter.reserve())
+        self.assertAlmostEqual(0.2, limiter.reserve())
+        clock.now += 1
+        self.assertEqual(0, limiter.reserve())
+
+    def test_backs_off_and_recovers(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, increase=1, clock=clock)
+
+        limiter.record(429, "3")
+        self.assertEqual(5, limiter.rate)
+        self.assertAlmostEqual(3, limiter.reserve())
+        limiter.record(200)
+        limiter.record(200)
+        self.assertEqual(7, limiter.rate)
+        for i in range(10):
+            limiter.record(200)
+        self.assertEqual(10, limiter.rate)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(2.5, parse_retry_after("2.5"))
+        self.assertEqual(30, parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_client_resends_throttled_calls(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        limiter = RateLimiter(rate=1000)
+        client.with_rate_limiter(limiter)
+        responses = [(429, {"error": {"message": "Slow down"}}, {"Retry-After": "0"}), (200, {"data": {"id": "me"}}, None)]
+        adapter = install(client, lambda request: responses.pop(0))
+
+        result = client.me.retrieve_me()
+
+        self.assertTrue(result.success)
+        self.assertEqual(2, len(adapter.requests))
+        self.assertEqual(1, limiter.throttled)
+        self.assertLess(limiter.rate, 1000)
+
+    def test_gives_up_after_max_retries(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_rate_limiter(RateLimiter(rate=1000, max_retries=2))
+        adapter = install(client, lambda request: (429, {"error": {"message": "Slow down"}}, {"Retry-After": "0"}))
+
+        result = client.me.retrieve_me()
+
+        self.assertEqual(429, result.statusCode)
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_shared_with_async_client(self):
+        limiter = RateLimiter(rate=1000)
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_rate_limiter(limiter)
+        responses = [httpx.Response(429, json={}, headers={"Retry-After": "0"})] + [httpx.Response(200, json={"data": {}})] * 5
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+        async def run():
+            return await asyncio.gather(*(client.me.retrieve_me() for i in range(5)))
+
+        self.assertTrue(all(result.success for result in asyncio.run(run())))
+        self.assertEqual(1, limiter.throttled)
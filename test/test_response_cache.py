@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.models.projectprioritycreatedto import ProjectPriorityCreateDto
+from ProjectManagerSdk.models.taskstatuscreatedto import TaskStatusCreateDto
+from ProjectManagerSdk.models.taskstatusupdatedto import TaskStatusUpdateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.responsecache import ResponseCache
+from test.fakeserver import install
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(max_entries=3, clock=self.clock)
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.client.with_response_cache(self.cache)
+        self.adapter = install(self.client, lambda request: (200, {"data": []}, None))
+
+    def gets(self):
+        return len([request for request in self.adapter.requests if request.method == "GET"])
+
+    def test_caches_reference_data(self):
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        result = self.client.taskStatus.retrieve_task_statuses("p1")
+        self.client.task.retrieve_task("t1")
+        self.client.task.retrieve_task("t1")
+
+        self.assertEqual([], result.data)
+        self.assertEqual(3, self.gets())
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_expires(self):
+        self.client.userRole.retrieve_userroles()
+        self.clock.now += 899
+        self.client.userRole.retrieve_userroles()
+        self.clock.now += 1
+        self.client.userRole.retrieve_userroles()
+
+        self.assertEqual(2, self.gets())
+
+    def test_evicts_least_recently_used(self):
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        self.client.taskStatus.retrieve_task_statuses("p2")
+        self.client.taskStatus.retrieve_task_statuses("p3")
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        self.client.taskStatus.retrieve_task_statuses("p4")
+
+        self.assertEqual(1, self.cache.evictions)
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        self.assertEqual(4, self.gets())
+        self.client.taskStatus.retrieve_task_statuses("p2")
+        self.assertEqual(5, self.gets())
+
+    def test_writes_invalidate(self):
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        self.client.projectPriority.retrieve_project_priorities()
+        self.client.workSpace.retrieve_workspaces()
+
+        self.client.taskStatus.create_taskstatus("p1", TaskStatusCreateDto(name="Done"))
+        self.assertEqual(2, len(self.cache))
+        self.client.taskStatus.retrieve_task_statuses("p1")
+        self.client.taskStatus.update_taskstatus("s1", TaskStatusUpdateDto(name="Done"))
+        self.client.projectPriority.update_project_priority("1", ProjectPriorityCreateDto(name="High"))
+
+        self.assertEqual(1, len(self.cache))
+        self.client.workSpace.retrieve_workspaces()
+        self.assertEqual(4, self.gets())
+
+    def test_explicit_invalidation(self):
+        self.client.tag.query_tags(10, 0, None, None, None)
+        self.client.license.retrieve_licenses()
+
+        self.cache.invalidate("/api/data/tags")
+        self.assertEqual(1, len(self.cache))
+        self.cache.invalidate()
+        self.assertEqual(0, len(self.cache))
+
+    def test_errors_and_other_credentials_are_not_shared(self):
+        self.client.workSpace.retrieve_workspaces()
+        self.client.with_api_key("OTHER")
+        self.client.workSpace.retrieve_workspaces()
+        self.assertEqual(2, self.gets())
+
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_response_cache(ResponseCache())
+        adapter = install(client, lambda request: (500, {"error": {"message": "Failed"}}, None))
+        client.workSpace.retrieve_workspaces()
+        client.workSpace.retrieve_workspaces()
+        self.assertEqual(2, len(adapter.requests))
+
+    def test_async_client(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_response_cache(ResponseCache())
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"data": []})
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def retrieve():
+            await client.projectField.retrieve_project_fields()
+            return await client.projectField.retrieve_project_fields()
+
+        self.assertTrue(asyncio.run(retrieve()).success)
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import unittest
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.models.taskdto import TaskDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from test.fakeserver import install
+
+TASKS = {"data": [{"id": "a", "name": "First", "project": {"id": "p"}}, {"id": "b", "name": "Second"}]}
+
+
+class TestResultModes(unittest.TestCase):
+
+    def test_raw_client(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_result_mode("raw")
+        install(client, lambda request: (200, TASKS, None))
+
+        result = client.task.query_tasks(None, None, None, None, None)
+
+        self.assertTrue(result.success)
+        self.assertEqual(TASKS["data"], result.data)
+        self.assertIsInstance(result.data[0]["project"], dict)
+
+    def test_raw_block_only_affects_calls_inside_it(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        other = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (200, TASKS, None))
+        install(other, lambda request: (200, TASKS, None))
+
+        with client.result_mode("raw"):
+            raw = client.task.query_tasks(None, None, None, None, None)
+            unaffected = other.task.query_tasks(None, None, None, None, None)
+            paged = list(client.task.iter_tasks(page_size=10, prefetch=2))
+        models = client.task.query_tasks(None, None, None, None, None)
+
+        self.assertIsInstance(raw.data[0], dict)
+        self.assertIsInstance(paged[0], dict)
+        self.assertIsInstance(unaffected.data[0], TaskDto)
+        self.assertIsInstance(models.data[0], TaskDto)
+
+    def test_raw_block_is_per_thread(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (200, TASKS, None))
+        results = []
+
+        with client.result_mode("raw"):
+            thread = threading.Thread(target=lambda: results.append(client.task.query_tasks(None, None, None, None, None)))
+            thread.start()
+            thread.join()
+
+        self.assertIsInstance(results[0].data[0], TaskDto)
+
+    def test_async_raw_block(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=TASKS)))
+
+        async def run():
+            with client.result_mode("raw"):
+                return await client.task.query_tasks(None, None, None, None, None)
+
+        self.assertEqual(TASKS["data"], asyncio.run(run()).data)
+
+    def test_unknown_mode(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        with self.assertRaises(ValueError):
+            client.with_result_mode("columns")
@@ -0,0 +1,147 @@
+import asyncio
+import concurrent.futures
+import unittest
+import httpx
+import requests
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.models.taskcreatedto import TaskCreateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.retry import RetryBudget, RetryPolicy
+from test.fakeserver import install
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+
+        for attempt in range(1, 6):
+            delay = policy.delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5, 2 ** (attempt - 1)))
+        self.assertEqual(3, policy.delay(1, "3"))
+        self.assertEqual(5, policy.delay(1, "60"))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry("GET", 1, 503))
+        self.assertTrue(policy.should_retry("delete", 2, None))
+        self.assertFalse(policy.should_retry("GET", 3, 503))
+        self.assertFalse(policy.should_retry("GET", 1, 500))
+        self.assertFalse(policy.should_retry("POST", 1, 503))
+        self.assertEqual(2, policy.retries)
+
+    def test_counts_retries_from_many_threads(self):
+        policy = RetryPolicy(budget=RetryBudget(min_retries=100_000, window=0))
+
+        with concurrent.futures.ThreadPoolExecutor(8) as pool:
+            list(pool.map(lambda i: [policy.should_retry("GET", 1, 503) for _ in range(1000)], range(8)))
+        self.assertEqual(8000, policy.retries)
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, min_retries=1, window=4)
+
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        for i in range(100):
+            budget.deposit()
+        self.assertEqual(3, sum(budget.withdraw() for i in range(10)))
+
+    def test_client_retries_get(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0))
+        responses = [(503, b"Service Unavailable", None), (502, b"<html>Bad Gateway</html>", None), (200, {"data": {"id": "me"}}, None)]
+        adapter = install(client, lambda request: responses.pop(0))
+
+        result = client.me.retrieve_me()
+
+        self.assertTrue(result.success)
+        self.assertEqual(3, len(adapter.requests))
+        self.assertEqual(2, client.retryPolicy.retries)
+
+    def test_client_retries_dropped_connections(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0))
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise requests.exceptions.ConnectionError("Connection reset by peer")
+            return 200, {"data": {"id": "me"}}, None
+        install(client, handler)
+
+        self.assertTrue(client.me.retrieve_me().success)
+        self.assertEqual(2, len(calls))
+
+    def test_client_does_not_retry_post_by_default(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0))
+        adapter = install(client, lambda request: (503, b"Service Unavailable", None))
+
+        result = client.task.create_task("project", TaskCreateDto(name="Task"))
+
+        self.assertEqual(503, result.statusCode)
+        self.assertEqual(1, len(adapter.requests))
+
+        client.with_retry_policy(RetryPolicy(backoff=0, max_attempts=2, methods={"GET", "POST"}))
+        client.task.create_task("project", TaskCreateDto(name="Task"))
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_client_gives_up(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0, max_attempts=3))
+        adapter = install(client, lambda request: (504, b"", None))
+
+        result = client.me.retrieve_me()
+
+        self.assertFalse(result.success)
+        self.assertEqual(504, result.statusCode)
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_exhausted_budget_stops_retries(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0, budget=RetryBudget(ratio=0, min_retries=1)))
+        adapter = install(client, lambda request: (503, b"", None))
+
+        client.me.retrieve_me()
+        client.me.retrieve_me()
+
+        self.assertEqual(3, len(adapter.requests))
+
+    def test_non_json_error_body(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        install(client, lambda request: (502, b"<html>Bad Gateway</html>", None))
+
+        result = client.me.retrieve_me()
+
+        self.assertTrue(result.hasError)
+        self.assertEqual("<html>Bad Gateway</html>", result.error.technicalError)
+        self.assertIn("502", result.error.message)
+
+    def test_async_client_retries(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0))
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("Connection refused")
+            if len(calls) == 2:
+                return httpx.Response(503, text="Service Unavailable")
+            return httpx.Response(200, json={"data": {"id": "me"}})
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = asyncio.run(client.me.retrieve_me())
+
+        self.assertTrue(result.success)
+        self.assertEqual(3, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import unittest
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.singleflight import SingleFlight
+from test.fakeserver import install
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_gets_share_one_call(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_request_coalescing()
+
+        def handler(request):
+            # Hold the first call until the other callers are waiting for it
+            deadline = time.monotonic() + 5
+            while client.singleFlight.coalesced < 7 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            return 200, {"data": {"id": "me"}}, None
+        adapter = install(client, handler)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: client.me.retrieve_me(), range(8)))
+
+        self.assertEqual(1, len(adapter.requests))
+        self.assertEqual(7, client.singleFlight.coalesced)
+        self.assertTrue(all(result.data.id == "me" for result in results))
+
+        client.me.retrieve_me()
+        self.assertEqual(2, len(adapter.requests))
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            release.wait()
+            raise ValueError("failed")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        while flight.coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(2, len(errors))
+        self.assertIs(errors[0], errors[1])
+
+    def test_writes_and_distinct_gets_are_not_coalesced(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_request_coalescing()
+        adapter = install(client, lambda request: (200, {"data": {}}, None))
+
+        client.task.retrieve_task("1")
+        client.task.retrieve_task("2")
+        client.task.delete_task("1")
+
+        self.assertEqual(3, len(adapter.requests))
+        self.assertEqual(0, client.singleFlight.coalesced)
+
+    def test_async_gets_share_one_call(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_request_coalescing()
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"data": {"id": "me"}})
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def retrieve():
+            first = asyncio.ensure_future(client.me.retrieve_me())
+            cancelled = asyncio.ensure_future(client.me.retrieve_me())
+            others = [asyncio.ensure_future(client.me.retrieve_me()) for i in range(3)]
+            await asyncio.sleep(0.01)
+            cancelled.cancel()
+            return await asyncio.gather(first, *others)
+
+        results = asyncio.run(retrieve())
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result.data.id == "me" for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
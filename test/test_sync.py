@@ -0,0 +1,140 @@
+import os
+import tempfile
+import unittest
+import urllib.parse
+import zlib
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.sync import SyncEngine
+from test.fakeserver import install
+
+
+class FakeCollections:
+    """answers OData queries on tasks and resources filtered and ordered by modification time
+
+    Like a database without a tiebreaker, records sharing a modification
+    time come back in a different order for each filter unless the query
+    also orders them by id.
+    """
+
+    def __init__(self):
+        self.records = {
+            "/api/data/tasks": {},
+            "/api/data/resources": {},
+        }
+        self.filters = []
+        self.fail = False
+
+    def put(self, collection: str, id: str, modified: str, **fields):
+        field = "modifiedDate" if collection == "/api/data/resources" else "modifyDate"
+        self.records[collection][id] = {"id": id, field: modified, **fields}
+
+    def __call__(self, request):
+        url = urllib.parse.urlsplit(request.url)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        condition = query.get("$filter")
+        self.filters.append((url.path, condition))
+        if self.fail:
+            return 500, {"error": {"message": "Failed"}}, None
+        field, *tiebreakers = [part.split()[0] for part in query["$orderby"].split(",")]
+        if tiebreakers == ["id"]:
+            tie = lambda row: row["id"]
+        else:
+            tie = lambda row: zlib.crc32(f"{condition} {row['id']}".encode("utf-8"))
+        rows = sorted(self.records[url.path].values(), key=lambda row: (row[field] is not None, row[field] or "", tie(row)))
+        if condition:
+            _, operator, value = condition.split(" ", 2)
+            value = None if value == "null" else value
+            test = {"ge": lambda v: v is not None and v >= value, "gt": lambda v: v is not None and v > value,
+                    "eq": lambda v: v == value, "ne": lambda v: v != value}[operator]
+            rows = [row for row in rows if test(row[field])]
+        skip, top = int(query.get("$skip", 0)), int(query["$top"])
+        return 200, {"success": True, "data": rows[skip:skip + top]}, None
+
+
+class TestSyncEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "mirror.db")
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.server = FakeCollections()
+        install(self.client, self.server)
+        for index in range(7):
+            self.server.put("/api/data/tasks", f"t{index}", f"2024-01-0{index + 1}T00:00:00Z", name=f"Task {index}")
+        self.server.put("/api/data/resources", "r1", "2024-02-01T00:00:00Z", firstName="Ada")
+        self.engine = SyncEngine(self.client, self.path, ["tasks", "resources"], page_size=3, batch_size=2)
+
+    def tearDown(self):
+        self.engine.close()
+        self.directory.cleanup()
+
+    def test_initial_load_then_changes_only(self):
+        results = self.engine.sync()
+
+        self.assertTrue(results["tasks"].full)
+        self.assertEqual(7, results["tasks"].rows)
+        self.assertEqual(7, self.engine.count("tasks"))
+        self.assertEqual(1, self.engine.count("resources"))
+        self.assertEqual("2024-01-07T00:00:00Z", self.engine.high_water("tasks"))
+        self.assertEqual([None, "modifyDate ge 2024-01-03T00:00:00Z", "modifyDate ge 2024-01-05T00:00:00Z",
+                          "modifyDate ge 2024-01-07T00:00:00Z"],
+                         [condition for path, condition in self.server.filters if path == "/api/data/tasks"])
+
+        self.server.filters.clear()
+        self.server.put("/api/data/tasks", "t2", "2024-03-01T00:00:00Z", name="Renamed")
+        self.server.put("/api/data/tasks", "t9", "2024-03-02T00:00:00Z", name="New")
+        result = self.engine.sync(["tasks"])["tasks"]
+
+        self.assertFalse(result.full)
+        self.assertEqual(3, result.rows)
+        self.assertEqual(2, result.calls)
+        self.assertEqual(("/api/data/tasks", "modifyDate ge 2024-01-07T00:00:00Z"), self.server.filters[0])
+        self.assertEqual(8, self.engine.count("tasks"))
+        names = {record["id"]: record["name"] for record in self.engine.records("tasks")}
+        self.assertEqual("Renamed", names["t2"])
+        self.assertEqual("2024-03-02T00:00:00Z", self.engine.high_water("tasks"))
+
+    def test_pages_through_identical_modification_times(self):
+        for index in range(5):
+            self.server.put("/api/data/tasks", f"s{index}", "2024-01-03T00:00:00Z")
+        self.engine.sync(["tasks"])
+
+        self.assertEqual(12, self.engine.count("tasks"))
+        self.assertIn(("/api/data/tasks", "modifyDate eq 2024-01-03T00:00:00Z"), self.server.filters)
+        self.assertIn(("/api/data/tasks", "modifyDate gt 2024-01-03T00:00:00Z"), self.server.filters)
+
+    def test_ties_are_neither_skipped_nor_repeated(self):
+        for index in range(10):
+            self.server.put("/api/data/tasks", f"s{index}", "2024-01-03T00:00:00Z")
+        result = self.engine.sync(["tasks"])["tasks"]
+
+        self.assertEqual(17, self.engine.count("tasks"))
+        self.assertEqual(17, result.rows)
+
+    def test_full_reload_removes_deleted_records(self):
+        self.engine.sync(["tasks"])
+        del self.server.records["/api/data/tasks"]["t3"]
+        self.assertEqual(7, self.engine.count("tasks"))
+
+        result = self.engine.sync(["tasks"], full=True)["tasks"]
+        self.assertEqual(1, result.deleted)
+        self.assertEqual(6, self.engine.count("tasks"))
+
+    def test_resumes_after_a_failure(self):
+        self.engine.sync(["tasks"])
+        self.server.put("/api/data/tasks", "t8", "2024-04-01T00:00:00Z")
+        self.server.fail = True
+        with self.assertRaises(AstroException):
+            self.engine.sync(["tasks"])
+        self.assertEqual("2024-01-07T00:00:00Z", self.engine.high_water("tasks"))
+
+        self.server.fail = False
+        self.engine.close()
+        self.engine = SyncEngine(self.client, self.path, ["tasks"], page_size=3)
+        self.assertEqual(2, self.engine.sync()["tasks"].rows)
+        self.assertEqual(8, self.engine.count("tasks"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+import unittest
+from ProjectManagerSdk.models.astroexception import AstroException
+from ProjectManagerSdk.models.changesetstatusdto import ChangeSetStatusDto
+from ProjectManagerSdk.models.taskcreatedto import TaskCreateDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.taskwriter import TaskWriter
+from test.fakeserver import install
+
+
+class FakeBulkServer:
+    """creates tasks in bulk, failing for the project `broken`"""
+
+    def __init__(self, delay: float = 0.0):
+        self.lock = threading.Lock()
+        self.delay = delay
+        self.calls = []
+        self.active = {}
+        self.overlapped = False
+
+    def __call__(self, request):
+        projectId = request.path_url.split("/")[4]
+        names = [task["name"] for task in json.loads(request.body)]
+        with self.lock:
+            self.calls.append((projectId, names))
+            self.active[projectId] = self.active.get(projectId, 0) + 1
+            self.overlapped = self.overlapped or self.active[projectId] > 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[projectId] -= 1
+        if projectId == "broken":
+            return 500, {"error": {"message": "Failed"}}, None
+        return 200, {"success": True, "data": [{"changeSetId": f"cs-{name}", "id": name} for name in names]}, None
+
+
+class TestTaskWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.server = FakeBulkServer()
+        install(self.client, self.server)
+
+    def test_groups_tasks_per_project_in_chunks(self):
+        with TaskWriter(self.client, batch_size=100, flush_interval=60) as writer:
+            futures = [writer.add(f"p{index % 2}", TaskCreateDto(name=f"t{index}")) for index in range(250)]
+        self.assertEqual([100, 25], [len(names) for projectId, names in self.server.calls if projectId == "p0"])
+        self.assertEqual([100, 25], [len(names) for projectId, names in self.server.calls if projectId == "p1"])
+        self.assertEqual([f"t{index}" for index in range(0, 250, 2)],
+                         [name for projectId, names in self.server.calls if projectId == "p0" for name in names])
+        self.assertEqual(ChangeSetStatusDto("cs-t7", "t7"), futures[7].result())
+        self.assertEqual(250, writer.created)
+        self.assertEqual(4, writer.calls)
+        self.assertEqual(0, writer.pending)
+
+    def test_sends_after_the_flush_interval(self):
+        writer = TaskWriter(self.client, batch_size=100, flush_interval=0.05)
+        future = writer.add("p1", TaskCreateDto(name="late"))
+        self.assertEqual("late", future.result(timeout=5).id)
+        self.assertEqual([("p1", ["late"])], self.server.calls)
+        writer.close()
+
+    def test_failures_resolve_only_their_chunk(self):
+        with TaskWriter(self.client, batch_size=2, flush_interval=60) as writer:
+            good = writer.add_many("p1", [TaskCreateDto(name="a"), TaskCreateDto(name="b")])
+            bad = writer.add_many("broken", [TaskCreateDto(name="c")])
+        self.assertEqual(["a", "b"], [future.result().id for future in good])
+        with self.assertRaises(AstroException) as context:
+            bad[0].result()
+        self.assertEqual(500, context.exception.result.statusCode)
+        self.assertEqual(1, writer.failed)
+
+    def test_chunks_for_one_project_are_sent_in_order(self):
+        self.server.delay = 0.01
+        with TaskWriter(self.client, batch_size=3, flush_interval=60, max_workers=4) as writer:
+            for index in range(30):
+                writer.add("p1" if index < 20 else "p2", TaskCreateDto(name=f"t{index}"))
+        self.assertFalse(self.server.overlapped)
+        self.assertEqual([f"t{index}" for index in range(20)],
+                         [name for projectId, names in self.server.calls if projectId == "p1" for name in names])
+
+    def test_bounded_buffer_and_cancellation(self):
+        writer = TaskWriter(self.client, batch_size=2, flush_interval=60, max_pending=2)
+        cancelled = writer.add("p1", TaskCreateDto(name="skip"))
+        self.assertTrue(cancelled.cancel())
+        kept = writer.add("p1", TaskCreateDto(name="keep"))
+        writer.add("p1", TaskCreateDto(name="next"))
+        writer.close()
+
+        self.assertEqual(("p1", ["keep"]), self.server.calls[0])
+        self.assertEqual("keep", kept.result().id)
+        with self.assertRaises(RuntimeError):
+            writer.add("p1", TaskCreateDto(name="closed"))
+
+
+if __name__ == '__main__':
+    unittest.main()
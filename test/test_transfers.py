@@ -0,0 +1,149 @@
+import os
+import tempfile
+import threading
+import unittest
+from ProjectManagerSdk.models.filedto import FileDto
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.retry import RetryPolicy
+from ProjectManagerSdk.transfers import FileDownload, FileUpload, TransferManager
+from test.fakeserver import install
+
+
+class FakeFileServer:
+    """Serves documents `doc0` to `doc19`; `missing` does not exist and `flaky` fails once"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.downloads = []
+        self.uploads = []
+        self.flaky = 0
+
+    def __call__(self, request):
+        path = request.path_url.split("?")[0]
+        if request.method == "POST":
+            with self.lock:
+                self.uploads.append((path, b"".join(request.body)))
+            if path == "/api/data/tasks/flaky/files" and len(self.uploads) == 1:
+                return 503, b"Service Unavailable", None
+            return 200, {"data": {"id": f"new{len(self.uploads)}", "name": "uploaded"}}, None
+        if path.startswith("/api/data/tasks/"):
+            taskId = path.split("/")[4]
+            return 200, {"data": [{"id": f"{taskId}-a", "name": "notes.txt", "createDate": "2024-01-01T00:00:00Z"},
+                                  {"id": f"{taskId}-b", "name": "notes.txt"},
+                                  {"id": f"{taskId}-c", "name": "../escape.txt"}]}, None
+        documentId = path.split("/")[4]
+        with self.lock:
+            self.downloads.append(documentId)
+            if documentId == "flaky":
+                self.flaky += 1
+                if self.flaky == 1:
+                    return 503, b"Service Unavailable", None
+        if documentId == "missing":
+            return 404, {"error": {"message": "Not found"}}, None
+        return 200, f"contents of {documentId}".encode("utf-8"), None
+
+
+class TestTransferManager(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.server = FakeFileServer()
+        install(self.client, self.server)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_download_and_skip_unchanged(self):
+        files = [FileDto(id=f"doc{i}", name=f"file{i}.txt", size=len(f"contents of doc{i}"), createdDate="2024-01-01T00:00:00Z")
+                 for i in range(20)]
+        reports = []
+        manager = TransferManager(self.client, max_workers=4, progress=lambda report: reports.append(report.completed))
+
+        report = manager.download(files, self.directory.name)
+
+        self.assertEqual(20, report.transferred)
+        self.assertEqual(list(range(1, 21)), reports)
+        self.assertEqual(sum(file.size for file in files), report.bytes)
+        with open(os.path.join(self.directory.name, "file7.txt"), "rb") as file:
+            self.assertEqual(b"contents of doc7", file.read())
+
+        report = manager.download(files, self.directory.name)
+
+        self.assertEqual(20, report.skipped)
+        self.assertEqual(20, len(self.server.downloads))
+
+        with open(os.path.join(self.directory.name, "file7.txt"), "wb") as file:
+            file.write(b"changed")
+        report = manager.download(files, self.directory.name)
+        self.assertEqual(["doc7"], self.server.downloads[20:])
+
+    def test_skip_by_modification_date(self):
+        path = os.path.join(self.directory.name, "doc1.txt")
+        manager = TransferManager(self.client)
+
+        self.assertEqual(1, manager.download([FileDownload("doc1", path, modifiedDate="2024-01-01T00:00:00Z")]).transferred)
+        self.assertEqual(1, manager.download([FileDownload("doc1", path, modifiedDate="2024-01-01T00:00:00Z")]).skipped)
+        self.assertEqual(1, manager.download([FileDownload("doc1", path, modifiedDate="2024-06-01T00:00:00Z")]).transferred)
+
+    def test_retries_and_failures(self):
+        manager = TransferManager(self.client, backoff=0)
+        files = [FileDownload("flaky", os.path.join(self.directory.name, "flaky.txt")),
+                 FileDownload("missing", os.path.join(self.directory.name, "missing.txt"))]
+
+        report = manager.download(files)
+
+        self.assertEqual(1, report.transferred)
+        self.assertEqual(2, report.results[0].attempts)
+        self.assertEqual(["missing"], [result.item.documentId for result in report.errors])
+        self.assertEqual("Not found", report.errors[0].error)
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "missing.txt")))
+
+    def test_retries_do_not_multiply(self):
+        self.client.with_retry_policy(RetryPolicy(backoff=0))
+        manager = TransferManager(self.client, backoff=0)
+
+        report = manager.download([FileDownload("flaky", os.path.join(self.directory.name, "flaky.txt"))])
+
+        self.assertEqual(1, report.transferred)
+        self.assertEqual(1, report.results[0].attempts)
+        self.assertEqual(2, self.server.flaky)
+
+    def test_uploads_are_retried_only_on_request(self):
+        report = TransferManager(self.client, backoff=0).upload([FileUpload(b"data", taskId="flaky", filename="data.bin")])
+        self.assertEqual(1, report.failed)
+        self.assertEqual(1, len(self.server.uploads))
+
+        self.server.uploads.clear()
+        report = TransferManager(self.client, backoff=0, retry_uploads=True).upload([FileUpload(b"data", taskId="flaky", filename="data.bin")])
+        self.assertEqual(1, report.transferred)
+        self.assertEqual(2, report.results[0].attempts)
+
+    def test_download_task_files(self):
+        manager = TransferManager(self.client)
+
+        report = manager.download_task_files(["t1", "t2"], self.directory.name)
+
+        self.assertEqual(6, report.transferred)
+        self.assertEqual(["escape.txt", "notes (t1-b).txt", "notes.txt"], sorted(os.listdir(os.path.join(self.directory.name, "t1"))))
+        self.assertEqual(["t1", "t2"], sorted(os.listdir(self.directory.name)))
+
+    def test_upload(self):
+        manager = TransferManager(self.client)
+        source = os.path.join(self.directory.name, "report.txt")
+        with open(source, "wb") as file:
+            file.write(b"report")
+
+        report = manager.upload([FileUpload(source, taskId="t1"), FileUpload(b"data", projectId="p1", filename="data.bin"),
+                                 FileUpload(b"data", projectId="p1", folderId="f1", filename="data.bin"),
+                                 FileUpload(b"data", riskId="r1", filename="data.bin"), FileUpload(b"data", filename="home.bin")])
+
+        self.assertEqual(5, report.transferred)
+        self.assertEqual(len(b"report") + 4 * len(b"data"), report.bytes)
+        self.assertEqual("uploaded", report.results[0].data.name)
+        self.assertEqual(sorted(["/api/data/tasks/t1/files", "/api/data/projects/p1/files", "/api/data/projects/p1/folders/f1/files",
+                                 "/api/data/risks/r1/files", "/api/data/home/files"]), sorted(path for path, body in self.server.uploads))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import asyncio
+import http.server
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.ratelimiter import RateLimiter
+from ProjectManagerSdk.retry import RetryPolicy
+from ProjectManagerSdk.uploads import Upload
+from test.fakeserver import install
+
+CONTENT = os.urandom(300 * 1024)
+
+
+class UploadHandler(http.server.BaseHTTPRequestHandler):
+    """Records the headers and body of every upload"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while size := int(self.rfile.readline().strip(), 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+            self.rfile.readline()
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.uploads.append((self.headers, body))
+        response = json.dumps({"data": {"name": "uploaded"}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    do_PUT = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestUploads(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+        self.server.uploads = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.client = ProjectManagerClient(f"http://127.0.0.1:{self.server.server_address[1]}", "UNIT_TEST")
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def assertUploaded(self, headers, body, filename, content_type="application/octet-stream"):
+        boundary = headers["Content-Type"].split("boundary=")[1]
+        self.assertTrue(headers["Content-Type"].startswith("multipart/form-data"))
+        self.assertEqual((f'--{boundary}\r\nContent-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+                          f'Content-Type: {content_type}\r\n\r\n').encode("utf-8") + CONTENT + f"\r\n--{boundary}--\r\n".encode("ascii"), body)
+
+    def test_upload_path(self):
+        filename = os.path.join(self.directory.name, "report.pdf")
+        with open(filename, "wb") as file:
+            file.write(CONTENT)
+
+        result = self.client.taskFile.upload_task_file("task", filename)
+
+        self.assertTrue(result.success)
+        headers, body = self.server.uploads[0]
+        self.assertEqual(str(len(body)), headers["Content-Length"])
+        self.assertUploaded(headers, body, "report.pdf", "application/pdf")
+
+    def test_upload_path_closes_file(self):
+        filename = os.path.join(self.directory.name, "report.bin")
+        with open(filename, "wb") as file:
+            file.write(CONTENT)
+        upload = Upload(filename)
+
+        self.client.projectFile.upload_project_file("project", upload)
+
+        self.assertIsNone(upload._file)
+        self.assertEqual(len(CONTENT), upload.sent)
+        self.assertGreater(upload.throughput, 0)
+
+    def test_upload_file_object_and_bytes(self):
+        progress = []
+        file = io.BytesIO(b"skipped" + CONTENT)
+        file.seek(7)
+
+        self.client.riskFile.upload_risk_file("risk", Upload(file, filename="data.bin"))
+        self.client.homeFile.upload_home_file(Upload(CONTENT, filename="data.bin", progress=lambda sent, total: progress.append((sent, total))))
+
+        for headers, body in self.server.uploads:
+            self.assertUploaded(headers, body, "data.bin")
+        self.assertFalse(file.closed)
+        self.assertGreater(len(progress), 1)
+        self.assertEqual((len(CONTENT), len(CONTENT)), progress[-1])
+
+    def test_upload_chunks(self):
+        chunks = (CONTENT[offset:offset + 1000] for offset in range(0, len(CONTENT), 1000))
+
+        result = self.client.me.update_my_avatar(Upload(chunks, filename='my "avatar".png'))
+
+        self.assertTrue(result.success)
+        headers, body = self.server.uploads[0]
+        self.assertEqual("chunked", headers["Transfer-Encoding"])
+        self.assertUploaded(headers, body, "my %22avatar%22.png", "image/png")
+
+    def test_only_replayable_uploads_are_retried(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_retry_policy(RetryPolicy(backoff=0, methods={"POST"}))
+        bodies = []
+
+        def handler(request):
+            bodies.append(b"".join(request.body))
+            return (503, b"", None) if len(bodies) < 3 else (200, {"data": {}}, None)
+        install(client, handler)
+
+        self.assertTrue(client.taskFile.upload_task_file("task", Upload(CONTENT)).success)
+        self.assertEqual(3, len(bodies))
+        self.assertEqual(1, len(set(bodies)))
+
+        bodies.clear()
+        result = client.taskFile.upload_task_file("task", Upload(iter([CONTENT])))
+        self.assertEqual(503, result.statusCode)
+        self.assertEqual(1, len(bodies))
+
+    def test_unreplayable_uploads_still_slow_the_rate_limiter(self):
+        client = ProjectManagerClient("production", "UNIT_TEST")
+        client.with_rate_limiter(RateLimiter(rate=10))
+        install(client, lambda request: (429, b"", {"Retry-After": "0"}))
+
+        result = client.taskFile.upload_task_file("task", Upload(iter([CONTENT])))
+        self.assertEqual(429, result.statusCode)
+        self.assertEqual(1, client.rateLimiter.throttled)
+
+    def test_async_upload_reads_off_the_event_loop(self):
+        threads = []
+
+        def chunks():
+            threads.append(threading.get_ident())
+            yield CONTENT
+
+        async def upload():
+            async with AsyncProjectManagerClient(self.client.serverUrl, "UNIT_TEST") as client:
+                return await client.taskFile.upload_task_file("task", Upload(chunks(), filename="data.bin"))
+
+        self.assertTrue(asyncio.run(upload()).success)
+        self.assertNotEqual([threading.get_ident()], threads)
+        self.assertUploaded(*self.server.uploads[0], "data.bin")
+
+    def test_async_upload(self):
+        async def upload():
+            async with AsyncProjectManagerClient(self.client.serverUrl, "UNIT_TEST") as client:
+                return await client.taskFile.upload_task_file("task", Upload(io.BytesIO(CONTENT), filename="data.bin"))
+
+        self.assertTrue(asyncio.run(upload()).success)
+        headers, body = self.server.uploads[0]
+        self.assertEqual(str(len(body)), headers["Content-Length"])
+        self.assertUploaded(headers, body, "data.bin")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import unittest
+import unittest.mock
+import httpx
+from ProjectManagerSdk.asyncprojectmanagerclient import AsyncProjectManagerClient
+from ProjectManagerSdk.projectmanagerclient import ProjectManagerClient
+from ProjectManagerSdk.validatorcache import ValidatorCache
+from test.fakeserver import install
+
+
+class FakeProjectServer:
+    """answers project calls with a version that changes on demand"""
+
+    def __init__(self, validator: str = "ETag"):
+        self.version = 1
+        self.validator = validator
+        self.conditions = []
+
+    def tag(self) -> str:
+        return f'"v{self.version}"' if self.validator == "ETag" else f"Mon, 0{self.version} Jan 2024 00:00:00 GMT"
+
+    def __call__(self, request):
+        condition = request.headers.get("If-None-Match") or request.headers.get("If-Modified-Since")
+        self.conditions.append(condition)
+        if condition == self.tag():
+            return 304, b"", {self.validator: self.tag()}
+        if request.path_url.endswith("/members") or "/api/data/projects?" in request.path_url:
+            payload = {"success": True, "data": [{"id": "u1", "name": f"Member {self.version}"}]}
+        else:
+            payload = {"success": True, "data": {"id": "p1", "name": f"Project {self.version}"}}
+        return 200, payload, {self.validator: self.tag(), "Content-Type": "application/json"}
+
+
+class TestValidatorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ValidatorCache()
+        self.client = ProjectManagerClient("production", "UNIT_TEST")
+        self.client.with_validator_cache(self.cache)
+        self.server = FakeProjectServer()
+        self.adapter = install(self.client, self.server)
+
+    def test_revalidates_with_etag(self):
+        first = self.client.project.retrieve_project("p1")
+        second = self.client.project.retrieve_project("p1")
+
+        self.assertEqual([None, '"v1"'], self.server.conditions)
+        self.assertEqual(1, self.cache.revalidated)
+        self.assertEqual(200, second.statusCode)
+        self.assertEqual("Project 1", second.data.name)
+        self.assertEqual(first.data, second.data)
+
+        self.server.version = 2
+        third = self.client.project.retrieve_project("p1")
+        self.assertEqual("Project 2", third.data.name)
+        self.assertEqual(1, self.cache.revalidated)
+
+    def test_revalidates_with_last_modified(self):
+        self.server.validator = "Last-Modified"
+        self.client.project.retrieve_project("p1")
+        result = self.client.project.retrieve_project("p1")
+
+        self.assertEqual([None, "Mon, 01 Jan 2024 00:00:00 GMT"], self.server.conditions)
+        self.assertEqual("Project 1", result.data.name)
+
+    def test_callers_get_their_own_results(self):
+        first = self.client.project.retrieve_project("p1")
+        first.data.name = "Changed by the first caller"
+        second = self.client.project.retrieve_project("p1")
+        second.data.name = "Changed by the second caller"
+        third = self.client.project.retrieve_project("p1")
+
+        self.assertEqual(2, self.cache.revalidated)
+        self.assertEqual("Project 1", third.data.name)
+        self.assertIsNot(second.data, third.data)
+
+    def test_does_not_decode_unchanged_bodies_again(self):
+        self.client.with_json_codec("json")
+        self.client.project.retrieve_project("p1")
+        self.client.project.retrieve_project("p1")
+        with unittest.mock.patch("ProjectManagerSdk.clientbase.from_dict") as decode, \
+                unittest.mock.patch("ProjectManagerSdk.jsoncodec.json.loads", wraps=json.loads) as loads:
+            result = self.client.project.retrieve_project("p1")
+        self.assertEqual(2, self.cache.revalidated)
+        self.assertEqual(0, decode.call_count)
+        self.assertEqual(0, loads.call_count)
+        self.assertEqual("Project 1", result.data.name)
+
+    def test_lists_and_result_modes(self):
+        first = self.client.projectMembers.retrieve_project_members("p1", False)
+        second = self.client.projectMembers.retrieve_project_members("p1", False)
+        self.assertEqual(first.data, second.data)
+        self.assertIsNot(first.data[0], second.data[0])
+
+        with self.client.result_mode("raw"):
+            raw = self.client.projectMembers.retrieve_project_members("p1", False)
+        self.assertEqual("Member 1", raw.data[0]["name"])
+        with self.client.result_mode("lazy"):
+            lazy = self.client.projectMembers.retrieve_project_members("p1", False)
+        self.assertIsNot(first.data, lazy.data)
+        self.assertEqual("Member 1", lazy.data[0].name)
+
+    def test_only_configured_endpoints(self):
+        self.client.project.query_projects(10, 0, None, None, None)
+        self.client.project.query_projects(10, 0, None, None, None)
+        self.assertEqual([None, None], self.server.conditions)
+        self.assertEqual(0, len(self.cache))
+
+    def test_credentials_are_separate(self):
+        self.client.project.retrieve_project("p1")
+        self.client.with_api_key("OTHER")
+        self.client.project.retrieve_project("p1")
+        self.assertEqual([None, None], self.server.conditions)
+
+    def test_errors_drop_validators(self):
+        self.client.project.retrieve_project("p1")
+        install(self.client, lambda request: (404, {"error": {"message": "Not found"}}, None))
+        self.assertFalse(self.client.project.retrieve_project("p1").success)
+        self.assertEqual(0, len(self.cache))
+
+    def test_async_client(self):
+        client = AsyncProjectManagerClient("production", "UNIT_TEST")
+        client.with_validator_cache(ValidatorCache())
+        conditions = []
+
+        def handler(request):
+            conditions.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json={"success": True, "data": {"id": "t1", "name": "Task"}}, headers={"ETag": '"v1"'})
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def retrieve():
+            return [await client.task.retrieve_task("t1"), await client.task.retrieve_task("t1")]
+
+        first, second = asyncio.run(retrieve())
+        self.assertEqual([None, '"v1"'], conditions)
+        self.assertIsNot(first.data, second.data)
+        self.assertEqual("Task", second.data.name)
+
+
+if __name__ == '__main__':
+    unittest.main()